@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tax Law Crawler - 크롤링 워커 진입점
+
+작업 큐(crawl_jobs)에서 사이트 크롤링 작업을 할당받아 실행하고 결과를 보고
+웹 서버는 CRAWL_QUEUE_CONFIG["mode"] = "queue"로 설정하면 크롤링을 직접 실행하지 않고 큐에 등록
+
+사용법:
+    python crawl_worker.py                        # 전체 사이트, 설정된 동시 실행 수
+    python crawl_worker.py --concurrency 2        # 동시에 2개 사이트 크롤링
+    python crawl_worker.py --sites moef,mois      # 지정한 사이트 작업만 할당
+    python crawl_worker.py --once                 # 작업 하나만 실행하고 종료
+
+여러 호스트에서 실행하려면 웹 서버와 같은 DATABASE_URL(PostgreSQL)을 설정하세요.
+"""
+
+import argparse
+import signal
+import sys
+import os
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(__file__))
+
+# 로깅 시스템 초기화
+from src.config.logging_config import setup_logging, get_logger
+setup_logging(log_level="INFO", log_to_file=True)
+logger = get_logger(__name__)
+
+from src.services.crawler_service import CrawlingService
+from src.services.process_crawling_service import ProcessCrawlingService
+from src.services.crawl_job_queue import create_crawl_job_queue
+from src.services.crawl_worker import CrawlWorker
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.crawlers.registry import build_crawlers, SITE_CHOICES
+from src.config.settings import CRAWL_PROCESS_CONFIG
+
+
+def create_repository():
+    """DATABASE_URL이 PostgreSQL이면 공유 저장소, 아니면 SQLite 저장소"""
+    database_url = os.environ.get("DATABASE_URL", "")
+    if database_url.startswith(("postgresql://", "postgres://")):
+        from src.repositories.postgres_repository import PostgresRepository
+        return PostgresRepository(database_url)
+    return SQLiteRepository()
+
+
+def main():
+    """크롤링 워커 시작"""
+    parser = argparse.ArgumentParser(description="세금 법령 크롤링 워커")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 크롤링 사이트 수")
+    parser.add_argument("--sites", default=None, help="할당받을 사이트 키 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--worker-id", default=None, help="워커 식별자 (기본: 호스트:PID:임의값)")
+    parser.add_argument("--once", action="store_true", help="작업 하나만 실행하고 종료")
+    args = parser.parse_args()
+
+    sites = [site.strip() for site in args.sites.split(",") if site.strip()] if args.sites else None
+    unknown_sites = [site for site in sites or [] if site not in SITE_CHOICES]
+    if unknown_sites:
+        logger.error(f"알 수 없는 사이트: {', '.join(unknown_sites)}")
+        return 1
+
+    try:
+        repository = create_repository()
+        repository.force_schema_update()
+
+        # 프로세스 격리 모드면 작업마다 자식 프로세스에서 크롤링 (워커 프로세스 메모리 유지)
+        if CRAWL_PROCESS_CONFIG.get("enabled"):
+            crawling_service = ProcessCrawlingService(repository)
+        else:
+            crawling_service = CrawlingService(build_crawlers(), repository)
+        queue = create_crawl_job_queue(repository.db_path, getattr(repository, "dsn", None))
+        worker = CrawlWorker(queue, crawling_service, concurrency=args.concurrency, sites=sites,
+                             worker_id=args.worker_id)
+    except Exception as e:
+        logger.error(f"크롤링 워커 초기화 실패: {e}")
+        return 1
+
+    def handle_signal(signum, frame):
+        logger.info(f"종료 신호 수신 ({signal.Signals(signum).name}) - 실행 중 작업 완료 후 종료")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    if args.once:
+        if not worker.run_once():
+            logger.info("대기 중인 크롤링 작업 없음")
+        return 0
+
+    worker.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,4 +82,263 @@ GUI_CONFIG = {
         "7. 모두 크롤링"
     ],
     "default_interval": 60  # 기본 주기 (분)
-}
\ No newline at end of file
+}
+
+# 아카이브(hot/cold 계층) 설정
+ARCHIVE_CONFIG = {
+    "enabled": True,
+    "archive_folder": "data/archive",
+    "archive_file_template": "tax_data_{year}.db",
+    "document_retention_days": 730,  # 사이트 문서 테이블 hot 보관 기간 (created_at 기준)
+    "log_retention_days": 90,        # 로그 테이블 hot 보관 기간
+    "vacuum_after_archive": True,    # 이동 후 VACUUM으로 hot DB 파일 축소
+    "schedule_hour": 3               # 매일 아카이브 실행 시각
+}
+
+# 아카이브 대상 로그 테이블 (테이블명: 기준 시간 컬럼)
+ARCHIVE_LOG_TABLES = {
+    "new_data_log": "discovered_at",
+    "notification_history": "created_at",
+    "crawl_execution_log": "start_time",
+    "data_change_log": "changed_at"
+}
+
+# 사이트별 문서 날짜 컬럼 (분석용 월 파티션 기준)
+DATE_COLUMNS = {
+    "tax_tribunal": "결정일",
+    "nts_authority": "생산일자",
+    "nts_precedent": "생산일자",
+    "moef": "회신일자",
+    "mois": "생산일자",
+    "bai": "결정일자"
+}
+
+# 분석용 Parquet 스냅샷 설정 (pyarrow 설치 시에만 동작)
+SNAPSHOT_CONFIG = {
+    "enabled": True,
+    "snapshot_folder": "data/snapshots",
+    "batch_size": 5000,              # CDC 피드 1회 조회 건수
+    "compact_threshold_files": 20,   # 파티션 내 파일 수가 이 값을 넘으면 하나로 병합
+    "compression": "zstd"
+}
+
+# 비동기 DB 실행기 설정 (FastAPI 이벤트 루프 블로킹 방지)
+ASYNC_DB_CONFIG = {
+    "max_workers": 4,                # DB 전용 스레드 수
+    "max_pending": 64,               # 실행 대기 가능한 최대 작업 수 (초과 시 대기)
+    "disconnect_poll_interval": 0.5  # 클라이언트 연결 해제 확인 주기 (초)
+}
+
+# PostgreSQL 저장소 설정 (DATABASE_URL 환경 변수가 postgresql:// 로 시작하면 사용)
+POSTGRES_CONFIG = {
+    "min_pool_size": 1,
+    "max_pool_size": 10,
+    "pool_timeout": 30,              # 풀에서 연결을 기다리는 최대 시간 (초)
+    "fetch_size": 2000,              # 서버 사이드 커서 1회 조회 행 수
+    "application_name": "taxupdater"
+}
+
+# 크롤링 자원 풀 설정 (동시 실행 슬롯 수)
+CRAWL_RESOURCE_CONFIG = {
+    "pools": {
+        "selenium": "auto",          # Chrome 사용 크롤러 ("auto": 호스트 메모리 기준 자동 계산)
+        "http": 4                    # requests 기반 크롤러
+    },
+    "selenium_max_slots": 2,         # auto 계산 시 최대 Selenium 슬롯
+    "browser_memory_mb": 450,        # Chrome 1개당 예상 메모리
+    "reserved_memory_mb": 512,       # 웹 서버/스케줄러용 예약 메모리
+    "site_pools": {
+        "tax_tribunal": "http",
+        "nts_authority": "selenium",
+        "nts_precedent": "selenium",
+        "moef": "http",
+        "mois": "selenium",
+        "bai": "selenium"
+    },
+    "default_pool": "selenium",
+    "manual_priority_boost": 10,     # 수동 실행 작업의 우선순위 가산점
+    "wait_history_size": 100         # 대기 시간 통계에 사용할 최근 작업 수
+}
+
+# 실패한 사이트 크롤링 재시도 설정 (횟수/기본 지연은 crawl_schedules.max_retries, retry_delay 사용)
+CRAWL_RETRY_CONFIG = {
+    "enabled": True,
+    "max_delay_seconds": 3600,       # 지수 백오프 최대 지연 (1시간)
+    "jitter_ratio": 0.5,             # 지연 시간 중 무작위로 분산할 비율
+    "retry_unknown_errors": True,    # 분류되지 않은 오류도 재시도
+    # 일시적 오류 (네트워크/브라우저) - 재시도
+    "transient_error_types": [
+        "ConnectionError", "ConnectTimeout", "ReadTimeout", "Timeout", "TimeoutError",
+        "TimeoutException", "ChunkedEncodingError", "ProtocolError", "RemoteDisconnected",
+        "MaxRetryError", "WebDriverException", "SessionNotCreatedException", "HTTPError",
+        "CrawlTimeoutError", "CrawlResourceLimitError"
+    ],
+    "transient_error_patterns": [
+        "timed out", "timeout", "connection", "temporarily", "net::err_", "max retries exceeded",
+        "name resolution", "reset by peer", "502", "503", "504", "429", "chrome not reachable"
+    ],
+    # 구조적 오류 (페이지 구조 변경/파싱 실패) - 재시도하지 않음
+    "structural_error_types": [
+        "KeyError", "IndexError", "AttributeError", "NoSuchElementException",
+        "ValueError", "TypeError", "ParserError"
+    ],
+    "structural_error_patterns": [
+        "no such element", "unable to locate element", "컬럼", "column", "유효성 검증 실패", "parse"
+    ]
+}
+
+# 멈춘 크롤링 감시 설정 (사이트별 제한 시간은 crawl_schedules.timeout_seconds 사용)
+CRAWL_WATCHDOG_CONFIG = {
+    "enabled": True,
+    "check_interval_seconds": 15,    # 실행 중 작업 검사 주기
+    "default_timeout_seconds": 3600  # crawl_schedules에 값이 없을 때 제한 시간 (1시간)
+}
+
+# 적응형 크롤링 스케줄 설정 (new_data_log 기반 요일 x 시간대별 도착률 학습)
+ADAPTIVE_SCHEDULE_CONFIG = {
+    "enabled": False,                # True면 학습 데이터가 충분한 사이트는 cron 대신 적응형 스케줄 사용
+    "sites": None,                   # 적용 대상 사이트 목록 (None이면 전체)
+    "lookback_days": 56,             # 학습 기간 (8주)
+    "min_observations": 10,          # 적응형 전환에 필요한 최소 신규 문서 수 (미달 시 cron 유지)
+    "prior_weight_weeks": 1.0,       # 관측이 적은 시간대를 사이트 평균 쪽으로 수축시키는 가중치 (주)
+    "target_arrivals_per_crawl": 1.0,  # 크롤링 1회당 기대 신규 문서 수 (작을수록 자주 크롤링)
+    "min_interval_minutes": 60,      # 크롤링 최소 간격
+    "max_interval_hours": 24,        # 크롤링 최대 간격 (게시가 없어도 이 간격으로는 확인)
+    "skip_all_sites_crawl": True,    # 적응형 모드에서는 고정 전체 크롤링(02시/14시) 생략
+    "all_sites_crawl_cron": "0 2,14 * * *"  # 고정 전체 크롤링 스케줄 (보고서의 비교 기준)
+}
+
+# 스케줄 시작 시각 분산 설정 (같은 시각에 겹치는 cron/interval 작업을 결정적 오프셋으로 분산)
+SCHEDULE_STAGGER_CONFIG = {
+    "enabled": True,
+    "min_gap_seconds": 90,           # 작업 시작 시각 사이 최소 간격
+    "jitter_seconds": 30,            # 작업 ID 기반 결정적 지터 범위
+    "max_slots": 10,                 # 작업당 최대 분산 슬롯 (최대 오프셋 = max_slots * min_gap_seconds + 지터)
+    "horizon_hours": 168,            # 겹침 검사 기간 (1주일)
+    "all_sites_dedupe_minutes": 180  # 전체 크롤링 시 이 시간 내 성공한 사이트는 건너뜀 (0이면 비활성)
+}
+
+# 스케줄러 리더 선출 설정 (여러 웹 워커/호스트 중 리스를 보유한 하나의 프로세스만 예약 작업 실행)
+LEADER_ELECTION_CONFIG = {
+    "enabled": True,
+    "lease_name": "scheduler",
+    "lease_seconds": 30,             # 리스 유효 시간 (리더가 중단되면 최대 이 시간 후 인계)
+    "heartbeat_seconds": 10,         # 리스 갱신/획득 시도 주기 (lease_seconds보다 충분히 짧게)
+    "request_poll_seconds": 5,       # 리더가 전달된 수동 크롤링 요청을 확인하는 주기
+    "request_retention_days": 7,     # 처리 완료된 요청 보관 기간
+    "db_timeout_seconds": 10         # SQLite 잠금 대기 시간
+}
+
+# 크롤링 작업 큐 설정 (mode="queue"면 리더는 작업만 등록하고 crawl_worker.py 프로세스가 실행)
+CRAWL_QUEUE_CONFIG = {
+    "mode": "local",                 # "local": 웹 프로세스 디스패처에서 실행, "queue": 작업 큐 + 크롤링 워커
+    "backend": "sql",                # 작업 큐 구현 ("sql": SQLite 모니터링 DB, DATABASE_URL이 있으면 PostgreSQL)
+    "lease_seconds": 180,            # 작업 리스 유효 시간 (워커가 연장하지 못하면 대기열로 복귀)
+    "heartbeat_seconds": 30,         # 워커의 리스 연장 및 진행 상황 기록 주기
+    "poll_seconds": 5,               # 워커의 작업 확인 주기
+    "result_poll_seconds": 5,        # 리더의 완료 작업 수집 주기 (전체 크롤링의 작업 상태 확인 주기)
+    "result_wait_seconds": 7200,     # 전체 크롤링이 큐 작업 결과를 기다리는 최대 시간 (워커 대기 포함)
+    "max_claims": 3,                 # 리스 만료로 재할당할 최대 횟수 (초과 시 실패 처리)
+    "worker_concurrency": 1,         # 워커당 동시 실행 작업 수 (자원 풀 슬롯 범위 내)
+    "retention_days": 14,            # 보고 완료된 작업 보관 기간
+    "db_timeout_seconds": 10         # SQLite 잠금 대기 시간
+}
+
+# 프로세스 격리 크롤링 설정 (크롤링마다 자식 프로세스를 띄우고 완료 후 종료하여 웹/워커 프로세스 메모리 증가 방지)
+CRAWL_PROCESS_CONFIG = {
+    "enabled": False,                # True면 스케줄/수동/워커 크롤링을 자식 프로세스에서 실행
+    "start_method": "spawn",         # multiprocessing 시작 방식 (스레드가 많은 웹 프로세스에서는 spawn 권장)
+    "max_rss_mb": 2048,              # 자식 프로세스 트리(Chrome 포함) 최대 RSS (초과 시 강제 종료, psutil 필요)
+    "max_cpu_seconds": 1800,         # 자식 프로세스 CPU 시간 제한 (RLIMIT_CPU, None이면 제한 없음)
+    "max_address_space_mb": None,    # 자식 프로세스 가상 메모리 제한 (RLIMIT_AS, Chrome은 큰 가상 주소를 예약하므로 기본 미사용)
+    "monitor_interval_seconds": 2,   # 메모리 사용량/취소 여부 확인 주기
+    "shutdown_grace_seconds": 10     # 결과 수신 후 자식 프로세스 정상 종료 대기 시간
+}
+
+# 사이트 건강도 평가 설정 (5분마다 crawl_execution_log를 한 번의 SQL로 집계하여 site_health_summary에 저장)
+HEALTH_CHECK_CONFIG = {
+    "window_runs": 20,               # 성공률/p95 소요시간 계산에 사용할 사이트별 최근 실행 수
+    "lookback_days": 14,             # 최근 실행 조회 범위 (오래된 로그는 집계하지 않음)
+    "stale_success_hours": 24,       # 마지막 성공 후 이 시간이 지나면 warning
+    "error_consecutive_errors": 3,   # 연속 실패가 이 횟수 이상이면 error
+    "warning_success_rate": 0.5,     # 최근 실행 성공률이 이 값 미만이면 warning
+    "min_runs_for_rate": 5           # 성공률 판정에 필요한 최소 실행 수
+}
+
+# 이메일 발송 설정 (SMTP 서버별 연결 풀 + 수신자 일괄 발송)
+EMAIL_DELIVERY_CONFIG = {
+    "max_connections_per_server": 2,  # SMTP 서버(호스트/포트/계정)별 최대 동시 연결 수
+    "max_recipients_per_message": 50,  # 한 번의 발송(MAIL FROM + 여러 RCPT TO)에 포함할 최대 수신자 수
+    "idle_timeout_seconds": 240,      # 이 시간 이상 사용하지 않은 연결은 닫고 새로 연결 (서버 유휴 종료 대비)
+    "health_check_idle_seconds": 30,  # 이 시간 이상 유휴 상태였던 연결은 NOOP으로 확인 후 사용
+    "connect_timeout_seconds": 30,    # SMTP 연결/응답 제한 시간
+    "max_retries": 3,                 # 연결 오류 시 재연결 후 재시도 횟수
+    "retry_backoff_seconds": 1        # 재시도 대기 시간 (회차마다 2배)
+}
+
+# 알림 아웃박스 설정 (알림과 발송 건을 한 트랜잭션에 기록, 웹 서버의 디스패처가 채널별 발송/재시도)
+NOTIFICATION_OUTBOX_CONFIG = {
+    "poll_seconds": 5,               # 다른 프로세스가 등록한 알림/재시도 시각이 된 발송 건 확인 주기
+    "batch_size": 50,                # 한 번에 할당받을 최대 발송 건 수
+    "lease_seconds": 300,            # 발송 건 리스 (발송 중 프로세스가 중단되면 만료 후 재할당)
+    "max_attempts": 5,               # 발송 건별 최대 시도 횟수 (초과 시 failed)
+    "retry_backoff_seconds": 30,     # 재시도 대기 시간 (회차마다 2배)
+    "max_backoff_seconds": 1800,     # 재시도 대기 시간 상한
+    "retention_days": 30,            # 완료된 발송 건 보관 기간
+    "shutdown_timeout_seconds": 30,  # 종료 시 진행 중 발송 완료 대기 시간
+    "db_timeout_seconds": 10         # SQLite 잠금 대기 시간
+}
+
+# 알림 다이제스트 설정 (새로운 데이터 이메일을 수신자별로 모아 요약 1건으로 발송, WebSocket/푸시는 즉시 발송)
+NOTIFICATION_DIGEST_CONFIG = {
+    "enabled": True,                       # False면 이벤트마다 이메일 발송
+    "notification_types": ["new_data"],    # 다이제스트로 모을 알림 타입
+    "window_seconds": 1800,                # 첫 대기 이벤트 후 이 시간이 지나면 발송
+    "max_events": 20,                      # 대기 이벤트가 이 수 이상이면 즉시 발송
+    "max_documents": 50,                   # 대기 문서 수 합계가 이 수 이상이면 즉시 발송
+    "flush_urgency_levels": ["critical"],  # 이 긴급도의 이벤트가 있으면 즉시 발송
+    "max_items_per_site": 10,              # 요약 이메일에 사이트별로 표시할 최대 문서 수
+    "retention_days": 30                   # 발송 완료 이벤트 보관 기간
+}
+
+# WebSocket 브로드캐스트 설정 (메시지를 한 번 직렬화하여 클라이언트별 큐에 넣고 연결마다 별도 태스크로 전송)
+WEBSOCKET_BROADCAST_CONFIG = {
+    "queue_size": 100,                                    # 클라이언트별 최대 대기 메시지 수 (초과 시 가장 오래된 메시지 버림)
+    "send_timeout_seconds": 10,                           # 메시지 1건 전송 제한 시간 (초과 시 연결 제거)
+    "max_lag_seconds": 30,                                # 가장 오래된 대기 메시지가 이 시간을 넘으면 느린 연결로 보고 제거
+    "coalesce_types": ["crawl_progress", "crawl_status"]  # 대기 중인 같은 대상 메시지에 최신 필드를 병합할 타입
+}
+
+# 크롤링 진행 상황 스트림 설정 (크롤링별 진행률/상태를 모아 변경된 필드만 제한된 빈도로 WebSocket 전송)
+CRAWL_PROGRESS_STREAM_CONFIG = {
+    "max_updates_per_second": 2,  # 크롤링별 최대 전송 빈도
+    "eta_min_progress": 3         # 진행률이 이 값(%) 이상일 때부터 남은 시간(ETA) 계산
+}
+
+# 알림 빈도 제한 설정 (사이트/알림 타입별 토큰 버킷, 수신자별/전체 일일 한도, 상태는 SQLite에 키별 한 행으로 저장)
+NOTIFICATION_THROTTLE_CONFIG = {
+    "type_limits": {                                       # 사이트/알림 타입별 토큰 버킷 (refill_seconds마다 1건 충전)
+        "new_data": {"capacity": 1, "refill_seconds": 300},  # 사이트별 최소 알림 간격 5분 (초과분은 다이제스트에 합산)
+        "error": {"capacity": 3, "refill_seconds": 1200}     # 사이트별 에러 알림 시간당 3건
+    },
+    "daily_limit": 50,                # 전체 일일 최대 알림 수
+    "recipient_daily_limit": 20,      # 수신자별 일일 최대 이메일 수 (초과한 다이제스트는 다음 날 발송)
+    "exempt_types": ["system"],       # 빈도 제한을 적용하지 않는 알림 타입
+    "retention_days": 7,              # 사용되지 않은 제한 상태 보관 기간
+    "db_timeout_seconds": 10          # SQLite 잠금 대기 시간
+}
+
+# 최근 새로운 문서 프로젝션 설정 (new_data_log를 이메일/WebSocket/API가 바로 쓰는 형태로 유지, doc_id 커서 페이지네이션)
+RECENT_DOCUMENTS_CONFIG = {
+    "retention_days": 30,      # 프로젝션 보관 기간 (원본 new_data_log는 아카이브 설정을 따름)
+    "default_page_size": 100,  # 페이지 크기 기본값
+    "max_page_size": 1000      # 페이지 크기 상한
+}
+
+# 이메일 템플릿 설정 (컴파일된 Jinja 템플릿으로 렌더링, 알림별로 문서 조회/렌더링 결과 캐시)
+EMAIL_TEMPLATE_CONFIG = {
+    "template_dir": "src/web/templates/email",  # 이메일 템플릿 디렉토리 (notification.{locale}.html 우선, 없으면 notification.html)
+    "default_locale": "ko",                     # 수신자 언어 설정이 없을 때 사용할 언어
+    "render_cache_size": 64,                    # 렌더링한 본문/조회한 문서 목록 캐시 크기 (서버별 발송/재시도 시 재사용)
+    "max_items": 50                             # 새로운 데이터 알림 본문에 표시할 최대 문서 수
+}
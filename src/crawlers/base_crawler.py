@@ -10,6 +10,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.interfaces.crawler_interface import CrawlerInterface
 from src.config.settings import SELENIUM_OPTIONS, CRAWLING_CONFIG
 from src.config.logging_config import get_logger
+from src.utils.crawl_context import register_browser, set_crawl_stage, report_status
 
 
 class BaseCrawler(CrawlerInterface):
@@ -49,11 +50,13 @@ class BaseCrawler(CrawlerInterface):
         return True
     
     def get_selenium_driver(self) -> webdriver.Chrome:
-        """Selenium 드라이버 생성"""
+        """Selenium 드라이버 생성 (watchdog이 타임아웃 시 종료할 수 있도록 프로세스 등록)"""
         options = Options()
         for option in SELENIUM_OPTIONS:
             options.add_argument(option)
-        return webdriver.Chrome(options=options)
+        driver = webdriver.Chrome(options=options)
+        register_browser(driver)
+        return driver
     
     def safe_selenium_operation(self, operation_func: Callable, retries: Optional[int] = None, delay: Optional[int] = None) -> Any:
         """
@@ -95,16 +98,15 @@ class BaseCrawler(CrawlerInterface):
         except Exception as e:
             self.logger.error(f"진행률 업데이트 중 오류: {e}")
     
-    def update_status_safely(self, status_callback: Optional[Callable], message: str) -> None:
-        """안전한 상태 메시지 업데이트"""
+    def update_status_safely(self, status_callback: Optional[Callable], message: str, **fields) -> None:
+        """
+        안전한 상태 메시지 업데이트 (현재 크롤링 단계로도 기록)
+
+        fields: 웹 진행 상황 스트림에 전달할 구조화 필드 (stage, page, pages, items, total_items 등)
+        """
+        set_crawl_stage(message)
         try:
-            if status_callback and hasattr(status_callback, '__call__'):
-                status_callback(message)
-            elif status_callback and hasattr(status_callback, 'config'):
-                # tkinter Label 객체인 경우
-                status_callback.config(text=message)
-                if hasattr(status_callback, 'update'):
-                    status_callback.update()
+            report_status(status_callback, message, site=self.site_key, **fields)
         except Exception as e:
             self.logger.error(f"상태 메시지 업데이트 중 오류: {e}")
     
@@ -34,7 +34,7 @@ class NTSAuthorityCrawler(BaseCrawler):
         max_items = kwargs.get('max_items', self.config["max_items"])
         max_load_attempts = kwargs.get('max_load_attempts', self.config.get("max_load_attempts", 500))
         
-        self.update_status_safely(status_callback, f"{self.site_name} 데이터 로딩 중...")
+        self.update_status_safely(status_callback, f"{self.site_name} 데이터 로딩 중...", stage="start")
         
         driver = self.get_selenium_driver()
         
@@ -50,7 +50,8 @@ class NTSAuthorityCrawler(BaseCrawler):
             # 2단계: 데이터 추출
             self.update_status_safely(
                 status_callback, 
-                f"{self.site_name} 데이터 처리 중... (총 {total_cases}개 항목)"
+                f"{self.site_name} 데이터 처리 중... (총 {total_cases}개 항목)",
+                stage="processing", items=total_cases
             )
             
             raw_data = self._extract_data(driver, progress_callback)
@@ -61,7 +62,8 @@ class NTSAuthorityCrawler(BaseCrawler):
             self.update_progress_safely(progress_callback, 100)
             self.update_status_safely(
                 status_callback,
-                f"{self.site_name} 크롤링 완료: 총 {len(cleaned_data)}개 사례 수집"
+                f"{self.site_name} 크롤링 완료: 총 {len(cleaned_data)}개 사례 수집",
+                stage="done", items=len(cleaned_data)
             )
             
             return cleaned_data
@@ -97,7 +99,8 @@ class NTSAuthorityCrawler(BaseCrawler):
                     if current_attempt % 5 == 0:
                         self.update_status_safely(
                             status_callback,
-                            f"{self.site_name} 데이터 로딩 중: {total_cases}/{max_items} 사례"
+                            f"{self.site_name} 데이터 로딩 중: {total_cases}/{max_items} 사례",
+                            stage="loading", items=total_cases, total_items=max_items
                         )
                     
                     time.sleep(1)  # 로딩 대기
@@ -0,0 +1,91 @@
+"""
+크롤러 레지스트리
+웹 서버와 크롤링 워커가 같은 사이트별 크롤러 구성을 사용하도록 생성 로직을 한곳에 모음
+"""
+
+import os
+from typing import Dict
+import sys
+
+# 상위 디렉토리 모듈 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.interfaces.crawler_interface import CrawlerInterface
+from src.crawlers.tax_tribunal_crawler import TaxTribunalCrawler
+from src.crawlers.nts_authority_crawler import NTSAuthorityCrawler
+from src.crawlers.nts_precedent_crawler import NTSPrecedentCrawler
+from src.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 웹 환경용 레거시 크롤러들 import (tkinter 의존성 없음)
+try:
+    from src.crawlers.web_legacy_crawlers import (
+        crawl_moef_site, crawl_mois_site, crawl_bai_site
+    )
+    LEGACY_CRAWLERS_AVAILABLE = True
+except ImportError as e:
+    logger.error(f"웹 레거시 크롤러 import 실패: {e}")
+    LEGACY_CRAWLERS_AVAILABLE = False
+
+
+# 사이트 키 → CrawlingService.execute_crawling 선택 번호
+SITE_CHOICES = {
+    "tax_tribunal": "1",
+    "nts_authority": "2",
+    "moef": "3",
+    "nts_precedent": "4",
+    "mois": "5",
+    "bai": "6"
+}
+
+
+class LegacyCrawlerWrapper:
+    """레거시 크롤러 함수를 클래스 인터페이스로 래핑"""
+    def __init__(self, site_name, site_key, crawler_func, key_column):
+        self.site_name = site_name
+        self.site_key = site_key
+        self.crawler_func = crawler_func
+        self.key_column = key_column
+
+    def get_site_name(self):
+        return self.site_name
+
+    def get_site_key(self):
+        return self.site_key
+
+    def get_key_column(self):
+        return self.key_column
+
+    def crawl(self, progress_callback=None, status_callback=None, **kwargs):
+        return self.crawler_func(progress=progress_callback, status_message=status_callback, **kwargs)
+
+    def validate_data(self, data):
+        return not data.empty if data is not None else False
+
+
+def build_crawlers() -> Dict[str, CrawlerInterface]:
+    """사용 가능한 사이트별 크롤러 인스턴스 생성 (레거시 크롤러는 import 가능한 경우에만 포함)"""
+    # 기본 크롤러 (항상 사용 가능)
+    crawlers = {
+        "tax_tribunal": TaxTribunalCrawler(),
+        "nts_authority": NTSAuthorityCrawler(),
+        "nts_precedent": NTSPrecedentCrawler(),
+    }
+
+    if LEGACY_CRAWLERS_AVAILABLE:
+        crawlers.update({
+            "moef": LegacyCrawlerWrapper(
+                "기획재정부", "moef", crawl_moef_site, "문서번호"
+            ),
+            "mois": LegacyCrawlerWrapper(
+                "행정안전부", "mois", crawl_mois_site, "문서번호"
+            ),
+            "bai": LegacyCrawlerWrapper(
+                "감사원", "bai", crawl_bai_site, "문서번호"
+            )
+        })
+        logger.info(f"모든 크롤러 사용 가능: {len(crawlers)}개")
+    else:
+        logger.warning(f"기본 크롤러만 사용 가능: {len(crawlers)}개 (레거시 크롤러 제외)")
+
+    return crawlers
@@ -30,7 +30,7 @@ class TaxTribunalCrawler(BaseCrawler):
         """조세심판원 크롤링 실행"""
         max_pages = kwargs.get('max_pages', self.config["max_pages"])
         
-        self.update_status_safely(status_callback, f"{self.site_name} 크롤링 시작...")
+        self.update_status_safely(status_callback, f"{self.site_name} 크롤링 시작...", stage="start")
         
         all_new_data = []
         total_sections = len(self.sections)
@@ -51,12 +51,13 @@ class TaxTribunalCrawler(BaseCrawler):
             
             self.update_status_safely(
                 status_callback, 
-                f"{self.site_name} 크롤링 완료: {len(combined_data)}개 사례 수집"
+                f"{self.site_name} 크롤링 완료: {len(combined_data)}개 사례 수집",
+                stage="done", items=len(combined_data)
             )
             
             return combined_data
         else:
-            self.update_status_safely(status_callback, f"{self.site_name} 크롤링 결과 없음")
+            self.update_status_safely(status_callback, f"{self.site_name} 크롤링 결과 없음", stage="done", items=0)
             return pd.DataFrame(columns=DATA_COLUMNS[self.site_key])
     
     def _crawl_section(self, section: str, max_pages: int, progress_callback, 
@@ -115,7 +116,9 @@ class TaxTribunalCrawler(BaseCrawler):
                 # 상태 메시지 업데이트
                 self.update_status_safely(
                     status_callback,
-                    f"세목 {current_section_index + 1}/{total_sections} 진행 중: {total_cases}/{total_estimated_cases} 사례"
+                    f"세목 {current_section_index + 1}/{total_sections} 진행 중: {total_cases}/{total_estimated_cases} 사례",
+                    stage="crawling", section=current_section_index + 1, sections=total_sections,
+                    page=page, pages=max_pages, items=total_cases, total_items=total_estimated_cases
                 )
                 
             except Exception as e:
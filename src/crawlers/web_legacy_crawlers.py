@@ -22,6 +22,7 @@ from src.config.settings import (
     URLS, SECTIONS, CRAWLING_CONFIG, 
     BAI_CLAIM_TYPES, SELENIUM_OPTIONS
 )
+from src.utils.crawl_context import register_browser, set_crawl_stage
 
 # 웹 환경용 가짜 progress/status 클래스
 class WebProgress:
@@ -37,6 +38,7 @@ class WebStatus:
     
     def config(self, text):
         self.text = text
+        set_crawl_stage(text)
         print(f"[크롤링 상태] {text}")
     
     def update(self):
@@ -162,6 +164,7 @@ def crawl_mois_site(progress=None, status_message=None, **kwargs):
     for option in SELENIUM_OPTIONS:
         options.add_argument(option)
     driver = webdriver.Chrome(options=options)
+    register_browser(driver)
     
     try:
         driver.get(mois_url)
@@ -316,6 +319,7 @@ def crawl_bai_site(progress=None, status_message=None, **kwargs):
     for option in SELENIUM_OPTIONS:
         options.add_argument(option)
     driver = webdriver.Chrome(options=options)
+    register_browser(driver)
     
     # 청구분야 목록 (조세 관련만) - 실제 사이트 값으로 수정
     claim_types = [
@@ -59,6 +59,10 @@ class DatabaseMigration:
                 # 7. 기존 crawl_metadata 테이블 확장
                 self._extend_crawl_metadata_table(cursor)
                 
+                # 7-1. 스케줄/실행 로그 재시도 관련 컬럼 추가
+                self._extend_crawl_schedules_table(cursor)
+                self._extend_crawl_execution_log_table(cursor)
+                
                 # 8. 인덱스 생성
                 self._create_performance_indexes(cursor)
                 
@@ -342,6 +346,59 @@ class DatabaseMigration:
         except Exception as e:
             self.logger.error(f"crawl_metadata 테이블 확장 실패: {e}")
     
+    def _add_missing_columns(self, cursor: sqlite3.Cursor, table_name: str, new_columns: list):
+        """테이블에 없는 컬럼만 추가"""
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        
+        for column_name, column_def in new_columns:
+            if column_name not in existing_columns:
+                try:
+                    cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_def}")
+                    self.logger.info(f"    컬럼 추가: {table_name}.{column_name}")
+                except sqlite3.Error as e:
+                    self.logger.warning(f"    컬럼 추가 실패 ({table_name}.{column_name}): {e}")
+    
+    def _extend_crawl_schedules_table(self, cursor: sqlite3.Cursor):
+        """crawl_schedules 테이블 확장 (평균 소요시간, 연속 실패 횟수)"""
+        try:
+            self._add_missing_columns(cursor, "crawl_schedules", [
+                ("avg_crawl_time", "INTEGER DEFAULT 0"),  # 평균 크롤링 시간(초)
+                ("consecutive_errors", "INTEGER DEFAULT 0")  # 연속 실패 횟수 (성공 시 0)
+            ])
+            self.logger.info("  ✓ crawl_schedules 테이블 확장 완료")
+        except Exception as e:
+            self.logger.error(f"crawl_schedules 테이블 확장 실패: {e}")
+    
+    def _extend_crawl_execution_log_table(self, cursor: sqlite3.Cursor):
+        """crawl_execution_log 테이블 확장 (사이트별 시도 기록)"""
+        try:
+            self._add_missing_columns(cursor, "crawl_execution_log", [
+                ("site_key", "TEXT"),  # 개별 사이트 실행 시 사이트 키
+                ("attempt", "INTEGER DEFAULT 1"),  # 시도 횟수 (1: 최초 실행, 2~: 재시도)
+                ("error_type", "TEXT")  # 'transient', 'structural', 'unknown'
+            ])
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_crawl_execution_log_site_key 
+                ON crawl_execution_log(site_key, start_time DESC)
+            """)
+            self.logger.info("  ✓ crawl_execution_log 테이블 확장 완료")
+        except Exception as e:
+            self.logger.error(f"crawl_execution_log 테이블 확장 실패: {e}")
+    
+    def apply_schema_updates(self) -> bool:
+        """이미 마이그레이션된 DB에 이후 추가된 컬럼 반영 (시작 시마다 실행, 멱등)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                self._extend_crawl_schedules_table(cursor)
+                self._extend_crawl_execution_log_table(cursor)
+                conn.commit()
+            return True
+        except Exception as e:
+            self.logger.error(f"스키마 업데이트 실패: {e}")
+            return False
+    
     def _create_performance_indexes(self, cursor: sqlite3.Cursor):
         """성능 최적화를 위한 인덱스 생성"""
         indexes = [
@@ -416,7 +473,8 @@ class DatabaseMigration:
         if not os.path.exists(self.db_path):
             return ""
         
-        backup_dir = "data/backups"
+        # 데이터베이스 파일과 같은 디렉토리의 backups (기본 경로면 data/backups)
+        backup_dir = os.path.join(os.path.dirname(self.db_path), "backups")
         if not os.path.exists(backup_dir):
             os.makedirs(backup_dir)
         
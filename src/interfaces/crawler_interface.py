@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import pandas as pd
 
 
@@ -91,6 +91,69 @@ class DataRepositoryInterface(ABC):
         pass
 
 
+class CrawlJobQueueInterface(ABC):
+    """
+    크롤링 작업 큐 인터페이스 - 스케줄러(리더)가 등록하고 크롤링 워커가 가져가 실행
+    
+    작업은 리스(lease)와 함께 할당되며, 워커가 heartbeat로 연장하지 못하면 다시 대기열로 돌아감
+    """
+    
+    @abstractmethod
+    def enqueue(self, site_key: str, is_manual: bool = False, attempt: int = 1,
+                priority: int = 0, timeout_seconds: float = None) -> Optional[int]:
+        """작업 등록 후 작업 ID 반환 (같은 사이트 작업이 대기/실행 중이면 None)"""
+        pass
+    
+    @abstractmethod
+    def claim(self, worker_id: str, sites: List[str] = None) -> Optional[Dict[str, Any]]:
+        """실행할 작업 하나를 리스와 함께 할당 (없으면 None)"""
+        pass
+    
+    @abstractmethod
+    def heartbeat(self, job_id: int, worker_id: str, stage: str = None, progress: float = None) -> bool:
+        """리스 연장 및 진행 상황 기록 (리스를 잃었으면 False)"""
+        pass
+    
+    @abstractmethod
+    def complete(self, job_id: int, worker_id: str, status: str, result: Dict[str, Any] = None,
+                 error_message: str = None, error_type: str = None, stage: str = None) -> bool:
+        """작업 결과 기록 (리스를 잃었으면 False)"""
+        pass
+    
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """리스가 만료된 실행 중 작업을 대기열로 되돌리고 처리한 작업 수 반환"""
+        pass
+    
+    @abstractmethod
+    def collect_finished(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """스케줄러에 아직 보고되지 않은 완료 작업 목록"""
+        pass
+    
+    @abstractmethod
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 상태와 결과 조회 (없으면 None)"""
+        pass
+    
+    @abstractmethod
+    def mark_reported(self, job_id: int) -> None:
+        """완료 작업을 보고 처리됨으로 표시"""
+        pass
+    
+    @abstractmethod
+    def get_status(self) -> Dict[str, Any]:
+        """상태별 작업 수, 실행 중 작업과 워커 목록"""
+        pass
+    
+    def register_worker(self, worker_id: str, concurrency: int, sites: List[str] = None) -> None:
+        """워커 등록 및 생존 신호 갱신 (워커 목록을 관리하지 않는 큐는 무시)"""
+        pass
+    
+    def unregister_worker(self, worker_id: str) -> None:
+        """워커 등록 해제"""
+        pass
+
+
 class UIInterface(ABC):
     """
     UI 인터페이스 - tkinter, Flask, FastAPI 등 다양한 UI 프레임워크 지원
@@ -0,0 +1,204 @@
+import os
+import sqlite3
+import asyncio
+import threading
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
+import sys
+
+import pandas as pd
+
+# 상위 디렉토리 모듈 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.config.settings import ASYNC_DB_CONFIG
+from src.config.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# DB 전용 스레드 풀 (프로세스 전역 공유)
+_db_executor: Optional[ThreadPoolExecutor] = None
+_db_executor_lock = threading.Lock()
+
+# 이벤트 루프별 대기 작업 수 제한 세마포어 (asyncio.run으로 생성된 임시 루프는 종료 시 자동 제거)
+_pending_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# 현재 DB 스레드에서 실행 중인 작업의 취소 이벤트
+_thread_state = threading.local()
+
+
+class QueryCancelledError(Exception):
+    """클라이언트 연결 해제 등으로 DB 작업이 취소된 경우"""
+    pass
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """DB 전용 스레드 풀 반환 (최초 호출 시 생성)"""
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(
+                    max_workers=ASYNC_DB_CONFIG.get("max_workers", 4),
+                    thread_name_prefix="db"
+                )
+    return _db_executor
+
+
+def shutdown_db_executor():
+    """DB 전용 스레드 풀 종료"""
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is not None:
+            _db_executor.shutdown(wait=False)
+            _db_executor = None
+
+
+def _get_pending_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _pending_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ASYNC_DB_CONFIG.get("max_pending", 64))
+        _pending_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _run_with_cancel_event(cancel_event: threading.Event, func: Callable, *args, **kwargs):
+    """DB 스레드에서 취소 이벤트를 등록한 상태로 함수 실행"""
+    if cancel_event.is_set():
+        raise QueryCancelledError("실행 전 취소됨")
+
+    _thread_state.cancel_event = cancel_event
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _thread_state.cancel_event = None
+
+
+def connect_cancellable(db_path: str) -> sqlite3.Connection:
+    """
+    현재 작업의 취소 이벤트에 반응하는 SQLite 연결 생성
+
+    DB 스레드에서 호출되면 progress handler로 취소 여부를 확인하여,
+    클라이언트가 끊긴 경우 실행 중인 쿼리를 'interrupted' 오류로 중단함
+    """
+    conn = sqlite3.connect(db_path)
+    cancel_event = getattr(_thread_state, 'cancel_event', None)
+    if cancel_event is not None:
+        conn.set_progress_handler(lambda: 1 if cancel_event.is_set() else 0, 10000)
+    return conn
+
+
+async def run_in_db_executor(func: Callable, *args, request=None, **kwargs):
+    """
+    동기 DB 함수를 DB 전용 스레드 풀에서 실행
+
+    Args:
+        func: 실행할 동기 함수
+        request: FastAPI Request (지정 시 클라이언트 연결 해제를 감지하여 작업 취소)
+
+    Raises:
+        QueryCancelledError: 클라이언트 연결 해제로 취소된 경우
+    """
+    loop = asyncio.get_running_loop()
+    cancel_event = threading.Event()
+
+    async with _get_pending_semaphore():
+        future = loop.run_in_executor(
+            get_db_executor(),
+            functools.partial(_run_with_cancel_event, cancel_event, func, *args, **kwargs)
+        )
+
+        if request is None:
+            return await future
+
+        watcher = asyncio.ensure_future(_watch_disconnect(request, cancel_event, future))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if cancel_event.is_set():
+                raise QueryCancelledError("클라이언트 연결 해제로 취소됨")
+            raise
+        finally:
+            watcher.cancel()
+
+
+async def _watch_disconnect(request, cancel_event: threading.Event, future: asyncio.Future):
+    """클라이언트 연결 해제 감시 (해제 시 대기 중 작업 취소 + 실행 중 쿼리 중단 신호)"""
+    interval = ASYNC_DB_CONFIG.get("disconnect_poll_interval", 0.5)
+    try:
+        while not future.done():
+            if await request.is_disconnected():
+                cancel_event.set()
+                future.cancel()
+                logger.info("클라이언트 연결 해제 - DB 작업 취소")
+                return
+            await asyncio.sleep(interval)
+    except asyncio.CancelledError:
+        pass
+
+
+class AsyncRepository:
+    """
+    비동기 저장소 파사드
+
+    동기 저장소(SQLiteRepository 등)의 메서드와 임의 SQL 조회를 DB 전용 스레드 풀에서 실행하여
+    FastAPI 이벤트 루프가 sqlite3/pandas 작업으로 블로킹되지 않도록 함
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.db_path = repository.db_path
+
+    async def run(self, func: Callable, *args, request=None, **kwargs):
+        """동기 함수를 DB 스레드 풀에서 실행"""
+        return await run_in_db_executor(func, *args, request=request, **kwargs)
+
+    async def get_statistics(self, site_key: str, request=None) -> Dict[str, Any]:
+        return await self.run(self.repository.get_statistics, site_key, request=request)
+
+    async def get_all_statistics(self, site_keys: List[str], request=None) -> Dict[str, Dict[str, Any]]:
+        """여러 사이트 통계를 한 번의 DB 작업으로 조회"""
+        def _query():
+            return {site_key: self.repository.get_statistics(site_key) for site_key in site_keys}
+        return await self.run(_query, request=request)
+
+    async def load_existing_data(self, site_key: str, include_metadata: bool = False,
+                                 request=None) -> pd.DataFrame:
+        return await self.run(self.repository.load_existing_data, site_key, include_metadata, request=request)
+
+    async def load_filtered_data(self, site_key: str, recent_days: int = None, start_date: str = None,
+                                 end_date: str = None, request=None) -> pd.DataFrame:
+        return await self.run(self.repository.load_filtered_data, site_key, recent_days,
+                              start_date, end_date, request=request)
+
+    async def get_recent_data_counts(self, hours: int = 24, request=None) -> Dict[str, int]:
+        return await self.run(self.repository.get_recent_data_counts, hours, request=request)
+
+    async def get_database_info(self, request=None) -> Dict[str, Any]:
+        return await self.run(self.repository.get_database_info, request=request)
+
+    def _fetch_all(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        conn = connect_cancellable(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    async def fetch_all(self, query: str, params: tuple = (), request=None) -> List[Dict[str, Any]]:
+        """SELECT 실행 후 dict 목록 반환 (연결 해제 시 실행 중 쿼리도 중단)"""
+        return await self.run(self._fetch_all, query, tuple(params), request=request)
+
+    def _execute(self, query: str, params: tuple = ()) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(query, params)
+            return cursor.rowcount
+
+    async def execute(self, query: str, params: tuple = ()) -> int:
+        """쓰기 SQL 실행 후 영향받은 행 수 반환 (쓰기는 연결 해제로 취소하지 않음)"""
+        return await self.run(self._execute, query, tuple(params))
@@ -0,0 +1,259 @@
+import os
+import re
+import shutil
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import sys
+
+import pandas as pd
+
+# 상위 디렉토리 모듈 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.config.settings import SNAPSHOT_CONFIG, DATE_COLUMNS
+from src.config.logging_config import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class ParquetSnapshotRepository:
+    """
+    분석용 Parquet 스냅샷 저장소
+
+    사이트별로 data/snapshots/{site_key}/month=YYYY-MM/*.parquet 형태의
+    월 파티션 컬럼형 스냅샷을 저장하고, 컬럼 프루닝/파티션 필터로 집계 조회.
+    라이브 SQLite DB와 분리되어 분석 쿼리가 크롤링 쓰기와 경쟁하지 않음
+    """
+
+    PARTITION_COLUMN = "month"
+    SEQ_COLUMN = "_seq"
+    UNKNOWN_PARTITION = "unknown"
+
+    def __init__(self, snapshot_folder: str = None):
+        self.snapshot_folder = snapshot_folder or SNAPSHOT_CONFIG["snapshot_folder"]
+        self.compression = SNAPSHOT_CONFIG.get("compression", "zstd")
+        self.logger = get_logger(__name__)
+
+        if not PYARROW_AVAILABLE:
+            self.logger.warning("pyarrow 미설치 - Parquet 스냅샷 기능 비활성화")
+            return
+
+        if not os.path.exists(self.snapshot_folder):
+            os.makedirs(self.snapshot_folder)
+
+    def is_available(self, site_key: str = None) -> bool:
+        """스냅샷 사용 가능 여부 (site_key 지정 시 해당 사이트 스냅샷 존재 여부)"""
+        if not PYARROW_AVAILABLE:
+            return False
+        if site_key is None:
+            return True
+        return os.path.isdir(self._site_path(site_key))
+
+    def _site_path(self, site_key: str) -> str:
+        return os.path.join(self.snapshot_folder, site_key)
+
+    def _partitioning(self):
+        return ds.partitioning(pa.schema([(self.PARTITION_COLUMN, pa.string())]), flavor="hive")
+
+    def _month_partition(self, site_key: str, data: pd.DataFrame) -> pd.Series:
+        """문서 날짜 컬럼에서 YYYY-MM 파티션 값 추출 (2024-01-05, 2024.01.05, 20240105 등 지원)"""
+        date_column = DATE_COLUMNS.get(site_key)
+        if not date_column or date_column not in data.columns:
+            return pd.Series(self.UNKNOWN_PARTITION, index=data.index)
+
+        parts = data[date_column].astype(str).str.extract(r'(\d{4})\D*?(\d{1,2})')
+        month_numbers = pd.to_numeric(parts[1], errors='coerce')
+        valid = parts[0].notna() & month_numbers.between(1, 12)
+
+        months = parts[0].fillna('') + '-' + month_numbers.fillna(0).astype(int).astype(str).str.zfill(2)
+        return months.where(valid, self.UNKNOWN_PARTITION)
+
+    def append(self, site_key: str, data: pd.DataFrame, seqs: Optional[List[int]] = None,
+               batch_tag: str = None) -> int:
+        """
+        데이터프레임을 월 파티션 Parquet 파일로 추가 저장
+
+        Args:
+            site_key: 사이트 키
+            data: 저장할 문서 데이터
+            seqs: 각 행의 CDC 시퀀스 (부트스트랩 시 None → 0)
+            batch_tag: 파일명 구분자 (같은 파티션 내 기존 파일과 겹치지 않도록)
+
+        Returns:
+            저장한 행 수
+        """
+        if not PYARROW_AVAILABLE or data.empty:
+            return 0
+
+        frame = data.drop(columns=[self.PARTITION_COLUMN, self.SEQ_COLUMN], errors='ignore')
+        # 스키마가 파일 간 일관되도록 문서 컬럼은 모두 문자열로 저장
+        frame = frame.astype(object).where(frame.notna(), None).astype('string')
+        frame[self.SEQ_COLUMN] = pd.Series(seqs if seqs is not None else 0, index=frame.index, dtype='int64')
+        frame[self.PARTITION_COLUMN] = self._month_partition(site_key, data)
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        batch_tag = batch_tag or datetime.now().strftime('%Y%m%d%H%M%S%f')
+
+        pq.write_to_dataset(
+            table,
+            root_path=self._site_path(site_key),
+            partition_cols=[self.PARTITION_COLUMN],
+            basename_template=f"part-{batch_tag}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            compression=self.compression
+        )
+
+        self.logger.info(f"[Parquet] {site_key}: {len(frame)}개 행 스냅샷 추가 ({batch_tag})")
+        return len(frame)
+
+    def compact(self, site_key: str, threshold_files: int = None) -> int:
+        """파일 수가 임계값을 넘은 파티션을 단일 파일로 병합 (병합한 파티션 수 반환)"""
+        if not self.is_available(site_key):
+            return 0
+
+        if threshold_files is None:
+            threshold_files = SNAPSHOT_CONFIG.get("compact_threshold_files", 20)
+        compacted = 0
+
+        site_path = self._site_path(site_key)
+        for partition_dir in os.listdir(site_path):
+            partition_path = os.path.join(site_path, partition_dir)
+            if not os.path.isdir(partition_path):
+                continue
+
+            files = [name for name in os.listdir(partition_path) if name.endswith('.parquet')]
+            if len(files) <= max(threshold_files, 1):
+                continue
+
+            try:
+                # 파티션 값은 디렉토리명에 있으므로 파일에는 포함하지 않음
+                table = pq.read_table([os.path.join(partition_path, name) for name in files], partitioning=None)
+                if self.PARTITION_COLUMN in table.column_names:
+                    table = table.drop_columns([self.PARTITION_COLUMN])
+                table = table.sort_by(self.SEQ_COLUMN)
+                temp_file = os.path.join(partition_path, "compact.parquet.tmp")
+                pq.write_table(table, temp_file, compression=self.compression)
+
+                for name in files:
+                    os.remove(os.path.join(partition_path, name))
+                os.replace(temp_file, os.path.join(partition_path, "part-compacted-0.parquet"))
+
+                compacted += 1
+                self.logger.info(f"[Parquet] {site_key}/{partition_dir}: {len(files)}개 파일 병합")
+            except Exception as e:
+                self.logger.error(f"[Parquet] 파티션 병합 실패 ({partition_path}): {e}")
+
+        return compacted
+
+    def clear(self, site_key: str):
+        """사이트 스냅샷 전체 삭제 (재구축용)"""
+        site_path = self._site_path(site_key)
+        if os.path.isdir(site_path):
+            shutil.rmtree(site_path)
+
+    def _month_filter(self, start_month: str = None, end_month: str = None):
+        """월 파티션 필터 식 (파티션 프루닝으로 범위 밖 파일은 열지 않음)"""
+        expression = None
+        month = ds.field(self.PARTITION_COLUMN)
+        if start_month:
+            expression = month >= start_month
+        if end_month:
+            condition = month <= end_month
+            expression = condition if expression is None else expression & condition
+        if expression is not None:
+            # unknown 파티션은 범위 조회에서 제외
+            expression = expression & (month != self.UNKNOWN_PARTITION)
+        return expression
+
+    def _dataset(self, site_key: str):
+        return ds.dataset(self._site_path(site_key), format="parquet", partitioning=self._partitioning())
+
+    def load(self, site_key: str, columns: List[str] = None,
+             start_month: str = None, end_month: str = None) -> pd.DataFrame:
+        """
+        스냅샷 조회 (필요한 컬럼만 읽음)
+
+        Args:
+            columns: 읽을 컬럼 목록 (None이면 전체)
+            start_month, end_month: 'YYYY-MM' 형식 월 범위
+        """
+        if not self.is_available(site_key):
+            return pd.DataFrame(columns=columns or [])
+
+        try:
+            dataset = self._dataset(site_key)
+            if columns:
+                columns = [col for col in columns if col in dataset.schema.names]
+            table = dataset.to_table(columns=columns, filter=self._month_filter(start_month, end_month))
+            return table.to_pandas()
+        except Exception as e:
+            self.logger.error(f"[Parquet] 스냅샷 조회 실패 ({site_key}): {e}")
+            return pd.DataFrame(columns=columns or [])
+
+    def aggregate_counts(self, site_key: str, group_by: List[str] = None,
+                         start_month: str = None, end_month: str = None) -> List[Dict[str, Any]]:
+        """
+        그룹별 문서 수 집계 (예: 세목 × 월 추이)
+
+        group_by 컬럼만 읽어 Arrow에서 직접 집계하므로 전체 테이블을 pandas로 올리지 않음
+        """
+        if not self.is_available(site_key):
+            return []
+
+        group_by = group_by or [self.PARTITION_COLUMN]
+
+        try:
+            dataset = self._dataset(site_key)
+            missing = [col for col in group_by if col not in dataset.schema.names]
+            if missing:
+                raise ValueError(f"존재하지 않는 컬럼: {', '.join(missing)}")
+
+            table = dataset.to_table(columns=group_by, filter=self._month_filter(start_month, end_month))
+            result = table.group_by(group_by).aggregate(
+                [(group_by[0], "count", pc.CountOptions(mode="all"))]
+            )
+            result = result.rename_columns(group_by + ["count"])
+            result = result.sort_by([(col, "ascending") for col in group_by])
+            return result.to_pylist()
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self.logger.error(f"[Parquet] 집계 실패 ({site_key}): {e}")
+            return []
+
+    def get_snapshot_info(self, site_key: str) -> Dict[str, Any]:
+        """사이트 스냅샷 파일/행 수 및 크기 조회 (Parquet 메타데이터만 읽음)"""
+        if not self.is_available(site_key):
+            return {"available": False}
+
+        file_count = 0
+        total_bytes = 0
+        row_count = 0
+        partitions = set()
+
+        for root, _, files in os.walk(self._site_path(site_key)):
+            for name in files:
+                if not name.endswith('.parquet'):
+                    continue
+                file_path = os.path.join(root, name)
+                file_count += 1
+                total_bytes += os.path.getsize(file_path)
+                row_count += pq.ParquetFile(file_path).metadata.num_rows
+                match = re.search(rf'{self.PARTITION_COLUMN}=([^{re.escape(os.sep)}]+)', root)
+                if match:
+                    partitions.add(match.group(1))
+
+        return {
+            "available": True,
+            "row_count": row_count,
+            "file_count": file_count,
+            "partition_count": len(partitions),
+            "size_mb": round(total_bytes / 1024 / 1024, 2)
+        }
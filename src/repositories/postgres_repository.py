@@ -0,0 +1,560 @@
+import os
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import sys
+
+# 상위 디렉토리 모듈 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.interfaces.crawler_interface import DataRepositoryInterface
+from src.config.settings import DATA_COLUMNS, KEY_COLUMNS, POSTGRES_CONFIG
+from src.config.logging_config import get_logger
+
+try:
+    import psycopg
+    from psycopg import sql
+    from psycopg.conninfo import conninfo_to_dict, make_conninfo
+    from psycopg_pool import ConnectionPool
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+
+META_COLUMNS = ['created_at', 'updated_at']
+TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS'
+
+
+class PostgresRepository(DataRepositoryInterface):
+    """
+    PostgreSQL 기반 데이터 저장소
+
+    여러 크롤러 노드와 웹 워커가 하나의 저장소를 공유할 수 있도록
+    SQLiteRepository와 동일한 인터페이스를 PostgreSQL로 구현.
+    - 연결 풀(psycopg_pool)로 연결 재사용
+    - COPY로 임시 스테이징 테이블에 적재 후 INSERT ... ON CONFLICT DO NOTHING으로 중복 제거
+    - 대용량 조회는 서버 사이드 커서로 나누어 읽음
+
+    PostgreSQL로 옮긴 것은 사이트 데이터와 메타데이터(crawl_metadata)뿐이며,
+    모니터링 서비스(스케줄 실행 로그, new_data_log, 알림 아웃박스/다이제스트/스로틀, 최근 문서, 변경 피드)는
+    아직 각 노드의 SQLite 모니터링 DB(db_path)를 사용함 (노드 간 공유되지 않음, 리더 리스/작업 큐만 shared_db로 공유)
+    PostgreSQL 사이트 테이블에는 변경 로그 트리거가 없으므로 스케줄러는 크롤링 결과의 new_count로 새 데이터 수를 판단
+    """
+
+    def __init__(self, dsn: str = None, db_path: str = "data/tax_data.db",
+                 min_size: int = None, max_size: int = None):
+        if not PSYCOPG_AVAILABLE:
+            raise ImportError("psycopg 미설치 - pip install 'psycopg[binary]' psycopg_pool 필요")
+
+        self.dsn = dsn or os.environ.get("DATABASE_URL", "")
+        if not self.dsn:
+            raise ValueError("PostgreSQL 접속 정보(DATABASE_URL)가 없습니다")
+
+        # 모니터링 서비스(SQLite)와 공유하는 경로 (기존 서비스 호환용)
+        self.db_path = db_path
+        self.backup_folder = "data/backups"
+        self.fetch_size = POSTGRES_CONFIG.get("fetch_size", 2000)
+        self.logger = get_logger(__name__)
+
+        if not os.path.exists(self.backup_folder):
+            os.makedirs(self.backup_folder)
+
+        self.pool = ConnectionPool(
+            self.dsn,
+            min_size=min_size or POSTGRES_CONFIG.get("min_pool_size", 1),
+            max_size=max_size or POSTGRES_CONFIG.get("max_pool_size", 10),
+            timeout=POSTGRES_CONFIG.get("pool_timeout", 30),
+            kwargs={"application_name": POSTGRES_CONFIG.get("application_name", "taxupdater")},
+            open=True
+        )
+
+        # 데이터베이스 초기화
+        try:
+            self._initialize_database()
+            self.logger.info(f"PostgreSQL 저장소 초기화 완료: {self._safe_dsn()}")
+            self.logger.warning(f"모니터링/알림/변경 피드는 노드별 SQLite({self.db_path})에 기록됨 - 노드 간 공유되지 않음")
+        except Exception as e:
+            self.logger.error(f"PostgreSQL 저장소 초기화 실패: {e}")
+            self.pool.close()
+            raise
+
+    def close(self):
+        """연결 풀 종료"""
+        self.pool.close()
+
+    def _safe_dsn(self) -> str:
+        """비밀번호를 제외한 접속 정보 (로그/상태 표시용)"""
+        try:
+            params = conninfo_to_dict(self.dsn)
+            params.pop("password", None)
+            return make_conninfo(**params)
+        except Exception:
+            return "postgresql"
+
+    def _table(self, site_key: str):
+        return sql.Identifier(f"{site_key}_data")
+
+    def _initialize_database(self):
+        """데이터베이스 및 테이블 초기화"""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                # updated_at 자동 갱신 함수 (SQLite의 AFTER UPDATE 트리거 대응)
+                cursor.execute("""
+                    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.updated_at = CURRENT_TIMESTAMP;
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql
+                """)
+
+                # 메타데이터 테이블 생성
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS crawl_metadata (
+                        site_key TEXT PRIMARY KEY,
+                        last_crawl TIMESTAMP,
+                        total_records INTEGER DEFAULT 0,
+                        last_backup_path TEXT,
+                        table_name TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                # 각 사이트별 테이블 생성
+                for site_key, columns in DATA_COLUMNS.items():
+                    self._create_site_table(cursor, site_key, columns)
+
+        self.logger.info("PostgreSQL 데이터베이스 초기화 완료")
+
+    def _get_columns(self, cursor, table_name: str) -> List[str]:
+        """현재 스키마의 테이블 컬럼 목록 조회 (테이블 없으면 빈 목록)"""
+        cursor.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s
+            ORDER BY ordinal_position
+        """, (table_name,))
+        return [row[0] for row in cursor.fetchall()]
+
+    def _create_site_table(self, cursor, site_key: str, columns: List[str]):
+        """사이트별 테이블 생성 및 스키마 업데이트"""
+        table_name = f"{site_key}_data"
+        key_column = KEY_COLUMNS.get(site_key, "문서번호")
+
+        column_definitions = []
+        for col in columns:
+            if col == key_column:
+                column_definitions.append(sql.SQL("{} TEXT PRIMARY KEY").format(sql.Identifier(col)))
+            else:
+                column_definitions.append(sql.SQL("{} TEXT").format(sql.Identifier(col)))
+        column_definitions.extend([
+            sql.SQL("created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"),
+            sql.SQL("updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+        ])
+
+        cursor.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {} ({})").format(
+            sql.Identifier(table_name), sql.SQL(', ').join(column_definitions)
+        ))
+
+        self._update_table_schema(cursor, table_name, columns)
+        cursor.execute(sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} (created_at DESC)").format(
+            sql.Identifier(f"idx_{table_name}_created_at"), sql.Identifier(table_name)
+        ))
+
+        cursor.execute("""
+            INSERT INTO crawl_metadata (site_key, table_name, total_records)
+            VALUES (%s, %s, 0)
+            ON CONFLICT (site_key) DO NOTHING
+        """, (site_key, table_name))
+
+        self.logger.info(f"테이블 생성/확인 완료: {table_name} ({len(columns)}개 컬럼)")
+
+    def _update_table_schema(self, cursor, table_name: str, columns: List[str]):
+        """기존 테이블 스키마 업데이트 (필요한 컬럼 추가)"""
+        existing_columns = set(self._get_columns(cursor, table_name))
+
+        for meta_col in META_COLUMNS:
+            if meta_col not in existing_columns:
+                cursor.execute(sql.SQL("ALTER TABLE {} ADD COLUMN IF NOT EXISTS {} TIMESTAMP DEFAULT CURRENT_TIMESTAMP").format(
+                    sql.Identifier(table_name), sql.Identifier(meta_col)
+                ))
+                self.logger.info(f"  컬럼 추가 성공: {meta_col}")
+
+        for col in columns:
+            if col not in existing_columns:
+                cursor.execute(sql.SQL("ALTER TABLE {} ADD COLUMN IF NOT EXISTS {} TEXT").format(
+                    sql.Identifier(table_name), sql.Identifier(col)
+                ))
+                self.logger.info(f"  데이터 컬럼 추가: {col}")
+
+    def _select_list(self, columns: List[str], include_metadata: bool = True):
+        """SELECT 컬럼 목록 (타임스탬프는 SQLite 저장소와 동일한 문자열 형식으로 변환)"""
+        items = []
+        for col in columns:
+            if col in META_COLUMNS:
+                if include_metadata:
+                    items.append(sql.SQL("to_char({col}, {fmt}) AS {col}").format(
+                        col=sql.Identifier(col), fmt=sql.Literal(TIMESTAMP_FORMAT)
+                    ))
+            else:
+                items.append(sql.Identifier(col))
+        return sql.SQL(', ').join(items)
+
+    def _read_dataframe(self, conn, query, params: tuple = (), name: str = "taxupdater_read") -> pd.DataFrame:
+        """서버 사이드 커서로 fetch_size 단위씩 읽어 데이터프레임 생성"""
+        frames = []
+        with conn.cursor(name=name) as cursor:
+            cursor.itersize = self.fetch_size
+            cursor.execute(query, params)
+            columns = [desc.name for desc in cursor.description]
+            while True:
+                rows = cursor.fetchmany(self.fetch_size)
+                if not rows:
+                    break
+                frames.append(pd.DataFrame(rows, columns=columns))
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    def load_existing_data(self, site_key: str, include_metadata: bool = False) -> pd.DataFrame:
+        """기존 데이터 로드"""
+        try:
+            table_name = f"{site_key}_data"
+
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    existing_columns = self._get_columns(cursor, table_name)
+                if not existing_columns:
+                    return self._create_empty_dataframe(site_key)
+
+                query = sql.SQL("SELECT {} FROM {} ORDER BY created_at DESC").format(
+                    self._select_list(existing_columns, include_metadata), sql.Identifier(table_name)
+                )
+                df = self._read_dataframe(conn, query, name=f"load_{site_key}")
+
+            self.logger.info(f"[PostgreSQL] {site_key} 기존 데이터 로드: {len(df)}개")
+            return df
+
+        except Exception as e:
+            self.logger.error(f"데이터 로드 실패 ({site_key}): {e}")
+            return self._create_empty_dataframe(site_key)
+
+    def load_filtered_data(self, site_key: str, recent_days: int = None, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """필터링된 데이터 로드 (시간 기반)"""
+        try:
+            table_name = f"{site_key}_data"
+            where_conditions = []
+            params = []
+
+            if recent_days:
+                # 최근 N일 필터
+                where_conditions.append(sql.SQL("created_at >= CURRENT_TIMESTAMP - make_interval(days => %s)"))
+                params.append(int(recent_days))
+            elif start_date and end_date:
+                # 날짜 범위 필터 (종료일 당일 포함)
+                where_conditions.append(sql.SQL("created_at >= %s::date"))
+                where_conditions.append(sql.SQL("created_at < %s::date + 1"))
+                params.extend([start_date, end_date])
+
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    existing_columns = self._get_columns(cursor, table_name)
+                if not existing_columns:
+                    return self._create_empty_dataframe(site_key)
+
+                query = sql.SQL("SELECT {} FROM {}").format(
+                    self._select_list(existing_columns), sql.Identifier(table_name)
+                )
+                if where_conditions:
+                    query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(where_conditions)
+                query += sql.SQL(" ORDER BY created_at DESC")
+
+                df = self._read_dataframe(conn, query, tuple(params), name=f"filter_{site_key}")
+
+            # 메타데이터 포함 (필터링된 데이터는 항상 메타데이터 포함)
+            self.logger.info(f"[PostgreSQL] {site_key} 필터링된 데이터 로드: {len(df)}개")
+            return df
+
+        except Exception as e:
+            self.logger.error(f"필터링된 데이터 로드 실패 ({site_key}): {e}")
+            return self._create_empty_dataframe(site_key)
+
+    def _to_copy_rows(self, data: pd.DataFrame, columns: List[str]):
+        """COPY 입력 행 생성 (NaN → NULL, 그 외 값은 문자열)"""
+        for row in data[columns].itertuples(index=False, name=None):
+            yield tuple(None if pd.isna(value) else str(value) for value in row)
+
+    def _drop_missing_keys(self, site_key: str, data: pd.DataFrame, key_column: str) -> pd.DataFrame:
+        """키가 비어 있는 행 제외 (키 컬럼은 PRIMARY KEY라 NULL 행이 섞이면 COPY 전체가 실패함)"""
+        missing = data[key_column].isna()
+        if missing.any():
+            self.logger.warning(f"[PostgreSQL] {site_key}: 키({key_column})가 없는 행 {int(missing.sum())}개 제외")
+        return data[~missing]
+
+    def _copy_into(self, cursor, table_name: str, data: pd.DataFrame, columns: List[str]):
+        """COPY FROM STDIN으로 테이블에 일괄 적재"""
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table_name), sql.SQL(', ').join(map(sql.Identifier, columns))
+        )
+        with cursor.copy(copy_sql) as copy:
+            for row in self._to_copy_rows(data, columns):
+                copy.write_row(row)
+
+    def save_data(self, site_key: str, data: pd.DataFrame, is_incremental: bool = True) -> bool:
+        """데이터 저장 (COPY 스테이징 + ON CONFLICT DO NOTHING)"""
+        try:
+            if data.empty:
+                self.logger.info(f"[PostgreSQL] {site_key}: 저장할 데이터가 없음")
+                return True
+
+            table_name = f"{site_key}_data"
+            key_column = KEY_COLUMNS.get(site_key, "문서번호")
+
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    table_columns = self._get_columns(cursor, table_name)
+                    columns = [col for col in data.columns if col in table_columns]
+                    ignored = [col for col in data.columns if col not in table_columns]
+                    if ignored:
+                        self.logger.warning(f"[PostgreSQL] {site_key}: 테이블에 없는 컬럼 제외 {ignored}")
+                    if key_column not in columns:
+                        raise ValueError(f"키 컬럼 없음: {key_column}")
+                    data = self._drop_missing_keys(site_key, data, key_column)
+
+                    if is_incremental:
+                        # 스테이징 테이블에 COPY 후 기존 키와 충돌하지 않는 행만 INSERT
+                        cursor.execute(sql.SQL("""
+                            CREATE TEMP TABLE stage_data (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP
+                        """).format(sql.Identifier(table_name)))
+                        self._copy_into(cursor, "stage_data", data, columns)
+
+                        column_list = sql.SQL(', ').join(map(sql.Identifier, columns))
+                        cursor.execute(sql.SQL("""
+                            INSERT INTO {table} ({columns})
+                            SELECT {columns} FROM stage_data
+                            ON CONFLICT ({key}) DO NOTHING
+                        """).format(
+                            table=sql.Identifier(table_name), columns=column_list,
+                            key=sql.Identifier(key_column)
+                        ))
+                        inserted = cursor.rowcount
+                        self._update_metadata(cursor, site_key, inserted)
+                        self.logger.info(f"[PostgreSQL] {site_key}: {inserted}/{len(data)}개 신규 항목 저장 완료")
+                    else:
+                        # 전체 교체 (같은 트랜잭션 내 TRUNCATE + COPY)
+                        cursor.execute(sql.SQL("TRUNCATE {}").format(sql.Identifier(table_name)))
+                        self._copy_into(cursor, table_name, data, columns)
+                        self._update_metadata(cursor, site_key, len(data), replace=True)
+                        self.logger.info(f"[PostgreSQL] {site_key}: {len(data)}개 항목 전체 저장 완료")
+
+            return True
+
+        except Exception as e:
+            self.logger.error(f"데이터 저장 실패 ({site_key}): {e}")
+            return False
+
+    def compare_and_get_new_entries(self, site_key: str, new_data: pd.DataFrame, key_column: str) -> pd.DataFrame:
+        """신규 데이터 추출 (키만 COPY하여 서버에서 비교)"""
+        try:
+            if new_data.empty:
+                return new_data
+
+            table_name = f"{site_key}_data"
+
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("CREATE TEMP TABLE stage_keys (key TEXT) ON COMMIT DROP")
+                    keys = new_data[[key_column]].rename(columns={key_column: "key"})
+                    self._copy_into(cursor, "stage_keys", keys, ["key"])
+
+                    cursor.execute(sql.SQL("""
+                        SELECT DISTINCT s.key FROM stage_keys s
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM {table} existing WHERE existing.{key} = s.key
+                        )
+                    """).format(table=sql.Identifier(table_name), key=sql.Identifier(key_column)))
+                    new_keys = {row[0] for row in cursor.fetchall()}
+
+            new_entries = new_data[new_data[key_column].astype(str).isin(new_keys)]
+
+            self.logger.info(f"[PostgreSQL] {site_key} 데이터 비교:")
+            self.logger.info(f"  새 데이터: {len(new_data)}개")
+            self.logger.info(f"  신규 항목: {len(new_entries)}개")
+
+            return new_entries
+
+        except Exception as e:
+            self.logger.error(f"신규 데이터 추출 실패 ({site_key}): {e}")
+            # 폴백: pandas 방식
+            existing_data = self.load_existing_data(site_key)
+            if existing_data.empty:
+                return new_data
+
+            new_entries = new_data[~new_data[key_column].isin(existing_data[key_column])]
+            self.logger.info(f"[Fallback] {site_key}: {len(new_entries)}개 신규 항목")
+            return new_entries
+
+    def backup_data(self, site_key: str, data: pd.DataFrame) -> str:
+        """데이터 백업"""
+        try:
+            if data.empty:
+                return ""
+
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_file = os.path.join(self.backup_folder, f"{site_key}_backup_{timestamp}.xlsx")
+
+            data.to_excel(backup_file, index=False)
+
+            # 메타데이터에 백업 경로 저장
+            with self.pool.connection() as conn:
+                conn.execute("""
+                    UPDATE crawl_metadata
+                    SET last_backup_path = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE site_key = %s
+                """, (backup_file, site_key))
+
+            self.logger.info(f"[PostgreSQL] 백업 완료: {backup_file}")
+            return backup_file
+
+        except Exception as e:
+            self.logger.error(f"백업 실패 ({site_key}): {e}")
+            return ""
+
+    def get_statistics(self, site_key: str) -> Dict[str, Any]:
+        """데이터 통계 정보 반환"""
+        try:
+            table_name = f"{site_key}_data"
+
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql.SQL("""
+                        SELECT COUNT(*),
+                               to_char(MIN(created_at), {fmt}),
+                               to_char(MAX(created_at), {fmt})
+                        FROM {}
+                    """).format(sql.Identifier(table_name), fmt=sql.Literal(TIMESTAMP_FORMAT)))
+                    total_count, earliest, latest = cursor.fetchone()
+
+                    cursor.execute(sql.SQL("""
+                        SELECT to_char(last_crawl, {fmt}), last_backup_path
+                        FROM crawl_metadata WHERE site_key = %s
+                    """).format(fmt=sql.Literal(TIMESTAMP_FORMAT)), (site_key,))
+                    meta_result = cursor.fetchone()
+
+                    cursor.execute("SELECT pg_database_size(current_database())")
+                    database_size = cursor.fetchone()[0]
+
+            stats = {
+                "total_count": total_count,
+                "last_updated": latest,
+                "last_crawl": meta_result[0] if meta_result else None,
+                "last_backup": meta_result[1] if meta_result else None,
+                "database_size_mb": round(database_size / 1024 / 1024, 2),
+                "hot_count": total_count,
+                "archived_count": 0
+            }
+            if total_count > 0:
+                stats["data_range"] = {"earliest": earliest, "latest": latest}
+
+            return stats
+
+        except Exception as e:
+            self.logger.error(f"통계 정보 조회 실패 ({site_key}): {e}")
+            return {"total_count": 0, "last_updated": None, "error": str(e)}
+
+    def _update_metadata(self, cursor, site_key: str, added_count: int, replace: bool = False):
+        """메타데이터 업데이트"""
+        if replace:
+            cursor.execute("""
+                UPDATE crawl_metadata
+                SET total_records = %s, last_crawl = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                WHERE site_key = %s
+            """, (added_count, site_key))
+        else:
+            cursor.execute("""
+                UPDATE crawl_metadata
+                SET total_records = total_records + %s, last_crawl = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                WHERE site_key = %s
+            """, (added_count, site_key))
+
+    def _create_empty_dataframe(self, site_key: str) -> pd.DataFrame:
+        """빈 데이터프레임 생성"""
+        columns = DATA_COLUMNS.get(site_key, [])
+        return pd.DataFrame(columns=columns)
+
+    def get_database_info(self) -> Dict[str, Any]:
+        """데이터베이스 전체 정보 반환"""
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT table_name FROM information_schema.tables
+                        WHERE table_schema = current_schema() AND table_type = 'BASE TABLE'
+                        ORDER BY table_name
+                    """)
+                    tables = [row[0] for row in cursor.fetchall()]
+
+                    # 각 테이블별 레코드 수
+                    table_stats = {}
+                    for table in tables:
+                        if table != 'crawl_metadata':
+                            cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table)))
+                            table_stats[table] = cursor.fetchone()[0]
+
+                    cursor.execute("SELECT pg_database_size(current_database())")
+                    database_size = cursor.fetchone()[0]
+
+            return {
+                "database_path": self._safe_dsn(),
+                "database_size_mb": round(database_size / 1024 / 1024, 2),
+                "tables": table_stats,
+                "total_records": sum(table_stats.values())
+            }
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    def get_recent_data_counts(self, hours: int = 24) -> Dict[str, int]:
+        """각 사이트별 최근 데이터 개수 조회 (단일 쿼리)"""
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT table_name FROM information_schema.tables
+                        WHERE table_schema = current_schema() AND table_name = ANY(%s)
+                    """, ([f"{site_key}_data" for site_key in DATA_COLUMNS.keys()],))
+                    existing_tables = {row[0] for row in cursor.fetchall()}
+
+                    counts = {site_key: 0 for site_key in DATA_COLUMNS.keys()}
+                    queries = [
+                        sql.SQL("SELECT {site}, COUNT(*) FROM {table} WHERE created_at >= CURRENT_TIMESTAMP - make_interval(hours => %(hours)s)").format(
+                            site=sql.Literal(site_key), table=sql.Identifier(f"{site_key}_data")
+                        )
+                        for site_key in DATA_COLUMNS.keys() if f"{site_key}_data" in existing_tables
+                    ]
+                    if queries:
+                        cursor.execute(sql.SQL(" UNION ALL ").join(queries), {"hours": int(hours)})
+                        counts.update({row[0]: row[1] for row in cursor.fetchall()})
+
+            self.logger.info(f"[PostgreSQL] 최근 {hours}시간 데이터 개수 조회 완료: {counts}")
+            return counts
+
+        except Exception as e:
+            self.logger.error(f"최근 데이터 개수 조회 실패: {e}")
+            return {}
+
+    def force_schema_update(self):
+        """강제 스키마 업데이트 (수동 실행용)"""
+        try:
+            self.logger.info("강제 스키마 업데이트 시작...")
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    for site_key, columns in DATA_COLUMNS.items():
+                        self._create_site_table(cursor, site_key, columns)
+
+            self.logger.info("강제 스키마 업데이트 완료")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"강제 스키마 업데이트 실패: {e}")
+            return False
@@ -1,7 +1,7 @@
 import os
 import sqlite3
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import sys
 import json
@@ -61,6 +61,9 @@ class SQLiteRepository(DataRepositoryInterface):
                     )
                 """)
                 
+                # 변경 데이터 캡처(CDC) 테이블 생성
+                self._create_change_log_tables(cursor)
+                
                 # 각 사이트별 테이블 생성
                 for site_key, columns in DATA_COLUMNS.items():
                     self._create_site_table(cursor, site_key, columns)
@@ -114,6 +117,9 @@ class SQLiteRepository(DataRepositoryInterface):
         # 인덱스 생성 (컬럼 존재 확인 후)
         self._create_indexes_safely(cursor, table_name)
         
+        # 신규 INSERT 시퀀스 기록용 트리거 생성
+        self._create_change_capture_trigger(cursor, site_key, table_name)
+        
         # 메타데이터 테이블에 정보 저장
         cursor.execute("""
             INSERT OR REPLACE INTO crawl_metadata (site_key, table_name, total_records)
@@ -177,8 +183,146 @@ class SQLiteRepository(DataRepositoryInterface):
         except Exception as e:
             self.logger.error(f"인덱스 생성 오류 ({table_name}): {e}")
     
-    def load_existing_data(self, site_key: str, include_metadata: bool = False) -> pd.DataFrame:
-        """기존 데이터 로드"""
+    def _create_change_log_tables(self, cursor: sqlite3.Cursor):
+        """변경 데이터 캡처(CDC) 로그 및 소비자 커서 테이블 생성"""
+        # seq는 AUTOINCREMENT로 삭제 후에도 재사용되지 않는 단조 증가 시퀀스
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS data_change_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                site_key TEXT NOT NULL,
+                data_id TEXT NOT NULL,
+                operation TEXT DEFAULT 'insert',
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_data_change_log_site_seq 
+            ON data_change_log(site_key, seq)
+        """)
+        
+        # 소비자(이메일, WebSocket, 내보내기, 외부 연동)별 마지막 처리 시퀀스
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS change_feed_cursors (
+                consumer_id TEXT PRIMARY KEY,
+                last_seq INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+    
+    def _create_change_capture_trigger(self, cursor: sqlite3.Cursor, site_key: str, table_name: str):
+        """사이트 테이블 INSERT 시 data_change_log에 시퀀스를 기록하는 트리거 생성"""
+        try:
+            key_column = KEY_COLUMNS.get(site_key, "문서번호")
+            
+            cursor.execute(f"PRAGMA table_info([{table_name}])")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            if key_column not in existing_columns:
+                self.logger.warning(f"  키 컬럼 없음, CDC 트리거 생성 건너뜀: {table_name}")
+                return
+            
+            # INSERT OR IGNORE로 무시된 행은 트리거가 실행되지 않으므로 실제 신규 행만 기록됨
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS cdc_{table_name}_insert
+                AFTER INSERT ON [{table_name}]
+                BEGIN
+                    INSERT INTO data_change_log (site_key, data_id)
+                    VALUES ('{site_key}', NEW.[{key_column}]);
+                END
+            """)
+        except Exception as e:
+            self.logger.error(f"CDC 트리거 생성 오류 ({table_name}): {e}")
+    
+    def get_latest_change_seq(self, site_key: str = None) -> int:
+        """마지막 변경 시퀀스 조회 (사이트 지정 시 해당 사이트 기준)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if site_key:
+                    cursor.execute(
+                        "SELECT MAX(seq) FROM data_change_log WHERE site_key = ?", (site_key,)
+                    )
+                else:
+                    cursor.execute("SELECT MAX(seq) FROM data_change_log")
+                result = cursor.fetchone()
+                return result[0] or 0
+        except Exception as e:
+            self.logger.error(f"변경 시퀀스 조회 실패: {e}")
+            return 0
+    
+    def _get_archives(self, conn: sqlite3.Connection, table_name: str,
+                      since: str = None, until: str = None) -> List[Dict[str, Any]]:
+        """
+        archive_manifest에서 테이블의 아카이브 목록 조회 (최신 연도 우선)
+
+        since/until이 주어지면 [min_time, max_time]이 조회 범위와 겹치는 아카이브만 반환
+        """
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT archive_year, archive_path, row_count, min_time, max_time
+                FROM archive_manifest
+                WHERE table_name = ? AND row_count > 0
+                ORDER BY archive_year DESC
+            """, (table_name,))
+            columns = [desc[0] for desc in cursor.description]
+            archives = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except sqlite3.OperationalError:
+            # 아카이브를 한 번도 실행하지 않은 경우 (manifest 테이블 없음)
+            return []
+        
+        return [
+            archive for archive in archives
+            if os.path.exists(archive['archive_path'])
+            and not (since and archive['max_time'] and archive['max_time'] < since)
+            and not (until and archive['min_time'] and archive['min_time'] > until)
+        ]
+    
+    def _concat_archive_data(self, conn: sqlite3.Connection, table_name: str, hot_df: pd.DataFrame,
+                             query: str, since: str = None, until: str = None) -> pd.DataFrame:
+        """hot 조회 쿼리를 각 아카이브 DB에 ATTACH하여 동일하게 실행한 뒤 결과 병합"""
+        archives = self._get_archives(conn, table_name, since, until)
+        if not archives:
+            return hot_df
+        
+        frames = [hot_df]
+        archive_query = query.replace(f"FROM [{table_name}]", f"FROM archive_db.[{table_name}]", 1)
+        
+        for archive in archives:
+            conn.execute("ATTACH DATABASE ? AS archive_db", (archive['archive_path'],))
+            try:
+                frames.append(pd.read_sql_query(archive_query, conn))
+            except Exception as e:
+                self.logger.warning(f"아카이브 조회 실패 ({archive['archive_path']}): {e}")
+            finally:
+                conn.execute("DETACH DATABASE archive_db")
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return hot_df
+        
+        df = pd.concat(frames, ignore_index=True)
+        self.logger.info(f"[SQLite] {table_name} 아카이브 {len(archives)}개 병합: 총 {len(df)}개")
+        return df
+    
+    def _exclude_archived_keys(self, conn: sqlite3.Connection, table_name: str,
+                               temp_table: str, key_column: str):
+        """임시 테이블에서 아카이브 계층에 이미 존재하는 키 삭제"""
+        for archive in self._get_archives(conn, table_name):
+            conn.execute("ATTACH DATABASE ? AS archive_db", (archive['archive_path'],))
+            try:
+                conn.execute(f"""
+                    DELETE FROM [{temp_table}]
+                    WHERE [{key_column}] IN (
+                        SELECT [{key_column}] FROM archive_db.[{table_name}]
+                    )
+                """)
+                conn.commit()
+            finally:
+                conn.execute("DETACH DATABASE archive_db")
+    
+    def load_existing_data(self, site_key: str, include_metadata: bool = False,
+                           include_archive: bool = True) -> pd.DataFrame:
+        """기존 데이터 로드 (include_archive: 아카이브 계층 포함 여부)"""
         try:
             table_name = f"{site_key}_data"
             
@@ -201,6 +345,10 @@ class SQLiteRepository(DataRepositoryInterface):
                 
                 df = pd.read_sql_query(query, conn)
                 
+                # 아카이브 계층 데이터 병합 (아카이브는 hot 데이터보다 오래된 행만 보관)
+                if include_archive:
+                    df = self._concat_archive_data(conn, table_name, df, query)
+                
                 # 메타데이터 컬럼 제거 (선택적)
                 if not include_metadata:
                     meta_columns = ['created_at', 'updated_at']
@@ -228,6 +376,9 @@ class SQLiteRepository(DataRepositoryInterface):
                 base_query = f"SELECT * FROM [{table_name}]"
                 where_conditions = []
                 
+                # 아카이브 조회 범위 (시간 필터와 겹치는 아카이브만 ATTACH)
+                archive_since = archive_until = None
+                
                 # 시간 필터 적용
                 if 'created_at' in existing_columns or 'updated_at' in existing_columns:
                     time_column = 'created_at' if 'created_at' in existing_columns else 'updated_at'
@@ -235,10 +386,12 @@ class SQLiteRepository(DataRepositoryInterface):
                     if recent_days:
                         # 최근 N일 필터
                         where_conditions.append(f"{time_column} >= datetime('now', '-{recent_days} days')")
+                        archive_since = (datetime.now() - timedelta(days=recent_days)).strftime('%Y-%m-%d')
                     elif start_date and end_date:
                         # 날짜 범위 필터
                         where_conditions.append(f"{time_column} >= '{start_date}'")
                         where_conditions.append(f"{time_column} <= '{end_date} 23:59:59'")
+                        archive_since, archive_until = start_date, f"{end_date} 23:59:59"
                 else:
                     self.logger.warning(f"[SQLite] {site_key}: 시간 컬럼이 없어 전체 데이터 반환")
                 
@@ -255,6 +408,7 @@ class SQLiteRepository(DataRepositoryInterface):
                     query += " ORDER BY updated_at DESC"
                 
                 df = pd.read_sql_query(query, conn)
+                df = self._concat_archive_data(conn, table_name, df, query, archive_since, archive_until)
                 
                 # 메타데이터 포함 (필터링된 데이터는 항상 메타데이터 포함)
                 self.logger.info(f"[SQLite] {site_key} 필터링된 데이터 로드: {len(df)}개")
@@ -314,6 +468,9 @@ class SQLiteRepository(DataRepositoryInterface):
                         data['updated_at'] = timestamp
                     
                     data.to_sql(table_name, conn, if_exists='replace', index=False, method='multi')
+                    
+                    # 테이블 교체 시 트리거가 함께 삭제되므로 재생성
+                    self._create_change_capture_trigger(conn.cursor(), site_key, table_name)
                     self._update_metadata(conn, site_key, len(data), replace=True)
                     self.logger.info(f"[SQLite] {site_key}: {len(data)}개 항목 전체 저장 완료")
                 
@@ -338,6 +495,9 @@ class SQLiteRepository(DataRepositoryInterface):
                 # 임시 테이블에 새 데이터 저장
                 new_data.to_sql(temp_table, conn, if_exists='replace', index=False)
                 
+                # 아카이브 계층에 이미 있는 키 제외 (아카이브된 문서의 재삽입 방지)
+                self._exclude_archived_keys(conn, table_name, temp_table, key_column)
+                
                 # SQL JOIN을 사용한 고성능 신규 데이터 추출
                 query = f"""
                     SELECT temp.*
@@ -405,7 +565,12 @@ class SQLiteRepository(DataRepositoryInterface):
                 
                 # 기본 통계
                 cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-                total_count = cursor.fetchone()[0]
+                hot_count = cursor.fetchone()[0]
+                
+                # 아카이브 통계 (archive_manifest 기준, 아카이브 파일은 열지 않음)
+                archives = self._get_archives(conn, table_name)
+                archived_count = sum(archive['row_count'] for archive in archives)
+                total_count = hot_count + archived_count
                 
                 # 메타데이터 조회
                 cursor.execute("""
@@ -417,7 +582,7 @@ class SQLiteRepository(DataRepositoryInterface):
                 
                 # 실제 데이터의 최신 업데이트 시간 조회
                 actual_last_updated = None
-                if total_count > 0:
+                if hot_count > 0:
                     # 컬럼 존재 확인
                     cursor.execute(f"PRAGMA table_info([{table_name}])")
                     existing_columns = {row[1] for row in cursor.fetchall()}
@@ -433,11 +598,13 @@ class SQLiteRepository(DataRepositoryInterface):
                     "last_updated": actual_last_updated,  # 실제 데이터의 최신 시간 사용
                     "last_crawl": meta_result[0] if meta_result else None,
                     "last_backup": meta_result[1] if meta_result else None,
-                    "database_size_mb": round(os.path.getsize(self.db_path) / 1024 / 1024, 2)
+                    "database_size_mb": round(os.path.getsize(self.db_path) / 1024 / 1024, 2),
+                    "hot_count": hot_count,
+                    "archived_count": archived_count
                 }
                 
                 # 최신/오래된 데이터 조회 (created_at 컬럼이 있는 경우에만)
-                if total_count > 0:
+                if hot_count > 0:
                     # 컬럼 존재 확인
                     cursor.execute(f"PRAGMA table_info([{table_name}])")
                     existing_columns = {row[1] for row in cursor.fetchall()}
@@ -448,6 +615,8 @@ class SQLiteRepository(DataRepositoryInterface):
                             FROM [{table_name}]
                         """)
                         earliest, latest = cursor.fetchone()
+                        if archives:
+                            earliest = min(archive['min_time'] for archive in archives if archive['min_time']) or earliest
                         stats["data_range"] = {
                             "earliest": earliest,
                             "latest": latest
@@ -0,0 +1,296 @@
+"""
+적응형 크롤링 스케줄 서비스
+사이트별 신규 문서 도착 패턴(요일 x 시간대)을 학습하여 다음 크롤링 시각을 결정
+"""
+
+import os
+import bisect
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from apscheduler.triggers.cron import CronTrigger
+import pytz
+
+from src.config.settings import ADAPTIVE_SCHEDULE_CONFIG
+from src.config.logging_config import get_logger
+
+
+HOURS_PER_WEEK = 7 * 24
+
+
+def _bucket(moment: datetime) -> int:
+    """요일 x 시간 버킷 번호 (월요일 0시 = 0)"""
+    return moment.weekday() * 24 + moment.hour
+
+
+def _next_hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+
+@dataclass
+class ArrivalModel:
+    """사이트의 요일 x 시간대별 시간당 신규 문서 도착률"""
+    site_key: str
+    rates: List[float] = field(default_factory=lambda: [0.0] * HOURS_PER_WEEK)
+    observations: int = 0
+    weeks_observed: float = 0.0
+
+    @property
+    def weekly_arrivals(self) -> float:
+        return sum(self.rates)
+
+    def expected_arrivals(self, start: datetime, end: datetime) -> float:
+        """start~end 사이 예상 도착 건수 (시간 버킷별 구간 적분)"""
+        total = 0.0
+        cursor = start
+        while cursor < end:
+            segment_end = min(_next_hour(cursor), end)
+            total += self.rates[_bucket(cursor)] * (segment_end - cursor).total_seconds() / 3600
+            cursor = segment_end
+        return total
+
+    def delay_mass(self, start: datetime, end: datetime) -> float:
+        """
+        start~end 사이 도착 문서가 end 시점 크롤링에서 발견될 때까지의 지연 합 (건 x 시간)
+
+        구간 [s, e]의 도착률 r에 대해 ∫ r (end - t) dt = r ((end-s)² - (end-e)²) / 2
+        """
+        total = 0.0
+        cursor = start
+        while cursor < end:
+            segment_end = min(_next_hour(cursor), end)
+            head = (end - cursor).total_seconds() / 3600
+            tail = (end - segment_end).total_seconds() / 3600
+            total += self.rates[_bucket(cursor)] * (head * head - tail * tail) / 2
+            cursor = segment_end
+        return total
+
+
+class AdaptiveScheduleService:
+    """
+    적응형 크롤링 스케줄 서비스 클래스
+
+    - new_data_log의 발견 시각과 crawl_execution_log의 직전 성공 크롤링 시각으로
+      각 문서가 실제로 게시되었을 수 있는 구간을 구하고, 그 구간의 시간 버킷에 균등 분배하여 도착률 학습
+      (발견 시각은 크롤링 시각에 몰리므로 그대로 쓰면 기존 스케줄을 다시 학습하게 됨)
+    - 직전 크롤링 이후 누적 예상 도착 건수가 target_arrivals_per_crawl에 도달하는 시각에 다음 크롤링 실행
+      (최소/최대 간격 범위 내) → 게시가 잦은 시간대에 크롤링을 집중하고, 뜸한 시간대에는 간격을 늘림
+    - 향후 1주일 계획의 예상 탐지 지연과 크롤링 횟수를 기존 고정 스케줄과 비교하여 보고
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None,
+                 timezone=None):
+        self.db_path = db_path
+        self.config = {**ADAPTIVE_SCHEDULE_CONFIG, **(config or {})}
+        self.timezone = timezone or pytz.timezone('Asia/Seoul')
+        self.logger = get_logger(__name__)
+        self._models: Dict[str, ArrivalModel] = {}
+
+    @property
+    def min_interval(self) -> timedelta:
+        return timedelta(minutes=self.config["min_interval_minutes"])
+
+    @property
+    def max_interval(self) -> timedelta:
+        return timedelta(hours=self.config["max_interval_hours"])
+
+    def is_enabled_for(self, site_key: str) -> bool:
+        """적응형 모드 사용 여부 (설정 활성화 + 대상 사이트 + 학습 데이터 충분)"""
+        if not self.config.get("enabled", False):
+            return False
+        sites = self.config.get("sites")
+        if sites and site_key not in sites:
+            return False
+        return self.get_model(site_key).observations >= self.config["min_observations"]
+
+    def get_model(self, site_key: str, refresh: bool = False) -> ArrivalModel:
+        if refresh or site_key not in self._models:
+            self._models[site_key] = self.learn_arrival_rates(site_key)
+        return self._models[site_key]
+
+    def learn_arrival_rates(self, site_key: str, now: datetime = None) -> ArrivalModel:
+        """new_data_log에서 사이트 도착률 학습"""
+        now = now or datetime.now()
+        since = now - timedelta(days=self.config["lookback_days"])
+        model = ArrivalModel(site_key)
+
+        try:
+            discoveries, crawl_times = self._load_history(site_key, since)
+        except Exception as e:
+            self.logger.error(f"도착 이력 조회 실패 ({site_key}): {e}")
+            return model
+
+        if not discoveries:
+            return model
+
+        mass = [0.0] * HOURS_PER_WEEK
+        for discovered_at in discoveries:
+            index = bisect.bisect_left(crawl_times, discovered_at)
+            previous = crawl_times[index - 1] if index > 0 else None
+            # 직전 크롤링을 알 수 없거나 너무 오래전이면 최대 간격 구간으로 제한
+            if previous is None or discovered_at - previous > self.max_interval:
+                previous = discovered_at - self.max_interval
+            self._spread(mass, previous, discovered_at)
+
+        first_seen = min(discoveries[0], crawl_times[0]) if crawl_times else discoveries[0]
+        weeks = max((now - max(since, first_seen)).total_seconds() / (7 * 86400), 1 / 7)
+
+        # 관측 주 수가 적은 버킷은 사이트 평균 도착률 쪽으로 수축 (prior_weight_weeks 만큼의 가상 관측)
+        prior_weeks = self.config["prior_weight_weeks"]
+        mean_rate = sum(mass) / HOURS_PER_WEEK / weeks
+        model.rates = [(m + prior_weeks * mean_rate) / (weeks + prior_weeks) for m in mass]
+        model.observations = len(discoveries)
+        model.weeks_observed = round(weeks, 2)
+        return model
+
+    def _load_history(self, site_key: str, since: datetime) -> Tuple[List[datetime], List[datetime]]:
+        """신규 문서 발견 시각과 사이트의 성공 크롤링 종료 시각 (모두 오름차순)"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT discovered_at FROM new_data_log
+                WHERE site_key = ? AND discovered_at >= ?
+                ORDER BY discovered_at
+            """, (site_key, since.isoformat()))
+            discoveries = [self._parse_time(row[0]) for row in cursor.fetchall()]
+
+            cursor.execute("""
+                SELECT end_time FROM crawl_execution_log
+                WHERE status IN ('success', 'partial_success') AND end_time >= ?
+                  AND (site_key = ? OR (site_key IS NULL AND site_results LIKE ?))
+                ORDER BY end_time
+            """, (since.isoformat(), site_key, f'%"{site_key}"%'))
+            crawl_times = [self._parse_time(row[0]) for row in cursor.fetchall()]
+
+        return ([t for t in discoveries if t is not None],
+                [t for t in crawl_times if t is not None])
+
+    @staticmethod
+    def _parse_time(value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value).replace('T', ' ')).replace(tzinfo=None)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _spread(mass: List[float], start: datetime, end: datetime):
+        """문서 1건의 도착 확률을 start~end 구간의 시간 버킷에 시간 비례로 분배"""
+        span = (end - start).total_seconds()
+        if span <= 0:
+            mass[_bucket(end)] += 1.0
+            return
+
+        cursor = start
+        while cursor < end:
+            segment_end = min(_next_hour(cursor), end)
+            mass[_bucket(cursor)] += (segment_end - cursor).total_seconds() / span
+            cursor = segment_end
+
+    def plan_next_crawl(self, site_key: str, last_crawl: datetime = None) -> datetime:
+        """
+        다음 크롤링 시각 계산
+
+        last_crawl 이후 예상 도착 건수가 target_arrivals_per_crawl에 도달하는 시각
+        (min_interval 이상, max_interval 이하)
+        """
+        model = self.get_model(site_key)
+        return self._plan_next(model, last_crawl or datetime.now())
+
+    def _plan_next(self, model: ArrivalModel, last_crawl: datetime) -> datetime:
+        target = self.config["target_arrivals_per_crawl"]
+        earliest = last_crawl + self.min_interval
+        latest = last_crawl + self.max_interval
+
+        accumulated = model.expected_arrivals(last_crawl, earliest)
+        cursor = earliest
+        while cursor < latest and accumulated < target:
+            segment_end = min(_next_hour(cursor), latest)
+            rate = model.rates[_bucket(cursor)]
+            segment = rate * (segment_end - cursor).total_seconds() / 3600
+            if rate > 0 and accumulated + segment >= target:
+                return cursor + timedelta(hours=(target - accumulated) / rate)
+            accumulated += segment
+            cursor = segment_end
+        return cursor
+
+    def _evaluate(self, model: ArrivalModel, crawl_times: List[datetime],
+                  start: datetime, end: datetime) -> Dict[str, Any]:
+        """주어진 크롤링 시각 목록의 예상 탐지 지연(시간)과 크롤링 횟수"""
+        crawl_times = sorted(t for t in crawl_times if start < t <= end)
+        arrivals = 0.0
+        delay = 0.0
+        previous = start
+        for crawl_time in crawl_times:
+            arrivals += model.expected_arrivals(previous, crawl_time)
+            delay += model.delay_mass(previous, crawl_time)
+            previous = crawl_time
+
+        return {
+            "crawls_per_week": len(crawl_times),
+            "expected_detection_latency_hours": round(delay / arrivals, 2) if arrivals > 0 else None
+        }
+
+    def _fixed_schedule_times(self, cron_expressions: List[str], start: datetime,
+                              end: datetime) -> List[datetime]:
+        """기존 고정 스케줄(사이트 cron + 전체 크롤링)의 실행 시각 목록 (로컬 시각)"""
+        times = set()
+        for expression in cron_expressions:
+            try:
+                trigger = CronTrigger.from_crontab(expression, timezone=self.timezone)
+            except ValueError:
+                continue
+            fire_time = trigger.get_next_fire_time(None, start.astimezone(self.timezone))
+            while fire_time:
+                local_time = fire_time.astimezone().replace(tzinfo=None)
+                if local_time > end:
+                    break
+                times.add(local_time)
+                fire_time = trigger.get_next_fire_time(fire_time, fire_time + timedelta(seconds=1))
+        return sorted(times)
+
+    def get_site_report(self, site_key: str, cron_expression: str = None,
+                        now: datetime = None) -> Dict[str, Any]:
+        """
+        사이트 적응형 스케줄 보고서
+
+        향후 1주일 동안 적응형 계획과 기존 고정 스케줄의 크롤링 횟수/예상 탐지 지연 비교
+        """
+        now = now or datetime.now()
+        end = now + timedelta(days=7)
+        model = self.get_model(site_key, refresh=True)
+
+        adaptive_times = []
+        cursor = now
+        while cursor < end:
+            cursor = self._plan_next(model, cursor)
+            adaptive_times.append(cursor)
+
+        fixed_crons = [cron_expression] if cron_expression else []
+        if self.config.get("all_sites_crawl_cron"):
+            fixed_crons.append(self.config["all_sites_crawl_cron"])
+        fixed_times = self._fixed_schedule_times(fixed_crons, now, end)
+
+        by_weekday = [round(sum(model.rates[day * 24:(day + 1) * 24]), 2) for day in range(7)]
+        peak_hours = sorted(range(HOURS_PER_WEEK), key=lambda b: model.rates[b], reverse=True)[:5]
+
+        return {
+            "site_key": site_key,
+            "adaptive_active": self.is_enabled_for(site_key),
+            "observations": model.observations,
+            "weeks_observed": model.weeks_observed,
+            "expected_weekly_arrivals": round(model.weekly_arrivals, 2),
+            "expected_arrivals_by_weekday": by_weekday,
+            "peak_buckets": [{"weekday": b // 24, "hour": b % 24, "rate_per_hour": round(model.rates[b], 3)}
+                             for b in peak_hours if model.rates[b] > 0],
+            "next_crawl": self._plan_next(model, now).isoformat(),
+            "adaptive": self._evaluate(model, adaptive_times, now, end),
+            "fixed": self._evaluate(model, fixed_times, now, end)
+        }
@@ -0,0 +1,285 @@
+"""
+아카이브(hot/cold 계층) 서비스
+보관 기간이 지난 문서/로그를 연도별 아카이브 DB 파일로 이동
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import ARCHIVE_CONFIG, ARCHIVE_LOG_TABLES, DATA_COLUMNS
+from src.config.logging_config import get_logger
+
+
+class ArchiveService:
+    """
+    hot/cold 아카이브 서비스 클래스
+
+    hot DB(data/tax_data.db)에서 기준 시간 컬럼이 보관 기간보다 오래된 행을
+    data/archive/tax_data_{year}.db 로 이동하고 archive_manifest에 기록.
+    조회 시에는 SQLiteRepository가 manifest를 보고 필요한 아카이브만 ATTACH함
+    """
+
+    ARCHIVE_ALIAS = "archive_db"
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**ARCHIVE_CONFIG, **(config or {})}
+        self.archive_folder = self.config["archive_folder"]
+        self.logger = get_logger(__name__)
+
+        if not os.path.exists(self.archive_folder):
+            os.makedirs(self.archive_folder)
+
+        self._ensure_manifest_table()
+
+    def _ensure_manifest_table(self):
+        """archive_manifest 테이블 생성"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS archive_manifest (
+                        table_name TEXT NOT NULL,
+                        archive_year TEXT NOT NULL,
+                        archive_path TEXT NOT NULL,
+                        row_count INTEGER DEFAULT 0,
+                        min_time TEXT,
+                        max_time TEXT,
+                        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (table_name, archive_year)
+                    )
+                """)
+        except Exception as e:
+            self.logger.error(f"archive_manifest 테이블 생성 실패: {e}")
+
+    def get_archive_path(self, year: str) -> str:
+        """연도별 아카이브 DB 파일 경로"""
+        return os.path.join(self.archive_folder, self.config["archive_file_template"].format(year=year))
+
+    def run_archive(self) -> Dict[str, Any]:
+        """
+        보관 기간이 지난 문서 및 로그 아카이브 실행
+
+        Returns:
+            테이블별 이동 행 수 및 전체 요약
+        """
+        if not self.config.get("enabled", True):
+            self.logger.info("아카이브 비활성화 상태 - 건너뜀")
+            return {"status": "disabled", "tables": {}, "total_moved": 0}
+
+        start_time = datetime.now()
+        document_cutoff = (start_time - timedelta(days=self.config["document_retention_days"])).strftime('%Y-%m-%d')
+        log_cutoff = (start_time - timedelta(days=self.config["log_retention_days"])).strftime('%Y-%m-%d')
+
+        targets = [(f"{site_key}_data", "created_at", document_cutoff) for site_key in DATA_COLUMNS.keys()]
+        targets += [(table_name, time_column, log_cutoff) for table_name, time_column in ARCHIVE_LOG_TABLES.items()]
+
+        results = {}
+        for table_name, time_column, cutoff in targets:
+            moved = self.archive_table(table_name, time_column, cutoff)
+            if moved:
+                results[table_name] = moved
+
+        total_moved = sum(results.values())
+
+        if total_moved > 0 and self.config.get("vacuum_after_archive", True):
+            self._vacuum_hot_db()
+
+        duration = (datetime.now() - start_time).total_seconds()
+        self.logger.info(f"아카이브 완료: {total_moved}개 행 이동 ({duration:.1f}초) {results}")
+
+        return {
+            "status": "success",
+            "tables": results,
+            "total_moved": total_moved,
+            "document_cutoff": document_cutoff,
+            "log_cutoff": log_cutoff,
+            "duration_seconds": round(duration, 1)
+        }
+
+    def archive_table(self, table_name: str, time_column: str, cutoff: str) -> int:
+        """
+        단일 테이블의 cutoff 이전 행을 연도별 아카이브로 이동
+
+        Args:
+            table_name: hot DB 테이블명
+            time_column: 기준 시간 컬럼
+            cutoff: 'YYYY-MM-DD' 형식 기준일 (이 날짜 이전 행 이동)
+
+        Returns:
+            이동한 행 수
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                columns = self._get_columns(cursor, "main", table_name)
+                if not columns or time_column not in columns:
+                    return 0
+
+                cursor.execute(f"""
+                    SELECT DISTINCT substr([{time_column}], 1, 4)
+                    FROM [{table_name}]
+                    WHERE [{time_column}] IS NOT NULL AND [{time_column}] < ?
+                """, (cutoff,))
+                years = sorted(row[0] for row in cursor.fetchall() if row[0])
+
+            moved_total = 0
+            for year in years:
+                moved_total += self._archive_table_year(table_name, time_column, cutoff, year)
+
+            return moved_total
+
+        except Exception as e:
+            self.logger.error(f"테이블 아카이브 실패 ({table_name}): {e}")
+            return 0
+
+    def _archive_table_year(self, table_name: str, time_column: str, cutoff: str, year: str) -> int:
+        """단일 테이블의 특정 연도 행을 아카이브 DB로 이동 (하나의 트랜잭션)"""
+        archive_path = self.get_archive_path(year)
+        alias = self.ARCHIVE_ALIAS
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"ATTACH DATABASE ? AS {alias}", (archive_path,))
+
+            try:
+                columns = self._ensure_archive_table(cursor, table_name)
+                column_list = ', '.join(f'[{col}]' for col in columns)
+                where_clause = f"[{time_column}] < ? AND substr([{time_column}], 1, 4) = ?"
+
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO {alias}.[{table_name}] ({column_list})
+                    SELECT {column_list} FROM main.[{table_name}]
+                    WHERE {where_clause}
+                """, (cutoff, year))
+
+                cursor.execute(f"DELETE FROM main.[{table_name}] WHERE {where_clause}", (cutoff, year))
+                moved = cursor.rowcount
+
+                cursor.execute(f"""
+                    SELECT COUNT(*), MIN([{time_column}]), MAX([{time_column}])
+                    FROM {alias}.[{table_name}]
+                """)
+                row_count, min_time, max_time = cursor.fetchone()
+
+                cursor.execute("""
+                    INSERT INTO archive_manifest
+                    (table_name, archive_year, archive_path, row_count, min_time, max_time, archived_at)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(table_name, archive_year) DO UPDATE SET
+                        archive_path = excluded.archive_path,
+                        row_count = excluded.row_count,
+                        min_time = excluded.min_time,
+                        max_time = excluded.max_time,
+                        archived_at = CURRENT_TIMESTAMP
+                """, (table_name, year, archive_path, row_count, min_time, max_time))
+
+                conn.commit()
+                self.logger.info(f"  아카이브 이동: {table_name} {year}년 {moved}개 → {archive_path}")
+                return moved
+
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.execute(f"DETACH DATABASE {alias}")
+
+        except Exception as e:
+            self.logger.error(f"아카이브 이동 실패 ({table_name}, {year}): {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def _ensure_archive_table(self, cursor: sqlite3.Cursor, table_name: str) -> List[str]:
+        """
+        아카이브 DB에 hot 테이블과 동일한 스키마의 테이블 생성
+
+        hot 테이블의 DDL(sqlite_master)을 그대로 사용하여 UNIQUE 제약이 유지되도록 하고,
+        이후 hot 테이블에 추가된 컬럼은 ALTER TABLE로 보완
+
+        Returns:
+            hot/아카이브 공통 컬럼 목록
+        """
+        alias = self.ARCHIVE_ALIAS
+        hot_columns = self._get_columns(cursor, "main", table_name)
+        archive_columns = self._get_columns(cursor, alias, table_name)
+
+        if not archive_columns:
+            cursor.execute("SELECT sql FROM main.sqlite_master WHERE type='table' AND name=?", (table_name,))
+            ddl = cursor.fetchone()[0]
+            ddl = re.sub(
+                r'^\s*CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?("[^"]+"|\[[^\]]+\]|`[^`]+`|\S+)',
+                f'CREATE TABLE IF NOT EXISTS {alias}.[{table_name}]',
+                ddl,
+                count=1,
+                flags=re.IGNORECASE
+            )
+            cursor.execute(ddl)
+
+            # 조회용 인덱스 (created_at 정렬 등)
+            if 'created_at' in hot_columns:
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS {alias}.[idx_{table_name}_created_at]
+                    ON [{table_name}](created_at)
+                """)
+            archive_columns = self._get_columns(cursor, alias, table_name)
+
+        for column in hot_columns:
+            if column not in archive_columns:
+                cursor.execute(f"ALTER TABLE {alias}.[{table_name}] ADD COLUMN [{column}] TEXT")
+                archive_columns.append(column)
+
+        return [col for col in hot_columns if col in archive_columns]
+
+    def _get_columns(self, cursor: sqlite3.Cursor, schema: str, table_name: str) -> List[str]:
+        """스키마의 테이블 컬럼 목록 조회 (테이블 없으면 빈 목록)"""
+        cursor.execute(f"PRAGMA {schema}.table_info([{table_name}])")
+        return [row[1] for row in cursor.fetchall()]
+
+    def _vacuum_hot_db(self):
+        """hot DB VACUUM (삭제된 페이지 회수)"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            self.logger.info(f"hot DB VACUUM 완료: {round(os.path.getsize(self.db_path) / 1024 / 1024, 2)}MB")
+        except Exception as e:
+            self.logger.warning(f"hot DB VACUUM 실패: {e}")
+
+    def get_archive_status(self) -> Dict[str, Any]:
+        """아카이브 현황 조회"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT table_name, archive_year, archive_path, row_count,
+                           min_time, max_time, archived_at
+                    FROM archive_manifest
+                    ORDER BY table_name, archive_year
+                """)
+                columns = [desc[0] for desc in cursor.description]
+                archives = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+            archive_files = {archive['archive_path'] for archive in archives}
+            archive_size = sum(os.path.getsize(path) for path in archive_files if os.path.exists(path))
+
+            return {
+                "enabled": self.config.get("enabled", True),
+                "hot_db_size_mb": round(os.path.getsize(self.db_path) / 1024 / 1024, 2),
+                "archive_size_mb": round(archive_size / 1024 / 1024, 2),
+                "archived_rows": sum(archive['row_count'] for archive in archives),
+                "archives": archives
+            }
+        except Exception as e:
+            self.logger.error(f"아카이브 현황 조회 실패: {e}")
+            return {"error": str(e)}
@@ -0,0 +1,252 @@
+"""
+변경 데이터 캡처(CDC) 피드 서비스
+사이트 테이블에 INSERT된 문서를 단조 증가 시퀀스 기반 커서로 제공
+"""
+
+import os
+import sqlite3
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import KEY_COLUMNS
+from src.config.logging_config import get_logger
+from src.repositories.async_repository import run_in_db_executor
+
+
+class ChangeFeedService:
+    """
+    CDC 피드 서비스 클래스
+
+    data_change_log 테이블(사이트 테이블 INSERT 트리거로 기록)을 시퀀스 순으로 읽고,
+    소비자별 커서(change_feed_cursors)를 관리하여 각 소비자가 자신의 위치에서 재개할 수 있도록 함
+    """
+
+    # SQLite 바인딩 변수 제한을 고려한 IN 절 청크 크기
+    IN_CLAUSE_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: str = "data/tax_data.db", poll_interval: float = 1.0):
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.logger = get_logger(__name__)
+
+    def get_latest_seq(self, site_key: str = None) -> int:
+        """마지막 변경 시퀀스 조회"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if site_key:
+                    cursor.execute(
+                        "SELECT MAX(seq) FROM data_change_log WHERE site_key = ?", (site_key,)
+                    )
+                else:
+                    cursor.execute("SELECT MAX(seq) FROM data_change_log")
+                result = cursor.fetchone()
+                return result[0] or 0
+        except Exception as e:
+            self.logger.error(f"마지막 변경 시퀀스 조회 실패: {e}")
+            return 0
+
+    def count_changes(self, site_key: str, since_seq: int, until_seq: int = None) -> int:
+        """시퀀스 구간 (since_seq, until_seq] 내 사이트별 변경 개수 조회"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if until_seq is not None:
+                    cursor.execute("""
+                        SELECT COUNT(*) FROM data_change_log
+                        WHERE site_key = ? AND seq > ? AND seq <= ?
+                    """, (site_key, since_seq, until_seq))
+                else:
+                    cursor.execute("""
+                        SELECT COUNT(*) FROM data_change_log
+                        WHERE site_key = ? AND seq > ?
+                    """, (site_key, since_seq))
+                return cursor.fetchone()[0]
+        except Exception as e:
+            self.logger.error(f"변경 개수 조회 실패 ({site_key}): {e}")
+            return 0
+
+    def get_changes(self, since: int = 0, limit: int = 500, site_key: str = None,
+                    include_data: bool = False) -> Dict[str, Any]:
+        """
+        시퀀스 since 이후의 변경 목록 조회
+
+        Args:
+            since: 이 시퀀스보다 큰 변경만 반환 (exclusive)
+            limit: 최대 반환 개수
+            site_key: 특정 사이트만 조회
+            include_data: 사이트 테이블의 문서 데이터 포함 여부
+
+        Returns:
+            changes, next_seq(다음 호출 시 since로 사용), has_more 정보
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                where_conditions = ["seq > ?"]
+                params: List[Any] = [since]
+
+                if site_key:
+                    where_conditions.append("site_key = ?")
+                    params.append(site_key)
+
+                # limit + 1개를 조회하여 추가 데이터 존재 여부 판단
+                params.append(limit + 1)
+                cursor.execute(f"""
+                    SELECT seq, site_key, data_id, operation, changed_at
+                    FROM data_change_log
+                    WHERE {' AND '.join(where_conditions)}
+                    ORDER BY seq
+                    LIMIT ?
+                """, params)
+
+                columns = [desc[0] for desc in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+                has_more = len(rows) > limit
+                changes = rows[:limit]
+
+                if include_data and changes:
+                    self._attach_document_data(conn, changes)
+
+            next_seq = changes[-1]['seq'] if changes else since
+
+            return {
+                "changes": changes,
+                "next_seq": next_seq,
+                "has_more": has_more,
+                "count": len(changes)
+            }
+
+        except Exception as e:
+            self.logger.error(f"변경 목록 조회 실패: {e}")
+            return {"changes": [], "next_seq": since, "has_more": False, "count": 0, "error": str(e)}
+
+    async def wait_for_changes(self, since: int = 0, timeout: float = 30.0, limit: int = 500,
+                               site_key: str = None, include_data: bool = False) -> Dict[str, Any]:
+        """
+        롱폴링: since 이후 변경이 생길 때까지 최대 timeout초 대기 후 반환
+
+        대기 중에는 MAX(seq) 조회(rowid 기반 O(1))만 반복하므로 테이블 스캔이 발생하지 않음
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+
+        while True:
+            latest_seq = await run_in_db_executor(self.get_latest_seq, site_key)
+            if latest_seq > since or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+        result = await run_in_db_executor(self.get_changes, since, limit, site_key, include_data)
+        result["latest_seq"] = latest_seq
+        return result
+
+    def get_cursor(self, consumer_id: str, default: Optional[int] = 0) -> Optional[int]:
+        """소비자의 마지막 처리 시퀀스 조회 (없으면 default)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT last_seq FROM change_feed_cursors WHERE consumer_id = ?", (consumer_id,)
+                )
+                result = cursor.fetchone()
+                return result[0] if result else default
+        except Exception as e:
+            self.logger.error(f"소비자 커서 조회 실패 ({consumer_id}): {e}")
+            return default
+
+    @staticmethod
+    def commit_cursor_in(cursor: sqlite3.Cursor, consumer_id: str, seq: int):
+        """소비자 커서 저장 (호출자의 트랜잭션에서 실행, 뒤로 이동하지 않음)"""
+        cursor.execute("""
+            INSERT INTO change_feed_cursors (consumer_id, last_seq, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(consumer_id) DO UPDATE SET
+                last_seq = MAX(last_seq, excluded.last_seq),
+                updated_at = CURRENT_TIMESTAMP
+        """, (consumer_id, seq))
+
+    def commit_cursor(self, consumer_id: str, seq: int) -> bool:
+        """소비자 커서 저장 (뒤로 이동하지 않음)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self.commit_cursor_in(conn.cursor(), consumer_id, seq)
+            return True
+        except Exception as e:
+            self.logger.error(f"소비자 커서 저장 실패 ({consumer_id}): {e}")
+            return False
+
+    def read_from_cursor(self, consumer_id: str, limit: int = 500, site_key: str = None,
+                         include_data: bool = False, auto_commit: bool = False) -> Dict[str, Any]:
+        """소비자 커서 위치부터 변경 조회 (auto_commit 시 읽은 위치까지 커서 전진)"""
+        since = self.get_cursor(consumer_id)
+        result = self.get_changes(since, limit, site_key, include_data)
+        result["consumer_id"] = consumer_id
+
+        if auto_commit and result["changes"]:
+            self.commit_cursor(consumer_id, result["next_seq"])
+
+        return result
+
+    def list_cursors(self) -> List[Dict[str, Any]]:
+        """전체 소비자 커서 및 지연(lag) 조회"""
+        try:
+            latest_seq = self.get_latest_seq()
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT consumer_id, last_seq, updated_at
+                    FROM change_feed_cursors
+                    ORDER BY consumer_id
+                """)
+                return [
+                    {
+                        "consumer_id": consumer_id,
+                        "last_seq": last_seq,
+                        "lag": max(0, latest_seq - last_seq),
+                        "updated_at": updated_at
+                    }
+                    for consumer_id, last_seq, updated_at in cursor.fetchall()
+                ]
+        except Exception as e:
+            self.logger.error(f"소비자 커서 목록 조회 실패: {e}")
+            return []
+
+    def _attach_document_data(self, conn: sqlite3.Connection, changes: List[Dict[str, Any]]):
+        """변경 항목에 사이트 테이블의 문서 데이터 첨부 (사이트별 키 IN 조회)"""
+        ids_by_site: Dict[str, List[str]] = {}
+        for change in changes:
+            ids_by_site.setdefault(change['site_key'], []).append(change['data_id'])
+
+        documents: Dict[tuple, Dict[str, Any]] = {}
+        cursor = conn.cursor()
+
+        for site_key, data_ids in ids_by_site.items():
+            table_name = f"{site_key}_data"
+            key_column = KEY_COLUMNS.get(site_key, "문서번호")
+
+            for i in range(0, len(data_ids), self.IN_CLAUSE_CHUNK_SIZE):
+                chunk = data_ids[i:i + self.IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ', '.join(['?'] * len(chunk))
+                try:
+                    cursor.execute(f"""
+                        SELECT * FROM [{table_name}]
+                        WHERE [{key_column}] IN ({placeholders})
+                    """, chunk)
+                except sqlite3.Error as e:
+                    self.logger.warning(f"문서 데이터 조회 실패 ({table_name}): {e}")
+                    break
+
+                columns = [desc[0] for desc in cursor.description]
+                for row in cursor.fetchall():
+                    document = dict(zip(columns, row))
+                    documents[(site_key, str(document.get(key_column)))] = document
+
+        for change in changes:
+            change['data'] = documents.get((change['site_key'], str(change['data_id'])))
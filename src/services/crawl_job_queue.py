@@ -0,0 +1,418 @@
+"""
+크롤링 작업 큐 서비스
+스케줄러(리더)가 등록한 사이트 크롤링 작업을 별도 프로세스/호스트의 크롤링 워커가 리스와 함께 가져가 실행
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+import sys
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.interfaces.crawler_interface import CrawlJobQueueInterface
+from src.config.settings import CRAWL_QUEUE_CONFIG
+from src.config.logging_config import get_logger
+from src.utils.shared_db import COLUMN_TYPES, connect_shared_db, resolve_dsn
+
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_TIMEOUT = "timeout"
+FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_TIMEOUT)
+
+JOB_COLUMNS = [
+    "id", "site_key", "is_manual", "attempt", "priority", "timeout_seconds", "status",
+    "enqueued_at", "worker_id", "claim_count", "started_at", "heartbeat_at", "finished_at",
+    "stage", "progress", "result", "error_message", "error_type"
+]
+
+
+def evaluate_site_result(crawl_result: Dict[str, Any], site_key: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    CrawlingService.execute_crawling 결과에서 사이트 성공 여부 판정
+
+    전체 상태뿐 아니라 사이트별 결과까지 확인 (사이트 실패도 전체 상태는 success로 반환됨)
+
+    Returns:
+        (성공 여부, 오류 메시지, 오류 타입)
+    """
+    crawl_result = crawl_result or {}
+    site_result = next((result for result in crawl_result.get('results', [])
+                        if result.get('site_key') == site_key), None)
+    if crawl_result.get('status') == 'success' and site_result is not None \
+            and site_result.get('status') == 'success':
+        return True, None, None
+
+    if site_result:
+        return False, site_result.get('error_message') or '알 수 없는 오류', site_result.get('error_type')
+    return False, crawl_result.get('error') or crawl_result.get('message') or '크롤링 결과 없음', None
+
+
+def compact_crawl_result(crawl_result: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 큐에 기록할 수 있도록 크롤링 결과에서 DataFrame 제외 후 JSON 호환 형태로 변환"""
+    crawl_result = crawl_result or {}
+    compact = {key: value for key, value in crawl_result.items()
+               if key != 'results' and not isinstance(value, pd.DataFrame)}
+    compact['results'] = [
+        {key: value for key, value in result.items() if not isinstance(value, pd.DataFrame)}
+        for result in crawl_result.get('results', [])
+    ]
+    return json.loads(json.dumps(compact, ensure_ascii=False, default=str))
+
+
+class SQLCrawlJobQueue(CrawlJobQueueInterface):
+    """
+    SQL 테이블 기반 크롤링 작업 큐
+
+    - 같은 사이트는 대기/실행 중 한 건만 허용 (부분 유니크 인덱스, 워커가 여러 개여도 사이트별 배타 실행)
+    - 할당은 단일 UPDATE ... RETURNING으로 처리하여 두 워커가 같은 작업을 가져가지 않음
+    - 워커가 lease_seconds 안에 heartbeat를 보내지 못하면 다시 대기열로 돌아가고,
+      max_claims회를 넘기면 실패(WorkerLost)로 기록
+    - 완료 작업은 스케줄러가 collect_finished로 가져가 실행 로그/재시도/알림을 처리한 뒤 보고 완료로 표시
+
+    dsn이 있으면 PostgreSQL(여러 호스트의 워커), 없으면 SQLite 모니터링 DB(같은 호스트의 워커)를 사용
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", dsn: str = None, config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.dsn = resolve_dsn(dsn)
+        self.config = {**CRAWL_QUEUE_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._ensure_tables()
+
+    def _connect(self):
+        return connect_shared_db(self.db_path, self.dsn, self.config["db_timeout_seconds"])
+
+    def _ensure_tables(self):
+        """작업 및 워커 테이블 생성"""
+        types = COLUMN_TYPES["postgresql" if self.dsn else "sqlite"]
+        id_column, real_type = types["id"], types["real"]
+        try:
+            with self._connect() as (conn, _):
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS crawl_jobs (
+                        id {id_column},
+                        site_key TEXT NOT NULL,
+                        is_manual INTEGER NOT NULL DEFAULT 0,
+                        attempt INTEGER NOT NULL DEFAULT 1,
+                        priority INTEGER NOT NULL DEFAULT 0,
+                        timeout_seconds {real_type},
+                        status TEXT NOT NULL DEFAULT 'queued',
+                        enqueued_at {real_type} NOT NULL,
+                        worker_id TEXT,
+                        claim_count INTEGER NOT NULL DEFAULT 0,
+                        started_at {real_type},
+                        heartbeat_at {real_type},
+                        lease_expires_at {real_type},
+                        finished_at {real_type},
+                        stage TEXT,
+                        progress {real_type},
+                        result TEXT,
+                        error_message TEXT,
+                        error_type TEXT,
+                        reported INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status
+                    ON crawl_jobs(status, priority, id)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_crawl_jobs_site_status
+                    ON crawl_jobs(site_key, status)
+                """)
+                # 사이트별 대기/실행 중 작업은 한 건 (동시에 등록해도 DB가 보장, PostgreSQL READ COMMITTED 포함)
+                conn.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_jobs_active_site
+                    ON crawl_jobs(site_key) WHERE status IN ('queued', 'running')
+                """)
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS crawl_workers (
+                        worker_id TEXT PRIMARY KEY,
+                        hostname TEXT,
+                        pid INTEGER,
+                        concurrency INTEGER,
+                        sites TEXT,
+                        started_at {real_type} NOT NULL,
+                        heartbeat_at {real_type} NOT NULL
+                    )
+                """)
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 큐 테이블 생성 실패: {e}")
+
+    def enqueue(self, site_key: str, is_manual: bool = False, attempt: int = 1,
+                priority: int = 0, timeout_seconds: float = None) -> Optional[int]:
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    INSERT INTO crawl_jobs (site_key, is_manual, attempt, priority, timeout_seconds, enqueued_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT DO NOTHING
+                    RETURNING id
+                """), (site_key, int(is_manual), attempt, priority, timeout_seconds, time.time()))
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 등록 실패 ({site_key}): {e}")
+            return None
+
+        if row is None:
+            self.logger.info(f"크롤링 작업 이미 대기/실행 중: {site_key}")
+            return None
+        self.logger.info(f"크롤링 작업 큐 등록: {site_key} (작업 ID: {row[0]}, 우선순위: {priority})")
+        return row[0]
+
+    def claim(self, worker_id: str, sites: List[str] = None) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        site_filter = f"AND site_key IN ({', '.join('?' for _ in sites)})" if sites else ""
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q(f"""
+                    UPDATE crawl_jobs
+                    SET status = 'running', worker_id = ?, claim_count = claim_count + 1,
+                        started_at = ?, heartbeat_at = ?, lease_expires_at = ?, stage = NULL, progress = NULL
+                    WHERE status = 'queued' AND id = (
+                        SELECT id FROM crawl_jobs
+                        WHERE status = 'queued' {site_filter}
+                          AND site_key NOT IN (SELECT site_key FROM crawl_jobs WHERE status = 'running')
+                        ORDER BY priority DESC, id
+                        LIMIT 1
+                    )
+                    RETURNING id, site_key, is_manual, attempt, priority, timeout_seconds, claim_count, enqueued_at
+                """), (worker_id, now, now, now + self.config["lease_seconds"], *(sites or [])))
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 할당 실패 ({worker_id}): {e}")
+            return None
+
+        if row is None:
+            return None
+        job_id, site_key, is_manual, attempt, priority, timeout_seconds, claim_count, enqueued_at = row
+        return {
+            "id": job_id,
+            "site_key": site_key,
+            "is_manual": bool(is_manual),
+            "attempt": attempt,
+            "priority": priority,
+            "timeout_seconds": timeout_seconds,
+            "claim_count": claim_count,
+            "wait_seconds": round(now - enqueued_at, 1)
+        }
+
+    def heartbeat(self, job_id: int, worker_id: str, stage: str = None, progress: float = None) -> bool:
+        now = time.time()
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    UPDATE crawl_jobs
+                    SET heartbeat_at = ?, lease_expires_at = ?,
+                        stage = COALESCE(?, stage), progress = COALESCE(?, progress)
+                    WHERE id = ? AND worker_id = ? AND status = 'running'
+                """), (now, now + self.config["lease_seconds"], stage, progress, job_id, worker_id))
+                return cursor.rowcount == 1
+        except Exception as e:
+            # 일시적인 저장소 오류는 리스가 남아 있는 동안 다음 heartbeat에서 재시도
+            self.logger.warning(f"크롤링 작업 heartbeat 실패 ({job_id}): {e}")
+            return True
+
+    def complete(self, job_id: int, worker_id: str, status: str, result: Dict[str, Any] = None,
+                 error_message: str = None, error_type: str = None, stage: str = None) -> bool:
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    UPDATE crawl_jobs
+                    SET status = ?, finished_at = ?, result = ?, error_message = ?, error_type = ?,
+                        stage = COALESCE(?, stage)
+                    WHERE id = ? AND worker_id = ? AND status = 'running'
+                """), (status, time.time(), json.dumps(result, ensure_ascii=False) if result else None,
+                       error_message, error_type, stage, job_id, worker_id))
+                completed = cursor.rowcount == 1
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 결과 기록 실패 ({job_id}): {e}")
+            return False
+
+        if not completed:
+            self.logger.warning(f"리스를 잃은 작업의 결과 무시: {job_id} ({worker_id})")
+        return completed
+
+    def requeue_expired(self) -> int:
+        now = time.time()
+        max_claims = self.config["max_claims"]
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    UPDATE crawl_jobs
+                    SET status = CASE WHEN claim_count >= ? THEN 'failed' ELSE 'queued' END,
+                        finished_at = CASE WHEN claim_count >= ? THEN ? ELSE NULL END,
+                        error_message = CASE WHEN claim_count >= ?
+                                             THEN '워커 응답 없음 (리스 만료)' ELSE error_message END,
+                        error_type = CASE WHEN claim_count >= ? THEN 'WorkerLost' ELSE error_type END,
+                        worker_id = CASE WHEN claim_count >= ? THEN worker_id ELSE NULL END
+                    WHERE status = 'running' AND lease_expires_at < ?
+                    RETURNING id, site_key, status
+                """), (max_claims, max_claims, now, max_claims, max_claims, max_claims, now))
+                rows = cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"만료된 크롤링 작업 처리 실패: {e}")
+            return 0
+
+        for job_id, site_key, status in rows:
+            action = "대기열 복귀" if status == JOB_QUEUED else "실패 처리"
+            self.logger.warning(f"크롤링 작업 리스 만료 - {action}: {site_key} (작업 ID: {job_id})")
+        return len(rows)
+
+    def collect_finished(self, limit: int = 50) -> List[Dict[str, Any]]:
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q(f"""
+                    SELECT {', '.join(JOB_COLUMNS)} FROM crawl_jobs
+                    WHERE reported = 0 AND status IN ('succeeded', 'failed', 'timeout')
+                    ORDER BY finished_at, id
+                    LIMIT ?
+                """), (limit,))
+                rows = cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"완료 크롤링 작업 조회 실패: {e}")
+            return []
+
+        return [self._to_job(row) for row in rows]
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q(f"SELECT {', '.join(JOB_COLUMNS)} FROM crawl_jobs WHERE id = ?"),
+                                      (job_id,))
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 조회 실패 ({job_id}): {e}")
+            return None
+        return self._to_job(row) if row else None
+
+    @staticmethod
+    def _to_job(row) -> Dict[str, Any]:
+        job = dict(zip(JOB_COLUMNS, row))
+        job["is_manual"] = bool(job["is_manual"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        started_at = job["started_at"] or job["finished_at"]
+        job["duration"] = int(job["finished_at"] - started_at) if started_at and job["finished_at"] else 0
+        return job
+
+    def mark_reported(self, job_id: int) -> None:
+        try:
+            with self._connect() as (conn, q):
+                conn.execute(q("UPDATE crawl_jobs SET reported = 1 WHERE id = ?"), (job_id,))
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 보고 처리 실패 ({job_id}): {e}")
+
+    def register_worker(self, worker_id: str, concurrency: int, sites: List[str] = None):
+        """워커 등록 및 생존 신호 갱신 (상태 조회 시 최근 heartbeat가 있는 워커만 표시)"""
+        now = time.time()
+        hostname, pid = worker_id.split(":")[0], os.getpid()
+        try:
+            with self._connect() as (conn, q):
+                conn.execute(q("""
+                    INSERT INTO crawl_workers (worker_id, hostname, pid, concurrency, sites, started_at, heartbeat_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (worker_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at
+                """), (worker_id, hostname, pid, concurrency, ",".join(sites) if sites else None, now, now))
+        except Exception as e:
+            self.logger.warning(f"크롤링 워커 등록 실패 ({worker_id}): {e}")
+
+    def unregister_worker(self, worker_id: str):
+        try:
+            with self._connect() as (conn, q):
+                conn.execute(q("DELETE FROM crawl_workers WHERE worker_id = ?"), (worker_id,))
+        except Exception as e:
+            self.logger.warning(f"크롤링 워커 해제 실패 ({worker_id}): {e}")
+
+    def cleanup(self, retention_days: int = None) -> int:
+        """보고 완료된 오래된 작업 및 응답 없는 워커 정리"""
+        if retention_days is None:
+            retention_days = self.config["retention_days"]
+        now = time.time()
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("DELETE FROM crawl_jobs WHERE reported = 1 AND finished_at < ?"),
+                                      (now - retention_days * 86400,))
+                deleted = cursor.rowcount
+                conn.execute(q("DELETE FROM crawl_workers WHERE heartbeat_at < ?"),
+                             (now - self.config["lease_seconds"] * 10,))
+            return deleted
+        except Exception as e:
+            self.logger.warning(f"크롤링 작업 정리 실패: {e}")
+            return 0
+
+    def get_status(self) -> Dict[str, Any]:
+        now = time.time()
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    SELECT status, COUNT(*) FROM crawl_jobs
+                    WHERE status IN ('queued', 'running') OR reported = 0
+                    GROUP BY status
+                """))
+                counts = dict(cursor.fetchall())
+
+                cursor = conn.execute(q("""
+                    SELECT id, site_key, priority, enqueued_at, attempt FROM crawl_jobs
+                    WHERE status = 'queued' ORDER BY priority DESC, id
+                """))
+                queued = [
+                    {"id": job_id, "site_key": site_key, "priority": priority,
+                     "wait_seconds": round(now - enqueued_at, 1), "attempt": attempt}
+                    for job_id, site_key, priority, enqueued_at, attempt in cursor.fetchall()
+                ]
+
+                cursor = conn.execute(q("""
+                    SELECT id, site_key, worker_id, started_at, heartbeat_at, stage, progress, timeout_seconds
+                    FROM crawl_jobs WHERE status = 'running' ORDER BY started_at
+                """))
+                running = [
+                    {"id": job_id, "site_key": site_key, "worker_id": worker_id,
+                     "running_seconds": round(now - started_at, 1),
+                     "heartbeat_age_seconds": round(now - heartbeat_at, 1),
+                     "stage": stage, "progress": progress, "timeout_seconds": timeout_seconds}
+                    for job_id, site_key, worker_id, started_at, heartbeat_at, stage, progress, timeout_seconds
+                    in cursor.fetchall()
+                ]
+
+                cursor = conn.execute(q("""
+                    SELECT worker_id, concurrency, sites, started_at, heartbeat_at FROM crawl_workers
+                    WHERE heartbeat_at >= ? ORDER BY started_at
+                """), (now - self.config["lease_seconds"],))
+                workers = [
+                    {"worker_id": worker_id, "concurrency": concurrency,
+                     "sites": sites.split(",") if sites else None,
+                     "started_at": datetime.fromtimestamp(started_at).isoformat(),
+                     "heartbeat_age_seconds": round(now - heartbeat_at, 1)}
+                    for worker_id, concurrency, sites, started_at, heartbeat_at in cursor.fetchall()
+                ]
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 큐 상태 조회 실패: {e}")
+            return {"error": str(e)}
+
+        return {
+            "backend": "postgresql" if self.dsn else "sqlite",
+            "counts": counts,
+            "queue_depth": len(queued),
+            "queued": queued,
+            "running": running,
+            "workers": workers
+        }
+
+
+def create_crawl_job_queue(db_path: str = "data/tax_data.db", dsn: str = None,
+                           config: Dict[str, Any] = None) -> CrawlJobQueueInterface:
+    """설정의 backend에 맞는 크롤링 작업 큐 생성"""
+    backend = {**CRAWL_QUEUE_CONFIG, **(config or {})}.get("backend", "sql")
+    if backend == "sql":
+        return SQLCrawlJobQueue(db_path, dsn, config)
+    raise ValueError(f"지원하지 않는 크롤링 작업 큐: {backend}")
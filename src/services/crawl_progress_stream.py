@@ -0,0 +1,137 @@
+"""
+크롤링 진행 상황 스트림
+크롤링 스레드/프로세스의 진행률과 상태를 크롤링별로 모아 변경된 필드만 제한된 빈도로 WebSocket에 전송
+"""
+
+import os
+import time
+import asyncio
+import threading
+from datetime import datetime
+from typing import Dict, Any, Callable, Awaitable, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import CRAWL_PROGRESS_STREAM_CONFIG
+from src.config.logging_config import get_logger
+from src.utils.crawl_context import CrawlProgress, CrawlStatus
+
+
+# 사이트가 바뀌면 이전 사이트 값이 남지 않도록 초기화할 필드
+SITE_SCOPED_FIELDS = ("stage", "section", "sections", "page", "pages", "items", "total_items", "new_items")
+
+
+class CrawlProgressStream:
+    """
+    크롤링 진행 상황 스트림 클래스
+
+    - progress/status: 크롤러에 전달할 진행률/상태 콜백 (어느 스레드에서 호출해도 됨)
+    - 업데이트는 상태에 합쳐지기만 하고, 이벤트 루프에서 최대 max_updates_per_second 빈도로
+      마지막 전송 이후 바뀐 필드(site, stage, page, items, progress, eta_seconds 등)만 crawl_progress로 전송
+    - 같은 텍스트 재전송(status.update())이나 값이 같은 진행률은 전송하지 않음
+    """
+
+    def __init__(self, choice: str, publish: Callable[[Dict[str, Any]], Awaitable],
+                 loop: asyncio.AbstractEventLoop = None, config: Dict[str, Any] = None):
+        self.choice = choice
+        self.config = {**CRAWL_PROGRESS_STREAM_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._publish = publish
+        self._loop = loop or asyncio.get_running_loop()
+        self._interval = 1.0 / self.config["max_updates_per_second"]
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+        self._sent: Dict[str, Any] = {}
+        self._started = time.monotonic()
+        self._last_flush = 0.0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._scheduled = False
+        self._closed = False
+        self.seq = 0
+        self.updates = 0
+
+        self.progress = CrawlProgress(lambda value: self.update(progress=value))
+        self.status = CrawlStatus(lambda text, **fields: self.update(message=text, **fields))
+
+    def update(self, **fields):
+        """상태 필드 갱신 후 전송 예약 (어느 스레드에서 호출해도 됨)"""
+        with self._lock:
+            if self._closed:
+                return
+            self.updates += 1
+            site = fields.get("site")
+            if site is not None and site != self._state.get("site"):
+                for key in SITE_SCOPED_FIELDS:
+                    self._state.pop(key, None)
+            self._state.update({key: value for key, value in fields.items() if value is not None})
+            if "progress" in fields:
+                self._update_eta()
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = max(0.0, self._last_flush + self._interval - time.monotonic())
+        try:
+            self._loop.call_soon_threadsafe(self._schedule, delay)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨
+            pass
+
+    def _update_eta(self):
+        progress = self._state.get("progress") or 0
+        if self.config["eta_min_progress"] <= progress < 100:
+            elapsed = time.monotonic() - self._started
+            self._state["eta_seconds"] = int(elapsed * (100 - progress) / progress)
+        else:
+            self._state.pop("eta_seconds", None)
+
+    def _schedule(self, delay: float):
+        if self._closed:
+            return
+        self._handle = self._loop.call_later(delay, self._flush)
+
+    def _flush(self):
+        """마지막 전송 이후 바뀐 필드만 전송 (이벤트 루프에서 실행)"""
+        message = self._take_delta()
+        if message is not None:
+            task = self._loop.create_task(self._publish(message))
+            task.add_done_callback(self._log_failure)
+
+    def _take_delta(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._handle = None
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+            delta = {key: self._state.get(key) for key in self._state.keys() | self._sent.keys()
+                     if self._state.get(key) != self._sent.get(key)}
+            if not delta:
+                return None
+            self._sent = dict(self._state)
+            self.seq += 1
+            return {
+                "type": "crawl_progress",
+                "choice": self.choice,
+                "seq": self.seq,
+                **delta,
+                "timestamp": datetime.now().isoformat()
+            }
+
+    def _log_failure(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"진행 상황 전송 실패 (choice={self.choice}): {task.exception()}")
+
+    async def close(self):
+        """대기 중인 변경을 즉시 전송하고 스트림 종료 (이벤트 루프에서 호출)"""
+        with self._lock:
+            self._closed = True
+        if self._handle is not None:
+            self._handle.cancel()
+        message = self._take_delta()
+        if message is not None:
+            # 완료/오류 메시지보다 먼저 전송되도록 직접 대기
+            try:
+                await self._publish(message)
+            except Exception as e:
+                self.logger.error(f"진행 상황 전송 실패 (choice={self.choice}): {e}")
+        self.logger.info(f"진행 상황 스트림 종료 (choice={self.choice}): 업데이트 {self.updates}회 → 전송 {self.seq}회")
@@ -0,0 +1,70 @@
+"""
+크롤링 재시도 정책
+실패 원인 분류(일시적/구조적) 및 지수 백오프 지연 계산
+"""
+
+import os
+import random
+from typing import Dict, Any, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import CRAWL_RETRY_CONFIG
+
+
+ERROR_TRANSIENT = "transient"
+ERROR_STRUCTURAL = "structural"
+ERROR_UNKNOWN = "unknown"
+
+
+def classify_crawl_error(error_type: Optional[str], error_message: Optional[str],
+                         config: Dict[str, Any] = None) -> str:
+    """
+    크롤링 오류 분류
+
+    예외 타입명을 먼저 보고, 판단할 수 없으면 오류 메시지 패턴으로 분류.
+    구조적 패턴이 일시적 패턴보다 우선 (예: 'NoSuchElement ... timeout' → 구조적)
+
+    Returns:
+        'transient' (네트워크/브라우저 일시 오류), 'structural' (파싱/구조 변경), 'unknown'
+    """
+    config = config or CRAWL_RETRY_CONFIG
+    error_type = error_type or ""
+    message = (error_message or "").lower()
+
+    if error_type in config.get("structural_error_types", []):
+        return ERROR_STRUCTURAL
+    if error_type in config.get("transient_error_types", []):
+        return ERROR_TRANSIENT
+
+    if any(pattern.lower() in message for pattern in config.get("structural_error_patterns", [])):
+        return ERROR_STRUCTURAL
+    if any(pattern.lower() in message for pattern in config.get("transient_error_patterns", [])):
+        return ERROR_TRANSIENT
+
+    return ERROR_UNKNOWN
+
+
+def is_retryable(error_class: str, config: Dict[str, Any] = None) -> bool:
+    """재시도 대상 오류 여부"""
+    config = config or CRAWL_RETRY_CONFIG
+    if error_class == ERROR_TRANSIENT:
+        return True
+    if error_class == ERROR_UNKNOWN:
+        return config.get("retry_unknown_errors", True)
+    return False
+
+
+def compute_backoff_delay(attempt: int, base_delay: int, config: Dict[str, Any] = None) -> int:
+    """
+    지수 백오프 + 지터 지연 시간 계산 (초)
+
+    attempt번째 실패 후 지연 = min(base_delay * 2^(attempt-1), max_delay)에서
+    jitter_ratio 비율만큼을 무작위로 분산하여 여러 사이트의 재시도가 동시에 몰리지 않도록 함
+    """
+    config = config or CRAWL_RETRY_CONFIG
+    delay = min(base_delay * (2 ** max(0, attempt - 1)), config.get("max_delay_seconds", 3600))
+    jitter = delay * config.get("jitter_ratio", 0.5)
+    return max(1, int(delay - jitter + random.uniform(0, jitter)))
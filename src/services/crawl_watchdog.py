@@ -0,0 +1,103 @@
+"""
+크롤링 watchdog
+실행 제한 시간을 넘긴 크롤링 작업을 포기 처리하고 브라우저 프로세스를 정리
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+from src.config.settings import CRAWL_WATCHDOG_CONFIG
+from src.services.job_dispatcher import CrawlJob, CrawlJobDispatcher
+
+
+class CrawlTimeoutError(Exception):
+    """크롤링 작업이 제한 시간을 초과한 경우"""
+
+    def __init__(self, site_key: str, timeout_seconds: float, stage: str):
+        self.site_key = site_key
+        self.timeout_seconds = timeout_seconds
+        self.stage = stage
+        super().__init__(f"크롤링 타임아웃: {site_key} ({int(timeout_seconds)}초 초과, 단계: {stage})")
+
+
+class CrawlWatchdog:
+    """
+    크롤링 watchdog 클래스
+
+    디스패처의 실행 중 작업을 주기적으로 검사하여 제한 시간을 넘긴 작업을
+    1) 포기 처리(Future에 CrawlTimeoutError 설정, 풀 슬롯 반환, 사이트 잠금은 작업 스레드가 끝날 때 해제)하고
+    2) 작업에 등록된 chromedriver/Chrome 프로세스 트리를 강제 종료한 뒤
+    3) on_timeout 콜백으로 타임아웃 기록을 맡김
+
+    브라우저가 종료되면 멈춰 있던 WebDriver 호출이 오류로 끝나므로 작업 스레드도 정리되며,
+    HTTP 크롤링은 다음 단계 진입 시 취소 여부를 확인하여 중단됨
+    """
+
+    def __init__(self, dispatcher: CrawlJobDispatcher,
+                 on_timeout: Optional[Callable[[CrawlJob, CrawlTimeoutError], None]] = None,
+                 check_interval: float = None):
+        self.logger = get_logger(__name__)
+        self.dispatcher = dispatcher
+        self.on_timeout = on_timeout
+        self.check_interval = check_interval or CRAWL_WATCHDOG_CONFIG.get("check_interval_seconds", 15)
+        self.default_timeout = CRAWL_WATCHDOG_CONFIG.get("default_timeout_seconds", 3600)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch_loop, name="crawl-watchdog", daemon=True)
+        self._thread.start()
+        self.logger.info(f"크롤링 watchdog 시작 (검사 주기: {self.check_interval}초)")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.check_interval + 1)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _watch_loop(self):
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                self.check_jobs()
+            except Exception as e:
+                self.logger.error(f"watchdog 검사 실패: {e}")
+
+    def check_jobs(self, now: datetime = None) -> int:
+        """제한 시간을 넘긴 작업을 정리하고 정리한 작업 수 반환"""
+        now = now or datetime.now()
+        expired = 0
+
+        for job in self.dispatcher.running_jobs():
+            timeout = job.timeout_seconds or self.default_timeout
+            if (now - job.started_at).total_seconds() < timeout:
+                continue
+
+            error = CrawlTimeoutError(job.site_key, timeout, job.context.stage)
+            if self.dispatcher.abandon(job.site_key, error) is None:
+                continue
+
+            expired += 1
+            killed = job.context.kill_processes()
+            self.logger.error(f"{error} - 브라우저 프로세스 {killed}개 종료")
+
+            if self.on_timeout:
+                try:
+                    self.on_timeout(job, error)
+                except Exception as e:
+                    self.logger.error(f"타임아웃 처리 실패 ({job.site_key}): {e}")
+
+        return expired
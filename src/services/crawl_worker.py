@@ -0,0 +1,216 @@
+"""
+크롤링 워커 서비스
+작업 큐에서 사이트 크롤링 작업을 가져와 CrawlingService로 실행하고 진행 상황과 결과를 큐에 보고
+웹 서버와 별도 프로세스/호스트에서 실행하여 크롤링 용량을 웹 계층과 독립적으로 확장
+"""
+
+import os
+import uuid
+import socket
+import threading
+from typing import Dict, Any, List, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+from src.config.settings import CRAWL_QUEUE_CONFIG, CRAWL_WATCHDOG_CONFIG
+from src.crawlers.registry import SITE_CHOICES
+from src.interfaces.crawler_interface import CrawlJobQueueInterface
+from src.services.crawler_service import CrawlingService
+from src.services.crawl_job_queue import (
+    JOB_SUCCEEDED, JOB_FAILED, JOB_TIMEOUT, evaluate_site_result, compact_crawl_result
+)
+from src.services.job_dispatcher import CrawlJob, CrawlJobDispatcher
+from src.services.crawl_watchdog import CrawlWatchdog, CrawlTimeoutError
+from src.utils.crawl_context import CrawlCancelledError, CrawlProgress, get_crawl_context
+
+
+class CrawlWorker:
+    """
+    크롤링 워커 클래스
+
+    - poll_seconds마다 만료된 리스를 정리하고, 실행 중 작업이 concurrency보다 적으면 새 작업을 할당받음
+    - 할당받은 작업은 로컬 디스패처(자원 풀 슬롯)에서 실행하고 watchdog이 제한 시간을 감시
+    - heartbeat_seconds마다 작업 리스를 연장하며 현재 단계/진행률을 기록
+      (리스를 잃은 작업은 다른 워커에 재할당되었으므로 브라우저를 정리하고 포기)
+    - 종료 시 새 작업 할당을 멈추고 실행 중 작업이 끝날 때까지 대기
+    """
+
+    def __init__(self, queue: CrawlJobQueueInterface, crawling_service: CrawlingService,
+                 concurrency: int = None, sites: List[str] = None, worker_id: str = None,
+                 config: Dict[str, Any] = None):
+        self.queue = queue
+        self.crawling_service = crawling_service
+        self.config = {**CRAWL_QUEUE_CONFIG, **(config or {})}
+        self.concurrency = max(1, concurrency or self.config["worker_concurrency"])
+        self.sites = sites
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.logger = get_logger(__name__)
+
+        self.dispatcher = CrawlJobDispatcher()
+        self.watchdog = CrawlWatchdog(self.dispatcher, self._handle_timeout)
+        self._active: Dict[int, Dict[str, Any]] = {}
+        self._progress: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def run(self):
+        """stop() 호출(또는 SIGTERM/SIGINT) 전까지 작업 할당 및 실행 반복"""
+        self.logger.info(f"크롤링 워커 시작: {self.worker_id} (동시 실행: {self.concurrency}, "
+                         f"대상: {', '.join(self.sites) if self.sites else '전체 사이트'})")
+        self._start_background()
+        try:
+            while not self._stop_event.is_set():
+                self.queue.requeue_expired()
+                while self._active_count() < self.concurrency and not self._stop_event.is_set():
+                    if not self._claim_and_submit():
+                        break
+                self._stop_event.wait(self.config["poll_seconds"])
+        finally:
+            self._shutdown()
+
+    def run_once(self) -> bool:
+        """작업 하나를 할당받아 완료될 때까지 실행 (없으면 False)"""
+        self._start_background()
+        try:
+            self.queue.requeue_expired()
+            job = self._claim_and_submit()
+            if job is None:
+                return False
+            job["future"].exception()
+            return True
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _start_background(self):
+        """watchdog 및 heartbeat 스레드 시작"""
+        self.queue.register_worker(self.worker_id, self.concurrency, self.sites)
+        if CRAWL_WATCHDOG_CONFIG.get("enabled", True):
+            self.watchdog.start()
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="crawl-worker-heartbeat",
+                                                  daemon=True)
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self):
+        while not self._heartbeat_stop.wait(self.config["heartbeat_seconds"]):
+            try:
+                self.queue.register_worker(self.worker_id, self.concurrency, self.sites)
+                self._send_heartbeats()
+            except Exception as e:
+                self.logger.error(f"크롤링 워커 heartbeat 실패: {e}")
+
+    def _shutdown(self):
+        self.logger.info(f"크롤링 워커 종료 중: 실행 중 작업 {self._active_count()}개 완료 대기")
+        # 대기 중 작업 취소 및 실행 중 작업 완료 대기 (그동안에도 watchdog/heartbeat 유지)
+        self.dispatcher.shutdown(wait=True)
+        self.watchdog.stop()
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join(timeout=5)
+        self.queue.unregister_worker(self.worker_id)
+        self.logger.info(f"크롤링 워커 종료: {self.worker_id}")
+
+    def _active_count(self) -> int:
+        with self._lock:
+            return len(self._active)
+
+    def _register(self, job: Dict[str, Any]):
+        with self._lock:
+            self._active[job["id"]] = job
+
+    def _unregister(self, job_id: int) -> bool:
+        with self._lock:
+            self._progress.pop(job_id, None)
+            return self._active.pop(job_id, None) is not None
+
+    def _claim_and_submit(self) -> Optional[Dict[str, Any]]:
+        """작업 하나를 할당받아 로컬 디스패처에 등록 (할당할 작업이 없으면 None)"""
+        job = self.queue.claim(self.worker_id, self.sites)
+        if job is None:
+            return None
+
+        self.logger.info(f"크롤링 작업 할당: {job['site_key']} (작업 ID: {job['id']}, "
+                         f"대기: {job['wait_seconds']}초, 할당 {job['claim_count']}회차)")
+        self._register(job)
+        job["future"] = self.dispatcher.submit(job["site_key"], self._execute_job, job,
+                                               priority=job["priority"], timeout=job["timeout_seconds"])
+        if job["future"] is None:
+            self._unregister(job["id"])
+            self.queue.complete(job["id"], self.worker_id, JOB_FAILED,
+                                error_message="워커에서 같은 사이트 작업이 이미 실행 중", error_type="RuntimeError")
+            return None
+        return job
+
+    def _execute_job(self, job: Dict[str, Any]):
+        """디스패처 작업 스레드에서 사이트 크롤링 실행 후 결과 보고"""
+        site_key = job["site_key"]
+        job_id = job["id"]
+
+        def record_progress(value):
+            # 크롤러의 진행률 (heartbeat 시 함께 기록)
+            with self._lock:
+                self._progress[job_id] = value
+
+        try:
+            choice = SITE_CHOICES.get(site_key)
+            if not choice:
+                raise ValueError(f"알 수 없는 사이트: {site_key}")
+
+            crawl_result = self.crawling_service.execute_crawling(choice, CrawlProgress(record_progress), None,
+                                                                   is_periodic=True)
+            context = get_crawl_context()
+            if context is not None and context.cancelled:
+                raise CrawlCancelledError(f"취소된 크롤링 ({site_key}, 마지막 단계: {context.stage})")
+
+            success, error_message, error_type = evaluate_site_result(crawl_result, site_key)
+            status = JOB_SUCCEEDED if success else JOB_FAILED
+            if self._unregister(job_id):
+                self.queue.complete(job_id, self.worker_id, status, compact_crawl_result(crawl_result),
+                                    error_message, error_type)
+            self.logger.info(f"크롤링 작업 완료: {site_key} (작업 ID: {job_id}, 상태: {status})")
+            return crawl_result
+
+        except CrawlCancelledError as e:
+            # 타임아웃/리스 상실로 이미 처리된 작업
+            self.logger.warning(f"취소된 크롤링 작업 종료: {site_key} ({e})")
+        except Exception as e:
+            self.logger.error(f"크롤링 작업 실패: {site_key} (작업 ID: {job_id}): {e}")
+            if self._unregister(job_id):
+                context = get_crawl_context()
+                self.queue.complete(job_id, self.worker_id, JOB_FAILED, None, str(e), type(e).__name__,
+                                    context.stage if context else None)
+        return None
+
+    def _handle_timeout(self, crawl_job: CrawlJob, error: CrawlTimeoutError):
+        """watchdog 타임아웃 시 작업 결과를 timeout으로 기록"""
+        job = crawl_job.args[0]
+        if self._unregister(job["id"]):
+            self.queue.complete(job["id"], self.worker_id, JOB_TIMEOUT, None, str(error),
+                                "CrawlTimeoutError", error.stage)
+
+    def _send_heartbeats(self):
+        """실행 중 작업의 리스 연장 및 단계/진행률 기록 (리스를 잃은 작업은 포기)"""
+        contexts = {crawl_job.site_key: crawl_job.context for crawl_job in self.dispatcher.running_jobs()}
+        with self._lock:
+            jobs = list(self._active.values())
+            progress = dict(self._progress)
+
+        for job in jobs:
+            context = contexts.get(job["site_key"])
+            stage = context.stage if context else None
+            if self.queue.heartbeat(job["id"], self.worker_id, stage, progress.get(job["id"])):
+                continue
+
+            self.logger.warning(f"작업 리스 상실 - 크롤링 포기: {job['site_key']} (작업 ID: {job['id']})")
+            self._unregister(job["id"])
+            abandoned = self.dispatcher.abandon(job["site_key"], CrawlCancelledError("작업 리스 상실"))
+            if abandoned is not None:
+                abandoned.context.kill_processes()
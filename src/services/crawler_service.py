@@ -9,11 +9,13 @@ import pandas as pd
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.interfaces.crawler_interface import CrawlerInterface, DataRepositoryInterface
 from src.services.legacy_notification_service import NotificationService as LegacyNotificationService
+from src.services.recent_documents import RecentDocuments
 from src.config.logging_config import get_logger
+from src.utils.crawl_context import CrawlCancelledError, set_crawl_stage, ensure_not_cancelled, report_status
+from src.utils.event_loop import submit_coroutine
 import sqlite3
 from datetime import datetime
 import json
-import asyncio
 
 
 class CrawlingService:
@@ -39,6 +41,7 @@ class CrawlingService:
         
         # 새로운 모니터링 시스템용 notification_service는 필요할 때 import
         self._notification_service = None
+        self._snapshot_service = None
     
     @property
     def notification_service(self):
@@ -52,6 +55,19 @@ class CrawlingService:
                 self._notification_service = self.legacy_notification_service
         return self._notification_service
     
+    @notification_service.setter
+    def notification_service(self, service):
+        """웹 서버 등에서 공유 알림 서비스(WebSocket 매니저 포함) 주입"""
+        self._notification_service = service
+    
+    @property
+    def snapshot_service(self):
+        """지연 로딩을 통한 분석용 스냅샷 서비스 접근 (SQLite 저장소에서만 사용)"""
+        if self._snapshot_service is None and hasattr(self.repository, 'get_latest_change_seq'):
+            from src.services.snapshot_service import SnapshotService
+            self._snapshot_service = SnapshotService(self.repository)
+        return self._snapshot_service
+    
     def execute_crawling(self, choice: str, progress: Optional[Callable], status_message: Optional[Callable], is_periodic: bool = False) -> Dict[str, Any]:
         """
         example.py 기반 새로운 데이터 탐지에 특화된 크롤링 실행 로직
@@ -85,7 +101,7 @@ class CrawlingService:
                 error_msg = f"선택된 크롤러 '{target_crawler}'가 사용 불가능합니다."
                 self.logger.error(error_msg)
                 self._show_message(error_msg)
-                return
+                return {"status": "error", "message": error_msg, "error": error_msg, "results": []}
             selected_crawlers = [target_crawler]
         elif choice == "7":
             # 전체 크롤링인 경우만 사용 가능한 크롤러 필터링
@@ -118,9 +134,14 @@ class CrawlingService:
                     self.log_new_data_and_notify(
                         crawler_key, 
                         result.get('new_entries', pd.DataFrame()), 
-                        session_id
+                        session_id,
+                        result.get('change_seq_range')
                     )
                 
+                # 분석용 Parquet 스냅샷 증분 반영
+                if result.get('status') == 'success':
+                    self._export_snapshot(crawler_key)
+                
                 # 개별 사이트 완료 시 즉시 알림 (전체 크롤링이 아닌 경우) - 레거시 알림
                 if choice != "7":
                     alert_message = self.legacy_notification_service.create_new_data_alert(
@@ -183,15 +204,14 @@ class CrawlingService:
             key_column = crawler.get_key_column()
             
             # 상태 메시지 업데이트
-            if status_message:
-                status_message.config(text=f"{site_name} 데이터 크롤링 중...")
-                status_message.update()
+            report_status(status_message, f"{site_name} 데이터 크롤링 중...", site=crawler_key, stage="start")
             
             self.logger.info(f"{site_name} 크롤링 상세 로그:")
             self.logger.info("-" * 50)
             
             # 1단계: 기존 데이터 로드 및 분석
             self.logger.info("[1/4] 기존 데이터 로드 중...")
+            set_crawl_stage("[1/4] 기존 데이터 로드")
             existing_data = self.repository.load_existing_data(crawler_key)
             self.logger.info(f"  기존 데이터: {len(existing_data)}개")
             
@@ -202,9 +222,9 @@ class CrawlingService:
             
             # 2단계: 새 데이터 크롤링
             self.logger.info(f"[2/4] {site_name} 사이트 크롤링 중...")
-            if status_message:
-                status_message.config(text=f"{site_name} 사이트에서 최신 데이터 수집 중...")
-                status_message.update()
+            set_crawl_stage(f"[2/4] {site_name} 사이트 크롤링")
+            report_status(status_message, f"{site_name} 사이트에서 최신 데이터 수집 중...",
+                          site=crawler_key, stage="crawling")
             
             new_data = crawler.crawl(progress_callback=progress, status_callback=status_message)
             
@@ -235,9 +255,9 @@ class CrawlingService:
             
             # 3단계: example.py 스타일의 상세한 새로운 데이터 탐지 로직
             self.logger.info("[3/4] 새로운 데이터 탐지 및 분석...")
-            if status_message:
-                status_message.config(text=f"{site_name} 새로운 데이터 분석 중...")
-                status_message.update()
+            set_crawl_stage("[3/4] 새로운 데이터 탐지")
+            report_status(status_message, f"{site_name} 새로운 데이터 분석 중...",
+                          site=crawler_key, stage="comparing", items=len(new_data))
             
             # example.py의 compare_data 로직을 정확히 재현
             self.logger.debug("  [DEBUG] compare_data 스타일 분석:")
@@ -303,6 +323,7 @@ class CrawlingService:
             
             # 4단계: 데이터 저장 및 백업
             self.logger.info("[4/4] 데이터 저장 및 백업...")
+            set_crawl_stage("[4/4] 데이터 저장")
             crawling_stats = {
                 'total_crawled': len(new_data),
                 'existing_count': len(existing_data),
@@ -312,9 +333,8 @@ class CrawlingService:
             }
             
             if not new_entries.empty:
-                if status_message:
-                    status_message.config(text=f"{site_name} 새로운 데이터 {len(new_entries)}개 저장 중...")
-                    status_message.update()
+                report_status(status_message, f"{site_name} 새로운 데이터 {len(new_entries)}개 저장 중...",
+                              site=crawler_key, stage="saving", new_items=len(new_entries))
                 
                 # 백업 생성 전 링크 상태 확인
                 if crawler_key in ['nts_authority', 'nts_precedent']:
@@ -327,7 +347,13 @@ class CrawlingService:
                 self.logger.info(f"  백업 완료: {backup_path}")
                 
                 # 데이터 저장 (기존 데이터에 신규 데이터 추가)
+                # 저장 전후 CDC 시퀀스로 이번 실행에서 삽입된 변경 구간 기록
+                seq_before = self._get_latest_change_seq(crawler_key)
+                ensure_not_cancelled()
                 save_success = self.repository.save_data(crawler_key, new_entries, is_incremental=True)
+                change_seq_range = None
+                if seq_before is not None:
+                    change_seq_range = (seq_before, self._get_latest_change_seq(crawler_key))
                 
                 if save_success:
                     self.logger.info(f"  저장 완료: {len(new_entries)}개 신규 항목")
@@ -347,6 +373,8 @@ class CrawlingService:
                     }
             else:
                 self.logger.info("  새로운 데이터 없음 (모든 데이터가 기존에 존재)")
+                latest_seq = self._get_latest_change_seq(crawler_key)
+                change_seq_range = (latest_seq, latest_seq) if latest_seq is not None else None
             
             # 진행률 업데이트 (웹 환경 전용)
             if progress and hasattr(progress, 'value'):
@@ -354,9 +382,8 @@ class CrawlingService:
                 progress.value = overall_progress
                 progress.update()
             
-            if status_message and hasattr(status_message, 'config'):
-                status_message.config(text=f"{site_name} 완료: 신규 {len(new_entries)}개")
-                status_message.update()
+            report_status(status_message, f"{site_name} 완료: 신규 {len(new_entries)}개",
+                          site=crawler_key, stage="done", items=len(new_data), new_items=len(new_entries))
             
             self.logger.info(f"  {site_name} 크롤링 완료!")
             self.logger.info(f"    전체 수집: {len(new_data)}개")
@@ -371,9 +398,13 @@ class CrawlingService:
                 'existing_count': len(existing_data),
                 'new_entries': new_entries,
                 'crawling_stats': crawling_stats,
-                'key_samples': self._get_new_data_samples(new_entries, crawler_key, 5)
+                'key_samples': self._get_new_data_samples(new_entries, crawler_key, 5),
+                'change_seq_range': change_seq_range
             }
                 
+        except CrawlCancelledError:
+            # 포기된 크롤링은 오류 알림 없이 종료 (타임아웃 기록은 watchdog이 담당)
+            raise
         except Exception as e:
             error_msg = f"  ❌ {crawler_key} 크롤링 중 오류 발생: {str(e)}"
             print(error_msg)
@@ -394,6 +425,7 @@ class CrawlingService:
                 'site_key': crawler_key,
                 'status': 'error',
                 'error_message': str(e),
+                'error_type': type(e).__name__,
                 'new_count': 0,
                 'total_crawled': 0
             }
@@ -463,10 +495,27 @@ class CrawlingService:
         """메시지 표시 (웹 환경 전용)"""
         self.logger.info(f"[알림] 크롤링 완료: {message}")
     
-    def log_new_data_and_notify(self, site_key: str, new_entries: pd.DataFrame, session_id: str = None) -> None:
-        """새로운 데이터를 로그에 기록하고 알림 발송"""
+    def _export_snapshot(self, site_key: str) -> None:
+        """크롤링 후 분석용 스냅샷 증분 내보내기 (실패해도 크롤링 결과에는 영향 없음)"""
+        try:
+            snapshot_service = self.snapshot_service
+            if snapshot_service and snapshot_service.is_enabled():
+                snapshot_service.export_incremental(site_key)
+        except Exception as e:
+            self.logger.warning(f"스냅샷 내보내기 실패 ({site_key}): {e}")
+    
+    def _get_latest_change_seq(self, site_key: str) -> Optional[int]:
+        """저장소의 마지막 CDC 변경 시퀀스 조회 (지원하지 않는 저장소는 None)"""
+        if hasattr(self.repository, 'get_latest_change_seq'):
+            return self.repository.get_latest_change_seq(site_key)
+        return None
+    
+    def log_new_data_and_notify(self, site_key: str, new_entries: pd.DataFrame, session_id: str = None,
+                                seq_range: tuple = None) -> None:
+        """새로운 데이터를 로그에 기록하고 알림 발송 (seq_range: 이번 저장의 CDC 시퀀스 구간)"""
         if new_entries.empty:
             return
+        ensure_not_cancelled()
         
         try:
             # 사이트별 키 컬럼 매핑
@@ -480,128 +529,119 @@ class CrawlingService:
             }
             
             key_column = key_column_mapping.get(site_key, "문서번호")
-            current_time = datetime.now()
             
-            # new_data_log 테이블에 개별 데이터 기록
+            # 기록할 행을 컬럼 단위로 미리 구성 (쓰기 트랜잭션은 INSERT 동안만 유지)
+            rows = self._build_new_data_log_rows(site_key, new_entries, key_column, session_id)
+            
+            # new_data_log 테이블에 일괄 기록
             with sqlite3.connect(self.repository.db_path) as conn:
-                for _, row in new_entries.iterrows():
-                    data_id = str(row.get(key_column, "unknown"))
-                    data_title = str(row.get("제목", ""))[:200]  # 제목 길이 제한
-                    data_category = str(row.get("세목", ""))
-                    data_date = str(row.get("생산일자", row.get("결정일자", row.get("회신일자", ""))))
-                    
-                    # 데이터 요약 생성
-                    data_summary = self._create_data_summary(row, site_key)
-                    
-                    # 태그 생성
-                    tags = self._generate_tags(row, site_key)
-                    
-                    # 메타데이터 생성
-                    metadata = {
-                        "crawl_session_id": session_id,
-                        "original_data": dict(row.head(5)),  # 처음 5개 컬럼만 저장
-                        "site_key": site_key
-                    }
-                    
-                    conn.execute("""
-                        INSERT OR IGNORE INTO new_data_log 
-                        (site_key, data_id, data_type, data_title, data_summary,
-                         data_category, data_date, crawl_session_id, discovered_at,
-                         tags, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        site_key,
-                        data_id,
-                        "record",
-                        data_title,
-                        data_summary,
-                        data_category,
-                        data_date,
-                        session_id,
-                        current_time.isoformat(),
-                        json.dumps(tags, ensure_ascii=False),
-                        json.dumps(metadata, ensure_ascii=False)
-                    ))
+                conn.executemany("""
+                    INSERT OR IGNORE INTO new_data_log 
+                    (site_key, data_id, data_type, data_title, data_summary,
+                     data_category, data_date, crawl_session_id, discovered_at,
+                     tags, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
                 
                 inserted_count = conn.total_changes
                 self.logger.info(f"새로운 데이터 로그 기록: {inserted_count}개")
+                
+                # 최근 문서 프로젝션에 같은 트랜잭션에서 반영 (알림 본문/API가 바로 조회)
+                RecentDocuments.refresh(conn)
             
             # 알림 발송 (비동기)
             if hasattr(self.notification_service, 'send_new_data_notification'):
                 try:
-                    # asyncio 이벤트 루프가 있는 경우에만 알림 발송
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(
-                            self.notification_service.send_new_data_notification(
-                                site_key, len(new_entries), session_id
-                            )
-                        )
-                    else:
-                        # 이벤트 루프가 없는 경우 새 루프 생성하여 실행
-                        asyncio.run(
-                            self.notification_service.send_new_data_notification(
-                                site_key, len(new_entries), session_id
-                            )
-                        )
+                    # 웹 서버 이벤트 루프가 있으면 그 루프로 전달, 없으면(CLI) 즉시 실행
+                    submit_coroutine(
+                        self.notification_service.send_new_data_notification(
+                            site_key, len(new_entries), session_id, seq_range
+                        ),
+                        "새로운 데이터 알림 발송"
+                    )
                 except Exception as e:
                     self.logger.warning(f"알림 발송 실패: {e}")
             
         except Exception as e:
             self.logger.error(f"새로운 데이터 로깅 실패: {e}")
     
-    def _create_data_summary(self, row: pd.Series, site_key: str) -> str:
-        """데이터 요약 생성"""
-        try:
-            if site_key == "tax_tribunal":
-                return f"{row.get('세목', '')} - {row.get('유형', '')} ({row.get('결정일', '')})"
-            elif site_key in ["nts_authority", "nts_precedent"]:
-                return f"{row.get('세목', '')} 관련 ({row.get('생산일자', '')})"
-            elif site_key == "moef":
-                return f"기획재정부 해석 ({row.get('회신일자', '')})"
-            elif site_key == "mois":
-                return f"{row.get('세목', '')} 유권해석 ({row.get('생산일자', '')})"
-            elif site_key == "bai":
-                return f"{row.get('청구분야', '')} 심사 ({row.get('결정일자', '')})"
-            else:
-                return str(row.get("제목", ""))[:100]
-        except Exception:
-            return "데이터 요약 생성 실패"
+    def _build_new_data_log_rows(self, site_key: str, new_entries: pd.DataFrame, key_column: str,
+                                 session_id: str = None) -> List[tuple]:
+        """new_data_log INSERT 파라미터 목록 (요약/태그/메타데이터를 컬럼 단위로 계산하고 JSON은 일괄 직렬화)"""
+        df = new_entries.reset_index(drop=True)
+        
+        def column(name: str, default: str = "") -> pd.Series:
+            # 행 단위 str()과 같은 결과 (결측값은 'nan'/'None', pandas 3의 astype(str)은 결측값을 유지함)
+            return df[name].map(str) if name in df.columns else pd.Series(default, index=df.index)
+        
+        data_date_column = next((name for name in ("생산일자", "결정일자", "회신일자") if name in df.columns), None)
+        data_date = column(data_date_column) if data_date_column else pd.Series("", index=df.index)
+        
+        # 메타데이터: 처음 5개 컬럼을 행별 dict로 변환 (결측값은 null)
+        original_columns = df.iloc[:, :5].astype(object)
+        original_data = original_columns.where(original_columns.notna(), None).to_dict("records")
+        metadata = [
+            json.dumps({"crawl_session_id": session_id, "original_data": original, "site_key": site_key},
+                       ensure_ascii=False, default=str)
+            for original in original_data
+        ]
+        
+        return list(zip(
+            [site_key] * len(df),
+            column(key_column, "unknown"),
+            ["record"] * len(df),
+            column("제목").str[:200],  # 제목 길이 제한
+            self._create_data_summaries(df, site_key, column),
+            column("세목"),
+            data_date,
+            [session_id] * len(df),
+            [datetime.now().isoformat()] * len(df),
+            self._generate_tags_json(df, site_key),
+            metadata
+        ))
     
-    def _generate_tags(self, row: pd.Series, site_key: str) -> List[str]:
-        """데이터 태그 생성"""
-        tags = [site_key]
+    def _create_data_summaries(self, df: pd.DataFrame, site_key: str, column: Callable[..., pd.Series]) -> pd.Series:
+        """사이트별 데이터 요약 (컬럼 단위 문자열 결합)"""
+        if site_key == "tax_tribunal":
+            return column("세목") + " - " + column("유형") + " (" + column("결정일") + ")"
+        elif site_key in ["nts_authority", "nts_precedent"]:
+            return column("세목") + " 관련 (" + column("생산일자") + ")"
+        elif site_key == "moef":
+            return "기획재정부 해석 (" + column("회신일자") + ")"
+        elif site_key == "mois":
+            return column("세목") + " 유권해석 (" + column("생산일자") + ")"
+        elif site_key == "bai":
+            return column("청구분야") + " 심사 (" + column("결정일자") + ")"
+        else:
+            return column("제목").str[:100]
+    
+    def _generate_tags_json(self, df: pd.DataFrame, site_key: str) -> pd.Series:
+        """
+        데이터 태그 JSON 배열 (컬럼 단위 계산)
         
-        try:
-            # 세목 태그
-            if "세목" in row and row["세목"]:
-                tags.append(f"세목:{row['세목']}")
-            
-            # 청구분야 태그 (감사원)
-            if "청구분야" in row and row["청구분야"]:
-                tags.append(f"분야:{row['청구분야']}")
-            
-            # 유형 태그 (조세심판원)
-            if "유형" in row and row["유형"]:
-                tags.append(f"유형:{row['유형']}")
-            
-            # 시간 태그
-            current_time = datetime.now()
-            tags.append(f"발견:{current_time.strftime('%Y-%m')}")
-            
-            # 중요도 태그 (제목에 특정 키워드가 있는 경우)
-            title = str(row.get("제목", "")).lower()
+        사이트, 세목/분야/유형(값이 있는 경우), 발견 월, 중요(제목에 중요 키워드 포함) 순서
+        분류 값은 종류가 적으므로 고유 값만 JSON 이스케이프하여 매핑
+        """
+        tags = pd.Series("[" + json.dumps(site_key, ensure_ascii=False), index=df.index)
+        
+        for name, prefix in (("세목", "세목"), ("청구분야", "분야"), ("유형", "유형")):
+            if name not in df.columns:
+                continue
+            values = df[name]
+            present = values.notna() & (values.map(str) != "")
+            encoded = {value: ", " + json.dumps(f"{prefix}:{value}", ensure_ascii=False)
+                       for value in values[present].unique()}
+            tags = tags + values.map(encoded).where(present, "")
+        
+        tags = tags + ", " + json.dumps(f"발견:{datetime.now().strftime('%Y-%m')}", ensure_ascii=False)
+        
+        # 중요도 태그 (제목에 특정 키워드가 있는 경우)
+        if "제목" in df.columns:
             important_keywords = ["긴급", "중요", "신설", "개정", "폐지", "특례"]
-            
-            for keyword in important_keywords:
-                if keyword in title:
-                    tags.append("중요")
-                    break
-            
-        except Exception as e:
-            self.logger.warning(f"태그 생성 중 오류: {e}")
+            important = df["제목"].map(str).str.lower().str.contains("|".join(important_keywords), regex=True)
+            tags = tags + pd.Series(', "중요"', index=df.index).where(important, "")
         
-        return tags[:10]  # 최대 10개 태그
+        return tags + "]"
     
     def _get_new_data_samples(self, new_entries: pd.DataFrame, site_key: str, limit: int = 3) -> List[str]:
         """새로운 데이터 샘플 생성"""
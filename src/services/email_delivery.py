@@ -0,0 +1,275 @@
+"""
+이메일 발송 서비스
+SMTP 서버별로 로그인된 연결을 풀에 유지하고, 같은 서버의 여러 수신자에게는 한 세션에서 한 번에 발송
+"""
+
+import os
+import time
+import smtplib
+import threading
+from collections import deque
+from contextlib import contextmanager
+from email.message import Message
+from typing import Dict, Any, List, Optional, Tuple
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import EMAIL_DELIVERY_CONFIG
+from src.config.logging_config import get_logger
+
+
+def is_connection_error(error: Exception) -> bool:
+    """
+    연결을 버리고 재연결해야 하는 오류 여부
+
+    SMTPException도 OSError의 하위 클래스이므로, 인증 실패/수신자 거부/메시지 거부 같은
+    SMTP 응답 오류는 제외하고 연결 끊김과 소켓 오류만 해당
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, smtplib.SMTPHeloError)):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class _PooledConnection:
+    """풀에 보관되는 로그인된 SMTP 연결"""
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            try:
+                self.smtp.close()
+            except Exception:
+                pass
+
+
+class SMTPConnectionPool:
+    """
+    SMTP 서버 1개(호스트/포트/계정)에 대한 연결 풀
+
+    - 동시 사용 연결 수를 max_connections로 제한 (초과 요청은 반납될 때까지 대기)
+    - 반납된 연결은 재사용하며, health_check_idle_seconds 이상 유휴였던 연결은 NOOP으로 확인 후 사용
+    - idle_timeout_seconds 이상 유휴였거나 확인에 실패한 연결은 닫고 새로 연결/로그인
+    """
+
+    def __init__(self, host: str, port: int, username: str = None, password: str = None,
+                 use_tls: bool = True, config: Dict[str, Any] = None):
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.use_tls = bool(use_tls)
+        self.config = {**EMAIL_DELIVERY_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+
+        self._idle: deque = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.config["max_connections_per_server"])
+        self._closed = False
+        self.stats = {"connects": 0, "reuses": 0, "discards": 0, "messages": 0}
+
+    @contextmanager
+    def connection(self):
+        """
+        사용할 SMTP 연결 (블록 종료 시 풀에 반납)
+
+        블록 안에서 연결 오류가 발생하면 연결을 버리고 예외를 다시 발생시킴
+        """
+        self._slots.acquire()
+        pooled = None
+        try:
+            pooled = self._checkout()
+            yield pooled.smtp
+        except Exception as e:
+            if pooled is not None and is_connection_error(e):
+                self._discard(pooled)
+                pooled = None
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled)
+            self._slots.release()
+
+    def close(self):
+        """유휴 연결 모두 종료 (사용 중인 연결은 반납 시 종료)"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for pooled in idle:
+            pooled.close()
+
+    def _checkout(self) -> _PooledConnection:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+            if pooled is None:
+                return self._connect()
+
+            idle_seconds = now - pooled.last_used
+            if idle_seconds >= self.config["idle_timeout_seconds"]:
+                self._discard(pooled)
+                continue
+            if idle_seconds >= self.config["health_check_idle_seconds"] and not self._is_healthy(pooled):
+                self._discard(pooled)
+                continue
+
+            self.stats["reuses"] += 1
+            return pooled
+
+    def _checkin(self, pooled: _PooledConnection):
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(pooled)
+                return
+        pooled.close()
+
+    def _discard(self, pooled: _PooledConnection):
+        self.stats["discards"] += 1
+        pooled.close()
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        try:
+            return pooled.smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.config["connect_timeout_seconds"])
+        try:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.stats["connects"] += 1
+        self.logger.info(f"SMTP 연결 생성: {self.host}:{self.port} ({self.username or '익명'})")
+        return _PooledConnection(smtp)
+
+
+class EmailDeliveryService:
+    """
+    이메일 발송 서비스 클래스
+
+    - SMTP 서버 설정(호스트, 포트, 계정, TLS)별 연결 풀 관리
+    - send_message()는 수신자를 max_recipients_per_message 단위로 나누어 한 세션에서
+      MAIL FROM 1회 + RCPT TO 여러 회로 발송 (수신자 주소는 메시지 헤더에 노출되지 않음, BCC 방식)
+    - 연결 오류 시 연결을 버리고 재연결하여 재시도, 수신자 거부는 재시도하지 않고 결과에 기록
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = {**EMAIL_DELIVERY_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._pools: Dict[Tuple, SMTPConnectionPool] = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, host: str, port: int, username: str = None, password: str = None,
+                 use_tls: bool = True) -> SMTPConnectionPool:
+        key = (host, int(port), username or "", bool(use_tls))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or pool.password != password:
+                if pool is not None:
+                    pool.close()
+                pool = SMTPConnectionPool(host, port, username, password, use_tls, self.config)
+                self._pools[key] = pool
+            return pool
+
+    def send_message(self, pool: SMTPConnectionPool, message: Message, recipients: List[str],
+                     from_addr: str = None) -> Dict[str, Optional[str]]:
+        """
+        수신자 목록에 메시지 발송
+
+        Returns:
+            수신자별 결과 (성공이면 None, 실패면 오류 메시지)
+        """
+        results: Dict[str, Optional[str]] = {}
+        batch_size = max(1, self.config["max_recipients_per_message"])
+        for start in range(0, len(recipients), batch_size):
+            batch = recipients[start:start + batch_size]
+            results.update(self._send_batch(pool, message, batch, from_addr))
+        return results
+
+    def _send_batch(self, pool: SMTPConnectionPool, message: Message, recipients: List[str],
+                    from_addr: Optional[str]) -> Dict[str, Optional[str]]:
+        max_retries = max(1, self.config["max_retries"])
+        for attempt in range(max_retries):
+            try:
+                with pool.connection() as smtp:
+                    refused = smtp.send_message(message, from_addr=from_addr, to_addrs=recipients)
+                pool.stats["messages"] += 1
+                return {recipient: self._refusal_message(refused.get(recipient)) for recipient in recipients}
+
+            except smtplib.SMTPRecipientsRefused as e:
+                # 모든 수신자가 거부된 경우 (연결은 정상이므로 재시도하지 않음)
+                return {recipient: self._refusal_message(e.recipients.get(recipient, (0, b"refused")))
+                        for recipient in recipients}
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if not is_connection_error(e):
+                    # 인증 실패/메시지 거부 등은 재연결해도 같은 결과
+                    self.logger.error(f"SMTP 발송 실패 ({pool.host}): {e}")
+                    return {recipient: error for recipient in recipients}
+
+                self.logger.warning(f"SMTP 발송 시도 {attempt + 1}/{max_retries} 실패 ({pool.host}): {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(self.config["retry_backoff_seconds"] * (2 ** attempt))
+                    continue
+                self.logger.error(f"SMTP 발송 최종 실패 ({pool.host}): {e}")
+                return {recipient: error for recipient in recipients}
+        return {recipient: "발송 실패" for recipient in recipients}
+
+    @staticmethod
+    def _refusal_message(refusal) -> Optional[str]:
+        if refusal is None:
+            return None
+        code, response = refusal
+        if isinstance(response, bytes):
+            response = response.decode("utf-8", "replace")
+        return f"{code} {response}"
+
+    def close(self):
+        """모든 연결 풀 종료"""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return [{"host": pool.host, "port": pool.port, "username": pool.username,
+                 "idle_connections": len(pool._idle), **pool.stats} for pool in pools]
+
+
+# 프로세스 전역 공유 발송 서비스 (NotificationService 인스턴스가 여러 개여도 연결 풀 공유)
+_delivery_service: Optional[EmailDeliveryService] = None
+_delivery_service_lock = threading.Lock()
+
+
+def get_email_delivery_service() -> EmailDeliveryService:
+    """공유 이메일 발송 서비스 반환 (최초 호출 시 생성)"""
+    global _delivery_service
+    if _delivery_service is None:
+        with _delivery_service_lock:
+            if _delivery_service is None:
+                _delivery_service = EmailDeliveryService()
+    return _delivery_service
+
+
+def shutdown_email_delivery():
+    """공유 이메일 발송 서비스의 SMTP 연결 종료"""
+    global _delivery_service
+    with _delivery_service_lock:
+        if _delivery_service is not None:
+            _delivery_service.close()
+            _delivery_service = None
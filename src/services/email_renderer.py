@@ -0,0 +1,142 @@
+"""
+이메일 본문 렌더링
+컴파일된 Jinja 템플릿으로 알림 이메일 HTML을 렌더링하고, 알림별 문서 조회/렌더링 결과를 캐시
+(한 알림을 여러 SMTP 서버/수신자에게 발송해도 문서 조회와 렌더링은 한 번만 수행)
+"""
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Hashable, Tuple
+import sys
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import EMAIL_TEMPLATE_CONFIG
+from src.config.logging_config import get_logger
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# (제목, 문서 목록) - 이메일 본문의 목록 단위
+EmailSection = Tuple[str, List[Dict[str, Any]]]
+
+
+class EmailRenderer:
+    """
+    이메일 본문 렌더러 클래스
+
+    - 템플릿은 시작 시 한 번 컴파일되어 재사용 (파일 변경 확인 없음)
+    - 문서 목록은 (알림, 구독 보기) 단위로, 렌더링한 본문은 (알림, 언어, 구독 보기) 단위로 캐시
+      (구독 보기: 다이제스트 수신자에게 표시할 사이트별 일치 문서 ID)
+    - 같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 조회/렌더링하고 나머지는 결과를 기다림
+    """
+
+    def __init__(self, recent_documents, site_names: Dict[str, str], config: Dict[str, Any] = None,
+                 max_items_per_site: int = 10):
+        self.recent_documents = recent_documents
+        self.site_names = site_names
+        self.config = {**EMAIL_TEMPLATE_CONFIG, **(config or {})}
+        self.max_items_per_site = max_items_per_site
+        self.logger = get_logger(__name__)
+
+        template_dir = self.config["template_dir"]
+        if not os.path.isabs(template_dir):
+            template_dir = os.path.join(PROJECT_ROOT, template_dir)
+        self.environment = Environment(
+            loader=FileSystemLoader(template_dir),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.environment.get_template("notification.html")
+
+        self._sections: OrderedDict = OrderedDict()
+        self._bodies: OrderedDict = OrderedDict()
+        self._inflight: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = {"renders": 0, "cache_hits": 0, "data_loads": 0}
+
+    def render(self, notification, locale: str = None) -> str:
+        """알림 이메일 HTML 본문 (같은 알림/언어/구독 보기면 캐시된 본문 재사용)"""
+        locale = locale or self.config["default_locale"]
+        notification_key, view = self._keys(notification)
+        return self._cached(self._bodies, (notification_key, locale, view),
+                            lambda: self._render(notification, locale, notification_key, view))
+
+    def _render(self, notification, locale: str, notification_key: tuple, view: Optional[str]) -> str:
+        sections = self._cached(self._sections, (notification_key, view),
+                                lambda: self._load_sections(notification))
+        template = self.environment.select_template([f"notification.{locale}.html", "notification.html"])
+        self.stats["renders"] += 1
+        return template.render(
+            title=notification.title,
+            message=notification.message,
+            sections=sections,
+            dashboard_url=os.getenv('DASHBOARD_URL', 'http://localhost:8001'),
+            data_path="" if notification.notification_type == 'digest' else f"/data/{notification.site_key}"
+        )
+
+    def _load_sections(self, notification) -> List[EmailSection]:
+        """본문에 표시할 문서 목록 조회 (최근 문서 프로젝션 기준, 다이제스트는 사이트별 목록)"""
+        self.stats["data_loads"] += 1
+        metadata = notification.metadata or {}
+        if notification.notification_type == 'digest':
+            data_ids = metadata.get('data_ids', {})
+            return [
+                (f"{self.site_names.get(site_key, site_key)} ({count}개)",
+                 self.recent_documents.get_documents(site_key, data_ids[site_key][:self.max_items_per_site])
+                 if site_key in data_ids
+                 else self.recent_documents.list_documents(
+                     site_key=site_key, limit=min(count, self.max_items_per_site))["documents"])
+                for site_key, count in metadata.get('site_counts', {}).items()
+            ]
+        if notification.new_data_count <= 0:
+            return []
+        data_ids = metadata.get('data_ids', {}).get(notification.site_key)
+        if data_ids is not None:
+            # 구독 규칙으로 선별된 수신자는 일치 문서만 표시
+            documents = self.recent_documents.get_documents(notification.site_key, data_ids[:self.config["max_items"]])
+        else:
+            documents = self.recent_documents.list_documents(
+                site_key=notification.site_key, session_id=metadata.get('session_id'),
+                limit=min(notification.new_data_count, self.config["max_items"]))["documents"]
+        return [("새로운 데이터 목록", documents)]
+
+    @staticmethod
+    def _keys(notification) -> Tuple[tuple, Optional[str]]:
+        """(알림 키, 구독 보기 키)"""
+        metadata = dict(notification.metadata or {})
+        data_ids = metadata.pop('data_ids', None)
+        notification_key = (notification.notification_type, notification.site_key, notification.title,
+                            notification.message, notification.new_data_count,
+                            json.dumps(metadata, sort_keys=True, default=str))
+        return notification_key, json.dumps(data_ids, sort_keys=True) if data_ids else None
+
+    def _cached(self, cache: OrderedDict, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cache[key]
+            key_lock = self._inflight.setdefault((id(cache), key), threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in cache:
+                    self.stats["cache_hits"] += 1
+                    return cache[key]
+            try:
+                value = build()
+                with self._lock:
+                    cache[key] = value
+                    while len(cache) > self.config["render_cache_size"]:
+                        cache.popitem(last=False)
+                return value
+            finally:
+                with self._lock:
+                    self._inflight.pop((id(cache), key), None)
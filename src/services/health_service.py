@@ -0,0 +1,194 @@
+"""
+사이트 건강도 서비스
+crawl_schedules와 crawl_execution_log를 한 번의 집합 기반 SQL로 집계하여 사이트별 건강도 요약(site_health_summary)을 갱신
+상태 조회 API는 원본 로그 대신 요약 테이블을 읽어 사이트/이력이 늘어나도 일정한 비용으로 응답
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import HEALTH_CHECK_CONFIG
+from src.config.logging_config import get_logger
+
+
+# 사이트별 최근 실행 집계 후 상태 판정까지 한 번에 수행하여 요약 테이블에 UPSERT
+# (crawl_execution_log의 start_time/end_time은 로컬 ISO 문자열, crawl_schedules.last_success는 UTC CURRENT_TIMESTAMP)
+REFRESH_SQL = """
+    WITH recent AS (
+        SELECT site_key, status,
+               (julianday(end_time) - julianday(start_time)) * 86400.0 AS duration,
+               ROW_NUMBER() OVER (PARTITION BY site_key ORDER BY start_time DESC) AS run_index
+        FROM crawl_execution_log
+        WHERE site_key IS NOT NULL AND end_time IS NOT NULL AND status != 'running'
+          AND start_time >= :since
+    ),
+    windowed AS (
+        SELECT site_key, status, duration,
+               CUME_DIST() OVER (PARTITION BY site_key ORDER BY duration) AS duration_rank
+        FROM recent
+        WHERE run_index <= :window_runs
+    ),
+    stats AS (
+        SELECT site_key,
+               COUNT(*) AS runs,
+               SUM(status = 'success') AS successes,
+               MIN(CASE WHEN duration_rank >= 0.95 THEN duration END) AS p95_duration
+        FROM windowed
+        GROUP BY site_key
+    ),
+    sites AS (
+        SELECT s.site_key, s.last_success,
+               COALESCE(s.consecutive_errors, 0) AS consecutive_errors,
+               (julianday('now') - julianday(s.last_success)) * 24 AS age_hours,
+               COALESCE(st.runs, 0) AS runs,
+               CASE WHEN st.runs > 0 THEN CAST(st.successes AS REAL) / st.runs END AS success_rate,
+               st.p95_duration
+        FROM crawl_schedules s
+        LEFT JOIN stats st ON st.site_key = s.site_key
+    )
+    INSERT INTO site_health_summary
+        (site_key, status, status_reason, last_success, last_success_age_hours, consecutive_errors,
+         window_runs, success_rate, p95_duration_seconds, evaluated_at)
+    SELECT site_key,
+           CASE
+               WHEN consecutive_errors >= :error_consecutive_errors THEN 'error'
+               WHEN age_hours > :stale_success_hours THEN 'warning'
+               WHEN runs >= :min_runs_for_rate AND success_rate < :warning_success_rate THEN 'warning'
+               WHEN last_success IS NULL THEN 'unknown'
+               ELSE 'healthy'
+           END,
+           CASE
+               WHEN consecutive_errors >= :error_consecutive_errors THEN '연속 ' || consecutive_errors || '회 실패'
+               WHEN age_hours > :stale_success_hours
+                   THEN printf('%d시간 이상 성공한 크롤링 없음', :stale_success_hours)
+               WHEN runs >= :min_runs_for_rate AND success_rate < :warning_success_rate
+                   THEN printf('최근 %d회 성공률 %d%%', runs, CAST(success_rate * 100 AS INTEGER))
+               WHEN last_success IS NULL THEN '성공 이력 없음'
+           END,
+           last_success, ROUND(age_hours, 2), consecutive_errors,
+           runs, ROUND(success_rate, 4), ROUND(p95_duration, 1), CURRENT_TIMESTAMP
+    FROM sites
+    WHERE 1
+    ON CONFLICT(site_key) DO UPDATE SET
+        status = excluded.status,
+        status_reason = excluded.status_reason,
+        last_success = excluded.last_success,
+        last_success_age_hours = excluded.last_success_age_hours,
+        consecutive_errors = excluded.consecutive_errors,
+        window_runs = excluded.window_runs,
+        success_rate = excluded.success_rate,
+        p95_duration_seconds = excluded.p95_duration_seconds,
+        evaluated_at = excluded.evaluated_at
+"""
+
+# 요약에서 warning/error로 판정된 크롤러의 system_status를 한 번에 반영 (실행 중 사이트는 제외)
+SYNC_SYSTEM_STATUS_SQL = """
+    UPDATE system_status
+    SET status = h.status,
+        error_message = h.status_reason,
+        last_check = CURRENT_TIMESTAMP,
+        updated_at = CURRENT_TIMESTAMP
+    FROM site_health_summary h
+    WHERE system_status.site_key = h.site_key
+      AND system_status.component_type = 'crawler'
+      AND system_status.status != 'running'
+      AND h.status IN ('warning', 'error')
+"""
+
+
+class SiteHealthService:
+    """
+    사이트 건강도 서비스 클래스
+
+    - refresh(): 사이트별 마지막 성공 경과 시간, 연속 실패, 최근 window_runs회 성공률/p95 소요시간을
+      한 번의 SQL로 계산하여 site_health_summary에 저장하고 이상 사이트의 system_status 갱신
+    - get_system_status(): system_status와 건강도 요약을 조인하여 조회 (상태 API용)
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**HEALTH_CHECK_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._ensure_table()
+
+    def _ensure_table(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS site_health_summary (
+                        site_key TEXT PRIMARY KEY,
+                        status TEXT NOT NULL,  -- 'healthy', 'warning', 'error', 'unknown'
+                        status_reason TEXT,
+                        last_success TIMESTAMP,
+                        last_success_age_hours REAL,
+                        consecutive_errors INTEGER DEFAULT 0,
+                        window_runs INTEGER DEFAULT 0,  -- 집계에 사용된 최근 실행 수
+                        success_rate REAL,
+                        p95_duration_seconds REAL,
+                        evaluated_at TIMESTAMP
+                    )
+                """)
+        except Exception as e:
+            self.logger.error(f"건강도 요약 테이블 생성 실패: {e}")
+
+    def refresh(self) -> Dict[str, int]:
+        """건강도 요약 갱신 후 상태별 사이트 수 반환"""
+        params = {
+            "since": (datetime.now() - timedelta(days=self.config["lookback_days"])).isoformat(),
+            "window_runs": self.config["window_runs"],
+            "stale_success_hours": self.config["stale_success_hours"],
+            "error_consecutive_errors": self.config["error_consecutive_errors"],
+            "warning_success_rate": self.config["warning_success_rate"],
+            "min_runs_for_rate": self.config["min_runs_for_rate"]
+        }
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(REFRESH_SQL, params)
+                conn.execute(SYNC_SYSTEM_STATUS_SQL)
+                cursor = conn.execute("SELECT status, COUNT(*) FROM site_health_summary GROUP BY status")
+                return dict(cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"건강도 요약 갱신 실패: {e}")
+            return {}
+
+    def get_summary(self, site_key: str = None) -> List[Dict[str, Any]]:
+        """사이트별 건강도 요약 조회"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                if site_key:
+                    cursor = conn.execute("SELECT * FROM site_health_summary WHERE site_key = ?", (site_key,))
+                else:
+                    cursor = conn.execute("SELECT * FROM site_health_summary ORDER BY site_key")
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"건강도 요약 조회 실패: {e}")
+            return []
+
+    def get_system_status(self) -> Optional[List[Dict[str, Any]]]:
+        """system_status와 건강도 요약 조인 조회 (system_status 테이블이 없으면 None)"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='system_status'")
+            if not cursor.fetchone():
+                return None
+
+            cursor.execute("""
+                SELECT ss.site_key, ss.component_type, ss.status, ss.last_check, ss.last_success,
+                       ss.last_error, ss.error_message, ss.consecutive_errors, ss.health_score,
+                       ss.uptime_seconds, ss.response_time_ms,
+                       h.status AS health_status, h.status_reason AS health_reason,
+                       h.last_success_age_hours, h.window_runs, h.success_rate,
+                       h.p95_duration_seconds, h.evaluated_at AS health_evaluated_at
+                FROM system_status ss
+                LEFT JOIN site_health_summary h ON h.site_key = ss.site_key
+                ORDER BY ss.site_key, ss.component_type
+            """)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -0,0 +1,347 @@
+"""
+크롤링 작업 디스패처
+자원 풀(Selenium/HTTP 슬롯)과 우선순위 큐 기반 크롤링 작업 실행
+"""
+
+import os
+import heapq
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+from src.config.settings import CRAWL_RESOURCE_CONFIG
+from src.utils.crawl_context import CrawlContext, bind_crawl_context
+
+
+@dataclass
+class CrawlJob:
+    """대기/실행 중인 크롤링 작업"""
+    site_key: str
+    pool: str
+    priority: int
+    func: Callable
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    future: Future = field(default_factory=Future)
+    enqueued_at: datetime = field(default_factory=datetime.now)
+    started_at: datetime = None
+    timeout_seconds: Optional[float] = None
+    context: CrawlContext = None
+    thread: threading.Thread = None
+    released: bool = False  # 풀 슬롯 반환 여부 (사이트 잠금은 스레드가 끝날 때 해제)
+
+    @property
+    def abandoned(self) -> bool:
+        return self.context is not None and self.context.cancelled
+
+
+def detect_selenium_slots(config: Dict[str, Any] = None) -> int:
+    """
+    호스트 메모리 기준 동시 실행 가능한 Chrome(Selenium) 수 계산
+
+    (전체 메모리 - 예약 메모리) / 브라우저당 메모리를 selenium_max_slots 이내로 제한
+    """
+    config = config or CRAWL_RESOURCE_CONFIG
+    max_slots = config.get("selenium_max_slots", 2)
+    try:
+        total_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 / 1024
+        usable_mb = total_mb - config.get("reserved_memory_mb", 512)
+        slots = int(usable_mb // config.get("browser_memory_mb", 450))
+        return max(1, min(max_slots, slots))
+    except (ValueError, OSError, AttributeError):
+        return 1
+
+
+def _settle_future(future: Future, result: Any = None, error: BaseException = None):
+    """Future 결과 설정 (watchdog이 먼저 오류를 설정한 경우 무시)"""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class CrawlJobDispatcher:
+    """
+    크롤링 작업 디스패처 클래스
+
+    - 이름 있는 자원 풀(selenium, http 등)별 동시 실행 슬롯 제한
+    - crawl_schedules.priority 기반 우선순위 큐 (같은 우선순위는 먼저 들어온 순)
+    - 사이트별 배타 실행 (같은 사이트는 대기/실행 중 한 건만 허용)
+
+    풀 슬롯이 비어 있는 작업 중 우선순위가 가장 높은 작업을 꺼내 실행하므로,
+    Selenium 슬롯이 모두 사용 중이어도 HTTP 작업은 계속 진행됨.
+    작업은 각자 전용 스레드에서 실행되어, watchdog이 포기(abandon)한 작업의 스레드가
+    늦게 끝나더라도 다른 작업의 실행 슬롯을 점유하지 않음.
+    단, 포기한 작업의 사이트 잠금은 스레드가 실제로 끝날 때까지 유지하여
+    같은 사이트의 새 크롤링이 남은 스레드의 저장/알림 단계와 겹치지 않게 함
+    """
+
+    def __init__(self, pools: Dict[str, int] = None, site_pools: Dict[str, str] = None,
+                 default_pool: str = None):
+        self.logger = get_logger(__name__)
+        self.site_pools = site_pools or CRAWL_RESOURCE_CONFIG.get("site_pools", {})
+        self.default_pool = default_pool or CRAWL_RESOURCE_CONFIG.get("default_pool", "http")
+
+        pools = pools or CRAWL_RESOURCE_CONFIG.get("pools", {})
+        self.capacities = {
+            name: detect_selenium_slots() if capacity == "auto" else max(1, int(capacity))
+            for name, capacity in pools.items()
+        }
+        self.capacities.setdefault(self.default_pool, 1)
+        self.in_use = {name: 0 for name in self.capacities}
+
+        self._condition = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._queued: Dict[str, CrawlJob] = {}
+        self._running: Dict[str, CrawlJob] = {}
+        self._wait_times = deque(maxlen=CRAWL_RESOURCE_CONFIG.get("wait_history_size", 100))
+        self._completed_count = 0
+        self._abandoned_count = 0
+        self._shutdown = False
+
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, name="crawl-dispatcher", daemon=True
+        )
+        self._dispatch_thread.start()
+
+        self.logger.info(f"크롤링 디스패처 시작: 자원 풀 {self.capacities}")
+
+    def get_pool(self, site_key: str) -> str:
+        """사이트가 사용하는 자원 풀 이름"""
+        pool = self.site_pools.get(site_key, self.default_pool)
+        return pool if pool in self.capacities else self.default_pool
+
+    def submit(self, site_key: str, func: Callable, *args, priority: int = 0,
+               timeout: Optional[float] = None, **kwargs) -> Optional[Future]:
+        """
+        크롤링 작업 등록
+
+        Args:
+            timeout: 실행 제한 시간(초) - watchdog이 초과 여부를 검사
+
+        Returns:
+            작업 결과 Future (이미 실행 중이면 None, 이미 대기 중이면 기존 작업의 Future)
+        """
+        with self._condition:
+            if self._shutdown:
+                self.logger.warning(f"디스패처 종료됨 - 작업 등록 거부: {site_key}")
+                return None
+
+            running = self._running.get(site_key)
+            if running is not None:
+                if running.abandoned:
+                    self.logger.warning(f"포기된 크롤링 스레드가 아직 종료되지 않음: {site_key}")
+                else:
+                    self.logger.warning(f"크롤링 이미 실행 중: {site_key}")
+                return None
+
+            queued = self._queued.get(site_key)
+            if queued is not None:
+                self.logger.info(f"크롤링 이미 대기 중: {site_key}")
+                return queued.future
+
+            job = CrawlJob(site_key=site_key, pool=self.get_pool(site_key), priority=priority,
+                           func=func, args=args, kwargs=kwargs, timeout_seconds=timeout)
+            heapq.heappush(self._queue, (-priority, next(self._sequence), job))
+            self._queued[site_key] = job
+            self._condition.notify_all()
+
+        self.logger.info(f"크롤링 작업 대기열 등록: {site_key} (풀: {job.pool}, 우선순위: {priority})")
+        return job.future
+
+    def _take_runnable_job(self) -> Optional[CrawlJob]:
+        """슬롯이 비어 있는 풀의 작업 중 우선순위가 가장 높은 작업 꺼내기 (락 보유 상태에서 호출)"""
+        for entry in sorted(self._queue):
+            job = entry[2]
+            if self.in_use[job.pool] < self.capacities[job.pool]:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                return job
+        return None
+
+    def _dispatch_loop(self):
+        """대기열에서 실행 가능한 작업을 꺼내 작업 스레드에 할당"""
+        while True:
+            with self._condition:
+                job = self._take_runnable_job()
+                while job is None and not self._shutdown:
+                    self._condition.wait()
+                    job = self._take_runnable_job()
+
+                if self._shutdown:
+                    if job is not None:
+                        job.future.cancel()
+                    return
+
+                del self._queued[job.site_key]
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+
+                self.in_use[job.pool] += 1
+                job.started_at = datetime.now()
+                job.context = CrawlContext(job.site_key)
+                self._running[job.site_key] = job
+                self._wait_times.append((job.started_at - job.enqueued_at).total_seconds())
+
+                job.thread = threading.Thread(
+                    target=self._run_job, args=(job,), name=f"crawl-{job.site_key}", daemon=True
+                )
+                job.thread.start()
+
+    def _run_job(self, job: CrawlJob):
+        """작업 실행 후 슬롯 반환 (watchdog이 이미 포기한 작업이면 결과를 버림)"""
+        bind_crawl_context(job.context)
+        try:
+            _settle_future(job.future, result=job.func(*job.args, **job.kwargs))
+        except BaseException as e:
+            if job.context.cancelled:
+                self.logger.info(f"포기된 크롤링 작업 종료 ({job.site_key}): {e}")
+            else:
+                self.logger.error(f"크롤링 작업 예외 ({job.site_key}): {e}")
+            _settle_future(job.future, error=e)
+        finally:
+            bind_crawl_context(None)
+            self._finish(job)
+
+    def _release_slot(self, job: CrawlJob) -> bool:
+        """작업의 풀 슬롯 반환 (락 보유 상태에서 호출, 이미 반환했으면 False)"""
+        if job.released:
+            return False
+        job.released = True
+        self.in_use[job.pool] -= 1
+        self._condition.notify_all()
+        return True
+
+    def _finish(self, job: CrawlJob):
+        """작업 스레드 종료 시 풀 슬롯(포기되지 않은 경우)과 사이트 잠금 해제"""
+        with self._condition:
+            if self._release_slot(job):
+                self._completed_count += 1
+            if self._running.get(job.site_key) is job:
+                del self._running[job.site_key]
+            self._condition.notify_all()
+
+    def abandon(self, site_key: str, error: BaseException) -> Optional[CrawlJob]:
+        """
+        실행 중인 작업 포기 (watchdog 타임아웃 처리용)
+
+        작업을 취소 상태로 표시하고 Future에 오류를 설정한 뒤 풀 슬롯만 즉시 반환함.
+        작업 스레드는 강제 종료할 수 없으므로 사이트 잠금은 스레드가 끝날 때까지 유지
+        (남은 스레드는 다음 set_crawl_stage()에서 CrawlCancelledError로 저장/알림 단계를 건너뜀)
+
+        Returns:
+            포기한 작업 (실행 중이 아니거나 이미 포기한 작업이면 None)
+        """
+        with self._condition:
+            job = self._running.get(site_key)
+            if job is None or job.abandoned:
+                return None
+            job.context.cancelled = True
+            self._abandoned_count += 1
+            self._release_slot(job)
+
+        _settle_future(job.future, error=error)
+        return job
+
+    def running_jobs(self) -> List[CrawlJob]:
+        """실행 중인 작업 목록 (watchdog 검사용, 포기한 작업 제외)"""
+        with self._condition:
+            return [job for job in self._running.values() if not job.abandoned]
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown
+
+    def is_busy(self, site_key: str) -> bool:
+        """사이트 작업이 대기 또는 실행 중인지 여부"""
+        with self._condition:
+            return site_key in self._running or site_key in self._queued
+
+    def running_sites(self) -> List[str]:
+        """실행 중인 사이트 (포기했지만 스레드가 아직 끝나지 않은 사이트 포함)"""
+        with self._condition:
+            return list(self._running)
+
+    def get_status(self) -> Dict[str, Any]:
+        """대기열 깊이, 풀 사용량, 대기 시간 통계 조회"""
+        now = datetime.now()
+        with self._condition:
+            queued = [
+                {
+                    "site_key": job.site_key,
+                    "pool": job.pool,
+                    "priority": job.priority,
+                    "wait_seconds": round((now - job.enqueued_at).total_seconds(), 1)
+                }
+                for _, _, job in sorted(self._queue)
+            ]
+            running = [
+                {
+                    "site_key": job.site_key,
+                    "pool": job.pool,
+                    "priority": job.priority,
+                    "running_seconds": round((now - job.started_at).total_seconds(), 1),
+                    "waited_seconds": round((job.started_at - job.enqueued_at).total_seconds(), 1),
+                    "timeout_seconds": job.timeout_seconds,
+                    "stage": job.context.stage,
+                    "abandoned": job.abandoned
+                }
+                for job in self._running.values()
+            ]
+            pools = {
+                name: {
+                    "capacity": capacity,
+                    "in_use": self.in_use[name],
+                    "available": capacity - self.in_use[name],
+                    "queued": sum(1 for job in queued if job["pool"] == name)
+                }
+                for name, capacity in self.capacities.items()
+            }
+            wait_times = list(self._wait_times)
+            completed_count = self._completed_count
+            abandoned_count = self._abandoned_count
+
+        return {
+            "queue_depth": len(queued),
+            "queued": queued,
+            "running": running,
+            "pools": pools,
+            "completed_count": completed_count,
+            "abandoned_count": abandoned_count,
+            "wait_time": {
+                "samples": len(wait_times),
+                "avg_seconds": round(sum(wait_times) / len(wait_times), 1) if wait_times else 0,
+                "max_seconds": round(max(wait_times), 1) if wait_times else 0
+            }
+        }
+
+    def shutdown(self, wait: bool = True):
+        """대기 중 작업 취소 후 디스패처 종료 (wait=True면 실행 중 작업 완료 또는 포기까지 대기)"""
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            for _, _, job in self._queue:
+                job.future.cancel()
+            self._queue.clear()
+            self._queued.clear()
+            self._condition.notify_all()
+
+            # 실행 중 작업 완료 대기 (watchdog이 포기 처리한 작업은 기다리지 않음)
+            while wait and any(not job.abandoned for job in self._running.values()):
+                self._condition.wait()
+
+        self.logger.info("크롤링 디스패처 종료")
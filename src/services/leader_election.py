@@ -0,0 +1,325 @@
+"""
+스케줄러 리더 선출 서비스
+여러 웹 워커/호스트 중 리스(lease)를 보유한 하나의 프로세스만 예약 작업을 실행하고,
+나머지 프로세스의 수동 크롤링 요청은 요청 테이블을 통해 리더에게 전달
+"""
+
+import os
+import time
+import uuid
+import socket
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import LEADER_ELECTION_CONFIG
+from src.config.logging_config import get_logger
+from src.utils.shared_db import COLUMN_TYPES, connect_shared_db, resolve_dsn
+
+
+# 리더에게 전달하는 요청 종류
+REQUEST_CRAWL = "crawl"                   # 사이트 수동 크롤링 (site_key="all"이면 전체 크롤링)
+REQUEST_RELOAD_SCHEDULES = "reload_schedules"  # crawl_schedules 변경 반영
+
+
+class LeaderElection:
+    """
+    리스 기반 리더 선출 클래스
+
+    scheduler_leases 테이블의 행 하나를 리스로 사용:
+    - 획득/갱신은 단일 UPSERT로 처리 (보유자가 자신이거나 만료된 경우에만 갱신되므로 원자적)
+    - 리더는 heartbeat_seconds마다 만료 시각을 연장하고, 갱신하지 못한 채 만료되면 리더 자격을 내려놓음
+    - 팔로워는 같은 주기로 획득을 시도하여 리더가 종료/중단되면 lease_seconds 이내에 인계받음
+    - 리더가 바뀔 때마다 term이 증가 (로그/상태 조회 시 리더 교체 확인용)
+
+    dsn이 있으면 PostgreSQL(여러 호스트), 없으면 SQLite 모니터링 DB(같은 호스트의 여러 워커)를 사용.
+    만료 판단은 각 프로세스의 시계를 사용하므로 호스트 간 시계 오차는 lease_seconds보다 충분히 작아야 함
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", dsn: str = None,
+                 config: Dict[str, Any] = None,
+                 on_elected: Callable[[], None] = None,
+                 on_demoted: Callable[[], None] = None):
+        self.db_path = db_path
+        self.dsn = resolve_dsn(dsn)
+        self.config = {**LEADER_ELECTION_CONFIG, **(config or {})}
+        self.lease_name = self.config["lease_name"]
+        self.holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.logger = get_logger(__name__)
+
+        if dsn and not self.dsn:
+            self.logger.warning("psycopg 미설치 - 리더 리스를 SQLite에 저장 (같은 호스트의 워커끼리만 조정)")
+
+        self.is_leader = False
+        self.term = None
+        self._lease_expires_at = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._ensure_tables()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.get("enabled", True)
+
+    def _connect(self):
+        return connect_shared_db(self.db_path, self.dsn, self.config["db_timeout_seconds"])
+
+    def _ensure_tables(self):
+        """리스 및 요청 테이블 생성"""
+        types = COLUMN_TYPES["postgresql" if self.dsn else "sqlite"]
+        id_column, real_type = types["id"], types["real"]
+        try:
+            with self._connect() as (conn, _):
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS scheduler_leases (
+                        lease_name TEXT PRIMARY KEY,
+                        holder_id TEXT NOT NULL,
+                        term INTEGER NOT NULL DEFAULT 1,
+                        acquired_at {real_type} NOT NULL,
+                        renewed_at {real_type} NOT NULL,
+                        expires_at {real_type} NOT NULL
+                    )
+                """)
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS scheduler_requests (
+                        id {id_column},
+                        action TEXT NOT NULL,
+                        site_key TEXT,
+                        run_after {real_type} NOT NULL,
+                        requested_by TEXT,
+                        requested_at {real_type} NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',  -- 'pending', 'claimed', 'handled'
+                        handled_by TEXT,
+                        handled_at {real_type}
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_scheduler_requests_status
+                    ON scheduler_requests(status, id)
+                """)
+        except Exception as e:
+            self.logger.error(f"리더 선출 테이블 생성 실패: {e}")
+
+    def try_acquire(self) -> bool:
+        """
+        리스 획득 또는 갱신 시도
+
+        Returns:
+            이번 시도 후 리더 여부
+        """
+        now = time.time()
+        expires_at = now + self.config["lease_seconds"]
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    INSERT INTO scheduler_leases (lease_name, holder_id, term, acquired_at, renewed_at, expires_at)
+                    VALUES (?, ?, 1, ?, ?, ?)
+                    ON CONFLICT (lease_name) DO UPDATE SET
+                        holder_id = excluded.holder_id,
+                        term = CASE WHEN scheduler_leases.holder_id = excluded.holder_id
+                                    THEN scheduler_leases.term ELSE scheduler_leases.term + 1 END,
+                        acquired_at = CASE WHEN scheduler_leases.holder_id = excluded.holder_id
+                                           THEN scheduler_leases.acquired_at ELSE excluded.acquired_at END,
+                        renewed_at = excluded.renewed_at,
+                        expires_at = excluded.expires_at
+                    WHERE scheduler_leases.holder_id = excluded.holder_id
+                       OR scheduler_leases.expires_at < ?
+                """), (self.lease_name, self.holder_id, now, now, expires_at, now))
+                acquired = cursor.rowcount == 1
+
+                term = None
+                if acquired:
+                    cursor = conn.execute(q("SELECT term FROM scheduler_leases WHERE lease_name = ?"),
+                                          (self.lease_name,))
+                    row = cursor.fetchone()
+                    term = row[0] if row else None
+
+        except Exception as e:
+            # 저장소 오류 시 이미 받은 리스가 만료되기 전까지는 리더 유지
+            self.logger.warning(f"리더 리스 갱신 실패: {e}")
+            acquired = self.is_leader and time.time() < self._lease_expires_at
+            expires_at = self._lease_expires_at
+            term = self.term
+
+        with self._lock:
+            was_leader, self.is_leader = self.is_leader, acquired
+            if acquired:
+                self._lease_expires_at = max(self._lease_expires_at, expires_at)
+                self.term = term
+
+        if acquired and not was_leader:
+            self.logger.info(f"스케줄러 리더 선출됨: {self.holder_id} (term {term})")
+            self._notify(self.on_elected)
+        elif was_leader and not acquired:
+            self.logger.warning(f"스케줄러 리더 자격 상실: {self.holder_id}")
+            self._notify(self.on_demoted)
+
+        return acquired
+
+    def _notify(self, callback: Optional[Callable[[], None]]):
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            self.logger.error(f"리더 상태 변경 처리 실패: {e}")
+
+    def release(self):
+        """리스 반납 (정상 종료 시 다른 워커가 만료를 기다리지 않고 바로 인계)"""
+        with self._lock:
+            was_leader, self.is_leader = self.is_leader, False
+        if not was_leader:
+            return
+        try:
+            with self._connect() as (conn, q):
+                conn.execute(q("""
+                    UPDATE scheduler_leases SET expires_at = 0
+                    WHERE lease_name = ? AND holder_id = ?
+                """), (self.lease_name, self.holder_id))
+            self.logger.info(f"스케줄러 리더 리스 반납: {self.holder_id}")
+        except Exception as e:
+            self.logger.warning(f"리더 리스 반납 실패: {e}")
+
+    def start(self):
+        """즉시 한 번 획득을 시도한 뒤 heartbeat 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.try_acquire()
+        self._thread = threading.Thread(target=self._heartbeat_loop, name="leader-heartbeat", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """heartbeat 중지 및 리스 반납"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.config["heartbeat_seconds"] + 5)
+        self._thread = None
+        self.release()
+
+    def _heartbeat_loop(self):
+        while not self._stop_event.wait(self.config["heartbeat_seconds"]):
+            self.try_acquire()
+
+    def get_leader(self) -> Optional[Dict[str, Any]]:
+        """현재 리스 보유자 정보 (만료된 리스면 None)"""
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    SELECT holder_id, term, acquired_at, renewed_at, expires_at
+                    FROM scheduler_leases WHERE lease_name = ?
+                """), (self.lease_name,))
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.warning(f"리더 정보 조회 실패: {e}")
+            return None
+
+        if not row or row[4] < time.time():
+            return None
+        holder_id, term, acquired_at, renewed_at, expires_at = row
+        return {
+            "holder_id": holder_id,
+            "term": term,
+            "acquired_at": datetime.fromtimestamp(acquired_at).isoformat(),
+            "renewed_at": datetime.fromtimestamp(renewed_at).isoformat(),
+            "expires_at": datetime.fromtimestamp(expires_at).isoformat()
+        }
+
+    def submit_request(self, action: str, site_key: str = None, delay_seconds: int = 0) -> bool:
+        """리더에게 전달할 요청 등록 (리더가 request_poll_seconds 주기로 처리)"""
+        now = time.time()
+        try:
+            with self._connect() as (conn, q):
+                conn.execute(q("""
+                    INSERT INTO scheduler_requests (action, site_key, run_after, requested_by, requested_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """), (action, site_key, now + max(delay_seconds, 0), self.holder_id, now))
+            self.logger.info(f"리더에게 요청 전달: {action} {site_key or ''}".rstrip())
+            return True
+        except Exception as e:
+            self.logger.error(f"리더 요청 등록 실패 ({action}, {site_key}): {e}")
+            return False
+
+    def claim_requests(self) -> List[Dict[str, Any]]:
+        """
+        실행 시각(run_after)이 된 요청을 처리 중으로 변경하고 반환 (리더만 호출)
+
+        지연 요청은 실행 시각까지 테이블에 대기하므로 리더가 바뀌어도 새 리더가 처리하고,
+        이전 리더가 가져간 뒤 complete_request로 완료하지 못한 요청(중단/자격 상실)도 다시 가져옴
+        """
+        if not self.is_leader:
+            return []
+        now = time.time()
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    UPDATE scheduler_requests
+                    SET status = 'claimed', handled_by = ?, handled_at = ?
+                    WHERE (status = 'pending' AND run_after <= ?)
+                       OR (status = 'claimed' AND handled_by <> ?)
+                    RETURNING id, action, site_key, run_after
+                """), (self.holder_id, now, now, self.holder_id))
+                rows = cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"리더 요청 조회 실패: {e}")
+            return []
+
+        # run_after는 epoch 초 (실행 시각 변환은 스케줄러 시간대 기준으로 호출 측에서 처리)
+        return [
+            {"id": row[0], "action": row[1], "site_key": row[2], "run_after": row[3]}
+            for row in sorted(rows)
+        ]
+
+    def complete_request(self, request_id: int) -> bool:
+        """처리한 요청을 완료로 표시 (이 프로세스가 가져간 요청만)"""
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    UPDATE scheduler_requests SET status = 'handled', handled_at = ?
+                    WHERE id = ? AND handled_by = ? AND status = 'claimed'
+                """), (time.time(), request_id, self.holder_id))
+                return cursor.rowcount == 1
+        except Exception as e:
+            self.logger.error(f"리더 요청 완료 처리 실패 ({request_id}): {e}")
+            return False
+
+    def cleanup_requests(self, retention_days: int = None) -> int:
+        """처리 완료된 오래된 요청 삭제"""
+        if retention_days is None:
+            retention_days = self.config["request_retention_days"]
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("""
+                    DELETE FROM scheduler_requests WHERE status = 'handled' AND handled_at < ?
+                """), (time.time() - retention_days * 86400,))
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.warning(f"리더 요청 정리 실패: {e}")
+            return 0
+
+    def get_status(self) -> Dict[str, Any]:
+        """리더 선출 상태 조회"""
+        pending = 0
+        try:
+            with self._connect() as (conn, q):
+                cursor = conn.execute(q("SELECT COUNT(*) FROM scheduler_requests WHERE status = 'pending'"))
+                pending = cursor.fetchone()[0]
+        except Exception as e:
+            self.logger.warning(f"리더 요청 수 조회 실패: {e}")
+
+        return {
+            "enabled": self.enabled,
+            "backend": "postgresql" if self.dsn else "sqlite",
+            "holder_id": self.holder_id,
+            "is_leader": self.is_leader,
+            "leader": self.get_leader(),
+            "pending_requests": pending
+        }
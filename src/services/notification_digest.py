@@ -0,0 +1,223 @@
+"""
+알림 다이제스트
+새로운 데이터 이벤트를 수신자별로 모아 두었다가 기간/건수/긴급도 조건을 만족하면 하나의 요약 알림으로 발송
+"""
+
+import os
+import json
+import time
+import sqlite3
+from typing import Dict, Any, List, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import NOTIFICATION_DIGEST_CONFIG
+from src.config.logging_config import get_logger
+
+
+class NotificationDigest:
+    """
+    알림 다이제스트 클래스
+
+    - add_event(): 알림 저장 트랜잭션에서 이벤트와 수신자별 대기 항목 기록 (프로세스가 중단되어도 유실 없음)
+    - collect_due(): 첫 대기 이벤트 후 window_seconds가 지났거나, 대기 이벤트/문서 수가 기준을 넘었거나,
+      flush_urgency_levels 긴급도의 이벤트가 있는 수신자를 찾아 같은 이벤트 묶음을 가진 수신자끼리 그룹화
+      (그룹마다 요약 알림 1건 + 수신자별 발송 건을 만들어 SMTP 서버별 일괄 발송이 그대로 적용됨)
+    - mark_flushed(): 요약 알림과 같은 트랜잭션에서 항목을 발송 완료로 표시하고 수신자별 마지막 발송 기록
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**NOTIFICATION_DIGEST_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._ensure_tables()
+
+    def _ensure_tables(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS notification_digest_events (
+                        event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        site_key TEXT NOT NULL,
+                        notification_type TEXT NOT NULL,
+                        new_data_count INTEGER DEFAULT 0,
+                        urgency_level TEXT DEFAULT 'normal',
+                        session_id TEXT,
+                        seq_range TEXT,  -- JSON: [시작 시퀀스, 끝 시퀀스]
+                        notification_id INTEGER,  -- 즉시 알림이 생략된 이벤트는 NULL
+                        created_at REAL NOT NULL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS notification_digest_items (
+                        event_id INTEGER NOT NULL,
+                        setting_id INTEGER NOT NULL,
+                        data_ids TEXT,  -- JSON: 구독 규칙에 일치한 문서 ID (NULL이면 이벤트의 전체 문서)
+                        digest_notification_id INTEGER,  -- 요약 알림으로 발송되기 전까지 NULL
+                        PRIMARY KEY (event_id, setting_id)
+                    )
+                """)
+                # 구독 규칙 도입 전에 생성된 테이블에 컬럼 추가
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(notification_digest_items)")]
+                if "data_ids" not in columns:
+                    conn.execute("ALTER TABLE notification_digest_items ADD COLUMN data_ids TEXT")
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_notification_digest_items_pending
+                    ON notification_digest_items(digest_notification_id, setting_id)
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS notification_digest_state (
+                        setting_id INTEGER PRIMARY KEY,
+                        last_flush_at REAL,
+                        last_digest_notification_id INTEGER,
+                        last_event_count INTEGER,
+                        last_document_count INTEGER,
+                        total_digests INTEGER DEFAULT 0
+                    )
+                """)
+        except Exception as e:
+            self.logger.error(f"알림 다이제스트 테이블 생성 실패: {e}")
+
+    def applies_to(self, notification_type: str) -> bool:
+        """이메일 발송을 다이제스트로 모을 알림 타입인지 여부"""
+        return bool(self.config["enabled"]) and notification_type in self.config["notification_types"]
+
+    @staticmethod
+    def add_event(cursor: sqlite3.Cursor, site_key: str, notification_type: str, new_data_count: int,
+                  urgency_level: str, recipients: Dict[int, Optional[List[str]]], session_id: str = None,
+                  seq_range: tuple = None, notification_id: int = None) -> Optional[int]:
+        """
+        이벤트와 수신자별 대기 항목 기록 (호출자의 트랜잭션에서 실행, 수신자가 없으면 기록하지 않음)
+
+        Args:
+            recipients: 수신자 설정 ID별 일치 문서 ID 목록 (None이면 이벤트의 전체 문서)
+        """
+        if not recipients:
+            return None
+        cursor.execute("""
+            INSERT INTO notification_digest_events
+            (site_key, notification_type, new_data_count, urgency_level, session_id, seq_range,
+             notification_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (site_key, notification_type, new_data_count, urgency_level, session_id,
+              json.dumps(list(seq_range)) if seq_range else None, notification_id, time.time()))
+        event_id = cursor.lastrowid
+        cursor.executemany("""
+            INSERT OR IGNORE INTO notification_digest_items (event_id, setting_id, data_ids) VALUES (?, ?, ?)
+        """, [(event_id, setting_id, json.dumps(data_ids, ensure_ascii=False) if data_ids is not None else None)
+              for setting_id, data_ids in recipients.items()])
+        return event_id
+
+    def collect_due(self, cursor: sqlite3.Cursor, force: bool = False) -> List[Dict[str, Any]]:
+        """
+        발송 조건을 만족한 수신자 그룹 조회 (호출자의 트랜잭션에서 실행)
+
+        Returns:
+            [{"setting_ids": [...], "events": [이벤트 dict, ...]}, ...]
+        """
+        cursor.execute("""
+            SELECT i.setting_id, i.data_ids, e.event_id, e.site_key, e.notification_type, e.new_data_count,
+                   e.urgency_level, e.session_id, e.seq_range, e.created_at
+            FROM notification_digest_items i
+            JOIN notification_digest_events e ON e.event_id = i.event_id
+            WHERE i.digest_notification_id IS NULL
+            ORDER BY i.setting_id, e.event_id
+        """)
+        columns = [desc[0] for desc in cursor.description]
+        pending: Dict[int, List[Dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            item = dict(zip(columns, row))
+            item["data_ids"] = json.loads(item["data_ids"]) if item["data_ids"] else None
+            pending.setdefault(item.pop("setting_id"), []).append(item)
+
+        now = time.time()
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for setting_id, events in pending.items():
+            if not (force or self._is_due(events, now)):
+                continue
+            # 같은 이벤트/일치 문서 묶음을 가진 수신자끼리 같은 요약 알림을 받음
+            key = tuple((event["event_id"], tuple(event["data_ids"]) if event["data_ids"] is not None else None)
+                        for event in events)
+            groups.setdefault(key, {"setting_ids": [], "events": events})["setting_ids"].append(setting_id)
+        return list(groups.values())
+
+    def _is_due(self, events: List[Dict[str, Any]], now: float) -> bool:
+        if now - events[0]["created_at"] >= self.config["window_seconds"]:
+            return True
+        if len(events) >= self.config["max_events"]:
+            return True
+        if sum(self.document_count(event) for event in events) >= self.config["max_documents"]:
+            return True
+        return any(event["urgency_level"] in self.config["flush_urgency_levels"] for event in events)
+
+    @staticmethod
+    def document_count(event: Dict[str, Any]) -> int:
+        """수신자에게 해당하는 이벤트 문서 수 (구독 규칙 일치 문서가 있으면 그 수)"""
+        if event.get("data_ids") is not None:
+            return len(event["data_ids"])
+        return event["new_data_count"] or 0
+
+    @staticmethod
+    def mark_flushed(cursor: sqlite3.Cursor, group: Dict[str, Any], digest_notification_id: int):
+        """그룹의 대기 항목을 발송 완료로 표시하고 수신자별 마지막 발송 기록 (호출자의 트랜잭션에서 실행)"""
+        event_ids = [event["event_id"] for event in group["events"]]
+        document_count = sum(NotificationDigest.document_count(event) for event in group["events"])
+        now = time.time()
+        cursor.executemany("""
+            UPDATE notification_digest_items SET digest_notification_id = ?
+            WHERE event_id = ? AND setting_id = ? AND digest_notification_id IS NULL
+        """, [(digest_notification_id, event_id, setting_id)
+              for setting_id in group["setting_ids"] for event_id in event_ids])
+        cursor.executemany("""
+            INSERT INTO notification_digest_state
+            (setting_id, last_flush_at, last_digest_notification_id, last_event_count, last_document_count,
+             total_digests)
+            VALUES (?, ?, ?, ?, ?, 1)
+            ON CONFLICT(setting_id) DO UPDATE SET
+                last_flush_at = excluded.last_flush_at,
+                last_digest_notification_id = excluded.last_digest_notification_id,
+                last_event_count = excluded.last_event_count,
+                last_document_count = excluded.last_document_count,
+                total_digests = total_digests + 1
+        """, [(setting_id, now, digest_notification_id, len(event_ids), document_count)
+              for setting_id in group["setting_ids"]])
+
+    def cleanup(self) -> int:
+        """보관 기간이 지난 발송 완료 이벤트/항목 정리 (대기 중인 항목은 유지)"""
+        cutoff = time.time() - self.config["retention_days"] * 86400
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    DELETE FROM notification_digest_items
+                    WHERE digest_notification_id IS NOT NULL
+                      AND event_id IN (SELECT event_id FROM notification_digest_events WHERE created_at < ?)
+                """, (cutoff,))
+                cursor = conn.execute("""
+                    DELETE FROM notification_digest_events
+                    WHERE created_at < ?
+                      AND event_id NOT IN (SELECT event_id FROM notification_digest_items)
+                """, (cutoff,))
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"알림 다이제스트 정리 실패: {e}")
+            return 0
+
+    def get_state(self) -> List[Dict[str, Any]]:
+        """수신자별 대기 항목 수와 마지막 발송 기록"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute("""
+                    SELECT i.setting_id, COUNT(*) AS pending_events,
+                           s.last_flush_at, s.last_digest_notification_id, s.total_digests
+                    FROM notification_digest_items i
+                    LEFT JOIN notification_digest_state s ON s.setting_id = i.setting_id
+                    WHERE i.digest_notification_id IS NULL
+                    GROUP BY i.setting_id
+                """)
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"알림 다이제스트 상태 조회 실패: {e}")
+            return []
@@ -0,0 +1,169 @@
+"""
+알림 디스패처
+웹 서버 이벤트 루프에서 백그라운드로 실행되며 아웃박스의 발송 건을 가져가 채널별로 발송하고 결과를 기록
+"""
+
+import os
+import uuid
+import socket
+import asyncio
+from typing import Dict, Any, List, Optional
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+from src.repositories.async_repository import run_in_db_executor
+
+
+class NotificationDispatcher:
+    """
+    알림 디스패처 클래스
+
+    - 알림 등록 시 wake()로 즉시 깨어나 발송하고, 그 외에는 poll_seconds마다 확인
+      (크롤링 워커 프로세스가 등록한 알림, 재시도 시각이 된 알림, 리스가 만료된 알림)
+    - 할당 전에 발송 조건을 만족한 이메일 다이제스트를 요약 알림으로 변환
+    - 한 번에 batch_size건을 할당받아 알림별로 동시에 발송 (이메일은 SMTP 서버별 일괄 발송)
+    - WebSocket 발송 건은 할당하지 않고 디스패처마다 커서로 읽어 이 프로세스의 연결에 전송
+      (uvicorn 워커가 여러 개여도 모든 워커에 연결된 대시보드가 알림을 받음)
+    - 크롤링/API 요청은 알림을 아웃박스에 기록만 하고 반환하므로 발송 지연의 영향을 받지 않음
+    """
+
+    def __init__(self, notification_service, worker_id: str = None):
+        self.notification_service = notification_service
+        self.outbox = notification_service.outbox
+        self.config = self.outbox.config
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.logger = get_logger(__name__)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._fanout_cursor: Optional[int] = None
+        self.stats = {"digests": 0, "dispatched": 0, "relayed": 0, "sent": 0, "retry": 0, "failed": 0}
+
+    def start(self):
+        """실행 중인 이벤트 루프에서 디스패처 시작"""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = self._loop.create_task(self._run())
+        self.notification_service.dispatcher = self
+        self.logger.info(f"알림 디스패처 시작: {self.worker_id}")
+
+    async def stop(self, timeout: float = None):
+        """진행 중인 발송 결과를 기록한 뒤 종료 (제한 시간 초과 시 취소, 미기록 건은 리스 만료 후 재할당)"""
+        if self._task is None:
+            return
+        self._stopping = True
+        self.wake()
+        try:
+            await asyncio.wait_for(self._task, timeout or self.config["shutdown_timeout_seconds"])
+        except asyncio.TimeoutError:
+            self.logger.warning("알림 디스패처 종료 대기 시간 초과 - 발송 중단")
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self.notification_service.dispatcher is self:
+            self.notification_service.dispatcher = None
+        self.logger.info("알림 디스패처 종료")
+
+    def wake(self):
+        """새 알림 등록 알림 (다른 스레드에서도 호출 가능)"""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨 (다음 시작 시 폴링으로 발송)
+            pass
+
+    async def _run(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                dispatched = await self.dispatch_once()
+            except Exception as e:
+                self.logger.error(f"알림 디스패치 실패: {e}")
+                dispatched = 0
+
+            if dispatched:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.config["poll_seconds"])
+            except asyncio.TimeoutError:
+                pass
+
+    async def dispatch_once(self) -> int:
+        """발송 건을 한 번 할당받아 발송 후 결과 기록 (처리한 건수 반환)"""
+        self.stats["digests"] += await run_in_db_executor(self.notification_service.flush_digests)
+        relayed = await self.relay_fanout()
+
+        deliveries = await run_in_db_executor(self.outbox.claim, self.worker_id)
+        if not deliveries:
+            return relayed
+
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for delivery in deliveries:
+            grouped.setdefault(delivery["notification_id"], []).append(delivery)
+        rows = await run_in_db_executor(self.outbox.load_notifications, list(grouped))
+
+        outcomes: Dict[int, Optional[str]] = {}
+        results = await asyncio.gather(*[
+            self._deliver(notification_id, rows.get(notification_id), items)
+            for notification_id, items in grouped.items()
+        ])
+        for result in results:
+            outcomes.update(result)
+
+        counts = await run_in_db_executor(self.outbox.complete, self.worker_id, deliveries, outcomes)
+        self.stats["dispatched"] += len(deliveries)
+        for key, value in counts.items():
+            self.stats[key] += value
+        return relayed + len(deliveries)
+
+    async def relay_fanout(self) -> int:
+        """커서 이후 기록된 WebSocket 발송 건을 이 프로세스의 연결에 전송 (전송 실패는 재시도하지 않음)"""
+        if self._fanout_cursor is None:
+            self._fanout_cursor = await run_in_db_executor(self.outbox.fanout_cursor)
+            return 0
+
+        deliveries = await run_in_db_executor(self.outbox.read_fanout, self._fanout_cursor)
+        if not deliveries:
+            return 0
+        self._fanout_cursor = deliveries[-1]["delivery_id"]
+
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        for delivery in deliveries:
+            grouped.setdefault(delivery["notification_id"], []).append(delivery)
+        rows = await run_in_db_executor(self.outbox.load_notifications, list(grouped))
+        await asyncio.gather(*[
+            self._deliver(notification_id, rows.get(notification_id), items)
+            for notification_id, items in grouped.items()
+        ])
+        self.stats["relayed"] += len(deliveries)
+        return len(deliveries)
+
+    async def _deliver(self, notification_id: int, row: Optional[Dict[str, Any]],
+                       deliveries: List[Dict[str, Any]]) -> Dict[int, Optional[str]]:
+        if row is None:
+            return {delivery["delivery_id"]: "알림이 존재하지 않음" for delivery in deliveries}
+        try:
+            notification = self.notification_service.notification_from_row(row)
+            return await self.notification_service.deliver(notification_id, notification, deliveries)
+        except Exception as e:
+            self.logger.error(f"알림 발송 실패 ({notification_id}): {e}")
+            return {delivery["delivery_id"]: str(e) or type(e).__name__ for delivery in deliveries}
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running": self._task is not None and not self._task.done(),
+            "fanout_cursor": self._fanout_cursor,
+            "deliveries": self.outbox.get_stats(),
+            **self.stats
+        }
@@ -0,0 +1,299 @@
+"""
+알림 아웃박스
+알림(notification_history)과 채널별 발송 건(notification_deliveries)을 같은 트랜잭션에 기록하고,
+디스패처가 발송 건을 리스와 함께 가져가 발송 결과를 기록
+"""
+
+import os
+import json
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional, Iterable
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import NOTIFICATION_OUTBOX_CONFIG
+from src.config.logging_config import get_logger
+
+
+# 프로세스별로 팬아웃하는 채널 (할당 없이 기록 시 sent로 확정하고, 모든 디스패처가 커서로 읽어 자신의 연결에 전송)
+FANOUT_CHANNELS = ('websocket',)
+
+# 남은 발송 건이 없는 알림의 최종 상태 반영 (하나라도 성공하면 sent, 성공 채널 목록 기록)
+# 사용자가 이미 읽은 알림(read)은 상태를 유지
+FINALIZE_SQL = """
+    UPDATE notification_history
+    SET status = CASE WHEN EXISTS (
+                     SELECT 1 FROM notification_deliveries d
+                     WHERE d.notification_id = notification_history.notification_id AND d.status = 'sent'
+                 ) THEN 'sent' ELSE 'failed' END,
+        delivery_channels = (
+            SELECT json_group_array(DISTINCT d.channel) FROM notification_deliveries d
+            WHERE d.notification_id = notification_history.notification_id AND d.status = 'sent'
+        ),
+        error_message = (
+            SELECT MAX(d.last_error) FROM notification_deliveries d
+            WHERE d.notification_id = notification_history.notification_id AND d.status = 'failed'
+        )
+    WHERE notification_id = ? AND status = 'pending'
+      AND NOT EXISTS (
+          SELECT 1 FROM notification_deliveries d
+          WHERE d.notification_id = notification_history.notification_id AND d.status IN ('pending', 'sending')
+      )
+"""
+
+
+class NotificationOutbox:
+    """
+    알림 발송 건 아웃박스
+
+    - add_deliveries(): 알림 저장과 같은 커서(트랜잭션)에서 채널/수신자별 발송 건 등록
+      (알림이 커밋되면 발송 건도 반드시 존재하므로 프로세스가 중단되어도 알림이 유실되지 않음)
+    - claim(): 발송 시각이 된 대기 건과 리스가 만료된 발송 중 건을 단일 UPDATE ... RETURNING으로 할당
+      (디스패처가 여러 개여도 같은 건을 동시에 가져가지 않음)
+    - complete(): 발송 결과 기록 후 남은 건이 없는 알림의 최종 상태 반영
+      실패 건은 지수 백오프로 재시도하고 max_attempts회를 넘기면 failed로 기록
+    - read_fanout(): WebSocket처럼 연결이 프로세스(웹 워커)마다 나뉜 채널은 한 디스패처가 할당받지 않고,
+      각 디스패처가 delivery_id 커서로 새 건을 읽어 자기 프로세스의 연결에 전송
+
+    발송 직후 결과를 기록하므로 재시작 시 다시 발송되는 것은 발송 중 프로세스가 중단된 건(리스 만료)뿐
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**NOTIFICATION_OUTBOX_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._ensure_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=self.config["db_timeout_seconds"])
+
+    def _ensure_table(self):
+        try:
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS notification_deliveries (
+                        delivery_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        notification_id INTEGER NOT NULL,
+                        channel TEXT NOT NULL,  -- 'websocket', 'push', 'email'
+                        target TEXT NOT NULL DEFAULT '',  -- 이메일: email_settings.setting_id
+                        data_ids TEXT,  -- JSON: 수신자의 구독 규칙에 일치한 문서 ID (NULL이면 알림의 전체 문서)
+                        status TEXT NOT NULL DEFAULT 'pending',  -- 'pending', 'sending', 'sent', 'failed'
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        next_attempt_at REAL NOT NULL,
+                        claimed_by TEXT,
+                        lease_expires_at REAL,
+                        last_error TEXT,
+                        created_at REAL NOT NULL,
+                        sent_at REAL,
+                        UNIQUE (notification_id, channel, target)
+                    )
+                """)
+                # 구독 규칙별 문서 목록 도입 전에 생성된 테이블에 컬럼 추가
+                columns = [row[1] for row in conn.execute("PRAGMA table_info(notification_deliveries)")]
+                if "data_ids" not in columns:
+                    conn.execute("ALTER TABLE notification_deliveries ADD COLUMN data_ids TEXT")
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_notification_deliveries_due
+                    ON notification_deliveries(status, next_attempt_at)
+                """)
+        except Exception as e:
+            self.logger.error(f"알림 아웃박스 테이블 생성 실패: {e}")
+
+    @staticmethod
+    def add_deliveries(cursor: sqlite3.Cursor, notification_id: int,
+                       deliveries: Iterable[tuple]):
+        """
+        발송 건 등록 (호출자의 트랜잭션에서 실행)
+
+        Args:
+            deliveries: (채널, 대상) 또는 (채널, 대상, 일치 문서 ID 목록) 목록
+        """
+        now = time.time()
+        rows = []
+        for channel, target, *rest in deliveries:
+            data_ids = rest[0] if rest else None
+            fanout = channel in FANOUT_CHANNELS
+            rows.append((notification_id, channel, str(target or ''),
+                         json.dumps(data_ids, ensure_ascii=False) if data_ids is not None else None,
+                         'sent' if fanout else 'pending', now, now, now if fanout else None))
+        cursor.executemany("""
+            INSERT OR IGNORE INTO notification_deliveries
+            (notification_id, channel, target, data_ids, status, next_attempt_at, created_at, sent_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+    @staticmethod
+    def finalize(cursor: sqlite3.Cursor, notification_ids: Iterable[int]):
+        """남은 발송 건이 없는 알림의 최종 상태 반영 (호출자의 트랜잭션에서 실행)"""
+        cursor.executemany(FINALIZE_SQL, [(notification_id,) for notification_id in set(notification_ids)])
+
+    def claim(self, worker_id: str, limit: int = None) -> List[Dict[str, Any]]:
+        """발송할 건 할당 (알림 ID, 발송 건 ID 순)"""
+        now = time.time()
+        limit = limit or self.config["batch_size"]
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute("""
+                    UPDATE notification_deliveries
+                    SET status = 'sending', claimed_by = ?, lease_expires_at = ?, attempts = attempts + 1
+                    WHERE delivery_id IN (
+                        SELECT delivery_id FROM notification_deliveries
+                        WHERE (status = 'pending' AND next_attempt_at <= ?)
+                           OR (status = 'sending' AND lease_expires_at < ?)
+                        ORDER BY notification_id, delivery_id
+                        LIMIT ?
+                    )
+                    RETURNING delivery_id, notification_id, channel, target, data_ids, attempts
+                """, (worker_id, now + self.config["lease_seconds"], now, now, limit))
+                rows = cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"알림 발송 건 할당 실패 ({worker_id}): {e}")
+            return []
+
+        deliveries = [self._to_delivery(row) for row in rows]
+        deliveries.sort(key=lambda delivery: (delivery["notification_id"], delivery["delivery_id"]))
+        return deliveries
+
+    def fanout_cursor(self) -> int:
+        """팬아웃 커서 시작 위치 (디스패처 시작 전에 기록된 건은 다시 전송하지 않음)"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT COALESCE(MAX(delivery_id), 0) FROM notification_deliveries").fetchone()
+                return row[0]
+        except Exception as e:
+            self.logger.error(f"알림 팬아웃 커서 조회 실패: {e}")
+            return 0
+
+    def read_fanout(self, after_id: int, limit: int = None) -> List[Dict[str, Any]]:
+        """커서 이후에 기록된 팬아웃 채널 발송 건 (delivery_id 순)"""
+        limit = limit or self.config["batch_size"]
+        placeholders = ", ".join("?" for _ in FANOUT_CHANNELS)
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(f"""
+                    SELECT delivery_id, notification_id, channel, target, data_ids, attempts
+                    FROM notification_deliveries
+                    WHERE delivery_id > ? AND channel IN ({placeholders})
+                    ORDER BY delivery_id
+                    LIMIT ?
+                """, (after_id, *FANOUT_CHANNELS, limit))
+                rows = cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"알림 팬아웃 발송 건 조회 실패: {e}")
+            return []
+
+        return [self._to_delivery(row) for row in rows]
+
+    @staticmethod
+    def _to_delivery(row: tuple) -> Dict[str, Any]:
+        delivery_id, notification_id, channel, target, data_ids, attempts = row
+        return {"delivery_id": delivery_id, "notification_id": notification_id, "channel": channel,
+                "target": target, "data_ids": json.loads(data_ids) if data_ids else None, "attempts": attempts}
+
+    def load_notifications(self, notification_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """할당된 발송 건의 알림 내용 조회"""
+        if not notification_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in notification_ids)
+        try:
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute(f"""
+                    SELECT notification_id, site_key, notification_type, title, message,
+                           new_data_count, urgency_level, metadata, expires_at
+                    FROM notification_history
+                    WHERE notification_id IN ({placeholders})
+                """, notification_ids)
+                return {row["notification_id"]: dict(row) for row in cursor.fetchall()}
+        except Exception as e:
+            self.logger.error(f"알림 내용 조회 실패: {e}")
+            return {}
+
+    def complete(self, worker_id: str, deliveries: List[Dict[str, Any]],
+                 outcomes: Dict[int, Optional[str]]) -> Dict[str, int]:
+        """
+        발송 결과 기록
+
+        Args:
+            deliveries: claim()으로 할당받은 발송 건
+            outcomes: 발송 건 ID별 결과 (성공이면 None, 실패면 오류 메시지)
+
+        리스가 만료되어 다른 디스패처가 다시 가져간 건은 기록하지 않음 (반환 건수에서도 제외)
+        """
+        now = time.time()
+        sent, retry, failed = [], [], []
+        for delivery in deliveries:
+            delivery_id = delivery["delivery_id"]
+            error = outcomes.get(delivery_id, "발송 결과 없음")
+            if error is None:
+                sent.append((now, delivery_id, worker_id))
+            elif delivery["attempts"] >= self.config["max_attempts"]:
+                failed.append((error[:500], delivery_id, worker_id))
+            else:
+                retry.append((now + self._backoff_seconds(delivery["attempts"]), error[:500],
+                              delivery_id, worker_id))
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                counts = {}
+                cursor.executemany("""
+                    UPDATE notification_deliveries
+                    SET status = 'sent', sent_at = ?, last_error = NULL, lease_expires_at = NULL
+                    WHERE delivery_id = ? AND claimed_by = ? AND status = 'sending'
+                """, sent)
+                counts["sent"] = max(cursor.rowcount, 0)
+                cursor.executemany("""
+                    UPDATE notification_deliveries
+                    SET status = 'pending', next_attempt_at = ?, last_error = ?, lease_expires_at = NULL
+                    WHERE delivery_id = ? AND claimed_by = ? AND status = 'sending'
+                """, retry)
+                counts["retry"] = max(cursor.rowcount, 0)
+                cursor.executemany("""
+                    UPDATE notification_deliveries
+                    SET status = 'failed', last_error = ?, lease_expires_at = NULL
+                    WHERE delivery_id = ? AND claimed_by = ? AND status = 'sending'
+                """, failed)
+                counts["failed"] = max(cursor.rowcount, 0)
+                self.finalize(cursor, [delivery["notification_id"] for delivery in deliveries])
+        except Exception as e:
+            # 기록하지 못한 건은 리스 만료 후 다시 할당됨
+            self.logger.error(f"알림 발송 결과 기록 실패: {e}")
+            return {}
+
+        if counts["retry"] or counts["failed"]:
+            self.logger.warning(f"알림 발송 결과: 성공 {counts['sent']}건, 재시도 예정 {counts['retry']}건, "
+                                f"실패 {counts['failed']}건")
+        return counts
+
+    def _backoff_seconds(self, attempts: int) -> float:
+        backoff = self.config["retry_backoff_seconds"] * (2 ** max(0, attempts - 1))
+        return min(backoff, self.config["max_backoff_seconds"])
+
+    def cleanup(self) -> int:
+        """보관 기간이 지난 완료 건과 알림이 삭제된 발송 건 정리"""
+        cutoff = time.time() - self.config["retention_days"] * 86400
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute("""
+                    DELETE FROM notification_deliveries
+                    WHERE (status IN ('sent', 'failed') AND created_at < ?)
+                       OR notification_id NOT IN (SELECT notification_id FROM notification_history)
+                """, (cutoff,))
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"알림 발송 건 정리 실패: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """상태별 발송 건 수"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute("SELECT status, COUNT(*) FROM notification_deliveries GROUP BY status")
+                return dict(cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"알림 발송 건 통계 조회 실패: {e}")
+            return {}
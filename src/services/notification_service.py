@@ -9,17 +9,25 @@ import json
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import sys
 import yagmail
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor
-import time
 
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.config.logging_config import get_logger
+from src.repositories.async_repository import run_in_db_executor
+from src.services.email_delivery import get_email_delivery_service
+from src.services.notification_outbox import NotificationOutbox
+from src.services.notification_digest import NotificationDigest
+from src.services.subscription_matcher import SubscriptionService
+from src.services.notification_throttle import NotificationThrottle
+from src.services.recent_documents import RecentDocuments
+from src.services.change_feed_service import ChangeFeedService
+from src.services.email_renderer import EmailRenderer
 
 # 환경 변수 로드
 load_dotenv()
@@ -61,32 +69,64 @@ class NotificationService:
         self.notification_settings = {
             'email_enabled': True,  # 이메일 알림
             'websocket_enabled': True,  # WebSocket 알림
-            'push_enabled': True,  # 브라우저 푸시 알림
-            'min_interval': 300,  # 최소 알림 간격 (초)
-            'max_daily_notifications': 50  # 일일 최대 알림 수
+            'push_enabled': True  # 브라우저 푸시 알림
         }
         
-        # 최근 알림 캐시 (스팸 방지)
-        self.recent_notifications = {}
+        # 알림 빈도 제한 (사이트/타입별 최소 간격, 에러 알림 빈도, 전체/수신자별 일일 한도 - 프로세스 간 공유)
+        self.throttle = NotificationThrottle(db_path)
         
         # ThreadPoolExecutor for blocking email operations
         self.email_executor = ThreadPoolExecutor(max_workers=3)
         
+        # 알림 아웃박스 (발송은 웹 서버의 NotificationDispatcher가 담당, 시작 시 dispatcher 설정)
+        self.outbox = NotificationOutbox(db_path)
+        self.dispatcher = None
+        
+        # 이메일 다이제스트 (새로운 데이터 이메일을 수신자별로 모아 요약 발송)
+        self.digest = NotificationDigest(db_path)
+        
+        # 수신자별 세목/키워드 구독 규칙 (새로운 데이터 이메일 수신자 선별)
+        self.subscriptions = SubscriptionService(db_path)
+        
+        # 최근 새로운 문서 프로젝션 (이메일 본문, WebSocket 알림, /api/new-data 목록)
+        self.recent_documents = RecentDocuments(db_path)
+        
+        # 사이트별 알림 소비자 커서 (CDC 시퀀스 기준으로 이미 알림을 만든 구간 기록)
+        self.change_feed = ChangeFeedService(db_path)
+        
+        # 이메일 본문 렌더러 (컴파일된 템플릿, 알림별 문서 조회/렌더링 결과 캐시)
+        self.email_renderer = EmailRenderer(self.recent_documents, self.site_names,
+                                            max_items_per_site=self.digest.config['max_items_per_site'])
+        
         self.logger.info("알림 서비스 초기화 완료")
     
+    async def _run_db(self, func, *args, **kwargs):
+        """동기 DB 작업을 DB 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)"""
+        return await run_in_db_executor(func, *args, **kwargs)
+    
     async def send_new_data_notification(self, site_key: str, new_data_count: int, 
-                                       session_id: str = None) -> bool:
-        """새로운 데이터 발견 알림 발송"""
+                                       session_id: str = None, seq_range: tuple = None) -> bool:
+        """새로운 데이터 발견 알림 발송 (seq_range: 이번 저장의 CDC 시퀀스 구간)"""
         try:
-            # 알림 임계값 확인
+            # 알림 대상 구간은 사이트별 알림 커서부터 이번 저장까지 (커서는 알림/다이제스트 저장과 함께 전진)
+            if seq_range:
+                seq_range, new_data_count = await self._run_db(
+                    self._resume_seq_range, site_key, new_data_count, seq_range
+                )
+                if seq_range[1] <= seq_range[0]:
+                    self.logger.info(f"이미 알림을 만든 구간: {site_key} (seq {seq_range[1]})")
+                    return True
+            
+            # 알림 임계값 확인 (미달이면 커서가 그대로 남아 다음 알림에 합산)
             threshold = await self._get_notification_threshold(site_key)
             if new_data_count < threshold:
                 self.logger.info(f"알림 임계값 미달: {site_key} ({new_data_count} < {threshold})")
                 return True
             
-            # 중복 알림 방지
-            if await self._check_duplicate_notification(site_key, 'new_data'):
-                self.logger.info(f"중복 알림 방지: {site_key}")
+            # 알림 빈도 제한 (다이제스트 모드에서는 즉시 알림만 생략하고 이메일 요약에는 합산)
+            throttled = await self._check_throttle(site_key, 'new_data')
+            if throttled and not self.digest.applies_to('new_data'):
+                self.logger.info(f"알림 빈도 제한: {site_key}")
                 return True
             
             site_name = self.site_names.get(site_key, site_key)
@@ -102,21 +142,24 @@ class NotificationService:
                 delivery_channels=['websocket', 'push', 'email'],
                 metadata={
                     'session_id': session_id,
-                    'site_name': site_name
+                    'site_name': site_name,
+                    'seq_range': list(seq_range) if seq_range else None
                 },
                 expires_at=datetime.now() + timedelta(hours=24)
             )
             
-            # 알림 저장 및 발송
-            notification_id = await self._save_notification(notification)
+            if throttled:
+                if await self._save_digest_event(notification, session_id=session_id, seq_range=seq_range):
+                    self.logger.info(f"빈도 제한 알림 다이제스트 합산: {site_key} ({new_data_count}개)")
+                    return True
+                return False
+            
+            # 알림, 발송 건, 새로운 데이터 로그 갱신을 한 트랜잭션으로 저장 (발송은 디스패처가 담당)
+            notification_id = await self._save_notification(notification, session_id=session_id,
+                                                            seq_range=seq_range)
             
             if notification_id:
-                await self._send_notification(notification, notification_id)
-                
-                # 새로운 데이터 로그 업데이트
-                await self._update_new_data_log(site_key, notification_id)
-                
-                self.logger.info(f"새로운 데이터 알림 발송: {site_key} ({new_data_count}개)")
+                self.logger.info(f"새로운 데이터 알림 등록: {site_key} ({new_data_count}개)")
                 return True
             
             return False
@@ -130,7 +173,7 @@ class NotificationService:
         """에러 알림 발송"""
         try:
             # 에러 알림 빈도 제한
-            if await self._check_error_rate_limit(site_key):
+            if await self._check_throttle(site_key, 'error'):
                 self.logger.info(f"에러 알림 빈도 제한: {site_key}")
                 return True
             
@@ -152,12 +195,11 @@ class NotificationService:
                 expires_at=datetime.now() + timedelta(hours=12)
             )
             
-            # 알림 저장 및 발송
+            # 알림 및 발송 건 저장 (발송은 디스패처가 담당)
             notification_id = await self._save_notification(notification)
             
             if notification_id:
-                await self._send_notification(notification, notification_id)
-                self.logger.info(f"에러 알림 발송: {site_key}")
+                self.logger.info(f"에러 알림 등록: {site_key}")
                 return True
             
             return False
@@ -186,8 +228,7 @@ class NotificationService:
             notification_id = await self._save_notification(notification)
             
             if notification_id:
-                await self._send_notification(notification, notification_id)
-                self.logger.info(f"시스템 알림 발송: {message}")
+                self.logger.info(f"시스템 알림 등록: {message}")
                 return True
             
             return False
@@ -202,57 +243,60 @@ class NotificationService:
                               unread_only: bool = False) -> List[Dict[str, Any]]:
         """알림 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 쿼리 구성
-                where_conditions = []
-                params = []
-                
-                if site_key:
-                    where_conditions.append("site_key = ?")
-                    params.append(site_key)
-                
-                if notification_type:
-                    where_conditions.append("notification_type = ?")
-                    params.append(notification_type)
-                
-                if unread_only:
-                    where_conditions.append("read_at IS NULL")
-                
-                # 만료되지 않은 알림만 조회
-                where_conditions.append("(expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)")
-                
-                where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-                
-                query = f"""
-                    SELECT notification_id, site_key, notification_type, title, message,
-                           new_data_count, urgency_level, status, delivery_channels,
-                           metadata, read_at, created_at, expires_at
-                    FROM notification_history 
-                    {where_clause}
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """
-                
-                params.append(limit)
-                cursor.execute(query, params)
-                
-                columns = [desc[0] for desc in cursor.description]
-                notifications = []
-                
-                for row in cursor.fetchall():
-                    notification = dict(zip(columns, row))
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
                     
-                    # JSON 필드 파싱
-                    if notification['delivery_channels']:
-                        notification['delivery_channels'] = json.loads(notification['delivery_channels'])
-                    if notification['metadata']:
-                        notification['metadata'] = json.loads(notification['metadata'])
+                    # 쿼리 구성
+                    where_conditions = []
+                    params = []
                     
-                    notifications.append(notification)
-                
-                return notifications
+                    if site_key:
+                        where_conditions.append("site_key = ?")
+                        params.append(site_key)
+                    
+                    if notification_type:
+                        where_conditions.append("notification_type = ?")
+                        params.append(notification_type)
+                    
+                    if unread_only:
+                        where_conditions.append("read_at IS NULL")
+                    
+                    # 만료되지 않은 알림만 조회
+                    where_conditions.append("(expires_at IS NULL OR expires_at > CURRENT_TIMESTAMP)")
+                    
+                    where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+                    
+                    query = f"""
+                        SELECT notification_id, site_key, notification_type, title, message,
+                               new_data_count, urgency_level, status, delivery_channels,
+                               metadata, read_at, created_at, expires_at
+                        FROM notification_history 
+                        {where_clause}
+                        ORDER BY created_at DESC
+                        LIMIT ?
+                    """
+                    
+                    params.append(limit)
+                    cursor.execute(query, params)
+                    
+                    columns = [desc[0] for desc in cursor.description]
+                    notifications = []
+                    
+                    for row in cursor.fetchall():
+                        notification = dict(zip(columns, row))
+                        
+                        # JSON 필드 파싱
+                        if notification['delivery_channels']:
+                            notification['delivery_channels'] = json.loads(notification['delivery_channels'])
+                        if notification['metadata']:
+                            notification['metadata'] = json.loads(notification['metadata'])
+                        
+                        notifications.append(notification)
+                    
+                    return notifications
+            
+            return await self._run_db(_db_work)
                 
         except Exception as e:
             self.logger.error(f"알림 조회 실패: {e}")
@@ -261,98 +305,347 @@ class NotificationService:
     async def mark_notification_read(self, notification_id: int) -> bool:
         """알림 읽음 처리"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    UPDATE notification_history 
-                    SET read_at = CURRENT_TIMESTAMP, status = 'read'
-                    WHERE notification_id = ?
-                """, (notification_id,))
-                
-                if conn.total_changes > 0:
-                    self.logger.info(f"알림 읽음 처리: {notification_id}")
-                    return True
-                else:
-                    self.logger.warning(f"알림 읽음 처리 실패: {notification_id} (존재하지 않음)")
-                    return False
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("""
+                        UPDATE notification_history 
+                        SET read_at = CURRENT_TIMESTAMP, status = 'read'
+                        WHERE notification_id = ?
+                    """, (notification_id,))
+                    
+                    if conn.total_changes > 0:
+                        self.logger.info(f"알림 읽음 처리: {notification_id}")
+                        return True
+                    else:
+                        self.logger.warning(f"알림 읽음 처리 실패: {notification_id} (존재하지 않음)")
+                        return False
+            
+            return await self._run_db(_db_work)
                     
         except Exception as e:
             self.logger.error(f"알림 읽음 처리 실패: {e}")
             return False
     
-    async def _save_notification(self, notification: NotificationData) -> Optional[int]:
-        """알림을 데이터베이스에 저장"""
+    async def _save_notification(self, notification: NotificationData, session_id: str = None,
+                                 seq_range: tuple = None) -> Optional[int]:
+        """
+        알림과 채널/수신자별 발송 건을 한 트랜잭션으로 저장
+
+        새로운 데이터 알림이면 new_data_log의 알림 정보도 같은 트랜잭션에서 갱신하고,
+        다이제스트 대상 알림의 이메일은 발송 건 대신 수신자별 다이제스트 항목으로 기록
+        커밋 후 디스패처를 깨워 발송 (디스패처가 없는 프로세스면 웹 서버 디스패처가 폴링으로 발송)
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    INSERT INTO notification_history 
-                    (site_key, notification_type, title, message, new_data_count, 
-                     urgency_level, status, delivery_channels, metadata, expires_at)
-                    VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?)
-                """, (
-                    notification.site_key,
-                    notification.notification_type,
-                    notification.title,
-                    notification.message,
-                    notification.new_data_count,
-                    notification.urgency_level,
-                    json.dumps(notification.delivery_channels or []),
-                    json.dumps(notification.metadata or {}),
-                    notification.expires_at.isoformat() if notification.expires_at else None
-                ))
-                
-                notification_id = cursor.lastrowid
-                
-                # 알림 수 업데이트
-                cursor.execute("""
-                    UPDATE crawl_metadata 
-                    SET notification_count = notification_count + 1
-                    WHERE site_key = ?
-                """, (notification.site_key,))
-                
-                return notification_id
-                
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    # 수신자별 일일 한도 소비가 알림 저장과 함께 확정되도록 쓰기 잠금을 잡고 시작
+                    cursor.execute("BEGIN IMMEDIATE")
+                    subscriptions = self._match_subscriptions(conn, notification, session_id, seq_range)
+                    notification_id = self._insert_notification(cursor, notification)
+
+                    # 채널/수신자별 발송 건 등록
+                    deliveries = self._plan_deliveries(cursor, notification)
+                    recipients = self._select_email_recipients(cursor, notification, subscriptions)
+                    if self.digest.applies_to(notification.notification_type):
+                        self.digest.add_event(cursor, notification.site_key, notification.notification_type,
+                                              notification.new_data_count, notification.urgency_level,
+                                              recipients, session_id, seq_range, notification_id)
+                    else:
+                        # 구독 규칙이 있는 수신자는 일치 문서 목록을 발송 건에 함께 기록 (본문에 일치 문서만 표시)
+                        deliveries += [('email', setting_id, data_ids) for setting_id, data_ids in recipients.items()
+                                       if self.throttle.acquire_in(cursor, self.throttle.recipient_scopes(setting_id))]
+                    self.outbox.add_deliveries(cursor, notification_id, deliveries)
+                    # 할당할 발송 건이 없으면(팬아웃 채널만 있거나 발송 건 없음) 바로 최종 상태 확정
+                    self.outbox.finalize(cursor, [notification_id])
+
+                    if notification.notification_type == 'new_data':
+                        self._update_new_data_log(cursor, notification.site_key, notification_id,
+                                                  session_id, seq_range)
+                        self._advance_notification_cursor(cursor, notification.site_key, seq_range)
+
+                    return notification_id
+
+            notification_id = await self._run_db(_db_work)
+
         except Exception as e:
             self.logger.error(f"알림 저장 실패: {e}")
             return None
-    
-    async def _send_notification(self, notification: NotificationData, notification_id: int):
-        """실제 알림 발송"""
+
+        if self.dispatcher:
+            self.dispatcher.wake()
+        return notification_id
+
+    def _insert_notification(self, cursor: sqlite3.Cursor, notification: NotificationData) -> int:
+        """알림 히스토리 저장 (호출자의 트랜잭션에서 실행)"""
+        cursor.execute("""
+            INSERT INTO notification_history 
+            (site_key, notification_type, title, message, new_data_count, 
+             urgency_level, status, delivery_channels, metadata, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?)
+        """, (
+            notification.site_key,
+            notification.notification_type,
+            notification.title,
+            notification.message,
+            notification.new_data_count,
+            notification.urgency_level,
+            json.dumps(notification.delivery_channels or []),
+            json.dumps(notification.metadata or {}),
+            notification.expires_at.isoformat() if notification.expires_at else None
+        ))
+        
+        notification_id = cursor.lastrowid
+        
+        # 알림 수 업데이트
+        cursor.execute("""
+            UPDATE crawl_metadata 
+            SET notification_count = notification_count + 1
+            WHERE site_key = ?
+        """, (notification.site_key,))
+        
+        return notification_id
+
+    def _plan_deliveries(self, cursor: sqlite3.Cursor, notification: NotificationData) -> List[tuple]:
+        """
+        즉시 발송 채널(WebSocket/푸시)의 발송 건 목록
+
+        WebSocket은 알림당 한 건만 기록하고, 각 웹 워커의 디스패처가 읽어 자신의 연결에 전송
+        """
+        channels = notification.delivery_channels or []
+        deliveries = []
+
+        if 'websocket' in channels and self.notification_settings['websocket_enabled']:
+            deliveries.append(('websocket', ''))
+
+        if 'push' in channels and self.notification_settings['push_enabled']:
+            deliveries.append(('push', ''))
+
+        return deliveries
+
+    def _match_subscriptions(self, conn: sqlite3.Connection, notification: NotificationData,
+                             session_id: str = None, seq_range: tuple = None) -> Optional[tuple]:
+        """
+        이번 새로운 데이터 문서를 구독 규칙과 한 번에 매칭 (호출자의 트랜잭션에서 실행)
+
+        일치한 규칙별 문서 수는 알림 메타데이터(matched_subscriptions)에 기록되어 WebSocket 알림에도 포함
+
+        Returns:
+            (규칙이 있는 수신자 설정 ID 집합, 수신자별 일치 문서 ID 목록), 새로운 데이터 알림이 아니거나 규칙이 없으면 None
+        """
+        if notification.notification_type != 'new_data':
+            return None
+        matcher = self.subscriptions.get_matcher(conn)
+        if not matcher.rules:
+            return None
+
+        where_clause, params = self._new_data_log_filter(notification.site_key, session_id, seq_range)
+        conn.row_factory = sqlite3.Row
         try:
-            channels = notification.delivery_channels or []
-            success_channels = []
-            
+            documents = [dict(row) for row in conn.execute(f"""
+                SELECT site_key, data_id, data_category, data_title, data_summary
+                FROM new_data_log
+                WHERE {where_clause}
+            """, params)]
+        except Exception as e:
+            self.logger.error(f"구독 매칭 대상 문서 조회 실패: {e}")
+            documents = []
+        finally:
+            conn.row_factory = None
+
+        matches, label_counts = matcher.match(documents)
+        if label_counts:
+            notification.metadata = {**(notification.metadata or {}), 'matched_subscriptions': label_counts}
+        return matcher.subscribed_settings, matches
+
+    def _select_email_recipients(self, cursor: sqlite3.Cursor, notification: NotificationData,
+                                 subscriptions: Optional[tuple] = None) -> Dict[int, Optional[List[str]]]:
+        """
+        임계값/알림 타입/구독 규칙 조건을 만족하는 이메일 수신자
+
+        Returns:
+            수신자 설정 ID별 일치 문서 ID 목록 (구독 규칙이 없는 수신자는 None = 전체 문서)
+        """
+        if 'email' not in (notification.delivery_channels or []) or not self.notification_settings['email_enabled']:
+            return {}
+        subscribed_settings, matches = subscriptions or (set(), {})
+
+        cursor.execute("""
+            SELECT setting_id, min_data_threshold, notification_types FROM email_settings
+            WHERE is_active = 1
+            ORDER BY is_primary DESC, created_at
+        """)
+        recipients = {}
+        for setting_id, min_data_threshold, notification_types in cursor.fetchall():
+            # 구독 규칙이 있는 수신자는 일치한 문서만 대상
+            data_ids = matches.get(setting_id, []) if setting_id in subscribed_settings else None
+            data_count = notification.new_data_count if data_ids is None else len(data_ids)
+            if data_ids is not None and not data_ids:
+                continue
+
+            # 임계값 확인
+            if data_count < (min_data_threshold or 0):
+                continue
+
+            # 알림 타입 확인
+            if notification.notification_type not in json.loads(notification_types or '["new_data"]'):
+                continue
+
+            recipients[setting_id] = data_ids
+        return recipients
+
+    async def _save_digest_event(self, notification: NotificationData, session_id: str = None,
+                                 seq_range: tuple = None) -> bool:
+        """즉시 알림 없이 이메일 다이제스트 항목만 기록 (최소 알림 간격 내 중복 알림)"""
+        try:
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    subscriptions = self._match_subscriptions(conn, notification, session_id, seq_range)
+                    recipients = self._select_email_recipients(cursor, notification, subscriptions)
+                    self.digest.add_event(cursor, notification.site_key, notification.notification_type,
+                                          notification.new_data_count, notification.urgency_level,
+                                          recipients, session_id, seq_range)
+                    self._advance_notification_cursor(cursor, notification.site_key, seq_range)
+                    return True
+
+            return await self._run_db(_db_work)
+
+        except Exception as e:
+            self.logger.error(f"다이제스트 항목 저장 실패: {e}")
+            return False
+
+    def flush_digests(self, force: bool = False) -> int:
+        """
+        발송 조건을 만족한 다이제스트를 요약 알림으로 변환 (디스패처가 주기적으로 실행)
+
+        수신자 그룹마다 요약 알림과 이메일 발송 건을 만들고 대기 항목을 발송 완료로 표시하는 작업을
+        한 트랜잭션으로 처리하므로 항목이 유실되거나 두 번 요약되지 않음
+        (발송할 그룹이 있을 때만 쓰기 잠금을 잡고 다시 조회하여 여러 디스패처 간 중복 방지)
+
+        Returns:
+            생성한 요약 알림 수
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if not self.digest.collect_due(cursor, force=force):
+                    return 0
+                
+                cursor.execute("BEGIN IMMEDIATE")
+                groups = []
+                for group in self.digest.collect_due(cursor, force=force):
+                    # 일일 한도에 도달한 수신자의 항목은 대기 상태로 남겨 다음 날 발송
+                    group['setting_ids'] = [
+                        setting_id for setting_id in group['setting_ids']
+                        if self.throttle.acquire_in(cursor, self.throttle.recipient_scopes(setting_id))
+                    ]
+                    if not group['setting_ids']:
+                        continue
+                    groups.append(group)
+                    notification = self._build_digest_notification(group['events'])
+                    notification_id = self._insert_notification(cursor, notification)
+                    self.outbox.add_deliveries(cursor, notification_id,
+                                               [('email', setting_id) for setting_id in group['setting_ids']])
+                    self.digest.mark_flushed(cursor, group, notification_id)
+        except Exception as e:
+            self.logger.error(f"다이제스트 발송 준비 실패: {e}")
+            return 0
+
+        if groups:
+            self.logger.info(f"다이제스트 요약 알림 생성: {len(groups)}건 "
+                             f"(수신자 {sum(len(group['setting_ids']) for group in groups)}명)")
+        return len(groups)
+
+    def _build_digest_notification(self, events: List[Dict[str, Any]]) -> NotificationData:
+        """대기 이벤트 묶음을 하나의 요약 알림으로 구성 (사이트별 문서 수 합산)"""
+        site_counts: Dict[str, int] = {}
+        site_data_ids: Dict[str, Optional[List[str]]] = {}
+        for event in events:
+            site_key = event['site_key']
+            site_counts[site_key] = site_counts.get(site_key, 0) + self.digest.document_count(event)
+            # 구독 규칙으로 선별된 이벤트만 있는 사이트는 일치 문서만 표시
+            if event['data_ids'] is None:
+                site_data_ids[site_key] = None
+            elif site_data_ids.get(site_key, []) is not None:
+                site_data_ids[site_key] = site_data_ids.get(site_key, []) + event['data_ids']
+        total_count = sum(site_counts.values())
+        urgency_order = ['low', 'normal', 'high', 'critical']
+        urgency_level = max((event['urgency_level'] or 'normal' for event in events),
+                            key=lambda level: urgency_order.index(level) if level in urgency_order else 1)
+
+        summary = ", ".join(f"{self.site_names.get(site_key, site_key)} {count}개"
+                            for site_key, count in site_counts.items())
+        return NotificationData(
+            site_key='all_sites',
+            notification_type='digest',
+            title=f"새로운 데이터 요약: {len(site_counts)}개 사이트 {total_count}개",
+            message=f"최근 발견된 새로운 데이터: {summary}",
+            urgency_level=urgency_level,
+            new_data_count=total_count,
+            delivery_channels=['email'],
+            metadata={
+                'site_counts': site_counts,
+                'data_ids': {site_key: data_ids for site_key, data_ids in site_data_ids.items() if data_ids is not None},
+                'event_ids': [event['event_id'] for event in events],
+                'first_event_at': datetime.fromtimestamp(events[0]['created_at']).isoformat(),
+                'last_event_at': datetime.fromtimestamp(events[-1]['created_at']).isoformat()
+            },
+            expires_at=datetime.now() + timedelta(hours=24)
+        )
+
+    @staticmethod
+    def notification_from_row(row: Dict[str, Any]) -> NotificationData:
+        """notification_history 행을 알림 데이터로 변환 (디스패처용)"""
+        return NotificationData(
+            site_key=row['site_key'],
+            notification_type=row['notification_type'],
+            title=row['title'],
+            message=row['message'],
+            urgency_level=row['urgency_level'] or 'normal',
+            new_data_count=row['new_data_count'] or 0,
+            metadata=json.loads(row['metadata']) if row['metadata'] else {},
+            expires_at=datetime.fromisoformat(row['expires_at']) if row['expires_at'] else None
+        )
+
+    async def deliver(self, notification_id: int, notification: NotificationData,
+                      deliveries: List[Dict[str, Any]]) -> Dict[int, Optional[str]]:
+        """
+        아웃박스에서 할당받은 발송 건을 채널별로 발송
+
+        Returns:
+            발송 건 ID별 결과 (성공이면 None, 실패면 오류 메시지)
+        """
+        outcomes: Dict[int, Optional[str]] = {}
+        email_deliveries = []
+
+        for delivery in deliveries:
+            channel = delivery['channel']
+
             # WebSocket 알림
-            if 'websocket' in channels:
-                if await self._send_websocket_notification(notification, notification_id):
-                    success_channels.append('websocket')
-            
+            if channel == 'websocket':
+                sent = await self._send_websocket_notification(notification, notification_id)
+                outcomes[delivery['delivery_id']] = None if sent else "WebSocket 발송 실패"
+
             # Push 알림 (브라우저에서 처리하므로 성공으로 간주)
-            if 'push' in channels:
-                success_channels.append('push')
+            elif channel == 'push':
+                outcomes[delivery['delivery_id']] = None
                 self.logger.info(f"Push 알림 채널 활성화: {notification_id}")
-            
-            # 이메일 알림
-            if 'email' in channels and self.notification_settings['email_enabled']:
-                if await self._send_email_notification(notification, notification_id):
-                    success_channels.append('email')
-            
-            # 상태 업데이트
-            status = 'sent' if success_channels else 'failed'
-            
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    UPDATE notification_history 
-                    SET status = ?, delivery_channels = ?
-                    WHERE notification_id = ?
-                """, (status, json.dumps(success_channels), notification_id))
-            
-            self.logger.info(f"알림 발송 완료: {notification_id} ({', '.join(success_channels)})")
-            
-        except Exception as e:
-            self.logger.error(f"알림 발송 실패: {e}")
-    
+
+            # 이메일 알림 (수신자별 발송 건을 모아 서버별로 일괄 발송)
+            elif channel == 'email':
+                email_deliveries.append(delivery)
+
+            else:
+                outcomes[delivery['delivery_id']] = f"알 수 없는 채널: {channel}"
+
+        if email_deliveries:
+            outcomes.update(await self._send_email_notification(notification, email_deliveries))
+
+        self.logger.info(f"알림 발송 처리: {notification_id} "
+                         f"(성공 {sum(error is None for error in outcomes.values())}/{len(outcomes)}건)")
+        return outcomes
+
     async def _send_websocket_notification(self, notification: NotificationData, 
                                          notification_id: int) -> bool:
         """WebSocket 알림 발송"""
@@ -371,6 +664,13 @@ class NotificationService:
                 'timestamp': datetime.now().isoformat()
             }
             
+            # 새로운 데이터 알림은 이번 크롤링 세션의 문서 목록 포함 (대시보드가 API를 다시 조회하지 않음)
+            if notification.notification_type == 'new_data':
+                message['documents'] = await self._run_db(
+                    self._get_recent_new_data_sync, notification.site_key,
+                    min(notification.new_data_count, self.digest.config['max_items_per_site']),
+                    (notification.metadata or {}).get('session_id'))
+            
             # WebSocket 매니저를 통해 실제 발송
             if self.websocket_manager:
                 await self.websocket_manager.broadcast(message)
@@ -384,381 +684,202 @@ class NotificationService:
             self.logger.error(f"WebSocket 알림 발송 실패: {e}")
             return False
     
-    async def _send_email_notification(self, notification: NotificationData, 
-                                     notification_id: int) -> bool:
-        """이메일 알림 발송"""
+    async def _send_email_notification(self, notification: NotificationData,
+                                     deliveries: List[Dict[str, Any]]) -> Dict[int, Optional[str]]:
+        """
+        이메일 발송 건 발송 (같은 SMTP 서버의 수신자는 한 세션에서 일괄 발송, 서버별로는 동시 발송)
+
+        구독 규칙으로 선별된 수신자는 일치 문서만 담은 본문을 받으므로 (구독 보기, SMTP 서버) 단위로 묶음
+
+        Returns:
+            발송 건 ID별 결과 (성공이면 None, 실패면 오류 메시지)
+        """
+        delivery_ids = {int(delivery['target']): delivery['delivery_id'] for delivery in deliveries}
+        data_ids = {int(delivery['target']): delivery.get('data_ids') for delivery in deliveries}
         try:
-            # 활성화된 이메일 설정 조회
-            email_settings = await self._get_active_email_settings()
+            # 발송 대상 중 여전히 활성화된 이메일 설정 조회
+            email_settings = await self._get_active_email_settings(list(delivery_ids))
+            outcomes = {delivery_id: "비활성화되었거나 삭제된 이메일 설정" for delivery_id in delivery_ids.values()}
             if not email_settings:
                 self.logger.warning("활성화된 이메일 설정이 없음")
-                return False
-            
-            # 각 이메일 주소로 발송
-            success_count = 0
+                return outcomes
+
+            # 수신자를 구독 보기와 SMTP 서버별로 묶음
+            views: Dict[str, NotificationData] = {}
+            groups: Dict[tuple, List[dict]] = {}
             for setting in email_settings:
-                # 임계값 확인
-                if notification.new_data_count < setting['min_data_threshold']:
-                    continue
-                
-                # 알림 타입 확인
-                notification_types = json.loads(setting['notification_types'] or '["new_data"]')
-                if notification.notification_type not in notification_types:
-                    continue
-                
-                # 이메일 발송
-                if await self._send_single_email(setting, notification):
-                    success_count += 1
-                    # 발송 통계 업데이트
-                    await self._update_email_send_stats(setting['setting_id'], success=True)
-                else:
-                    await self._update_email_send_stats(setting['setting_id'], success=False)
-            
-            return success_count > 0
-            
+                view = self._email_view(notification, data_ids.get(setting['setting_id']))
+                views.setdefault(view[0], view[1])
+                groups.setdefault((view[0], self._smtp_server_key(setting)), []).append(setting)
+
+            # 본문은 서버/수신자 수와 관계없이 구독 보기마다 한 번만 조회/렌더링
+            bodies = {key: await self._run_db(self.email_renderer.render, view) for key, view in views.items()}
+
+            loop = asyncio.get_event_loop()
+            group_results = await asyncio.gather(*[
+                loop.run_in_executor(self.email_executor, self._sync_send_email_batch, settings, views[view_key],
+                                     bodies[view_key])
+                for (view_key, _), settings in groups.items()
+            ])
+
+            # 발송 통계 업데이트
+            results = {setting_id: success for group in group_results for setting_id, success in group.items()}
+            await self._update_email_send_stats([sid for sid, success in results.items() if success], success=True)
+            await self._update_email_send_stats([sid for sid, success in results.items() if not success], success=False)
+
+            for setting_id, success in results.items():
+                outcomes[delivery_ids[setting_id]] = None if success else "이메일 발송 실패"
+            return outcomes
+
         except Exception as e:
             self.logger.error(f"이메일 알림 발송 실패: {e}")
-            return False
+            return {delivery_id: str(e) or type(e).__name__ for delivery_id in delivery_ids.values()}
     
     async def _send_single_email(self, email_setting: dict, 
                                 notification: NotificationData) -> bool:
-        """단일 이메일 발송 (재시도 로직 포함)"""
+        """단일 이메일 발송"""
         # ThreadPoolExecutor를 사용하여 블로킹 이메일 작업을 비동기로 실행
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
+        results = await loop.run_in_executor(
             self.email_executor,
-            self._sync_send_email_with_retry,
-            email_setting,
+            self._sync_send_email_batch,
+            [email_setting],
             notification
         )
+        return results.get(email_setting['setting_id'], False)
     
-    def _sync_send_email_with_retry(self, email_setting: dict, 
-                                   notification: NotificationData,
-                                   max_retries: int = 3) -> bool:
-        """동기 이메일 발송 (재시도 로직 포함)"""
-        for attempt in range(max_retries):
-            try:
-                # 환경 변수에서 이메일 비밀번호 가져오기
-                email_password = os.getenv('EMAIL_PASSWORD')
-                if not email_password:
-                    self.logger.error("EMAIL_PASSWORD 환경 변수가 설정되지 않음")
-                    return False
-                
-                # 표준 smtplib 사용
-                import smtplib
-                from email.mime.multipart import MIMEMultipart
-                from email.mime.text import MIMEText
-                
-                # 이메일 내용 구성
-                subject = f"[예규판례 모니터링] {notification.title}"
-                html_content = self._create_email_html_content_sync(notification)
-                
-                # MIME 메시지 생성
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = subject
-                msg['From'] = email_setting['smtp_username'] or email_setting['email_address']
-                msg['To'] = email_setting['email_address']
-                
-                # HTML 본문 추가
-                html_part = MIMEText(html_content, 'html')
-                msg.attach(html_part)
-                
-                # SMTP 서버 연결 및 발송
-                with smtplib.SMTP(email_setting['smtp_server'], int(email_setting['smtp_port'])) as server:
-                    if email_setting['use_tls']:
-                        server.starttls()
-                    server.login(
-                        email_setting['smtp_username'] or email_setting['email_address'],
-                        email_password
-                    )
-                    server.send_message(msg)
-                
-                self.logger.info(f"이메일 발송 성공: {email_setting['email_address']}")
-                return True
-                
-            except Exception as e:
-                self.logger.warning(f"이메일 발송 시도 {attempt + 1}/{max_retries} 실패: {e}")
-                
-                if attempt < max_retries - 1:
-                    # 지수 백오프로 재시도 대기
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"{wait_time}초 후 재시도...")
-                    time.sleep(wait_time)
-                else:
-                    self.logger.error(f"이메일 발송 최종 실패 ({email_setting['email_address']}): {e}")
-                    return False
-        
-        return False
-    
-    async def _create_email_html_content(self, notification: NotificationData) -> str:
-        """이메일 HTML 내용 생성"""
-        site_name = self.site_names.get(notification.site_key, notification.site_key)
-        
-        # 새로운 데이터 상세 정보 조회
-        new_data_items = await self._get_recent_new_data(notification.site_key, 
-                                                        notification.new_data_count)
-        
-        # HTML 템플릿
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: 'Inter', -apple-system, sans-serif; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #f3f4f6; border-radius: 8px; padding: 20px; margin-bottom: 20px; }}
-                .header h2 {{ margin: 0; color: #1f2937; }}
-                .content {{ background: white; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px; }}
-                .data-item {{ border-bottom: 1px solid #e5e7eb; padding: 12px 0; }}
-                .data-item:last-child {{ border-bottom: none; }}
-                .title {{ font-weight: 600; color: #1f2937; margin-bottom: 4px; }}
-                .metadata {{ font-size: 14px; color: #6b7280; }}
-                .link {{ color: #3b82f6; text-decoration: none; }}
-                .link:hover {{ text-decoration: underline; }}
-                .footer {{ margin-top: 20px; text-align: center; color: #6b7280; font-size: 14px; }}
-                .button {{ display: inline-block; background: #3b82f6; color: white; padding: 10px 20px; 
-                          border-radius: 6px; text-decoration: none; margin-top: 16px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2>{notification.title}</h2>
-                    <p style="margin: 8px 0 0 0; color: #6b7280;">{notification.message}</p>
-                </div>
-                
-                <div class="content">
-                    <h3>새로운 데이터 목록</h3>
+    @staticmethod
+    def _email_view(notification: NotificationData, data_ids: Optional[List[str]]) -> tuple:
         """
-        
-        # 데이터 항목 추가
-        for item in new_data_items:
-            doc_number = item.get('문서번호', '')
-            title = item.get('제목', '')
-            date = item.get('생산일자') or item.get('결정일', '')
-            link = item.get('링크', '')
-            
-            html_content += f"""
-                    <div class="data-item">
-                        <div class="title">{title}</div>
-                        <div class="metadata">
-                            문서번호: {doc_number} | 날짜: {date}
-                        </div>
-                        {f'<a href="{link}" class="link">문서 보기 →</a>' if link else ''}
-                    </div>
-            """
-        
-        # 웹 대시보드 링크 추가
-        dashboard_url = os.getenv('DASHBOARD_URL', 'http://localhost:8001')
-        html_content += f"""
-                    <div style="text-align: center; margin-top: 20px;">
-                        <a href="{dashboard_url}/data/{notification.site_key}" class="button">
-                            전체 데이터 보기
-                        </a>
-                    </div>
-                </div>
-                
-                <div class="footer">
-                    <p>이 이메일은 예규판례 모니터링 시스템에서 자동으로 발송되었습니다.</p>
-                    <p><a href="{dashboard_url}/settings" class="link">알림 설정 변경</a></p>
-                </div>
-            </div>
-        </body>
-        </html>
+        수신자에게 보낼 알림 (구독 보기 키, 알림)
+
+        구독 규칙에 일치한 문서만 받는 수신자는 다이제스트와 같이 metadata['data_ids']에 사이트별 문서 ID를 담음
         """
-        
-        return html_content
+        if data_ids is None:
+            return "", notification
+        metadata = {**(notification.metadata or {}), 'data_ids': {notification.site_key: data_ids}}
+        return (json.dumps(data_ids, ensure_ascii=False),
+                replace(notification, new_data_count=len(data_ids), metadata=metadata))
+
+    @staticmethod
+    def _smtp_server_key(email_setting: dict) -> tuple:
+        """같은 SMTP 세션으로 발송할 수 있는 설정 묶음 키 (서버, 포트, 로그인 계정, TLS)"""
+        return (email_setting['smtp_server'], int(email_setting['smtp_port']),
+                email_setting['smtp_username'] or email_setting['email_address'],
+                bool(email_setting['use_tls']))
     
-    def _create_email_html_content_sync(self, notification: NotificationData) -> str:
-        """이메일 HTML 내용 생성 (동기 버전)"""
-        site_name = self.site_names.get(notification.site_key, notification.site_key)
-        
-        # 새로운 데이터 상세 정보 조회 (동기 버전)
-        new_data_items = self._get_recent_new_data_sync(notification.site_key, 
-                                                       notification.new_data_count)
-        
-        # HTML 템플릿 (동일한 내용)
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: 'Inter', -apple-system, sans-serif; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #f3f4f6; border-radius: 8px; padding: 20px; margin-bottom: 20px; }}
-                .header h2 {{ margin: 0; color: #1f2937; }}
-                .content {{ background: white; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px; }}
-                .data-item {{ border-bottom: 1px solid #e5e7eb; padding: 12px 0; }}
-                .data-item:last-child {{ border-bottom: none; }}
-                .title {{ font-weight: 600; color: #1f2937; margin-bottom: 4px; }}
-                .metadata {{ font-size: 14px; color: #6b7280; }}
-                .link {{ color: #3b82f6; text-decoration: none; }}
-                .link:hover {{ text-decoration: underline; }}
-                .footer {{ margin-top: 20px; text-align: center; color: #6b7280; font-size: 14px; }}
-                .button {{ display: inline-block; background: #3b82f6; color: white; padding: 10px 20px; 
-                          border-radius: 6px; text-decoration: none; margin-top: 16px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2>{notification.title}</h2>
-                    <p style="margin: 8px 0 0 0; color: #6b7280;">{notification.message}</p>
-                </div>
-                
-                <div class="content">
-                    <h3>새로운 데이터 목록</h3>
+    def _sync_send_email_batch(self, email_settings: List[dict], 
+                               notification: NotificationData, html_content: str = None) -> Dict[int, bool]:
         """
+        같은 SMTP 서버를 쓰는 수신자들에게 동기 이메일 발송 (연결 풀 재사용, 연결 오류 시 재연결 후 재시도)
         
-        # 데이터 항목 추가
-        for item in new_data_items:
-            doc_number = item.get('문서번호', '')
-            title = item.get('제목', '')
-            date = item.get('생산일자') or item.get('결정일', '')
-            link = item.get('링크', '')
-            
-            html_content += f"""
-                    <div class="data-item">
-                        <div class="title">{title}</div>
-                        <div class="metadata">
-                            문서번호: {doc_number} | 날짜: {date}
-                        </div>
-                        {f'<a href="{link}" class="link">문서 보기 →</a>' if link else ''}
-                    </div>
-            """
-        
-        # 웹 대시보드 링크 추가
-        dashboard_url = os.getenv('DASHBOARD_URL', 'http://localhost:8001')
-        html_content += f"""
-                    <div style="text-align: center; margin-top: 20px;">
-                        <a href="{dashboard_url}/data/{notification.site_key}" class="button">
-                            전체 데이터 보기
-                        </a>
-                    </div>
-                </div>
-                
-                <div class="footer">
-                    <p>이 이메일은 예규판례 모니터링 시스템에서 자동으로 발송되었습니다.</p>
-                    <p><a href="{dashboard_url}/settings" class="link">알림 설정 변경</a></p>
-                </div>
-            </div>
-        </body>
-        </html>
+        Returns:
+            설정 ID별 발송 성공 여부
         """
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
         
-        return html_content
-    
-    async def _get_recent_new_data(self, site_key: str, limit: int) -> List[Dict[str, Any]]:
-        """최근 새로운 데이터 조회"""
+        # 환경 변수에서 이메일 비밀번호 가져오기
+        email_password = os.getenv('EMAIL_PASSWORD')
+        if not email_password:
+            self.logger.error("EMAIL_PASSWORD 환경 변수가 설정되지 않음")
+            return {setting['setting_id']: False for setting in email_settings}
+        
+        host, port, username, use_tls = self._smtp_server_key(email_settings[0])
         try:
-            # 사이트별 테이블명 매핑
-            table_mapping = {
-                "tax_tribunal": "tax_tribunal_cases",
-                "nts_authority": "nts_authority_interpretations",
-                "nts_precedent": "nts_precedent_cases",
-                "moef": "moef_tax_interpretations",
-                "mois": "mois_interpretations",
-                "bai": "bai_audit_claims"
-            }
+            recipients = [setting['email_address'] for setting in email_settings]
             
-            table_name = table_mapping.get(site_key)
-            if not table_name:
-                return []
+            # 이메일 내용 구성
+            subject = f"[예규판례 모니터링] {notification.title}"
+            html_content = html_content or self.email_renderer.render(notification)
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 최근 추가된 데이터 조회 (created_at 기준)
-                cursor.execute(f"""
-                    SELECT * FROM {table_name}
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (limit,))
-                
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                
-                return [dict(zip(columns, row)) for row in rows]
-                
+            # MIME 메시지 생성 (수신자가 여러 명이면 주소는 봉투에만 두고 헤더에는 발신자만 표시)
+            msg = MIMEMultipart('alternative')
+            msg['Subject'] = subject
+            msg['From'] = username
+            msg['To'] = recipients[0] if len(recipients) == 1 else username
+            
+            # HTML 본문 추가
+            html_part = MIMEText(html_content, 'html')
+            msg.attach(html_part)
+            
+            delivery = get_email_delivery_service()
+            pool = delivery.get_pool(host, port, username, email_password, use_tls)
+            results = delivery.send_message(pool, msg, recipients, from_addr=username)
         except Exception as e:
-            self.logger.error(f"새로운 데이터 조회 실패: {e}")
-            return []
+            self.logger.error(f"이메일 발송 실패 ({host}): {e}")
+            return {setting['setting_id']: False for setting in email_settings}
+        
+        outcome = {}
+        for setting in email_settings:
+            error = results.get(setting['email_address'], "결과 없음")
+            if error is None:
+                self.logger.info(f"이메일 발송 성공: {setting['email_address']}")
+            else:
+                self.logger.error(f"이메일 발송 최종 실패 ({setting['email_address']}): {error}")
+            outcome[setting['setting_id']] = error is None
+        return outcome
     
-    def _get_recent_new_data_sync(self, site_key: str, limit: int) -> List[Dict[str, Any]]:
-        """최근 새로운 데이터 조회 (동기 버전)"""
+    async def _get_recent_new_data(self, site_key: str, limit: int, session_id: str = None) -> List[Dict[str, Any]]:
+        """최근 새로운 데이터 조회"""
+        return await self._run_db(self._get_recent_new_data_sync, site_key, limit, session_id)
+    
+    def _get_recent_new_data_sync(self, site_key: str, limit: int, session_id: str = None) -> List[Dict[str, Any]]:
+        """최근 새로운 데이터 조회 (최근 문서 프로젝션 기준, 세션을 지정하면 해당 크롤링에서 발견된 문서만)"""
         try:
-            # 사이트별 테이블명 매핑
-            table_mapping = {
-                "tax_tribunal": "tax_tribunal_cases",
-                "nts_authority": "nts_authority_interpretations",
-                "nts_precedent": "nts_precedent_cases",
-                "moef": "moef_tax_interpretations",
-                "mois": "mois_interpretations",
-                "bai": "bai_audit_claims"
-            }
-            
-            table_name = table_mapping.get(site_key)
-            if not table_name:
-                return []
-            
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 최근 추가된 데이터 조회 (created_at 기준)
-                cursor.execute(f"""
-                    SELECT * FROM {table_name}
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (limit,))
-                
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                
-                return [dict(zip(columns, row)) for row in rows]
-                
+            return self.recent_documents.list_documents(site_key=site_key, session_id=session_id,
+                                                        limit=max(limit, 1))["documents"]
         except Exception as e:
             self.logger.error(f"새로운 데이터 조회 실패: {e}")
             return []
     
-    async def _get_active_email_settings(self) -> List[Dict[str, Any]]:
-        """활성화된 이메일 설정 조회"""
+    async def _get_active_email_settings(self, setting_ids: List[int] = None) -> List[Dict[str, Any]]:
+        """활성화된 이메일 설정 조회 (setting_ids가 있으면 해당 설정만)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM email_settings 
-                    WHERE is_active = 1
-                    ORDER BY is_primary DESC, created_at
-                """)
-                
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                
-                return [dict(zip(columns, row)) for row in rows]
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    id_filter = f"AND setting_id IN ({', '.join('?' for _ in setting_ids)})" if setting_ids else ""
+                    cursor.execute(f"""
+                        SELECT * FROM email_settings 
+                        WHERE is_active = 1 {id_filter}
+                        ORDER BY is_primary DESC, created_at
+                    """, setting_ids or [])
+                    
+                    columns = [desc[0] for desc in cursor.description]
+                    rows = cursor.fetchall()
+                    
+                    return [dict(zip(columns, row)) for row in rows]
+            
+            return await self._run_db(_db_work)
                 
         except Exception as e:
             self.logger.error(f"이메일 설정 조회 실패: {e}")
             return []
     
-    async def _update_email_send_stats(self, setting_id: int, success: bool):
-        """이메일 발송 통계 업데이트"""
+    async def _update_email_send_stats(self, setting_ids: List[int], success: bool):
+        """이메일 발송 통계 업데이트 (여러 설정을 한 번에 갱신)"""
+        if not setting_ids:
+            return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                if success:
-                    conn.execute("""
-                        UPDATE email_settings 
-                        SET send_count = send_count + 1,
-                            last_sent_at = CURRENT_TIMESTAMP
-                        WHERE setting_id = ?
-                    """, (setting_id,))
-                else:
-                    conn.execute("""
-                        UPDATE email_settings 
-                        SET failure_count = failure_count + 1
-                        WHERE setting_id = ?
-                    """, (setting_id,))
+            def _db_work():
+                params = [(setting_id,) for setting_id in setting_ids]
+                with sqlite3.connect(self.db_path) as conn:
+                    if success:
+                        conn.executemany("""
+                            UPDATE email_settings 
+                            SET send_count = send_count + 1,
+                                last_sent_at = CURRENT_TIMESTAMP
+                            WHERE setting_id = ?
+                        """, params)
+                    else:
+                        conn.executemany("""
+                            UPDATE email_settings 
+                            SET failure_count = failure_count + 1
+                            WHERE setting_id = ?
+                        """, params)
+            
+            await self._run_db(_db_work)
                     
         except Exception as e:
             self.logger.error(f"이메일 발송 통계 업데이트 실패: {e}")
@@ -779,33 +900,37 @@ class NotificationService:
             )
             
             # 이메일 설정 조회
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM email_settings 
-                    WHERE email_address = ?
-                """, (email_address,))
-                
-                columns = [desc[0] for desc in cursor.description]
-                row = cursor.fetchone()
-                
-                if not row:
-                    self.logger.error(f"이메일 설정을 찾을 수 없음: {email_address}")
-                    return False
-                
-                email_setting = dict(zip(columns, row))
+            def _load_setting():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("""
+                        SELECT * FROM email_settings 
+                        WHERE email_address = ?
+                    """, (email_address,))
+                    
+                    columns = [desc[0] for desc in cursor.description]
+                    row = cursor.fetchone()
+                    return dict(zip(columns, row)) if row else None
+            
+            email_setting = await self._run_db(_load_setting)
+            if not email_setting:
+                self.logger.error(f"이메일 설정을 찾을 수 없음: {email_address}")
+                return False
             
             # 테스트 이메일 발송
             success = await self._send_single_email(email_setting, test_notification)
             
             if success:
                 # 테스트 발송 성공 기록
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.execute("""
-                        UPDATE email_settings 
-                        SET test_email_sent = 1
-                        WHERE email_address = ?
-                    """, (email_address,))
+                def _mark_tested():
+                    with sqlite3.connect(self.db_path) as conn:
+                        conn.execute("""
+                            UPDATE email_settings 
+                            SET test_email_sent = 1
+                            WHERE email_address = ?
+                        """, (email_address,))
+                
+                await self._run_db(_mark_tested)
             
             return success
             
@@ -816,79 +941,90 @@ class NotificationService:
     async def _get_notification_threshold(self, site_key: str) -> int:
         """사이트별 알림 임계값 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT notification_threshold FROM crawl_schedules 
-                    WHERE site_key = ?
-                """, (site_key,))
-                
-                result = cursor.fetchone()
-                return result[0] if result else 1
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("""
+                        SELECT notification_threshold FROM crawl_schedules 
+                        WHERE site_key = ?
+                    """, (site_key,))
+                    
+                    result = cursor.fetchone()
+                    return result[0] if result else 1
+            
+            return await self._run_db(_db_work)
                 
         except Exception as e:
             self.logger.error(f"알림 임계값 조회 실패: {e}")
             return 1
     
-    async def _check_duplicate_notification(self, site_key: str, 
-                                          notification_type: str) -> bool:
-        """중복 알림 체크"""
-        try:
-            cache_key = f"{site_key}_{notification_type}"
-            
-            # 메모리 캐시 체크
-            if cache_key in self.recent_notifications:
-                last_sent = self.recent_notifications[cache_key]
-                if datetime.now() - last_sent < timedelta(seconds=self.notification_settings['min_interval']):
-                    return True
-            
-            # 캐시 업데이트
-            self.recent_notifications[cache_key] = datetime.now()
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"중복 알림 체크 실패: {e}")
+    async def _check_throttle(self, site_key: str, notification_type: str) -> bool:
+        """알림 빈도 제한 확인 (제한되면 True, 허용되면 한도를 소비하고 False)"""
+        scopes = self.throttle.type_scopes(site_key, notification_type)
+        if not scopes:
             return False
+        return not await self._run_db(self.throttle.acquire, scopes)
     
-    async def _check_error_rate_limit(self, site_key: str) -> bool:
-        """에러 알림 빈도 제한 체크"""
-        try:
-            # 최근 1시간 내 에러 알림 수 확인
-            cutoff_time = datetime.now() - timedelta(hours=1)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT COUNT(*) FROM notification_history 
-                    WHERE site_key = ? AND notification_type = 'error' 
-                    AND created_at >= ?
-                """, (site_key, cutoff_time.isoformat()))
-                
-                count = cursor.fetchone()[0]
-                
-                # 1시간 내 3개 이상의 에러 알림이면 제한
-                return count >= 3
-                
-        except Exception as e:
-            self.logger.error(f"에러 알림 빈도 제한 체크 실패: {e}")
-            return False
+    @staticmethod
+    def notification_cursor_id(site_key: str) -> str:
+        """사이트별 알림 소비자 커서 ID (change_feed_cursors)"""
+        return f"notifications:{site_key}"
+
+    def _resume_seq_range(self, site_key: str, new_data_count: int, seq_range: tuple) -> tuple:
+        """
+        알림 커서부터 이번 저장 구간 끝까지의 CDC 구간과 그 안의 새로운 데이터 수
+
+        임계값 미달 등으로 알림을 만들지 않은 구간은 다음 알림 구간에 포함되고,
+        이미 알림을 만든 구간이 다시 전달되면 빈 구간이 됨 (커서가 없으면 전달받은 구간 시작에서 생성)
+        """
+        consumer_id = self.notification_cursor_id(site_key)
+        since = self.change_feed.get_cursor(consumer_id, default=None)
+        if since is None:
+            self.change_feed.commit_cursor(consumer_id, seq_range[0])
+            since = seq_range[0]
+        if since == seq_range[0]:
+            return tuple(seq_range), new_data_count
+        until = max(since, seq_range[1])
+        return (since, until), self.change_feed.count_changes(site_key, since, until)
+
+    def _advance_notification_cursor(self, cursor: sqlite3.Cursor, site_key: str, seq_range: tuple = None):
+        """알림 커서를 이번 알림 구간 끝으로 이동 (알림 저장 트랜잭션에서 실행)"""
+        if seq_range:
+            ChangeFeedService.commit_cursor_in(cursor, self.notification_cursor_id(site_key), seq_range[1])
+
+    @staticmethod
+    def _new_data_log_filter(site_key: str, session_id: str = None, seq_range: tuple = None) -> tuple:
+        """
+        이번 알림 대상 new_data_log 행 조건 (WHERE 절, 파라미터)
+
+        CDC 시퀀스 구간이 있으면 해당 구간에 삽입된 문서만, 없으면 크롤링 세션 기준으로,
+        둘 다 없으면 해당 사이트의 미발송 로그 전체를 대상으로 함
+        """
+        if seq_range and seq_range[1] > seq_range[0]:
+            return ("""site_key = ? AND notification_sent = 0
+                    AND data_id IN (
+                        SELECT data_id FROM data_change_log
+                        WHERE site_key = ? AND seq > ? AND seq <= ?
+                    )""", [site_key, site_key, seq_range[0], seq_range[1]])
+        if session_id:
+            return ("site_key = ? AND crawl_session_id = ? AND notification_sent = 0", [site_key, session_id])
+        return ("site_key = ? AND notification_sent = 0", [site_key])
     
-    async def _update_new_data_log(self, site_key: str, notification_id: int):
-        """새로운 데이터 로그의 알림 정보 업데이트"""
+    def _update_new_data_log(self, cursor: sqlite3.Cursor, site_key: str, notification_id: int,
+                             session_id: str = None, seq_range: tuple = None):
+        """새로운 데이터 로그의 알림 정보 업데이트 (알림 저장 트랜잭션에서 실행)"""
         try:
-            # 최근 5분 내 발견된 데이터 업데이트
-            cutoff_time = datetime.now() - timedelta(minutes=5)
+            where_clause, params = self._new_data_log_filter(site_key, session_id, seq_range)
+            # 조건에 notification_sent = 0이 포함되므로 new_data_log보다 먼저 갱신
+            RecentDocuments.mark_notified(cursor, notification_id, where_clause, params)
+            cursor.execute(f"""
+                UPDATE new_data_log 
+                SET notification_sent = 1, notification_id = ?
+                WHERE {where_clause}
+            """, [notification_id, *params])
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    UPDATE new_data_log 
-                    SET notification_sent = 1, notification_id = ?
-                    WHERE site_key = ? AND discovered_at >= ? 
-                    AND notification_sent = 0
-                """, (notification_id, site_key, cutoff_time.isoformat()))
-                
-                updated_count = conn.total_changes
-                self.logger.info(f"새로운 데이터 로그 업데이트: {updated_count}개")
+            updated_count = cursor.rowcount
+            self.logger.info(f"새로운 데이터 로그 업데이트: {updated_count}개")
                 
         except Exception as e:
             self.logger.error(f"새로운 데이터 로그 업데이트 실패: {e}")
@@ -942,6 +1078,10 @@ class NotificationService:
     async def send_all_sites_notification(self, total_new_count: int, summary: str, session_id: str = None) -> bool:
         """전체 사이트 크롤링 결과 알림 발송"""
         try:
+            if await self._check_throttle('all_sites', 'crawl_complete'):
+                self.logger.info("알림 빈도 제한: 전체 사이트 크롤링 알림")
+                return True
+            
             notification = NotificationData(
                 site_key='all_sites',
                 notification_type='crawl_complete',
@@ -961,8 +1101,7 @@ class NotificationService:
             notification_id = await self._save_notification(notification)
             
             if notification_id:
-                await self._send_notification(notification, notification_id)
-                self.logger.info(f"전체 사이트 크롤링 알림 발송: {total_new_count}개")
+                self.logger.info(f"전체 사이트 크롤링 알림 등록: {total_new_count}개")
                 return True
             
             return False
@@ -1000,45 +1139,52 @@ class NotificationService:
     async def get_notification_stats(self, site_key: str = None) -> Dict[str, Any]:
         """알림 통계 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 기본 쿼리 조건
-                where_conditions = []
-                params = []
-                
-                if site_key:
-                    where_conditions.append("site_key = ?")
-                    params.append(site_key)
-                
-                where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-                
-                # 전체 알림 수
-                cursor.execute(f"SELECT COUNT(*) FROM notification_history {where_clause}", params)
-                total_notifications = cursor.fetchone()[0]
-                
-                # 읽지 않은 알림 수
-                unread_conditions = where_conditions + ["read_at IS NULL"]
-                unread_where = "WHERE " + " AND ".join(unread_conditions)
-                cursor.execute(f"SELECT COUNT(*) FROM notification_history {unread_where}", params)
-                unread_notifications = cursor.fetchone()[0]
-                
-                # 알림 타입별 통계
-                cursor.execute(f"""
-                    SELECT notification_type, COUNT(*) 
-                    FROM notification_history {where_clause}
-                    GROUP BY notification_type
-                """, params)
-                
-                type_stats = dict(cursor.fetchall())
-                
-                return {
-                    "total_notifications": total_notifications,
-                    "unread_notifications": unread_notifications,
-                    "read_notifications": total_notifications - unread_notifications,
-                    "type_breakdown": type_stats,
-                    "site_key": site_key
-                }
+            def _db_work():
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    
+                    # 기본 쿼리 조건
+                    where_conditions = []
+                    params = []
+                    
+                    if site_key:
+                        where_conditions.append("site_key = ?")
+                        params.append(site_key)
+                    
+                    where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+                    
+                    # 전체 알림 수
+                    cursor.execute(f"SELECT COUNT(*) FROM notification_history {where_clause}", params)
+                    total_notifications = cursor.fetchone()[0]
+                    
+                    # 읽지 않은 알림 수
+                    unread_conditions = where_conditions + ["read_at IS NULL"]
+                    unread_where = "WHERE " + " AND ".join(unread_conditions)
+                    cursor.execute(f"SELECT COUNT(*) FROM notification_history {unread_where}", params)
+                    unread_notifications = cursor.fetchone()[0]
+                    
+                    # 알림 타입별 통계
+                    cursor.execute(f"""
+                        SELECT notification_type, COUNT(*) 
+                        FROM notification_history {where_clause}
+                        GROUP BY notification_type
+                    """, params)
+                    
+                    type_stats = dict(cursor.fetchall())
+                    
+                    return {
+                        "total_notifications": total_notifications,
+                        "unread_notifications": unread_notifications,
+                        "read_notifications": total_notifications - unread_notifications,
+                        "type_breakdown": type_stats,
+                        "site_key": site_key,
+                        # 빈도 제한 허용/거부 수와 오늘 사용량
+                        "throttle": self.throttle.get_status(),
+                        # 이메일 본문 렌더링/문서 조회 횟수와 캐시 적중 수
+                        "email_render": dict(self.email_renderer.stats)
+                    }
+            
+            return await self._run_db(_db_work)
                 
         except Exception as e:
             self.logger.error(f"알림 통계 조회 실패: {e}")
@@ -0,0 +1,186 @@
+"""
+알림 빈도 제한
+사이트/알림 타입별, 수신자별 토큰 버킷과 일일 한도를 한 곳에서 관리
+(상태는 키별 한 행으로 SQLite에 저장되어 재시작 후에도 유지되고, DB를 공유하는 모든 프로세스가 같은 판단을 내림)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Tuple
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import NOTIFICATION_THROTTLE_CONFIG
+from src.config.logging_config import get_logger
+
+
+# (제한 키, 규칙) - 규칙: capacity/refill_seconds(토큰 버킷), daily_limit(일일 한도) 중 필요한 항목
+ThrottleScope = Tuple[str, Dict[str, Any]]
+
+
+class NotificationThrottle:
+    """
+    알림 빈도 제한 클래스
+
+    - 토큰 버킷: capacity개까지 연속 허용, refill_seconds마다 1개 충전 (capacity 1이면 최소 알림 간격)
+    - 일일 한도: 날짜가 바뀌면 초기화되는 키별 허용 수
+    - 판단은 키마다 기본 키 조회 1회와 UPSERT 1회 (알림 히스토리 COUNT 집계 없음)
+    - 여러 키를 함께 확인하면 모두 허용될 때만 함께 소비 (일부만 소비되지 않음)
+    - 거부된 키는 다시 허용될 시각까지 메모리에 기억하여 DB 조회 없이 거부
+      (다른 프로세스는 토큰을 소비만 하므로 메모리 판단이 DB보다 관대해지지 않음)
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**NOTIFICATION_THROTTLE_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.stats = {"allowed": 0, "denied": 0, "denied_from_memory": 0}
+        self._ensure_table()
+
+    def _ensure_table(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS notification_throttle (
+                        throttle_key TEXT PRIMARY KEY,
+                        tokens REAL,
+                        updated_at REAL NOT NULL,
+                        day TEXT,
+                        day_count INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+        except Exception as e:
+            self.logger.error(f"알림 빈도 제한 테이블 생성 실패: {e}")
+
+    def type_scopes(self, site_key: str, notification_type: str) -> List[ThrottleScope]:
+        """사이트/알림 타입 토큰 버킷 + 전체 일일 한도 (제외 타입이면 빈 목록)"""
+        if notification_type in self.config["exempt_types"]:
+            return []
+        scopes = [("daily:all", {"daily_limit": self.config["daily_limit"]})]
+        rule = self.config["type_limits"].get(notification_type)
+        if rule:
+            scopes.insert(0, (f"site:{site_key}:{notification_type}", rule))
+        return scopes
+
+    def recipient_scopes(self, setting_id: int) -> List[ThrottleScope]:
+        """수신자별 이메일 일일 한도"""
+        return [(f"recipient:{setting_id}", {"daily_limit": self.config["recipient_daily_limit"]})]
+
+    def acquire(self, scopes: List[ThrottleScope]) -> bool:
+        """모든 제한을 통과하면 소비하고 True (쓰기 잠금을 잡은 자체 트랜잭션에서 실행)"""
+        if not scopes:
+            return True
+        if self._denied_from_memory(scopes):
+            return False
+        try:
+            with sqlite3.connect(self.db_path, timeout=self.config["db_timeout_seconds"]) as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                return self.acquire_in(cursor, scopes)
+        except Exception as e:
+            # 제한 상태를 확인할 수 없으면 알림을 막지 않음
+            self.logger.error(f"알림 빈도 제한 확인 실패: {e}")
+            return True
+
+    def acquire_in(self, cursor: sqlite3.Cursor, scopes: List[ThrottleScope]) -> bool:
+        """
+        호출자의 트랜잭션에서 제한 확인 및 소비 (호출자는 BEGIN IMMEDIATE로 쓰기 잠금을 잡고 있어야 함)
+
+        호출자의 트랜잭션이 롤백되면 소비도 함께 취소됨
+        """
+        if not scopes:
+            return True
+        if self._denied_from_memory(scopes):
+            return False
+
+        now = time.time()
+        today = datetime.now().date().isoformat()
+        updates = []
+        for key, rule in scopes:
+            cursor.execute("SELECT tokens, updated_at, day, day_count FROM notification_throttle WHERE throttle_key = ?",
+                           (key,))
+            tokens, updated_at, day, day_count = cursor.fetchone() or (None, now, today, 0)
+            if day != today:
+                day_count = 0
+
+            if rule.get("capacity"):
+                capacity = rule["capacity"]
+                tokens = capacity if tokens is None else min(capacity, tokens + (now - updated_at) / rule["refill_seconds"])
+                if tokens < 1:
+                    self._deny(key, now + (1 - tokens) * rule["refill_seconds"])
+                    return False
+                tokens -= 1
+            if rule.get("daily_limit") is not None and day_count >= rule["daily_limit"]:
+                self._deny(key, self._next_midnight())
+                return False
+            updates.append((key, tokens, now, today, day_count + 1))
+
+        cursor.executemany("""
+            INSERT INTO notification_throttle (throttle_key, tokens, updated_at, day, day_count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(throttle_key) DO UPDATE SET
+                tokens = excluded.tokens,
+                updated_at = excluded.updated_at,
+                day = excluded.day,
+                day_count = excluded.day_count
+        """, updates)
+        self.stats["allowed"] += 1
+        return True
+
+    def _denied_from_memory(self, scopes: List[ThrottleScope]) -> bool:
+        now = time.time()
+        with self._lock:
+            for key, _ in scopes:
+                blocked_until = self._blocked_until.get(key)
+                if blocked_until is None:
+                    continue
+                if blocked_until > now:
+                    self.stats["denied"] += 1
+                    self.stats["denied_from_memory"] += 1
+                    return True
+                del self._blocked_until[key]
+        return False
+
+    def _deny(self, key: str, until: float):
+        with self._lock:
+            self._blocked_until[key] = until
+        self.stats["denied"] += 1
+
+    @staticmethod
+    def _next_midnight() -> float:
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+    def cleanup(self) -> int:
+        """보관 기간 동안 사용되지 않은 제한 상태 정리"""
+        cutoff = time.time() - self.config["retention_days"] * 86400
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("DELETE FROM notification_throttle WHERE updated_at < ?", (cutoff,))
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"알림 빈도 제한 정리 실패: {e}")
+            return 0
+
+    def get_status(self) -> Dict[str, Any]:
+        """허용/거부 통계와 오늘 사용량이 있는 제한 키"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute("""
+                    SELECT throttle_key, tokens, day_count, updated_at FROM notification_throttle
+                    WHERE day = ? ORDER BY throttle_key
+                """, (datetime.now().date().isoformat(),))
+                keys = [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"알림 빈도 제한 상태 조회 실패: {e}")
+            keys = []
+        return {**self.stats, "daily_limit": self.config["daily_limit"],
+                "recipient_daily_limit": self.config["recipient_daily_limit"], "keys": keys}
@@ -0,0 +1,283 @@
+"""
+프로세스 격리 크롤링 서비스
+크롤링(Selenium DOM, pandas 후처리)을 매번 새 자식 프로세스에서 실행하고 완료 후 종료하여
+장시간 실행되는 웹/워커 프로세스의 메모리가 크롤링마다 늘어나지 않도록 함
+"""
+
+import os
+import sys
+import json
+import signal
+import threading
+import multiprocessing
+from typing import Dict, Any, Callable, Optional
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+from src.config.settings import CRAWL_PROCESS_CONFIG
+from src.utils.crawl_context import (
+    PSUTIL_AVAILABLE, CrawlCancelledError, CrawlContext, CrawlProgress, CrawlStatus,
+    bind_crawl_context, get_crawl_context, report_status
+)
+
+if PSUTIL_AVAILABLE:
+    import psutil
+
+
+class CrawlResourceLimitError(Exception):
+    """자식 크롤링 프로세스가 메모리/CPU 제한을 초과한 경우"""
+    pass
+
+
+class CrawlProcessError(Exception):
+    """자식 크롤링 프로세스에서 처리되지 않은 예외가 발생하거나 결과 없이 종료된 경우"""
+
+    def __init__(self, message: str, error_type: str = None):
+        self.error_type = error_type
+        super().__init__(f"{error_type}: {message}" if error_type else message)
+
+
+class ProcessCrawlingService:
+    """
+    프로세스 격리 크롤링 서비스 클래스 (CrawlingService.execute_crawling과 같은 인터페이스)
+
+    - 호출마다 자식 프로세스를 시작하여 CrawlingService로 크롤링/저장을 수행하고 완료 후 종료 (프로세스 재사용 없음)
+    - 자식 프로세스는 단계/진행률/상태 메시지와 최종 결과(DataFrame 제외)를 파이프로 JSON 메시지로 전송
+    - 부모는 monitor_interval_seconds마다 자식 프로세스 트리(Chrome 포함) RSS를 확인하여 max_rss_mb 초과 시 강제 종료,
+      CPU 시간은 자식 프로세스의 RLIMIT_CPU로 제한
+    - 자식 프로세스 PID를 현재 크롤링 컨텍스트에 등록하므로 watchdog 타임아웃 시 프로세스 트리 전체가 정리됨
+    """
+
+    def __init__(self, repository, config: Dict[str, Any] = None):
+        self.db_path = repository.db_path
+        self.dsn = getattr(repository, "dsn", None)
+        self.config = {**CRAWL_PROCESS_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._mp_context = multiprocessing.get_context(self.config["start_method"])
+
+        if self.config.get("max_rss_mb") and not PSUTIL_AVAILABLE:
+            self.logger.warning("psutil 미설치 - 크롤링 프로세스 메모리 제한 비활성")
+
+    def execute_crawling(self, choice: str, progress: Optional[Callable], status_message: Optional[Callable],
+                         is_periodic: bool = False) -> Dict[str, Any]:
+        """자식 프로세스에서 크롤링 실행 후 결과 반환 (결과의 new_data 등 DataFrame은 제외됨)"""
+        receiver, sender = self._mp_context.Pipe(duplex=False)
+        limits = {key: self.config.get(key) for key in ("max_cpu_seconds", "max_address_space_mb")}
+        process = self._mp_context.Process(
+            target=_run_crawl_process,
+            args=(sender, choice, is_periodic, self.db_path, self.dsn, limits),
+            name=f"crawl-process-{choice}",
+            daemon=True
+        )
+        process.start()
+        sender.close()
+
+        context = get_crawl_context()
+        if context is not None:
+            # watchdog 타임아웃 시 자식 프로세스 트리 전체 종료
+            context.add_process(process.pid)
+
+        self.logger.info(f"크롤링 프로세스 시작: choice={choice} (PID: {process.pid})")
+        peak_rss_mb = 0.0
+        finished = False
+        try:
+            while True:
+                if context is not None and context.cancelled:
+                    raise CrawlCancelledError(f"취소된 크롤링 ({context.site_key}, 마지막 단계: {context.stage})")
+
+                rss_mb = _process_tree_rss_mb(process.pid)
+                peak_rss_mb = max(peak_rss_mb, rss_mb)
+                max_rss_mb = self.config.get("max_rss_mb")
+                if max_rss_mb and rss_mb > max_rss_mb:
+                    raise CrawlResourceLimitError(
+                        f"크롤링 프로세스 메모리 제한 초과: {int(rss_mb)}MB > {max_rss_mb}MB"
+                        + (f" (단계: {context.stage})" if context is not None else "")
+                    )
+
+                if not receiver.poll(self.config["monitor_interval_seconds"]):
+                    if not process.is_alive() and not receiver.poll():
+                        raise self._exit_error(process)
+                    continue
+
+                try:
+                    message = json.loads(receiver.recv_bytes().decode("utf-8"))
+                except EOFError:
+                    process.join(self.config["shutdown_grace_seconds"])
+                    raise self._exit_error(process)
+
+                message_type = message.get("type")
+                if message_type == "result":
+                    finished = True
+                    return message["result"]
+                if message_type == "error":
+                    raise CrawlProcessError(message.get("message"), message.get("error_type"))
+                if message_type == "stage" and context is not None:
+                    context.set_stage(message["stage"])
+                elif message_type == "progress":
+                    _forward_progress(progress, message["value"])
+                elif message_type == "status":
+                    _forward_status(status_message, message["text"], message.get("fields"))
+        finally:
+            receiver.close()
+            # 정상 완료 시에는 브라우저 정리를 기다리고, 제한 초과/취소/오류 시에는 즉시 종료
+            process.join(self.config["shutdown_grace_seconds"] if finished else 0)
+            if process.is_alive():
+                _kill_process(process.pid)
+                process.join(5)
+            self.logger.info(f"크롤링 프로세스 종료: choice={choice} (PID: {process.pid}, "
+                             f"종료 코드: {process.exitcode}, 최대 RSS: {int(peak_rss_mb)}MB)")
+
+    def _exit_error(self, process) -> Exception:
+        """결과 없이 종료된 자식 프로세스의 종료 코드를 예외로 변환"""
+        exitcode = process.exitcode
+        if exitcode is not None and exitcode < 0 and -exitcode in (signal.SIGXCPU, signal.SIGKILL):
+            return CrawlResourceLimitError(
+                f"크롤링 프로세스 CPU 시간 제한 초과 또는 강제 종료 (시그널: {signal.Signals(-exitcode).name})"
+            )
+        return CrawlProcessError(f"크롤링 프로세스가 결과 없이 종료됨 (종료 코드: {exitcode})")
+
+
+class _PipeCrawlContext(CrawlContext):
+    """단계 변경을 부모 프로세스로 전달하는 크롤링 컨텍스트 (자식 프로세스용)"""
+
+    def __init__(self, site_key: str, send: Callable[[Dict[str, Any]], None]):
+        super().__init__(site_key)
+        self._send = send
+
+    def set_stage(self, stage: str):
+        super().set_stage(stage)
+        self._send({"type": "stage", "stage": stage})
+
+
+def _run_crawl_process(conn, choice: str, is_periodic: bool, db_path: str, dsn: Optional[str],
+                       limits: Dict[str, Any]):
+    """자식 프로세스 진입점: 저장소/크롤러를 새로 구성하여 크롤링 실행 후 결과를 파이프로 전송"""
+    # 새 프로세스 그룹으로 분리 (psutil 없이도 Chrome까지 함께 종료할 수 있도록)
+    if hasattr(os, "setsid"):
+        os.setsid()
+    _apply_resource_limits(limits)
+    # 종료 요청 시 finally에서 브라우저를 정리하도록 SystemExit로 변환
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+
+    from src.config.logging_config import setup_logging
+    setup_logging(log_level="INFO", log_to_file=True)
+    logger = get_logger(__name__)
+
+    lock = threading.Lock()
+
+    def send(message: Dict[str, Any]):
+        payload = json.dumps(message, ensure_ascii=False, default=str).encode("utf-8")
+        with lock:
+            conn.send_bytes(payload)
+
+    from src.crawlers.registry import SITE_CHOICES, build_crawlers
+    site_key = next((key for key, value in SITE_CHOICES.items() if value == choice), "all")
+    context = _PipeCrawlContext(site_key, send)
+    bind_crawl_context(context)
+    try:
+        from src.services.crawler_service import CrawlingService
+        from src.services.crawl_job_queue import compact_crawl_result
+        if dsn:
+            from src.repositories.postgres_repository import PostgresRepository
+            repository = PostgresRepository(dsn, db_path=db_path)
+        else:
+            from src.repositories.sqlite_repository import SQLiteRepository
+            repository = SQLiteRepository(db_path)
+
+        crawling_service = CrawlingService(build_crawlers(), repository)
+        crawl_result = crawling_service.execute_crawling(
+            choice,
+            CrawlProgress(lambda value: send({"type": "progress", "value": value})),
+            CrawlStatus(lambda text, **fields: send({"type": "status", "text": text, "fields": fields})),
+            is_periodic=is_periodic
+        )
+        send({"type": "result", "result": compact_crawl_result(crawl_result)})
+    except Exception as e:
+        logger.error(f"크롤링 프로세스 오류 (choice={choice}): {e}")
+        try:
+            send({"type": "error", "error_type": type(e).__name__, "message": str(e)})
+        except OSError:
+            pass
+    finally:
+        context.kill_processes()
+        bind_crawl_context(None)
+        conn.close()
+
+
+def _apply_resource_limits(limits: Dict[str, Any]):
+    """자식 프로세스 CPU 시간/가상 메모리 제한 (resource 모듈이 없는 플랫폼에서는 생략)"""
+    if not RESOURCE_AVAILABLE:
+        return
+    cpu_seconds = limits.get("max_cpu_seconds")
+    if cpu_seconds:
+        # soft 제한 초과 시 SIGXCPU, 무시하면 hard 제한에서 SIGKILL
+        resource.setrlimit(resource.RLIMIT_CPU, (int(cpu_seconds), int(cpu_seconds) + 30))
+    address_space_mb = limits.get("max_address_space_mb")
+    if address_space_mb:
+        address_space = int(address_space_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (address_space, address_space))
+
+
+def _process_tree_rss_mb(pid: int) -> float:
+    """프로세스와 모든 하위 프로세스의 RSS 합계 (MB, psutil이 없으면 0)"""
+    if not PSUTIL_AVAILABLE:
+        return 0.0
+    try:
+        parent = psutil.Process(pid)
+        processes = [parent] + parent.children(recursive=True)
+    except psutil.Error:
+        return 0.0
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+
+def _kill_process(pid: int):
+    """자식 프로세스 트리 강제 종료 (psutil이 없으면 프로세스 그룹 단위로 종료)"""
+    if PSUTIL_AVAILABLE:
+        try:
+            parent = psutil.Process(pid)
+            targets = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return
+        for process in targets:
+            try:
+                process.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(targets, timeout=3)
+        return
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _forward_progress(progress, value):
+    """부모 프로세스의 진행률 콜백(함수 또는 tkinter 위젯 형태)에 전달"""
+    if progress is None:
+        return
+    if callable(progress):
+        progress(value, "")
+    elif hasattr(progress, "value"):
+        progress.value = value
+        if hasattr(progress, "update"):
+            progress.update()
+
+
+def _forward_status(status_message, text: str, fields: Dict[str, Any] = None):
+    """부모 프로세스의 상태 메시지 콜백(함수, tkinter 위젯, 구조화 필드를 받는 report() 객체)에 전달"""
+    report_status(status_message, text, **(fields or {}))
@@ -0,0 +1,198 @@
+"""
+최근 새로운 문서 프로젝션
+new_data_log를 이메일 본문, WebSocket 알림, /api/new-data가 바로 쓸 수 있는 형태로 유지하는 읽기 전용 테이블
+(링크/중요 여부를 기록 시점에 한 번만 추출하고, 사이트/세션별 커서 페이지네이션 인덱스 제공)
+"""
+
+import os
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import RECENT_DOCUMENTS_CONFIG
+from src.config.logging_config import get_logger
+
+
+DOCUMENT_COLUMNS = ("doc_id, log_id, site_key, session_id, data_id, data_title, data_summary, data_category, "
+                    "data_date, link, tags, is_important, notification_id, discovered_at")
+
+
+class RecentDocuments:
+    """
+    최근 새로운 문서 프로젝션 클래스
+
+    - refresh(): 새로운 데이터 로그 기록과 같은 트랜잭션에서 아직 반영되지 않은 로그를 추가 (log_id 기준 이어받기)
+    - mark_notified(): 알림 저장 트랜잭션에서 문서의 알림 ID 갱신
+    - list_documents(): doc_id 역순 커서 페이지네이션 (사이트/세션/기간 조건은 인덱스로 조회)
+    - 보관 기간(retention_days)이 지난 문서는 정리 작업에서 삭제 (원본 new_data_log는 별도 보관/아카이브)
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db", config: Dict[str, Any] = None):
+        self.db_path = db_path
+        self.config = {**RECENT_DOCUMENTS_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self.create_schema(conn)
+                self.refresh(conn, self.config["retention_days"])
+        except Exception as e:
+            self.logger.error(f"최근 문서 프로젝션 초기화 실패: {e}")
+
+    @staticmethod
+    def create_schema(conn: sqlite3.Connection):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS recent_documents (
+                doc_id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 페이지네이션 커서
+                log_id INTEGER NOT NULL UNIQUE,  -- new_data_log.log_id
+                site_key TEXT NOT NULL,
+                session_id TEXT,
+                data_id TEXT NOT NULL,
+                data_title TEXT,
+                data_summary TEXT,
+                data_category TEXT,
+                data_date TEXT,
+                link TEXT,
+                tags TEXT,  -- JSON 배열
+                is_important INTEGER NOT NULL DEFAULT 0,
+                notification_id INTEGER,
+                discovered_at TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recent_documents_site
+            ON recent_documents(site_key, doc_id DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recent_documents_session
+            ON recent_documents(session_id, site_key, doc_id DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_recent_documents_discovered
+            ON recent_documents(discovered_at)
+        """)
+
+    @staticmethod
+    def refresh(conn: sqlite3.Connection, retention_days: int = None) -> int:
+        """
+        아직 반영되지 않은 new_data_log 행을 프로젝션에 추가 (호출자의 트랜잭션에서 실행)
+
+        Returns:
+            추가한 문서 수
+        """
+        RecentDocuments.create_schema(conn)
+        retention_days = retention_days or RECENT_DOCUMENTS_CONFIG["retention_days"]
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        cursor = conn.execute("""
+            INSERT OR IGNORE INTO recent_documents
+            (log_id, site_key, session_id, data_id, data_title, data_summary, data_category, data_date,
+             link, tags, is_important, notification_id, discovered_at)
+            SELECT l.log_id, l.site_key, l.crawl_session_id, l.data_id, l.data_title, l.data_summary,
+                   NULLIF(NULLIF(l.data_category, 'nan'), ''), l.data_date,
+                   CASE WHEN json_valid(l.metadata)
+                        THEN NULLIF(json_extract(l.metadata, '$.original_data.링크'), '') END,
+                   CASE WHEN json_valid(l.tags) THEN l.tags ELSE '[]' END,
+                   COALESCE(l.is_important, 0)
+                       OR (json_valid(l.tags) AND EXISTS (SELECT 1 FROM json_each(l.tags) WHERE value = '중요')),
+                   l.notification_id, l.discovered_at
+            FROM new_data_log l
+            WHERE l.log_id > (SELECT COALESCE(MAX(log_id), 0) FROM recent_documents)
+              AND l.discovered_at >= ?
+            ORDER BY l.log_id
+        """, (cutoff,))
+        return cursor.rowcount
+
+    @staticmethod
+    def mark_notified(cursor: sqlite3.Cursor, notification_id: int, where_clause: str, params: list):
+        """new_data_log와 같은 조건의 문서에 알림 ID 기록 (호출자의 트랜잭션에서 실행)"""
+        cursor.execute(f"""
+            UPDATE recent_documents SET notification_id = ?
+            WHERE log_id IN (SELECT log_id FROM new_data_log WHERE {where_clause})
+        """, [notification_id, *params])
+
+    def list_documents(self, site_key: str = None, session_id: str = None, since: datetime = None,
+                       cursor: int = None, limit: int = None) -> Dict[str, Any]:
+        """
+        최근 문서 목록 (doc_id 역순)
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (이 doc_id보다 오래된 문서부터)
+
+        Returns:
+            {"documents": [...], "next_cursor": 다음 페이지 커서 또는 None}
+        """
+        limit = max(1, min(limit or self.config["default_page_size"], self.config["max_page_size"]))
+        where_conditions, params = self._filter(site_key, session_id, since)
+        if cursor is not None:
+            where_conditions.append("doc_id < ?")
+            params.append(cursor)
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(f"""
+                SELECT {DOCUMENT_COLUMNS} FROM recent_documents
+                {where_clause}
+                ORDER BY doc_id DESC
+                LIMIT ?
+            """, [*params, limit + 1]).fetchall()
+
+        # 다음 페이지가 있는지 한 행 더 조회하여 확인 (마지막 행에서 끝난 페이지는 커서 없음)
+        documents = [self._to_document(row) for row in rows[:limit]]
+        next_cursor = documents[-1]["doc_id"] if len(rows) > limit else None
+        return {"documents": documents, "next_cursor": next_cursor}
+
+    def count_documents(self, site_key: str = None, session_id: str = None, since: datetime = None) -> int:
+        where_conditions, params = self._filter(site_key, session_id, since)
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM recent_documents {where_clause}", params).fetchone()[0]
+
+    def get_documents(self, site_key: str, data_ids: List[str]) -> List[Dict[str, Any]]:
+        """사이트의 지정한 문서 목록 (구독 규칙에 일치한 문서 등)"""
+        if not data_ids:
+            return []
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(f"""
+                SELECT {DOCUMENT_COLUMNS} FROM recent_documents
+                WHERE site_key = ? AND data_id IN ({', '.join('?' for _ in data_ids)})
+                ORDER BY doc_id DESC
+            """, [site_key, *data_ids]).fetchall()
+        return [self._to_document(row) for row in rows]
+
+    @staticmethod
+    def _filter(site_key: str = None, session_id: str = None, since: datetime = None) -> tuple:
+        where_conditions, params = [], []
+        if session_id:
+            where_conditions.append("session_id = ?")
+            params.append(session_id)
+        if site_key:
+            where_conditions.append("site_key = ?")
+            params.append(site_key)
+        if since is not None:
+            where_conditions.append("discovered_at >= ?")
+            params.append(since.isoformat())
+        return where_conditions, params
+
+    @staticmethod
+    def _to_document(row: sqlite3.Row) -> Dict[str, Any]:
+        document = dict(row)
+        document["tags"] = json.loads(document["tags"]) if document["tags"] else []
+        document["is_important"] = bool(document["is_important"])
+        return document
+
+    def cleanup(self) -> int:
+        """보관 기간이 지난 문서 삭제"""
+        cutoff = (datetime.now() - timedelta(days=self.config["retention_days"])).isoformat()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("DELETE FROM recent_documents WHERE discovered_at < ?", (cutoff,))
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"최근 문서 정리 실패: {e}")
+            return 0
@@ -0,0 +1,152 @@
+"""
+스케줄 실행 시각 분산 계획
+같은 시각에 겹치는 cron/interval 작업을 찾아 작업별 고정 오프셋(결정적 지터)으로 시작 시각을 분산
+"""
+
+import os
+import zlib
+import bisect
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Tuple
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from apscheduler.triggers.base import BaseTrigger
+
+from src.config.settings import SCHEDULE_STAGGER_CONFIG
+
+
+class OffsetTrigger(BaseTrigger):
+    """기존 트리거의 모든 실행 시각을 고정 초 단위만큼 늦추는 트리거"""
+
+    def __init__(self, trigger: BaseTrigger, offset_seconds: int):
+        self.trigger = trigger
+        self.offset = timedelta(seconds=offset_seconds)
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        previous = previous_fire_time - self.offset if previous_fire_time else None
+        fire_time = self.trigger.get_next_fire_time(previous, now - self.offset)
+        return fire_time + self.offset if fire_time else None
+
+    def __str__(self):
+        return f"{self.trigger} +{int(self.offset.total_seconds())}s"
+
+    def __repr__(self):
+        return f"<OffsetTrigger ({self.trigger!r}, offset={int(self.offset.total_seconds())}s)>"
+
+
+def unwrap_trigger(trigger: BaseTrigger) -> BaseTrigger:
+    """OffsetTrigger로 감싼 경우 원래 트리거 반환"""
+    while isinstance(trigger, OffsetTrigger):
+        trigger = trigger.trigger
+    return trigger
+
+
+def stable_jitter(key: str, max_seconds: int) -> int:
+    """작업 ID 기반 결정적 지터 (재시작해도 같은 값)"""
+    if max_seconds <= 0:
+        return 0
+    return zlib.crc32(key.encode('utf-8')) % max_seconds
+
+
+def fire_times(trigger: BaseTrigger, start: datetime, end: datetime, limit: int = 5000) -> List[datetime]:
+    """start~end 사이 트리거 실행 시각 목록"""
+    times = []
+    previous = None
+    now = start
+    while len(times) < limit:
+        fire_time = trigger.get_next_fire_time(previous, now)
+        if fire_time is None or fire_time > end:
+            break
+        times.append(fire_time)
+        previous = fire_time
+        now = fire_time + timedelta(microseconds=1)
+    return times
+
+
+def find_overlaps(triggers: Dict[str, BaseTrigger], start: datetime, end: datetime,
+                  min_gap_seconds: int) -> Dict[Tuple[str, str], int]:
+    """
+    실행 시각이 min_gap_seconds 이내로 겹치는 작업 쌍과 겹친 횟수
+
+    Returns:
+        {(작업 ID, 작업 ID): 겹친 횟수}
+    """
+    events = sorted(
+        (fire_time, job_id)
+        for job_id, trigger in triggers.items()
+        for fire_time in fire_times(trigger, start, end)
+    )
+    gap = timedelta(seconds=min_gap_seconds)
+    overlaps: Dict[Tuple[str, str], int] = {}
+
+    for index, (fire_time, job_id) in enumerate(events):
+        for other_time, other_id in events[index + 1:]:
+            if other_time - fire_time >= gap:
+                break
+            if other_id != job_id:
+                pair = tuple(sorted((job_id, other_id)))
+                overlaps[pair] = overlaps.get(pair, 0) + 1
+    return overlaps
+
+
+def plan_offsets(triggers: Dict[str, BaseTrigger], order: List[str], now: datetime,
+                 config: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    겹치는 작업의 시작 시각 오프셋 계획
+
+    order 순서(중요한 작업 먼저)로 작업을 배치하면서, 이미 배치된 작업과 min_gap_seconds 이내로
+    겹치지 않는 가장 작은 슬롯을 선택. 슬롯 k의 오프셋 = k * min_gap_seconds + 작업 ID 기반 결정적 지터
+    (슬롯 0은 원래 시각 유지, 모든 슬롯이 겹치면 겹침이 가장 적은 슬롯 사용)
+
+    Returns:
+        offsets(작업별 오프셋 초), overlaps(분산 전 겹침), remaining_overlaps(분산 후 겹침)
+    """
+    config = {**SCHEDULE_STAGGER_CONFIG, **(config or {})}
+    min_gap = config["min_gap_seconds"]
+    end = now + timedelta(hours=config["horizon_hours"])
+    gap = timedelta(seconds=min_gap)
+
+    ordered = [job_id for job_id in order if job_id in triggers]
+    ordered += sorted(job_id for job_id in triggers if job_id not in ordered)
+    base_times = {job_id: fire_times(triggers[job_id], now, end) for job_id in ordered}
+
+    def count_conflicts(times: List[datetime], placed: List[datetime]) -> int:
+        conflicts = 0
+        for fire_time in times:
+            index = bisect.bisect_left(placed, fire_time - gap)
+            if index < len(placed) and placed[index] - fire_time < gap:
+                conflicts += 1
+        return conflicts
+
+    placed: List[datetime] = []
+    offsets: Dict[str, int] = {}
+    for job_id in ordered:
+        candidates = []
+        for slot in range(config["max_slots"] + 1):
+            offset = slot * min_gap + stable_jitter(job_id, config["jitter_seconds"]) if slot else 0
+            shifted = [fire_time + timedelta(seconds=offset) for fire_time in base_times[job_id]]
+            conflicts = count_conflicts(shifted, placed)
+            candidates.append((conflicts, slot, offset, shifted))
+            if conflicts == 0:
+                break
+
+        _, _, offset, shifted = min(candidates, key=lambda candidate: candidate[:2])
+        offsets[job_id] = offset
+        placed = sorted(placed + shifted)
+
+    staggered = {job_id: OffsetTrigger(trigger, offsets[job_id]) if offsets[job_id] else trigger
+                 for job_id, trigger in triggers.items()}
+
+    return {
+        "offsets": offsets,
+        "overlaps": _format_overlaps(find_overlaps(triggers, now, end, min_gap)),
+        "remaining_overlaps": _format_overlaps(find_overlaps(staggered, now, end, min_gap))
+    }
+
+
+def _format_overlaps(overlaps: Dict[Tuple[str, str], int]) -> List[Dict[str, Any]]:
+    return [{"jobs": list(pair), "count": count}
+            for pair, count in sorted(overlaps.items(), key=lambda item: -item[1])]
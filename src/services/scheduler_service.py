@@ -4,18 +4,21 @@ APScheduler를 사용한 주기적 크롤링 시스템
 """
 
 import os
-import sqlite3
+import time
 import asyncio
+import threading
+import sqlite3
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import sys
 
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
@@ -24,38 +27,140 @@ import pytz
 
 from src.config.logging_config import get_logger
 from src.services.crawler_service import CrawlingService
+from src.crawlers.registry import SITE_CHOICES
 from src.services.notification_service import NotificationService
+from src.services.change_feed_service import ChangeFeedService
+from src.services.archive_service import ArchiveService
+from src.services.job_dispatcher import CrawlJob, CrawlJobDispatcher
+from src.services.crawl_watchdog import CrawlWatchdog, CrawlTimeoutError
+from src.services.adaptive_schedule_service import AdaptiveScheduleService
+from src.services.health_service import SiteHealthService
+from src.services.schedule_planner import OffsetTrigger, unwrap_trigger, plan_offsets
+from src.services.leader_election import LeaderElection, REQUEST_CRAWL, REQUEST_RELOAD_SCHEDULES
+from src.services.crawl_job_queue import (
+    JOB_SUCCEEDED, JOB_TIMEOUT, FINISHED_STATUSES, create_crawl_job_queue, evaluate_site_result
+)
+from src.services.crawl_retry import classify_crawl_error, is_retryable, compute_backoff_delay
+from src.utils.crawl_context import get_crawl_context
+from src.utils.event_loop import set_main_loop, submit_coroutine
+from src.config.settings import (
+    ARCHIVE_CONFIG, CRAWL_RESOURCE_CONFIG, CRAWL_RETRY_CONFIG, CRAWL_WATCHDOG_CONFIG,
+    SCHEDULE_STAGGER_CONFIG, LEADER_ELECTION_CONFIG, CRAWL_QUEUE_CONFIG
+)
+
+
+# 수동 크롤링 요청에서 전체 사이트 크롤링을 나타내는 site_key
+ALL_SITES_KEY = "all"
+
+
+class QueuedJobFuture(Future):
+    """작업 큐에 등록한 크롤링의 결과 Future (결과 수집이 없어도 crawl_jobs 상태로 완료 확인)"""
+    
+    def __init__(self, job_id: int, deadline: float):
+        super().__init__()
+        self.job_id = job_id
+        self.deadline = deadline
 
 
 class SchedulerService:
     """스케줄링 서비스 클래스"""
     
-    def __init__(self, db_path: str = "data/tax_data.db", crawling_service=None):
+    # 시작 시각 분산에서 제외할 짧은 주기 작업
+    UNSTAGGERED_JOBS = {"leader_requests", "collect_queue_results"}
+    
+    def __init__(self, db_path: str = "data/tax_data.db", crawling_service=None,
+                 notification_service: NotificationService = None, lease_dsn: str = None):
         self.db_path = db_path
         self.logger = get_logger(__name__)
         self.timezone = pytz.timezone('Asia/Seoul')
         
-        # 스케줄러 초기화
-        self.scheduler = BackgroundScheduler(timezone=self.timezone)
-        self.scheduler.add_listener(self._job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+        # 스케줄러 초기화 (웹 서버에서는 attach_event_loop로 AsyncIOScheduler 전환)
+        self.loop = None
+        self.scheduler = self._create_scheduler()
         
         # 서비스 인스턴스 (전달받거나 나중에 설정)
+        # 웹 서버의 NotificationService(WebSocket 매니저 포함)를 공유해야 스케줄 크롤링 알림이 브라우저에 전달됨
         self.crawling_service = crawling_service
-        self.notification_service = NotificationService(db_path)
+        self.notification_service = notification_service or NotificationService(db_path)
+        self.change_feed = ChangeFeedService(db_path)
+        self.archive_service = ArchiveService(db_path)
+        self.adaptive_schedule = AdaptiveScheduleService(db_path, timezone=self.timezone)
+        self.health_service = SiteHealthService(db_path)
         
-        # 실행 중인 작업 추적
-        self.running_jobs = set()
+        # 크롤링 작업 디스패처 (자원 풀별 슬롯 제한 + 우선순위 큐 + 사이트별 배타 실행)
+        self.dispatcher = CrawlJobDispatcher()
+        self.watchdog = CrawlWatchdog(self.dispatcher, self._handle_crawl_timeout)
         self.job_results = {}
+        self.stagger_plan = {}
         
-        # ThreadPoolExecutor for async operations
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        # 리더 선출 (여러 웹 워커 중 리스를 보유한 프로세스만 예약 작업 실행, lease_dsn이 있으면 PostgreSQL 사용)
+        self.leader = LeaderElection(db_path, dsn=lease_dsn,
+                                     on_elected=self._on_leader_elected,
+                                     on_demoted=self._on_leader_demoted)
+        
+        # 작업 큐 모드: 크롤링을 별도 워커 프로세스(crawl_worker.py)에 맡기고 결과만 수집
+        self.job_queue = (create_crawl_job_queue(db_path, lease_dsn)
+                          if CRAWL_QUEUE_CONFIG.get("mode") == "queue" else None)
+        # 결과 수집(스케줄러 스레드), 결과 대기(크롤링 스레드), 리더 자격 상실(이벤트 루프)이 함께 접근
+        self._queue_futures: Dict[int, QueuedJobFuture] = {}
+        self._queue_futures_lock = threading.Lock()
         
         self.logger.info("스케줄러 서비스 초기화 완료")
     
+    def _create_scheduler(self, loop=None):
+        """이벤트 루프가 있으면 AsyncIOScheduler, 없으면(CLI 등) BackgroundScheduler 생성"""
+        if loop is not None:
+            scheduler = AsyncIOScheduler(event_loop=loop, timezone=self.timezone)
+        else:
+            scheduler = BackgroundScheduler(timezone=self.timezone)
+        scheduler.add_listener(self._job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+        return scheduler
+    
+    def attach_event_loop(self, loop):
+        """
+        웹 서버 이벤트 루프 연결
+        
+        스케줄러 트리거를 해당 루프에서 처리하고(AsyncIOScheduler, 동기 작업은 루프의 스레드 풀에서 실행),
+        작업 스레드의 알림/WebSocket 코루틴도 run_coroutine_threadsafe로 같은 루프에 전달함
+        """
+        set_main_loop(loop)
+        self.loop = loop
+        if not self.scheduler.running and not isinstance(self.scheduler, AsyncIOScheduler):
+            self.scheduler = self._create_scheduler(loop)
+            self.logger.info("AsyncIOScheduler로 전환 (웹 서버 이벤트 루프 공유)")
+    
     def start(self):
-        """스케줄러 시작"""
+        """
+        스케줄러 시작
+        
+        리더 선출을 사용하면 리스를 획득한 프로세스에서만 예약 작업을 시작하고,
+        나머지 프로세스는 heartbeat로 대기하다가 리더가 중단되면 인계받음
+        """
+        if not self.leader.enabled:
+            self._start_scheduling()
+            return
+        
+        self.leader.start()
+        if not self.leader.is_leader:
+            leader = self.leader.get_leader()
+            self.logger.info(f"스케줄러 대기 모드 (리더: {leader['holder_id'] if leader else '없음'})")
+    
+    def _start_scheduling(self):
+        """예약 작업 실행 시작 (리더 전용)"""
+        if self.leader.enabled and not self.leader.is_leader:
+            return
+        
         try:
             if not self.scheduler.running:
+                # stop() 이후 재시작 시 디스패처 재생성 (리더 자격 상실 후 남은 watchdog도 정리)
+                if self.dispatcher.is_shutdown:
+                    self.watchdog.stop()
+                    self.dispatcher = CrawlJobDispatcher()
+                    self.watchdog = CrawlWatchdog(self.dispatcher, self._handle_crawl_timeout)
+                
+                if CRAWL_WATCHDOG_CONFIG.get("enabled", True):
+                    self.watchdog.start()
+                
                 self.scheduler.start()
                 self.logger.info("스케줄러 시작됨")
                 
@@ -65,6 +170,9 @@ class SchedulerService:
                 # 시스템 상태 업데이트 작업 추가
                 self._add_system_maintenance_jobs()
                 
+                # 같은 시각에 겹치는 작업 시작 시각 분산
+                self._apply_schedule_stagger()
+                
             else:
                 self.logger.warning("스케줄러가 이미 실행 중입니다")
                 
@@ -73,21 +181,81 @@ class SchedulerService:
             raise
     
     def stop(self):
-        """스케줄러 중지"""
+        """스케줄러 중지 (리더였다면 리스를 반납하여 다른 워커가 바로 인계)"""
+        if self.leader.enabled:
+            self.leader.stop()
+        self._stop_scheduling()
+    
+    def _stop_scheduling(self, wait: bool = True):
+        """예약 작업 실행 중지"""
         try:
+            # 대기 중 크롤링 취소 및 실행 중 크롤링 완료 대기 (멈춘 크롤링은 watchdog이 정리)
+            # wait=False면 실행 중 크롤링은 백그라운드에서 마치도록 두고 watchdog도 계속 감시
+            self.dispatcher.shutdown(wait=wait)
+            # 큐 작업 결과는 더 이상 이 프로세스가 수집하지 않으므로 기다리던 전체 크롤링은 실패 처리
+            self._fail_queue_futures("스케줄러 중지 또는 리더 자격 상실")
+            if wait:
+                self.watchdog.stop()
+            
             if self.scheduler.running:
-                self.scheduler.shutdown(wait=True)
+                self.scheduler.shutdown(wait=wait)
                 self.logger.info("스케줄러 중지됨")
             
-            self.executor.shutdown(wait=True)
-            
         except Exception as e:
             self.logger.error(f"스케줄러 중지 실패: {e}")
     
+    def _on_leader_elected(self):
+        self._call_on_loop(self._start_scheduling)
+    
+    def _on_leader_demoted(self):
+        def demote():
+            if self.leader.is_leader:
+                return
+            # 실행 중 크롤링은 끝까지 진행하되 새 작업은 받지 않음, 예약 작업은 새 리더가 담당
+            self._stop_scheduling(wait=False)
+            self.scheduler = self._create_scheduler(self.loop)
+        self._call_on_loop(demote)
+    
+    def _call_on_loop(self, func: Callable[[], None]):
+        """AsyncIOScheduler 시작/중지는 이벤트 루프 스레드에서 실행 (heartbeat 스레드에서 호출 시 전달)"""
+        loop = self.loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            func()
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            func()
+        else:
+            loop.call_soon_threadsafe(func)
+    
+    def is_leader(self) -> bool:
+        """예약 작업을 실행하는 리더 프로세스인지 확인 (리더 선출 미사용 시 항상 True)"""
+        return not self.leader.enabled or self.leader.is_leader
+    
+    def get_leader_status(self) -> Dict[str, Any]:
+        """리더 선출 상태 조회"""
+        return self.leader.get_status()
+    
     def is_running(self) -> bool:
         """스케줄러 실행 상태 확인"""
         return self.scheduler.running
     
+    @property
+    def running_jobs(self) -> set:
+        """현재 크롤링 실행 중인 사이트 목록"""
+        if self.job_queue:
+            return {job["site_key"] for job in self.job_queue.get_status().get("running", [])}
+        return set(self.dispatcher.running_sites())
+    
+    def get_queue_status(self) -> Dict[str, Any]:
+        """크롤링 작업 대기열 및 자원 풀 상태 조회 (작업 큐 모드에서는 워커 상태 포함)"""
+        if self.job_queue:
+            return {"mode": "queue", **self.job_queue.get_status()}
+        return self.dispatcher.get_status()
+    
     def add_crawl_schedule(self, site_key: str, cron_expression: str, 
                           enabled: bool = True, priority: int = 0,
                           notification_threshold: int = 1) -> bool:
@@ -97,29 +265,14 @@ class SchedulerService:
             self._save_schedule_to_db(site_key, cron_expression, enabled, 
                                     priority, notification_threshold)
             
+            if not self.is_leader():
+                # 예약 작업은 리더가 실행하므로 변경 사항 반영 요청
+                return self.leader.submit_request(REQUEST_RELOAD_SCHEDULES, site_key)
+            
             if enabled:
-                # APScheduler에 작업 추가
-                job_id = f"crawl_{site_key}"
-                
-                # 기존 작업 제거
-                if self.scheduler.get_job(job_id):
-                    self.scheduler.remove_job(job_id)
-                
-                # 새 작업 추가
-                trigger = CronTrigger.from_crontab(cron_expression, timezone=self.timezone)
-                
-                self.scheduler.add_job(
-                    func=self._execute_crawl_job,
-                    trigger=trigger,
-                    id=job_id,
-                    args=[site_key],
-                    name=f"크롤링: {site_key}",
-                    replace_existing=True,
-                    max_instances=1,  # 동시 실행 방지
-                    misfire_grace_time=3600  # 1시간 지연 허용
-                )
-                
-                self.logger.info(f"크롤링 스케줄 추가: {site_key} ({cron_expression})")
+                # APScheduler에 작업 추가 (기존 작업은 replace_existing으로 교체)
+                self._add_site_crawl_job(site_key, cron_expression)
+                self._apply_schedule_stagger()
             
             return True
             
@@ -144,6 +297,9 @@ class SchedulerService:
                     WHERE site_key = ?
                 """, (site_key,))
             
+            if not self.is_leader():
+                self.leader.submit_request(REQUEST_RELOAD_SCHEDULES, site_key)
+            
             self.logger.info(f"크롤링 스케줄 제거: {site_key}")
             return True
             
@@ -173,7 +329,8 @@ class SchedulerService:
                         schedule_data['scheduler_status'] = {
                             'active': job is not None,
                             'next_run': job.next_run_time.isoformat() if job and job.next_run_time else None,
-                            'running': site_key in self.running_jobs
+                            'running': site_key in self.running_jobs,
+                            'retry_at': self._get_retry_time(site_key)
                         }
                         
                         return schedule_data
@@ -188,6 +345,7 @@ class SchedulerService:
                     columns = [desc[0] for desc in cursor.description]
                     
                     schedules = []
+                    running_sites = self.running_jobs
                     for row in rows:
                         schedule_data = dict(zip(columns, row))
                         
@@ -197,7 +355,8 @@ class SchedulerService:
                         schedule_data['scheduler_status'] = {
                             'active': job is not None,
                             'next_run': job.next_run_time.isoformat() if job and job.next_run_time else None,
-                            'running': schedule_data['site_key'] in self.running_jobs
+                            'running': schedule_data['site_key'] in running_sites,
+                            'retry_at': self._get_retry_time(schedule_data['site_key'])
                         }
                         
                         schedules.append(schedule_data)
@@ -213,62 +372,147 @@ class SchedulerService:
             return {"error": str(e)}
     
     def trigger_manual_crawl(self, site_key: str, delay_seconds: int = 0) -> bool:
-        """수동 크롤링 트리거"""
+        """
+        수동 크롤링 트리거 (site_key가 "all"이면 전체 사이트 크롤링)
+        
+        리더가 아닌 워커에서는 요청 테이블을 통해 리더에게 전달
+        """
+        if not self.is_leader():
+            return self.leader.submit_request(REQUEST_CRAWL, site_key, delay_seconds)
+        
         try:
             job_id = f"manual_{site_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
-            if delay_seconds > 0:
-                # 지연 실행
-                run_time = datetime.now(self.timezone) + timedelta(seconds=delay_seconds)
-                trigger = DateTrigger(run_date=run_time, timezone=self.timezone)
-            else:
-                # 즉시 실행
-                trigger = DateTrigger(run_date=datetime.now(self.timezone), timezone=self.timezone)
+            # delay_seconds가 있으면 지연 실행, 없으면 즉시 실행
+            run_time = datetime.now(self.timezone) + timedelta(seconds=max(delay_seconds, 0))
+            self._schedule_manual_crawl(site_key, run_time, job_id)
+            
+            self.logger.info(f"수동 크롤링 예약: {site_key} (지연: {delay_seconds}초)")
+            return True
             
+        except Exception as e:
+            self.logger.error(f"수동 크롤링 트리거 실패 ({site_key}): {e}")
+            return False
+    
+    def _schedule_manual_crawl(self, site_key: str, run_time: datetime, job_id: str):
+        trigger = DateTrigger(run_date=run_time, timezone=self.timezone)
+        if site_key == ALL_SITES_KEY:
             self.scheduler.add_job(
-                func=self._execute_crawl_job,
+                func=self._execute_all_sites_crawl,
+                trigger=trigger,
+                id=job_id,
+                name="수동 크롤링: 전체 사이트",
+                max_instances=1
+            )
+        else:
+            self.scheduler.add_job(
+                func=self._enqueue_crawl_job,
                 trigger=trigger,
                 id=job_id,
                 args=[site_key, True],  # is_manual=True
                 name=f"수동 크롤링: {site_key}",
                 max_instances=1
             )
-            
-            self.logger.info(f"수동 크롤링 예약: {site_key} (지연: {delay_seconds}초)")
-            return True
-            
+    
+    def _process_leader_requests(self):
+        """
+        다른 워커가 전달한 수동 크롤링/스케줄 변경 요청 처리 (리더 전용)
+        
+        실행 시각이 된 요청만 가져와 처리한 뒤 완료로 표시 (처리 전에 리더가 중단되면 새 리더가 다시 처리)
+        """
+        for request in self.leader.claim_requests():
+            try:
+                if request["action"] == REQUEST_RELOAD_SCHEDULES:
+                    self._reload_schedules()
+                elif request["action"] == REQUEST_CRAWL:
+                    # 실행 시각이 된 요청만 가져오므로 즉시 실행
+                    run_time = max(datetime.fromtimestamp(request["run_after"], self.timezone),
+                                   datetime.now(self.timezone))
+                    self._schedule_manual_crawl(request["site_key"], run_time,
+                                                f"manual_{request['site_key']}_req{request['id']}")
+                    self.logger.info(f"전달된 수동 크롤링 예약: {request['site_key']} "
+                                     f"({run_time.strftime('%H:%M:%S')})")
+                else:
+                    self.logger.warning(f"알 수 없는 리더 요청: {request['action']}")
+            except Exception as e:
+                self.logger.error(f"리더 요청 처리 실패 ({request}): {e}")
+            finally:
+                self.leader.complete_request(request["id"])
+    
+    def _reload_schedules(self):
+        """crawl_schedules 테이블 기준으로 사이트 크롤링 작업 재구성"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT site_key FROM crawl_schedules WHERE enabled = 1")
+            enabled_jobs = {f"crawl_{row[0]}" for row in cursor.fetchall()}
+        
+        for job in self.scheduler.get_jobs():
+            if job.id.startswith("crawl_") and job.id != "crawl_all_sites" and job.id not in enabled_jobs:
+                self.scheduler.remove_job(job.id)
+                self.logger.info(f"크롤링 스케줄 제거: {job.id[len('crawl_'):]}")
+        
+        self._load_schedules_from_db()
+        self._apply_schedule_stagger()
+    
+    def _enqueue_crawl_job(self, site_key: str, is_manual: bool = False, attempt: int = 1):
+        """
+        크롤링 작업을 디스패처 대기열에 등록
+        
+        crawl_schedules.priority 순으로 실행되며, 수동 실행은 우선순위 가산점을 받음
+        attempt는 재시도 회차 (1 = 최초 실행)
+        작업 큐 모드에서는 공유 큐에 등록하고, 워커가 완료한 결과는 _collect_queue_results가 처리
+        
+        Returns:
+            작업 결과 Future (이미 실행 중이면 None, 결과는 _wait_for_crawl_result로 대기)
+        """
+        priority, timeout = self._get_site_job_settings(site_key)
+        if is_manual:
+            priority += CRAWL_RESOURCE_CONFIG.get("manual_priority_boost", 10)
+        
+        if self.job_queue:
+            job_id = self.job_queue.enqueue(site_key, is_manual, attempt, priority, timeout)
+            if job_id is None:
+                return None
+            # 워커 대기 시간과 리스 만료 재할당까지 고려한 결과 대기 기한
+            wait_seconds = max(CRAWL_QUEUE_CONFIG.get("result_wait_seconds", 7200),
+                               timeout + CRAWL_QUEUE_CONFIG["lease_seconds"] * CRAWL_QUEUE_CONFIG["max_claims"])
+            future = QueuedJobFuture(job_id, time.time() + wait_seconds)
+            with self._queue_futures_lock:
+                self._queue_futures[job_id] = future
+            return future
+        
+        return self.dispatcher.submit(site_key, self._execute_crawl_job, site_key, is_manual, attempt,
+                                      priority=priority, timeout=timeout)
+    
+    def _get_site_job_settings(self, site_key: str) -> tuple:
+        """crawl_schedules의 사이트 우선순위와 실행 제한 시간 조회 (없으면 기본값)"""
+        default_timeout = CRAWL_WATCHDOG_CONFIG.get("default_timeout_seconds", 3600)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT priority, timeout_seconds FROM crawl_schedules WHERE site_key = ?",
+                               (site_key,))
+                row = cursor.fetchone()
+                if not row:
+                    return 0, default_timeout
+                return row[0] or 0, row[1] or default_timeout
         except Exception as e:
-            self.logger.error(f"수동 크롤링 트리거 실패 ({site_key}): {e}")
-            return False
+            self.logger.warning(f"사이트 작업 설정 조회 실패 ({site_key}): {e}")
+            return 0, default_timeout
     
-    def _execute_crawl_job(self, site_key: str, is_manual: bool = False):
-        """크롤링 작업 실행"""
+    def _execute_crawl_job(self, site_key: str, is_manual: bool = False, attempt: int = 1):
+        """크롤링 작업 실행 (디스패처 작업 스레드에서 호출되며, 사이트별 배타 실행은 디스패처가 보장)"""
         start_time = datetime.now()
         session_id = f"{site_key}_{start_time.strftime('%Y%m%d_%H%M%S')}"
         
         try:
-            # 중복 실행 방지
-            if site_key in self.running_jobs:
-                self.logger.warning(f"크롤링 이미 실행 중: {site_key}")
-                return
-            
-            self.running_jobs.add(site_key)
-            self.logger.info(f"크롤링 작업 시작: {site_key} (세션: {session_id})")
+            self.logger.info(f"크롤링 작업 시작: {site_key} (세션: {session_id}, 시도: {attempt})")
             
             # 시스템 상태 업데이트
             self._update_system_status(site_key, 'running')
             
             # 크롤링 실행
-            site_to_choice = {
-                "tax_tribunal": "1",
-                "nts_authority": "2", 
-                "moef": "3",
-                "nts_precedent": "4",
-                "mois": "5",
-                "bai": "6"
-            }
-            
-            choice = site_to_choice.get(site_key)
+            choice = SITE_CHOICES.get(site_key)
             if not choice:
                 raise ValueError(f"알 수 없는 사이트: {site_key}")
             
@@ -278,18 +522,25 @@ class SchedulerService:
                 crawl_result = self.crawling_service.execute_crawling(
                     choice, None, None, is_periodic=True
                 )
-                success = crawl_result.get('status') == 'success'
+                if self._is_abandoned():
+                    # watchdog이 이미 타임아웃으로 기록한 작업
+                    self.logger.warning(f"타임아웃 처리된 크롤링이 뒤늦게 종료됨: {site_key}")
+                    return crawl_result
+                
+                # 전체 상태뿐 아니라 사이트별 결과까지 확인 (사이트 실패도 전체 상태는 success로 반환됨)
+                success, error_msg, error_type = evaluate_site_result(crawl_result, site_key)
                 
                 end_time = datetime.now()
                 duration = int((end_time - start_time).total_seconds())
                 
                 if success:
                     # 성공 처리
-                    self._handle_crawl_success(site_key, session_id, duration, is_manual, crawl_result)
+                    self._handle_crawl_success(site_key, session_id, duration, is_manual,
+                                               crawl_result, attempt)
                 else:
                     # 실패 처리
-                    error_msg = crawl_result.get('error', '알 수 없는 오류')
-                    self._handle_crawl_failure(site_key, session_id, duration, error_msg)
+                    self._handle_crawl_failure(site_key, session_id, duration, error_msg,
+                                               error_type, attempt, is_manual)
                 
                 return crawl_result
             else:
@@ -297,15 +548,106 @@ class SchedulerService:
                 raise ValueError("크롤링 서비스가 설정되지 않음")
             
         except Exception as e:
+            if self._is_abandoned():
+                self.logger.warning(f"타임아웃 처리된 크롤링 종료: {site_key} ({e})")
+                return None
+            
             # 예외 처리
             end_time = datetime.now()
             duration = int((end_time - start_time).total_seconds())
-            self._handle_crawl_failure(site_key, session_id, duration, str(e))
+            self._handle_crawl_failure(site_key, session_id, duration, str(e),
+                                       type(e).__name__, attempt, is_manual)
             
         finally:
-            # 실행 중 상태 제거
-            self.running_jobs.discard(site_key)
-            self._update_system_status(site_key, 'healthy')
+            if not self._is_abandoned():
+                self._update_system_status(site_key, 'healthy')
+    
+    def _is_abandoned(self) -> bool:
+        """현재 작업 스레드의 크롤링이 watchdog에 의해 포기 처리되었는지 여부"""
+        context = get_crawl_context()
+        return context is not None and context.cancelled
+    
+    def _handle_crawl_timeout(self, job: CrawlJob, error: CrawlTimeoutError):
+        """watchdog 타임아웃 처리 (멈춘 단계와 함께 'timeout' 상태로 기록 후 재시도 예약)"""
+        site_key, is_manual, attempt = job.args
+        duration = int((datetime.now() - job.started_at).total_seconds())
+        session_id = f"{site_key}_{job.started_at.strftime('%Y%m%d_%H%M%S')}"
+        
+        self._handle_crawl_failure(site_key, session_id, duration, str(error), type(error).__name__,
+                                   attempt, is_manual, status='timeout', stage=error.stage)
+    
+    def _collect_queue_results(self):
+        """워커가 완료한 큐 작업 결과를 로컬 실행과 같은 방식으로 처리 (리더 전용)"""
+        self.job_queue.requeue_expired()
+        for job in self.job_queue.collect_finished():
+            site_key = job["site_key"]
+            try:
+                started_at = datetime.fromtimestamp(job["started_at"]) if job.get("started_at") else datetime.now()
+                session_id = f"{site_key}_{started_at.strftime('%Y%m%d_%H%M%S')}"
+                if job["status"] == JOB_SUCCEEDED:
+                    self._handle_crawl_success(site_key, session_id, job["duration"], job["is_manual"],
+                                               job["result"], job["attempt"])
+                else:
+                    self._handle_crawl_failure(site_key, session_id, job["duration"],
+                                               job["error_message"] or '알 수 없는 오류', job["error_type"],
+                                               job["attempt"], job["is_manual"],
+                                               status='timeout' if job["status"] == JOB_TIMEOUT else 'failed',
+                                               stage=job["stage"])
+                
+                # 전체 크롤링 등에서 결과를 기다리는 Future 완료
+                future = self._take_queue_future(job["id"])
+                if future is not None and not future.done():
+                    if job["result"] is not None:
+                        future.set_result(job["result"])
+                    else:
+                        future.set_exception(RuntimeError(job["error_message"] or job["status"]))
+            except Exception as e:
+                self.logger.error(f"큐 작업 결과 처리 실패 ({site_key}, 작업 ID: {job['id']}): {e}")
+            finally:
+                self.job_queue.mark_reported(job["id"])
+    
+    def _wait_for_crawl_result(self, future: Future) -> Dict[str, Any]:
+        """
+        크롤링 작업 결과 대기
+        
+        큐 작업은 결과 수집(리더 전용)이 Future를 완료하지 않아도 crawl_jobs 상태를 주기적으로 확인하고,
+        대기 기한이 지나면 TimeoutError 발생 (리더 교체/재시작 후에도 무한 대기하지 않음)
+        """
+        if not isinstance(future, QueuedJobFuture):
+            return future.result()
+        
+        poll_seconds = CRAWL_QUEUE_CONFIG.get("result_poll_seconds", 5)
+        while True:
+            try:
+                return future.result(timeout=poll_seconds)
+            except FutureTimeoutError:
+                pass
+            
+            job = self.job_queue.get_job(future.job_id)
+            if job and job["status"] in FINISHED_STATUSES:
+                self._take_queue_future(future.job_id)
+                if job["result"] is not None:
+                    return job["result"]
+                raise RuntimeError(job["error_message"] or job["status"])
+            if time.time() >= future.deadline:
+                self._take_queue_future(future.job_id)
+                raise TimeoutError(f"크롤링 작업 결과 대기 시간 초과 (작업 ID: {future.job_id})")
+    
+    def _take_queue_future(self, job_id: int) -> Optional[QueuedJobFuture]:
+        """결과를 기다리는 Future를 목록에서 꺼냄 (꺼낸 쪽만 Future를 완료)"""
+        with self._queue_futures_lock:
+            return self._queue_futures.pop(job_id, None)
+    
+    def _fail_queue_futures(self, reason: str):
+        """결과를 기다리는 큐 작업 Future를 모두 실패 처리 (작업 자체는 워커가 계속 실행)"""
+        with self._queue_futures_lock:
+            futures = dict(self._queue_futures)
+            self._queue_futures.clear()
+        for job_id, future in futures.items():
+            if not future.done():
+                future.set_exception(RuntimeError(f"{reason} (작업 ID: {job_id})"))
+        if futures:
+            self.logger.warning(f"큐 작업 결과 대기 {len(futures)}건 중단: {reason}")
     
     def _execute_all_sites_crawl(self):
         """전체 사이트 크롤링 실행 및 로그 기록"""
@@ -343,13 +685,34 @@ class SchedulerService:
             success_count = 0
             failed_count = 0
             
+            # 개별 스케줄로 최근에 이미 성공한 사이트는 건너뜀
+            recent_sites = self._get_recently_succeeded_sites(
+                SCHEDULE_STAGGER_CONFIG.get("all_sites_dedupe_minutes", 0)
+            )
+            for site_key, site_name in sites:
+                if site_key in recent_sites:
+                    site_results[site_key] = {
+                        "status": "skipped",
+                        "reason": f"최근 성공 ({recent_sites[site_key]})",
+                        "site_name": site_name
+                    }
+            if recent_sites:
+                self.logger.info(f"최근 크롤링된 사이트 건너뜀: {', '.join(recent_sites)}")
+            sites = [(site_key, site_name) for site_key, site_name in sites if site_key not in recent_sites]
+            
+            # 나머지 사이트를 대기열에 등록 (자원 풀 슬롯 범위 내에서 병렬 실행)
+            futures = {site_key: self._enqueue_crawl_job(site_key) for site_key, _ in sites}
+            
             for site_key, site_name in sites:
                 try:
-                    # 개별 사이트 크롤링 실행
-                    self.logger.info(f"크롤링 중: {site_name} ({site_key})")
+                    self.logger.info(f"크롤링 결과 대기: {site_name} ({site_key})")
+                    
+                    future = futures[site_key]
+                    if future is None:
+                        raise RuntimeError("이미 실행 중인 크롤링")
                     
                     # 크롤링 실행하고 상세 결과 받기
-                    crawl_result = self._execute_crawl_job(site_key, is_manual=False)
+                    crawl_result = self._wait_for_crawl_result(future)
                     
                     if crawl_result and crawl_result.get('results'):
                         # 개별 사이트 결과에서 해당 사이트 정보 추출
@@ -429,9 +792,9 @@ class SchedulerService:
             if total_new_count > 0:
                 try:
                     summary = self._create_crawl_summary(site_results)
-                    asyncio.run(self.notification_service.send_all_sites_notification(
+                    submit_coroutine(self.notification_service.send_all_sites_notification(
                         total_new_count, summary, f"crawl_log_{log_id}"
-                    ))
+                    ), "전체 크롤링 알림 발송")
                 except Exception as e:
                     self.logger.warning(f"전체 크롤링 알림 발송 실패: {e}")
                     
@@ -453,57 +816,33 @@ class SchedulerService:
                     """, (end_time.isoformat(), str(e), duration, log_id))
                     conn.commit()
     
-    def _get_site_data_count(self, site_key: str) -> int:
-        """사이트의 현재 데이터 개수 조회"""
+    def _get_recently_succeeded_sites(self, window_minutes: int) -> Dict[str, str]:
+        """window_minutes 이내에 크롤링이 성공한 사이트와 마지막 성공 시각"""
+        if not window_minutes:
+            return {}
         try:
-            table_name = self._get_table_name(site_key)
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-                return cursor.fetchone()[0]
+                # last_success는 CURRENT_TIMESTAMP(UTC)로 기록되므로 SQLite 시각 함수로 비교
+                cursor.execute("""
+                    SELECT site_key, last_success FROM crawl_schedules
+                    WHERE enabled = 1 AND last_success >= datetime('now', ?)
+                """, (f"-{int(window_minutes)} minutes",))
+                return {site_key: last_success for site_key, last_success in cursor.fetchall()}
         except Exception as e:
-            self.logger.error(f"데이터 개수 조회 실패 ({site_key}): {e}")
-            return 0
+            self.logger.warning(f"최근 성공 사이트 조회 실패: {e}")
+            return {}
     
-    def _get_recent_site_data_count(self, site_key: str, minutes: int = 10) -> int:
-        """사이트의 최근 생성된 데이터 개수 조회 (크롤링 시간 기준)"""
+    def _get_site_data_count(self, site_key: str) -> int:
+        """사이트의 현재 데이터 개수 조회"""
         try:
             table_name = self._get_table_name(site_key)
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                
-                # 테이블 존재 확인
-                cursor.execute(f"""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name='{table_name}'
-                """)
-                
-                if not cursor.fetchone():
-                    return 0
-                
-                # 컬럼 존재 확인
-                cursor.execute(f"PRAGMA table_info([{table_name}])")
-                existing_columns = {row[1] for row in cursor.fetchall()}
-                
-                # 시간 컬럼이 있는 경우만 최근 데이터 조회
-                if 'created_at' in existing_columns or 'updated_at' in existing_columns:
-                    time_column = 'created_at' if 'created_at' in existing_columns else 'updated_at'
-                    
-                    # 최근 N분 내 데이터 개수 조회 (로컬 시간 기준)
-                    query = f"""
-                        SELECT COUNT(*) FROM [{table_name}]
-                        WHERE {time_column} >= datetime('now', 'localtime', '-{minutes} minutes')
-                    """
-                    
-                    cursor.execute(query)
-                    count = cursor.fetchone()[0]
-                    return count
-                else:
-                    # 시간 컬럼이 없으면 0 반환 (신규 데이터 없음으로 간주)
-                    return 0
-                    
+                cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+                return cursor.fetchone()[0]
         except Exception as e:
-            self.logger.error(f"최근 데이터 개수 조회 실패 ({site_key}): {e}")
+            self.logger.error(f"데이터 개수 조회 실패 ({site_key}): {e}")
             return 0
     
     def _get_table_name(self, site_key: str) -> str:
@@ -523,15 +862,17 @@ class SchedulerService:
             return "신규 데이터 없음"
     
     def _handle_crawl_success(self, site_key: str, session_id: str, 
-                             duration: int, is_manual: bool, crawl_result: dict = None):
+                             duration: int, is_manual: bool, crawl_result: dict = None,
+                             attempt: int = 1):
         """크롤링 성공 처리"""
         try:
             # 새로운 데이터 확인
-            new_data_count = self._check_new_data_count(site_key, session_id)
+            new_data_count = self._check_new_data_count(site_key, session_id, crawl_result)
             
             # 크롤링 실행 로그 저장
             self._save_crawl_execution_log(site_key, session_id, duration, 'success', 
-                                         is_manual, crawl_result, new_data_count)
+                                         is_manual, crawl_result, new_data_count,
+                                         attempt=attempt)
             
             # 스케줄 정보 업데이트
             with sqlite3.connect(self.db_path) as conn:
@@ -540,10 +881,15 @@ class SchedulerService:
                     SET last_run = CURRENT_TIMESTAMP,
                         last_success = CURRENT_TIMESTAMP,
                         success_count = success_count + 1,
-                        avg_crawl_time = (avg_crawl_time + ?) / 2,
+                        consecutive_errors = 0,
+                        avg_crawl_time = CASE WHEN COALESCE(avg_crawl_time, 0) = 0 THEN ?
+                                              ELSE (avg_crawl_time + ?) / 2 END,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE site_key = ?
-                """, (duration, site_key))
+                """, (duration, duration, site_key))
+            
+            # 대기 중인 재시도 취소 (수동 실행 등으로 먼저 성공한 경우)
+            self._cancel_retry(site_key)
             
             # 메타데이터 업데이트
             self._update_crawl_metadata(site_key, duration, success=True)
@@ -551,25 +897,32 @@ class SchedulerService:
             # 알림 발송 (새로운 데이터가 있을 경우)
             if new_data_count > 0:
                 try:
-                    # ThreadPoolExecutor에서는 새 이벤트 루프 필요
-                    asyncio.run(self.notification_service.send_new_data_notification(
-                        site_key, new_data_count, session_id
-                    ))
+                    # 작업 스레드에서 메인 이벤트 루프로 전달
+                    submit_coroutine(self.notification_service.send_new_data_notification(
+                        site_key, new_data_count, session_id,
+                        self._get_change_seq_range(site_key, crawl_result)
+                    ), "새로운 데이터 알림 발송")
                 except Exception as async_error:
                     self.logger.warning(f"새로운 데이터 알림 발송 실패: {async_error}")
             
-            self.logger.info(f"크롤링 성공: {site_key} (소요시간: {duration}초, 신규: {new_data_count}개)")
+            self.logger.info(f"크롤링 성공: {site_key} (소요시간: {duration}초, 신규: {new_data_count}개, "
+                             f"시도: {attempt})")
             
         except Exception as e:
             self.logger.error(f"크롤링 성공 처리 실패: {e}")
     
     def _handle_crawl_failure(self, site_key: str, session_id: str, 
-                            duration: int, error_message: str):
-        """크롤링 실패 처리"""
+                            duration: int, error_message: str, error_type: str = None,
+                            attempt: int = 1, is_manual: bool = False,
+                            status: str = 'failed', stage: str = None):
+        """크롤링 실패 처리 (일시적 오류는 지수 백오프로 재시도 예약)"""
         try:
-            # 크롤링 실행 로그 저장
-            self._save_crawl_execution_log(site_key, session_id, duration, 'failed', 
-                                         False, None, 0, error_message)
+            error_class = classify_crawl_error(error_type, error_message)
+            
+            # 크롤링 실행 로그 저장 (시도 회차별 1건)
+            self._save_crawl_execution_log(site_key, session_id, duration, status, 
+                                         is_manual, None, 0, error_message,
+                                         attempt=attempt, error_type=error_class, stage=stage)
             # 스케줄 정보 업데이트
             with sqlite3.connect(self.db_path) as conn:
                 conn.execute("""
@@ -577,6 +930,7 @@ class SchedulerService:
                     SET last_run = CURRENT_TIMESTAMP,
                         last_failure = CURRENT_TIMESTAMP,
                         failure_count = failure_count + 1,
+                        consecutive_errors = COALESCE(consecutive_errors, 0) + 1,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE site_key = ?
                 """, (site_key,))
@@ -587,29 +941,117 @@ class SchedulerService:
             # 시스템 상태 업데이트
             self._update_system_status(site_key, 'error', error_message)
             
-            # 에러 알림 발송 (ThreadPoolExecutor에서 새 이벤트 루프 사용)
-            try:
-                asyncio.run(self.notification_service.send_error_notification(
-                    site_key, error_message, session_id
-                ))
-            except Exception as async_error:
-                self.logger.warning(f"에러 알림 발송 실패: {async_error}")
+            # 재시도 예약 (재시도 대상이 아니거나 횟수를 모두 사용한 경우에만 에러 알림)
+            retry_scheduled = self._schedule_retry(site_key, error_class, attempt, is_manual)
+            
+            if not retry_scheduled:
+                # 에러 알림 발송 (메인 이벤트 루프로 전달)
+                try:
+                    submit_coroutine(self.notification_service.send_error_notification(
+                        site_key, error_message, session_id
+                    ), "에러 알림 발송")
+                except Exception as async_error:
+                    self.logger.warning(f"에러 알림 발송 실패: {async_error}")
             
-            self.logger.error(f"크롤링 실패: {site_key} (에러: {error_message})")
+            self.logger.error(f"크롤링 실패: {site_key} (에러: {error_message}, 분류: {error_class}, "
+                              f"시도: {attempt})")
             
         except Exception as e:
             self.logger.error(f"크롤링 실패 처리 실패: {e}")
     
-    def _check_new_data_count(self, site_key: str, session_id: str) -> int:
-        """새로운 데이터 개수 확인 (실제 생성된 데이터 기준)"""
+    def _schedule_retry(self, site_key: str, error_class: str, attempt: int,
+                        is_manual: bool = False) -> bool:
+        """
+        실패한 크롤링의 재시도 예약
+        
+        crawl_schedules.max_retries/retry_delay를 사용하며,
+        attempt번째 실패 후 retry_delay * 2^(attempt-1)초(지터 포함) 뒤에 다시 대기열에 등록
+        
+        Returns:
+            재시도 예약 여부
+        """
+        if not CRAWL_RETRY_CONFIG.get("enabled", True) or not is_retryable(error_class):
+            return False
+        
+        if self.dispatcher.is_shutdown or not self.scheduler.running:
+            return False
+        
         try:
-            # 최근 5분 내에 실제로 생성된 데이터 개수 확인
-            return self._get_recent_site_data_count(site_key, minutes=5)
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT max_retries, retry_delay FROM crawl_schedules WHERE site_key = ?",
+                               (site_key,))
+                row = cursor.fetchone()
+            
+            max_retries = (row[0] or 0) if row else 0
+            retry_delay = (row[1] or 300) if row else 300
+            if attempt > max_retries:
+                self.logger.warning(f"재시도 횟수 초과: {site_key} ({attempt - 1}/{max_retries})")
+                return False
+            
+            delay = compute_backoff_delay(attempt, retry_delay)
+            run_date = datetime.now(self.timezone) + timedelta(seconds=delay)
+            self.scheduler.add_job(
+                func=self._enqueue_crawl_job,
+                trigger=DateTrigger(run_date=run_date, timezone=self.timezone),
+                id=f"retry_{site_key}",
+                args=[site_key, is_manual, attempt + 1],
+                name=f"크롤링 재시도: {site_key} ({attempt + 1}회차)",
+                replace_existing=True
+            )
+            
+            self.logger.info(f"크롤링 재시도 예약: {site_key} ({delay}초 후, {attempt + 1}/{max_retries + 1}회차)")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"크롤링 재시도 예약 실패 ({site_key}): {e}")
+            return False
+    
+    def _get_retry_time(self, site_key: str) -> Optional[str]:
+        """예약된 재시도 실행 시각 (없으면 None)"""
+        job = self.scheduler.get_job(f"retry_{site_key}")
+        return job.next_run_time.isoformat() if job and job.next_run_time else None
+    
+    def _cancel_retry(self, site_key: str):
+        """예약된 재시도 작업 취소"""
+        if self.scheduler.get_job(f"retry_{site_key}"):
+            self.scheduler.remove_job(f"retry_{site_key}")
+            self.logger.info(f"예약된 재시도 취소: {site_key}")
+    
+    def _check_new_data_count(self, site_key: str, session_id: str, crawl_result: dict = None) -> int:
+        """새로운 데이터 개수 확인 (이번 실행의 CDC 시퀀스 구간 기준)"""
+        try:
+            seq_range = self._get_change_seq_range(site_key, crawl_result)
+            if not seq_range:
+                # CDC를 지원하지 않는 저장소(PostgreSQL 등)는 크롤링 결과의 신규 개수 사용
+                return self._get_result_new_count(site_key, crawl_result)
+            
+            return self.change_feed.count_changes(site_key, seq_range[0], seq_range[1])
                 
         except Exception as e:
             self.logger.error(f"새로운 데이터 개수 확인 실패: {e}")
             return 0
     
+    def _get_change_seq_range(self, site_key: str, crawl_result: dict = None) -> Optional[tuple]:
+        """크롤링 결과에서 사이트의 CDC 시퀀스 구간 추출"""
+        if not crawl_result:
+            return None
+        
+        for result in crawl_result.get('results', []):
+            if result.get('site_key') == site_key and result.get('change_seq_range'):
+                return tuple(result['change_seq_range'])
+        return None
+    
+    def _get_result_new_count(self, site_key: str, crawl_result: dict = None) -> int:
+        """크롤링 결과에서 사이트의 신규 데이터 개수 추출"""
+        if not crawl_result:
+            return 0
+        
+        for result in crawl_result.get('results', []):
+            if result.get('site_key') == site_key and result.get('status') == 'success':
+                return result.get('new_count', 0)
+        return 0
+    
     def _update_system_status(self, site_key: str, status: str, error_message: str = None):
         """시스템 상태 업데이트"""
         try:
@@ -685,35 +1127,150 @@ class SchedulerService:
                     site_key, cron_expr, enabled, priority, threshold = row
                     
                     if enabled:
-                        job_id = f"crawl_{site_key}"
-                        trigger = CronTrigger.from_crontab(cron_expr, timezone=self.timezone)
-                        
-                        self.scheduler.add_job(
-                            func=self._execute_crawl_job,
-                            trigger=trigger,
-                            id=job_id,
-                            args=[site_key],
-                            name=f"크롤링: {site_key}",
-                            replace_existing=True,
-                            max_instances=1,
-                            misfire_grace_time=3600
-                        )
-                        
-                        self.logger.info(f"스케줄 로드: {site_key} ({cron_expr})")
+                        self._add_site_crawl_job(site_key, cron_expr)
                         
         except Exception as e:
             self.logger.error(f"스케줄 로드 실패: {e}")
     
+    def _add_site_crawl_job(self, site_key: str, cron_expression: str):
+        """사이트 크롤링 작업 등록 (적응형 모드 대상이면 학습된 다음 시각, 아니면 cron)"""
+        if self.adaptive_schedule.is_enabled_for(site_key):
+            self._schedule_adaptive_crawl(site_key)
+            return
+        
+        trigger = CronTrigger.from_crontab(cron_expression, timezone=self.timezone)
+        self.scheduler.add_job(
+            func=self._enqueue_crawl_job,
+            trigger=trigger,
+            id=f"crawl_{site_key}",
+            args=[site_key],
+            name=f"크롤링: {site_key}",
+            replace_existing=True,
+            max_instances=1,  # 동시 실행 방지
+            misfire_grace_time=3600  # 1시간 지연 허용
+        )
+        self.logger.info(f"크롤링 스케줄 등록: {site_key} ({cron_expression})")
+    
+    def _schedule_adaptive_crawl(self, site_key: str, last_crawl: datetime = None):
+        """적응형 모델로 계산한 다음 시각에 사이트 크롤링 예약"""
+        next_run = self.adaptive_schedule.plan_next_crawl(site_key, last_crawl)
+        self.scheduler.add_job(
+            func=self._run_adaptive_crawl,
+            trigger=DateTrigger(run_date=next_run.astimezone(self.timezone), timezone=self.timezone),
+            id=f"crawl_{site_key}",
+            args=[site_key],
+            name=f"크롤링(적응형): {site_key}",
+            replace_existing=True,
+            misfire_grace_time=3600
+        )
+        self.logger.info(f"적응형 크롤링 예약: {site_key} ({next_run.strftime('%m-%d %H:%M')})")
+    
+    def _run_adaptive_crawl(self, site_key: str):
+        """적응형 크롤링 실행 후 다음 실행 예약 (모델은 매 실행마다 최신 이력으로 갱신)"""
+        try:
+            self.adaptive_schedule.get_model(site_key, refresh=True)
+            if self.adaptive_schedule.is_enabled_for(site_key):
+                self._schedule_adaptive_crawl(site_key, datetime.now())
+            else:
+                # 학습 데이터가 줄어든 경우 등 cron 스케줄로 복귀
+                self._restore_cron_schedule(site_key)
+        finally:
+            self._enqueue_crawl_job(site_key)
+    
+    def _restore_cron_schedule(self, site_key: str):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT cron_expression FROM crawl_schedules WHERE site_key = ? AND enabled = 1",
+                           (site_key,))
+            row = cursor.fetchone()
+        if row:
+            self._add_site_crawl_job(site_key, row[0])
+    
+    def _apply_schedule_stagger(self) -> Dict[str, Any]:
+        """
+        반복 작업(cron/interval)의 겹침을 찾아 시작 시각 분산
+        
+        크롤링 작업(우선순위 높은 순) → 전체 크롤링 → 유지보수 작업 순으로 원래 시각을 우선 배정하고,
+        겹치는 작업에는 작업 ID 기반 고정 오프셋을 적용 (일회성 재시도/적응형 작업은 제외)
+        """
+        if not SCHEDULE_STAGGER_CONFIG.get("enabled", True):
+            return {}
+        
+        try:
+            jobs = {job.id: job for job in self.scheduler.get_jobs()
+                    if not isinstance(unwrap_trigger(job.trigger), DateTrigger)
+                    and job.id not in self.UNSTAGGERED_JOBS}
+            triggers = {job_id: unwrap_trigger(job.trigger) for job_id, job in jobs.items()}
+            
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT site_key FROM crawl_schedules ORDER BY priority DESC, site_key")
+                order = [f"crawl_{row[0]}" for row in cursor.fetchall()] + ["crawl_all_sites"]
+            
+            plan = plan_offsets(triggers, order, datetime.now(self.timezone))
+            for job_id, offset in plan["offsets"].items():
+                trigger = OffsetTrigger(triggers[job_id], offset) if offset else triggers[job_id]
+                if str(trigger) != str(jobs[job_id].trigger):
+                    jobs[job_id].reschedule(trigger=trigger)
+            
+            self.stagger_plan = plan
+            staggered = {job_id: offset for job_id, offset in plan["offsets"].items() if offset}
+            self.logger.info(f"스케줄 시작 시각 분산: 겹침 {len(plan['overlaps'])}쌍 → "
+                             f"{len(plan['remaining_overlaps'])}쌍, 오프셋 {staggered}")
+            return plan
+            
+        except Exception as e:
+            self.logger.error(f"스케줄 분산 실패: {e}")
+            return {}
+    
+    def get_schedule_plan(self) -> Dict[str, Any]:
+        """반복 작업의 분산 계획과 다음 실행 시각 조회"""
+        return {
+            "enabled": SCHEDULE_STAGGER_CONFIG.get("enabled", True),
+            "min_gap_seconds": SCHEDULE_STAGGER_CONFIG.get("min_gap_seconds"),
+            "offsets": self.stagger_plan.get("offsets", {}),
+            "overlaps": self.stagger_plan.get("overlaps", []),
+            "remaining_overlaps": self.stagger_plan.get("remaining_overlaps", []),
+            "jobs": [
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "trigger": str(job.trigger),
+                    "next_run": job.next_run_time.isoformat() if job.next_run_time else None
+                }
+                for job in sorted(self.scheduler.get_jobs(),
+                                  key=lambda job: (job.next_run_time is None, job.next_run_time or 0))
+            ]
+        }
+    
+    def get_adaptive_schedule_report(self) -> Dict[str, Any]:
+        """사이트별 학습된 도착 패턴, 다음 크롤링 시각, 예상 탐지 지연 (적응형 vs 고정 스케줄)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT site_key, cron_expression FROM crawl_schedules WHERE enabled = 1")
+                sites = cursor.fetchall()
+            
+            return {
+                "enabled": self.adaptive_schedule.config.get("enabled", False),
+                "sites": [self.adaptive_schedule.get_site_report(site_key, cron_expression)
+                          for site_key, cron_expression in sites]
+            }
+        except Exception as e:
+            self.logger.error(f"적응형 스케줄 보고서 생성 실패: {e}")
+            return {"error": str(e)}
+    
     def _add_system_maintenance_jobs(self):
         """시스템 유지보수 작업 추가"""
         try:
-            # 시스템 상태 체크 (5분마다)
+            # 시스템 상태 체크 (시작 시 1회 후 5분마다)
             self.scheduler.add_job(
                 func=self._system_health_check,
                 trigger=IntervalTrigger(minutes=5),
                 id="system_health_check",
                 name="시스템 상태 체크",
-                replace_existing=True
+                replace_existing=True,
+                next_run_time=datetime.now(self.timezone)
             )
             
             # 알림 정리 (매일 자정)
@@ -725,16 +1282,74 @@ class SchedulerService:
                 replace_existing=True
             )
             
-            # 전체 크롤링 스케줄 (매일 오전 2시와 오후 2시)
-            self.scheduler.add_job(
-                func=self._execute_all_sites_crawl,
-                trigger=CronTrigger(hour='2,14', minute=0, timezone=self.timezone),
-                id="crawl_all_sites",
-                name="전체 사이트 크롤링",
-                replace_existing=True,
-                max_instances=1,
-                misfire_grace_time=3600
-            )
+            # hot/cold 아카이브 (매일 새벽)
+            if ARCHIVE_CONFIG.get("enabled", True):
+                self.scheduler.add_job(
+                    func=self._archive_old_data,
+                    trigger=CronTrigger(hour=ARCHIVE_CONFIG.get("schedule_hour", 3), minute=0,
+                                        timezone=self.timezone),
+                    id="archive_old_data",
+                    name="오래된 데이터 아카이브",
+                    replace_existing=True,
+                    max_instances=1
+                )
+            
+            # 다른 워커가 전달한 요청 처리 및 오래된 요청 정리 (리더 선출 사용 시)
+            if self.leader.enabled:
+                self.scheduler.add_job(
+                    func=self._process_leader_requests,
+                    trigger=IntervalTrigger(seconds=LEADER_ELECTION_CONFIG.get("request_poll_seconds", 5)),
+                    id="leader_requests",
+                    name="리더 요청 처리",
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True
+                )
+                self.scheduler.add_job(
+                    func=self.leader.cleanup_requests,
+                    trigger=CronTrigger(hour=0, minute=30, timezone=self.timezone),
+                    id="cleanup_leader_requests",
+                    name="리더 요청 정리",
+                    replace_existing=True
+                )
+            
+            # 작업 큐 결과 수집 및 오래된 작업 정리 (작업 큐 모드)
+            if self.job_queue:
+                self.scheduler.add_job(
+                    func=self._collect_queue_results,
+                    trigger=IntervalTrigger(seconds=CRAWL_QUEUE_CONFIG.get("result_poll_seconds", 5)),
+                    id="collect_queue_results",
+                    name="크롤링 작업 큐 결과 수집",
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True
+                )
+                self.scheduler.add_job(
+                    func=self.job_queue.cleanup,
+                    trigger=CronTrigger(hour=0, minute=40, timezone=self.timezone),
+                    id="cleanup_crawl_jobs",
+                    name="크롤링 작업 큐 정리",
+                    replace_existing=True
+                )
+            
+            # 전체 크롤링 스케줄 (매일 오전 2시와 오후 2시, 적응형 모드에서는 생략)
+            adaptive_config = self.adaptive_schedule.config
+            if adaptive_config.get("enabled", False) and adaptive_config.get("skip_all_sites_crawl", True):
+                if self.scheduler.get_job("crawl_all_sites"):
+                    self.scheduler.remove_job("crawl_all_sites")
+            else:
+                self.scheduler.add_job(
+                    func=self._execute_all_sites_crawl,
+                    trigger=CronTrigger.from_crontab(
+                        adaptive_config.get("all_sites_crawl_cron", "0 2,14 * * *"),
+                        timezone=self.timezone
+                    ),
+                    id="crawl_all_sites",
+                    name="전체 사이트 크롤링",
+                    replace_existing=True,
+                    max_instances=1,
+                    misfire_grace_time=3600
+                )
             
             self.logger.info("시스템 유지보수 작업 추가 완료")
             
@@ -742,40 +1357,10 @@ class SchedulerService:
             self.logger.error(f"유지보수 작업 추가 실패: {e}")
     
     def _system_health_check(self):
-        """시스템 건강도 체크"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 각 사이트 상태 체크
-                cursor.execute("SELECT DISTINCT site_key FROM crawl_schedules")
-                sites = [row[0] for row in cursor.fetchall()]
-                
-                for site_key in sites:
-                    # 마지막 성공한 크롤링 시간 확인
-                    cursor.execute("""
-                        SELECT last_success, consecutive_errors 
-                        FROM crawl_schedules WHERE site_key = ?
-                    """, (site_key,))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        last_success, consecutive_errors = result
-                        
-                        # 24시간 이상 성공 없음 체크
-                        if last_success:
-                            last_success_dt = datetime.fromisoformat(last_success)
-                            if datetime.now() - last_success_dt > timedelta(hours=24):
-                                self._update_system_status(site_key, 'warning', 
-                                                         "24시간 이상 성공한 크롤링 없음")
-                        
-                        # 연속 에러 체크
-                        if consecutive_errors >= 3:
-                            self._update_system_status(site_key, 'error', 
-                                                     f"연속 {consecutive_errors}회 실패")
-                            
-        except Exception as e:
-            self.logger.error(f"시스템 건강도 체크 실패: {e}")
+        """시스템 건강도 체크 (사이트별 건강도 요약을 한 번의 SQL로 갱신)"""
+        counts = self.health_service.refresh()
+        if counts.get('warning') or counts.get('error'):
+            self.logger.warning(f"사이트 건강도: 경고 {counts.get('warning', 0)}개, 오류 {counts.get('error', 0)}개")
     
     def _cleanup_old_notifications(self):
         """오래된 알림 정리"""
@@ -793,20 +1378,37 @@ class SchedulerService:
                 
                 deleted_count = cursor.rowcount
                 
-                # 오래된 new_data_log 정리 (90일)
-                cutoff_date_log = datetime.now() - timedelta(days=90)
-                cursor.execute("""
-                    DELETE FROM new_data_log 
-                    WHERE discovered_at < ?
-                """, (cutoff_date_log.isoformat(),))
-                
-                deleted_log_count = cursor.rowcount
-                
-                self.logger.info(f"알림 정리 완료: 알림 {deleted_count}개, 로그 {deleted_log_count}개 삭제")
+                # 오래된 new_data_log 정리 (90일) - 아카이브 사용 시 삭제 대신 아카이브로 이동
+                deleted_log_count = 0
+                if not ARCHIVE_CONFIG.get("enabled", True):
+                    cutoff_date_log = datetime.now() - timedelta(days=90)
+                    cursor.execute("""
+                        DELETE FROM new_data_log 
+                        WHERE discovered_at < ?
+                    """, (cutoff_date_log.isoformat(),))
+                    
+                    deleted_log_count = cursor.rowcount
                 
+            # 보관 기간이 지났거나 알림이 삭제된 발송 건 정리
+            deleted_delivery_count = self.notification_service.outbox.cleanup()
+            self.notification_service.digest.cleanup()
+            self.notification_service.throttle.cleanup()
+            self.notification_service.recent_documents.cleanup()
+
+            self.logger.info(f"알림 정리 완료: 알림 {deleted_count}개, 로그 {deleted_log_count}개, "
+                             f"발송 건 {deleted_delivery_count}개 삭제")
+
         except Exception as e:
             self.logger.error(f"알림 정리 실패: {e}")
     
+    def _archive_old_data(self):
+        """보관 기간이 지난 문서/로그를 연도별 아카이브 DB로 이동"""
+        try:
+            result = self.archive_service.run_archive()
+            self.logger.info(f"아카이브 작업 완료: {result.get('total_moved', 0)}개 행 이동")
+        except Exception as e:
+            self.logger.error(f"아카이브 작업 실패: {e}")
+    
     def _save_schedule_to_db(self, site_key: str, cron_expression: str, 
                            enabled: bool, priority: int, notification_threshold: int):
         """스케줄을 데이터베이스에 저장"""
@@ -935,8 +1537,9 @@ class SchedulerService:
     
     def _save_crawl_execution_log(self, site_key: str, session_id: str, duration: int, 
                                  status: str, is_manual: bool, crawl_result: dict = None, 
-                                 new_count: int = 0, error_message: str = None):
-        """개별 크롤링 실행 로그 저장"""
+                                 new_count: int = 0, error_message: str = None,
+                                 attempt: int = 1, error_type: str = None, stage: str = None):
+        """개별 크롤링 실행 로그 저장 (재시도는 회차별로 별도 행 기록, stage는 타임아웃 시 멈춘 단계)"""
         try:
             start_time = datetime.now() - timedelta(seconds=duration)
             end_time = datetime.now()
@@ -971,23 +1574,29 @@ class SchedulerService:
                     'site_name': site_names.get(site_key, site_key)
                 }
             }
+            if stage:
+                site_results[site_key]['stage'] = stage
             
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     INSERT INTO crawl_execution_log 
                     (execution_type, trigger_source, start_time, end_time, 
-                     status, total_sites, total_new_data_count, site_results, error_summary)
-                    VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?)
+                     status, total_sites, total_new_data_count, site_results, error_summary,
+                     site_key, attempt, error_type)
+                    VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
                 """, (
-                    'manual' if is_manual else 'scheduled',
+                    'retry' if attempt > 1 else ('manual' if is_manual else 'scheduled'),
                     'manual' if is_manual else 'scheduler',
                     start_time.isoformat(),
                     end_time.isoformat(),
                     status,
                     new_count,
                     json.dumps(site_results),
-                    error_message
+                    error_message,
+                    site_key,
+                    attempt,
+                    error_type
                 ))
                 
                 log_id = cursor.lastrowid
@@ -1019,7 +1628,11 @@ class SchedulerService:
         try:
             if hasattr(self, 'scheduler') and self.scheduler.running:
                 self.scheduler.shutdown(wait=False)
-            if hasattr(self, 'executor'):
-                self.executor.shutdown(wait=False)
+            if hasattr(self, 'dispatcher'):
+                self.dispatcher.shutdown(wait=False)
+            if hasattr(self, 'watchdog'):
+                self.watchdog.stop()
+            if hasattr(self, 'leader'):
+                self.leader.stop()
         except:
             pass
\ No newline at end of file
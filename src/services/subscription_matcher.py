@@ -0,0 +1,294 @@
+"""
+구독 규칙 매칭 엔진
+수신자별 세목/키워드 구독 규칙을 역색인(세목)과 다중 패턴 오토마톤(키워드)으로 컴파일하여
+새로운 문서마다 모든 규칙을 한 번에 평가 (규칙 수 × 문서 수 반복 없음)
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterable
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.logging_config import get_logger
+
+
+RULE_TYPES = ("tax_type", "keyword")
+
+# 세목 필드 구분자 (예: "법인세, 부가가치세", "소득세/법인세")
+_CATEGORY_SEPARATOR = re.compile(r"[,/·ㆍ|]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: Any) -> str:
+    """매칭용 정규화 (공백 제거 + 대소문자 통일, '부가 가치세'와 '부가가치세'를 같은 것으로 취급)"""
+    if text is None:
+        return ""
+    return _WHITESPACE.sub("", str(text)).casefold()
+
+
+def split_categories(category: Any) -> List[str]:
+    """세목 필드를 정규화된 세목 목록으로 분리"""
+    if category is None or str(category).strip().lower() in ("", "nan", "none"):
+        return []
+    return [token for token in (normalize_text(part) for part in _CATEGORY_SEPARATOR.split(str(category))) if token]
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 패턴 오토마톤
+
+    패턴 수와 관계없이 본문을 한 번 훑어 포함된 모든 패턴의 값을 찾음 (본문 길이 + 일치 수에 비례)
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Any]] = [[]]
+        self._built = False
+
+    def add(self, pattern: str, value: Any):
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(value)
+        self._built = False
+
+    def build(self):
+        """실패 링크 계산 (너비 우선, 실패 상태의 출력을 합쳐 조회 시 링크를 따라가지 않음)"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        self._built = True
+
+    def find(self, text: str) -> Set[Any]:
+        """본문에 포함된 모든 패턴의 값"""
+        if not self._built:
+            self.build()
+        found: Set[Any] = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+        return found
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+class SubscriptionMatcher:
+    """
+    컴파일된 구독 규칙
+
+    - 세목 규칙: 정규화된 세목 → 규칙 ID 역색인 (문서의 세목마다 사전 조회 1회)
+    - 키워드 규칙: 제목/요약에 대한 Aho-Corasick 오토마톤 (문서마다 본문 1회 순회)
+    - 규칙에 사이트가 지정되어 있으면 해당 사이트 문서에만 적용
+    - 규칙이 하나라도 있는 수신자는 규칙에 일치하는 문서만 받고, 규칙이 없는 수신자는 모든 문서를 받음
+    """
+
+    def __init__(self, rules: Iterable[Dict[str, Any]] = ()):
+        self.rules: Dict[int, Dict[str, Any]] = {}
+        self.subscribed_settings: Set[int] = set()
+        self._tax_index: Dict[str, List[int]] = {}
+        self._keywords = KeywordAutomaton()
+
+        for rule in rules:
+            pattern = normalize_text(rule["pattern"])
+            if not pattern or rule["rule_type"] not in RULE_TYPES:
+                continue
+            self.rules[rule["rule_id"]] = rule
+            self.subscribed_settings.add(rule["setting_id"])
+            if rule["rule_type"] == "tax_type":
+                self._tax_index.setdefault(pattern, []).append(rule["rule_id"])
+            else:
+                self._keywords.add(pattern, rule["rule_id"])
+        self._keywords.build()
+
+    def match_document(self, site_key: str, category: Any = None, title: Any = None,
+                       summary: Any = None) -> Set[int]:
+        """문서에 일치하는 규칙 ID"""
+        candidates: Set[int] = set()
+        for token in split_categories(category):
+            candidates.update(self._tax_index.get(token, ()))
+        if len(self._keywords) > 1:
+            candidates.update(self._keywords.find(normalize_text(title) + "\n" + normalize_text(summary)))
+        return {rule_id for rule_id in candidates
+                if not self.rules[rule_id].get("site_key") or self.rules[rule_id]["site_key"] == site_key}
+
+    def match(self, documents: Iterable[Dict[str, Any]]) -> Tuple[Dict[int, List[str]], Dict[str, int]]:
+        """
+        문서 목록을 한 번 순회하여 수신자별 일치 문서 계산
+
+        Args:
+            documents: site_key, data_id, data_category, data_title, data_summary를 가진 문서
+
+        Returns:
+            (수신자 설정 ID별 일치 문서 ID 목록, 규칙 표시명별 일치 문서 수)
+        """
+        matches: Dict[int, List[str]] = {}
+        label_counts: Dict[str, int] = {}
+        if not self.rules:
+            return matches, label_counts
+
+        for document in documents:
+            rule_ids = self.match_document(document.get("site_key"), document.get("data_category"),
+                                           document.get("data_title"), document.get("data_summary"))
+            settings = set()
+            labels = set()
+            for rule_id in rule_ids:
+                rule = self.rules[rule_id]
+                settings.add(rule["setting_id"])
+                labels.add(rule["pattern"])
+            for setting_id in settings:
+                matches.setdefault(setting_id, []).append(document.get("data_id"))
+            for label in labels:
+                label_counts[label] = label_counts.get(label, 0) + 1
+        return matches, label_counts
+
+
+class SubscriptionService:
+    """
+    구독 규칙 서비스 클래스
+
+    - email_subscription_rules 테이블 관리 (수신자별 세목/키워드 규칙)
+    - get_matcher(): 규칙이 바뀌었을 때만 다시 컴파일한 매처 반환 (규칙 수/최대 ID/수정 시각으로 변경 감지)
+    """
+
+    def __init__(self, db_path: str = "data/tax_data.db"):
+        self.db_path = db_path
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._matcher: Optional[SubscriptionMatcher] = None
+        self._version: Optional[tuple] = None
+        self._ensure_table()
+
+    def _ensure_table(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS email_subscription_rules (
+                        rule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        setting_id INTEGER NOT NULL,
+                        rule_type TEXT NOT NULL,  -- 'tax_type'(세목), 'keyword'(제목/요약 키워드)
+                        pattern TEXT NOT NULL,
+                        site_key TEXT NOT NULL DEFAULT '',  -- 빈 값이면 전체 사이트
+                        is_active INTEGER NOT NULL DEFAULT 1,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE (setting_id, rule_type, pattern, site_key)
+                    )
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_email_subscription_rules_setting
+                    ON email_subscription_rules(setting_id, is_active)
+                """)
+        except Exception as e:
+            self.logger.error(f"구독 규칙 테이블 생성 실패: {e}")
+
+    def get_matcher(self, conn: sqlite3.Connection = None) -> SubscriptionMatcher:
+        """활성 규칙으로 컴파일한 매처 (conn이 있으면 호출자의 트랜잭션에서 조회)"""
+        try:
+            if conn is not None:
+                return self._get_matcher(conn)
+            with sqlite3.connect(self.db_path) as own_conn:
+                return self._get_matcher(own_conn)
+        except Exception as e:
+            self.logger.error(f"구독 규칙 조회 실패: {e}")
+            return self._matcher or SubscriptionMatcher()
+
+    def _get_matcher(self, conn: sqlite3.Connection) -> SubscriptionMatcher:
+        version = conn.execute("""
+            SELECT COUNT(*), MAX(rule_id), MAX(updated_at) FROM email_subscription_rules WHERE is_active = 1
+        """).fetchone()
+        with self._lock:
+            if self._matcher is not None and self._version == version:
+                return self._matcher
+
+        cursor = conn.execute("""
+            SELECT rule_id, setting_id, rule_type, pattern, site_key
+            FROM email_subscription_rules WHERE is_active = 1
+        """)
+        columns = [desc[0] for desc in cursor.description]
+        matcher = SubscriptionMatcher(dict(zip(columns, row)) for row in cursor.fetchall())
+        with self._lock:
+            self._matcher, self._version = matcher, version
+        self.logger.info(f"구독 규칙 컴파일: 규칙 {len(matcher.rules)}개, 수신자 {len(matcher.subscribed_settings)}명")
+        return matcher
+
+    def list_rules(self, setting_id: int = None) -> List[Dict[str, Any]]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                if setting_id is not None:
+                    cursor = conn.execute("""
+                        SELECT * FROM email_subscription_rules WHERE setting_id = ? ORDER BY rule_id
+                    """, (setting_id,))
+                else:
+                    cursor = conn.execute("SELECT * FROM email_subscription_rules ORDER BY setting_id, rule_id")
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"구독 규칙 목록 조회 실패: {e}")
+            return []
+
+    def add_rule(self, setting_id: int, rule_type: str, pattern: str, site_key: str = None) -> Optional[int]:
+        """구독 규칙 추가 (같은 규칙이 있으면 다시 활성화)"""
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"지원하지 않는 규칙 타입: {rule_type}")
+        pattern = str(pattern or "").strip()
+        if not normalize_text(pattern):
+            raise ValueError("규칙 패턴이 비어 있습니다")
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                INSERT INTO email_subscription_rules (setting_id, rule_type, pattern, site_key)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(setting_id, rule_type, pattern, site_key) DO UPDATE SET
+                    is_active = 1, updated_at = CURRENT_TIMESTAMP
+                RETURNING rule_id
+            """, (setting_id, rule_type, pattern, site_key or ''))
+            rule_id = cursor.fetchone()[0]
+        self._invalidate()
+        self.logger.info(f"구독 규칙 추가: 설정 {setting_id} {rule_type}={pattern} ({site_key or '전체 사이트'})")
+        return rule_id
+
+    def delete_rule(self, rule_id: int, setting_id: int = None) -> bool:
+        with sqlite3.connect(self.db_path) as conn:
+            if setting_id is not None:
+                cursor = conn.execute("DELETE FROM email_subscription_rules WHERE rule_id = ? AND setting_id = ?",
+                                      (rule_id, setting_id))
+            else:
+                cursor = conn.execute("DELETE FROM email_subscription_rules WHERE rule_id = ?", (rule_id,))
+            deleted = cursor.rowcount > 0
+        self._invalidate()
+        return deleted
+
+    def _invalidate(self):
+        with self._lock:
+            self._matcher, self._version = None, None
@@ -0,0 +1,244 @@
+"""
+WebSocket 브로드캐스터
+메시지를 한 번만 직렬화하여 클라이언트별 큐에 넣고, 연결마다 전송 태스크가 큐를 비우는 방식으로 동시 전송
+(느린 브라우저 하나가 다른 대시보드의 진행 상황 수신을 지연시키지 않음)
+"""
+
+import os
+import json
+import time
+import asyncio
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+import sys
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.config.settings import WEBSOCKET_BROADCAST_CONFIG
+from src.config.logging_config import get_logger
+
+
+@dataclass
+class QueuedMessage:
+    """클라이언트 큐에 대기 중인 직렬화된 메시지"""
+    text: str
+    key: Optional[Tuple[str, Any]] = None
+    message: Optional[Dict[str, Any]] = None  # 병합 대상 메시지의 원본 (변경 필드만 담은 메시지 병합용)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class BroadcastClient:
+    """연결된 클라이언트와 전송 큐/통계"""
+    client_id: int
+    websocket: Any
+    queue: deque = field(default_factory=deque)
+    pending: Dict[Tuple[str, Any], QueuedMessage] = field(default_factory=dict)  # 병합 키별 대기 메시지
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: asyncio.Task = None
+    connected_at: float = field(default_factory=time.time)
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    last_send_lag: float = 0.0
+    max_send_lag: float = 0.0
+
+    def lag(self, now: float = None) -> float:
+        """가장 오래 대기 중인 메시지의 대기 시간 (초)"""
+        if not self.queue:
+            return 0.0
+        return (now or time.monotonic()) - self.queue[0].enqueued_at
+
+
+class WebSocketBroadcaster:
+    """
+    WebSocket 브로드캐스터 클래스
+
+    - broadcast(): 메시지를 한 번 직렬화하여 모든 클라이언트 큐에 넣고 즉시 반환 (전송 완료를 기다리지 않음)
+    - 클라이언트마다 전송 태스크가 큐를 순서대로 전송 (send_timeout_seconds 초과 또는 오류 시 연결 제거)
+    - coalesce_types 메시지(진행률/상태)는 같은 타입/대상의 대기 메시지에 최신 필드를 병합
+      (변경 필드만 담은 진행 상황 메시지도 유실 없이 합쳐짐, 병합 시에만 클라이언트별 직렬화)
+    - 큐가 queue_size를 넘으면 가장 오래된 메시지를 버리고, 대기 시간이 max_lag_seconds를 넘으면 연결 제거
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = {**WEBSOCKET_BROADCAST_CONFIG, **(config or {})}
+        self.logger = get_logger(__name__)
+        self._clients: Dict[int, BroadcastClient] = {}
+        self._by_socket: Dict[int, int] = {}  # id(websocket) → client_id
+        self._ids = itertools.count(1)
+        self.stats = {"connections": 0, "evicted": 0, "broadcasts": 0, "serialize_errors": 0,
+                      "last_broadcast_ms": 0.0, "max_broadcast_ms": 0.0}
+
+    @property
+    def active_connections(self) -> List[Any]:
+        return [client.websocket for client in self._clients.values()]
+
+    async def connect(self, websocket):
+        await websocket.accept()
+        client = BroadcastClient(client_id=next(self._ids), websocket=websocket)
+        self._clients[client.client_id] = client
+        self._by_socket[id(websocket)] = client.client_id
+        client.writer = asyncio.get_running_loop().create_task(self._writer(client))
+        self.stats["connections"] += 1
+        self.logger.info(f"WebSocket 연결: 클라이언트 {client.client_id} (현재 {len(self._clients)}개)")
+
+    def disconnect(self, websocket):
+        """연결 종료 처리 (이미 제거된 연결이면 무시)"""
+        client = self._client_for(websocket)
+        if client is not None:
+            self._remove(client)
+            self.logger.info(f"WebSocket 연결 종료: 클라이언트 {client.client_id} (현재 {len(self._clients)}개)")
+
+    async def send_personal_message(self, message: dict, websocket):
+        client = self._client_for(websocket)
+        text = self._serialize(message)
+        if client is not None and text is not None:
+            self._enqueue(client, QueuedMessage(text), time.monotonic())
+
+    async def broadcast(self, message: dict) -> int:
+        """
+        모든 클라이언트 큐에 메시지 추가
+
+        Returns:
+            메시지를 받은 클라이언트 수
+        """
+        started = time.perf_counter()
+        text = self._serialize(message)
+        if text is None or not self._clients:
+            return 0
+
+        key = None
+        if message.get("type") in self.config["coalesce_types"]:
+            key = (message["type"], message.get("choice", message.get("site_key")))
+
+        now = time.monotonic()
+        delivered = 0
+        for client in list(self._clients.values()):
+            if self._enqueue(client, QueuedMessage(text, key, message if key is not None else None, now), now):
+                delivered += 1
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats["broadcasts"] += 1
+        self.stats["last_broadcast_ms"] = elapsed_ms
+        self.stats["max_broadcast_ms"] = max(self.stats["max_broadcast_ms"], elapsed_ms)
+        return delivered
+
+    def _serialize(self, message: dict) -> Optional[str]:
+        try:
+            return json.dumps(message, default=str)
+        except (TypeError, ValueError) as e:
+            self.stats["serialize_errors"] += 1
+            self.logger.error(f"WebSocket 메시지 직렬화 실패: {e}")
+            return None
+
+    def _enqueue(self, client: BroadcastClient, entry: QueuedMessage, now: float) -> bool:
+        if entry.key is not None and entry.key in client.pending:
+            # 아직 전송되지 않은 같은 대상의 진행률/상태에 최신 필드를 병합 (큐 위치와 대기 시작 시각 유지)
+            pending = client.pending[entry.key]
+            merged = {**pending.message, **entry.message}
+            text = self._serialize(merged)
+            if text is not None:
+                pending.message, pending.text = merged, text
+            client.coalesced += 1
+            return True
+
+        if len(client.queue) >= self.config["queue_size"]:
+            dropped = client.queue.popleft()
+            if dropped.key is not None and client.pending.get(dropped.key) is dropped:
+                del client.pending[dropped.key]
+            client.dropped += 1
+
+        if client.lag(now) > self.config["max_lag_seconds"]:
+            self._evict(client, f"대기 시간 {client.lag(now):.1f}초 초과")
+            return False
+
+        client.queue.append(entry)
+        if entry.key is not None:
+            client.pending[entry.key] = entry
+        client.ready.set()
+        return True
+
+    async def _writer(self, client: BroadcastClient):
+        """클라이언트 큐를 순서대로 전송"""
+        try:
+            while True:
+                if not client.queue:
+                    client.ready.clear()
+                    await client.ready.wait()
+                    continue
+                entry = client.queue.popleft()
+                if entry.key is not None and client.pending.get(entry.key) is entry:
+                    del client.pending[entry.key]
+
+                await asyncio.wait_for(client.websocket.send_text(entry.text), self.config["send_timeout_seconds"])
+
+                client.sent += 1
+                client.last_send_lag = time.monotonic() - entry.enqueued_at
+                client.max_send_lag = max(client.max_send_lag, client.last_send_lag)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._evict(client, f"전송 시간 {self.config['send_timeout_seconds']}초 초과")
+        except Exception as e:
+            self._evict(client, f"전송 실패: {e}")
+
+    def _evict(self, client: BroadcastClient, reason: str):
+        """끊어졌거나 느린 연결 제거 후 소켓 종료"""
+        if client.client_id not in self._clients:
+            return
+        self._remove(client)
+        self.stats["evicted"] += 1
+        self.logger.warning(f"WebSocket 클라이언트 {client.client_id} 제거: {reason}")
+        asyncio.get_running_loop().create_task(self._close(client.websocket))
+
+    def _remove(self, client: BroadcastClient):
+        self._clients.pop(client.client_id, None)
+        self._by_socket.pop(id(client.websocket), None)
+        client.queue.clear()
+        client.pending.clear()
+        if client.writer is not None and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+
+    async def _close(self, websocket):
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), self.config["send_timeout_seconds"])
+        except Exception:
+            # 이미 끊어진 연결
+            pass
+
+    def _client_for(self, websocket) -> Optional[BroadcastClient]:
+        client_id = self._by_socket.get(id(websocket))
+        return self._clients.get(client_id) if client_id is not None else None
+
+    async def close_all(self):
+        """서버 종료 시 모든 연결 종료"""
+        clients = list(self._clients.values())
+        for client in clients:
+            self._remove(client)
+        await asyncio.gather(*(self._close(client.websocket) for client in clients), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 수, 큐 깊이, 대기 시간 통계"""
+        now = time.monotonic()
+        clients = [{
+            "client_id": client.client_id,
+            "queued": len(client.queue),
+            "sent": client.sent,
+            "dropped": client.dropped,
+            "coalesced": client.coalesced,
+            "lag_seconds": round(client.lag(now), 3),
+            "last_send_lag_seconds": round(client.last_send_lag, 3),
+            "max_send_lag_seconds": round(client.max_send_lag, 3),
+            "connected_at": client.connected_at
+        } for client in self._clients.values()]
+        return {
+            **self.stats,
+            "active_connections": len(clients),
+            "queued": sum(client["queued"] for client in clients),
+            "max_lag_seconds": max((client["lag_seconds"] for client in clients), default=0.0),
+            "clients": clients
+        }
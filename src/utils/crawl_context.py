@@ -0,0 +1,195 @@
+"""
+크롤링 실행 컨텍스트
+작업 스레드별 현재 단계와 브라우저 프로세스를 기록하여 watchdog이 멈춘 크롤링을 추적/정리할 수 있도록 함
+"""
+
+import os
+import signal
+import threading
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+_local = threading.local()
+
+
+class CrawlCancelledError(Exception):
+    """watchdog 타임아웃 등으로 크롤링이 취소된 경우"""
+    pass
+
+
+class CrawlContext:
+    """작업 스레드에서 실행 중인 크롤링의 상태 (watchdog 스레드와 공유)"""
+
+    def __init__(self, site_key: str):
+        self.site_key = site_key
+        self.stage = "대기"
+        self.stage_updated_at = datetime.now()
+        self.cancelled = False
+        self._processes: List[Tuple[int, Optional[float]]] = []
+        self._lock = threading.Lock()
+
+    def set_stage(self, stage: str):
+        self.stage = stage
+        self.stage_updated_at = datetime.now()
+
+    def add_process(self, pid: int):
+        """브라우저 드라이버 프로세스 등록 (PID 재사용 방지를 위해 생성 시각 함께 기록)"""
+        create_time = None
+        if PSUTIL_AVAILABLE:
+            try:
+                create_time = psutil.Process(pid).create_time()
+            except psutil.Error:
+                return
+        with self._lock:
+            self._processes.append((pid, create_time))
+
+    def kill_processes(self) -> int:
+        """등록된 프로세스와 모든 하위 프로세스(Chrome 등) 강제 종료 후 종료한 프로세스 수 반환"""
+        with self._lock:
+            processes, self._processes = self._processes, []
+
+        killed = 0
+        for pid, create_time in processes:
+            killed += _kill_process_tree(pid, create_time)
+        return killed
+
+
+class CrawlProgress:
+    """
+    진행률 콜백 어댑터
+
+    크롤러는 진행률 객체를 함수(progress(value, message))나 tkinter 위젯 형태(progress.value = ...; progress.update())로
+    사용하므로 두 방식을 모두 받아 on_update(value)로 전달
+    """
+
+    def __init__(self, on_update: Callable[[float], None]):
+        self.value = 0
+        self._on_update = on_update
+
+    def __call__(self, value, message: str = ""):
+        self.value = value
+        self.update()
+
+    def update(self):
+        self._on_update(self.value)
+
+
+class CrawlStatus:
+    """
+    상태 메시지 콜백 어댑터 (status_message.config(text=...); status_message.update() 형태를 on_update(text)로 전달)
+
+    report(text, **fields)로 받은 구조화 필드(site, stage, page, items 등)는 on_update(text, **fields)로 함께 전달
+    """
+
+    def __init__(self, on_update: Callable[..., None]):
+        self.text = ""
+        self._on_update = on_update
+
+    def config(self, text: str = None, **kwargs):
+        if text is not None:
+            self.text = text
+            self._on_update(text)
+
+    configure = config
+
+    def report(self, text: str, **fields):
+        self.text = text
+        self._on_update(text, **fields)
+
+    def update(self):
+        pass
+
+
+def report_status(status_callback, message: str, **fields):
+    """
+    상태 메시지 전달 (함수, tkinter 위젯, 구조화 필드를 받는 report() 객체 모두 지원)
+
+    구조화 필드는 report()를 가진 객체에만 전달되고, 그 외에는 메시지만 전달
+    """
+    if status_callback is None:
+        return
+    if hasattr(status_callback, "report"):
+        status_callback.report(message, **{key: value for key, value in fields.items() if value is not None})
+    elif hasattr(status_callback, "config"):
+        # tkinter Label 객체인 경우
+        status_callback.config(text=message)
+        if hasattr(status_callback, "update"):
+            status_callback.update()
+    elif callable(status_callback):
+        status_callback(message)
+
+
+def _kill_process_tree(pid: int, create_time: Optional[float]) -> int:
+    if not PSUTIL_AVAILABLE:
+        # psutil이 없으면 드라이버 프로세스만 종료 (하위 브라우저는 드라이버 종료 시 함께 정리되길 기대)
+        try:
+            os.kill(pid, signal.SIGKILL)
+            return 1
+        except OSError:
+            return 0
+
+    try:
+        parent = psutil.Process(pid)
+        if create_time is not None and parent.create_time() != create_time:
+            return 0
+        targets = parent.children(recursive=True) + [parent]
+    except psutil.Error:
+        return 0
+
+    killed = 0
+    for process in targets:
+        try:
+            process.kill()
+            killed += 1
+        except psutil.Error:
+            pass
+    psutil.wait_procs(targets, timeout=3)
+    return killed
+
+
+def bind_crawl_context(context: Optional[CrawlContext]):
+    """현재 스레드에 크롤링 컨텍스트 연결 (None이면 해제)"""
+    _local.context = context
+
+
+def get_crawl_context() -> Optional[CrawlContext]:
+    return getattr(_local, "context", None)
+
+
+def set_crawl_stage(stage: str):
+    """
+    현재 크롤링 단계 기록 (watchdog 타임아웃 시 멈춘 단계로 보고됨)
+
+    이미 취소된 크롤링이면 CrawlCancelledError를 발생시켜 이후 단계(저장 등)를 중단함
+    """
+    context = get_crawl_context()
+    if context is None:
+        return
+    ensure_not_cancelled()
+    context.set_stage(stage)
+
+
+def ensure_not_cancelled():
+    """현재 크롤링이 취소되었으면 CrawlCancelledError 발생 (저장/알림 등 되돌릴 수 없는 단계 직전에 호출)"""
+    context = get_crawl_context()
+    if context is not None and context.cancelled:
+        raise CrawlCancelledError(f"취소된 크롤링 ({context.site_key}, 마지막 단계: {context.stage})")
+
+
+def register_browser(driver):
+    """Selenium 드라이버의 chromedriver 프로세스를 현재 크롤링에 등록"""
+    context = get_crawl_context()
+    if context is None:
+        return
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return
+    context.add_process(pid)
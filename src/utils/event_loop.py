@@ -0,0 +1,73 @@
+"""
+메인 이벤트 루프 연결 유틸리티
+작업 스레드(스케줄러, 크롤링 디스패처, watchdog)에서 웹 서버 이벤트 루프로 코루틴을 안전하게 전달
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+from src.config.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+_main_loop: Optional[asyncio.AbstractEventLoop] = None
+_main_loop_lock = threading.Lock()
+
+
+def set_main_loop(loop: Optional[asyncio.AbstractEventLoop]):
+    """알림/WebSocket 작업을 실행할 메인 이벤트 루프 등록 (None이면 해제)"""
+    global _main_loop
+    with _main_loop_lock:
+        _main_loop = loop
+
+
+def get_main_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """실행 중인 메인 이벤트 루프 (없거나 종료되었으면 None)"""
+    loop = _main_loop
+    if loop is None or loop.is_closed() or not loop.is_running():
+        return None
+    return loop
+
+
+def _log_failure(future, description: str):
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"{description} 실패: {error}")
+
+
+def submit_coroutine(coro: Coroutine, description: str = "비동기 작업",
+                     wait: bool = False, timeout: float = None) -> Any:
+    """
+    코루틴을 메인 이벤트 루프에서 실행
+
+    - 이벤트 루프 스레드에서 호출: 태스크로 등록 (wait 불가)
+    - 다른 스레드에서 호출: run_coroutine_threadsafe로 전달 (wait=True면 결과 대기)
+    - 메인 루프가 없는 경우(CLI/테스트): asyncio.run으로 즉시 실행
+
+    Returns:
+        wait=True 또는 메인 루프가 없을 때는 코루틴 결과, 그 외에는 Future/Task
+    """
+    loop = get_main_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if loop is None and running is None:
+        return asyncio.run(coro)
+
+    if running is not None and (loop is None or running is loop):
+        task = running.create_task(coro)
+        task.add_done_callback(lambda t: _log_failure(t, description))
+        return task
+
+    future: Future = asyncio.run_coroutine_threadsafe(coro, loop)
+    if wait:
+        return future.result(timeout)
+    future.add_done_callback(lambda f: _log_failure(f, description))
+    return future
@@ -0,0 +1,50 @@
+"""
+프로세스 간 조정용 DB 연결 유틸리티
+리더 리스, 크롤링 작업 큐처럼 여러 워커가 공유하는 테이블을 SQLite(같은 호스트) 또는 PostgreSQL(여러 호스트)에 저장
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict
+
+try:
+    import psycopg
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+
+
+# 백엔드별 컬럼 타입 (CREATE TABLE에서 사용)
+COLUMN_TYPES: Dict[str, Dict[str, str]] = {
+    "sqlite": {"id": "INTEGER PRIMARY KEY AUTOINCREMENT", "real": "REAL"},
+    "postgresql": {"id": "BIGSERIAL PRIMARY KEY", "real": "DOUBLE PRECISION"}
+}
+
+
+def resolve_dsn(dsn: str = None) -> str:
+    """PostgreSQL 접속 정보 (psycopg 미설치 또는 PostgreSQL URL이 아니면 None)"""
+    if dsn and PSYCOPG_AVAILABLE and dsn.startswith(("postgresql://", "postgres://")):
+        return dsn
+    return None
+
+
+@contextmanager
+def connect_shared_db(db_path: str, dsn: str = None, timeout: float = 10):
+    """
+    공유 DB 연결 (블록 종료 시 커밋)
+
+    SQL은 ? 플레이스홀더로 작성하고 함께 반환되는 변환 함수를 거쳐 실행 (PostgreSQL이면 %s로 변환)
+
+    Yields:
+        (연결, 쿼리 변환 함수)
+    """
+    if dsn:
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            yield conn, lambda query: query.replace("?", "%s")
+    else:
+        conn = sqlite3.connect(db_path, timeout=timeout)
+        try:
+            with conn:
+                yield conn, lambda query: query
+        finally:
+            conn.close()
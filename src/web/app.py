@@ -17,7 +17,7 @@ from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPExcept
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse
-from typing import Dict, Any, List
+from typing import Dict, Any
 import json
 import re
 import asyncio
@@ -27,66 +27,33 @@ import uvicorn
 
 # 기존 크롤링 시스템 import
 from src.services.crawler_service import CrawlingService
+from src.services.process_crawling_service import ProcessCrawlingService
 from src.repositories.sqlite_repository import SQLiteRepository
-from src.crawlers.tax_tribunal_crawler import TaxTribunalCrawler
-from src.crawlers.nts_authority_crawler import NTSAuthorityCrawler
-from src.crawlers.nts_precedent_crawler import NTSPrecedentCrawler
-from src.config.settings import GUI_CONFIG
+from src.repositories.async_repository import AsyncRepository, QueryCancelledError, shutdown_db_executor
+from src.crawlers.registry import build_crawlers, SITE_CHOICES
+from src.config.settings import (
+    GUI_CONFIG, CRAWL_PROCESS_CONFIG, CRAWL_QUEUE_CONFIG, CRAWL_RESOURCE_CONFIG, CRAWL_WATCHDOG_CONFIG
+)
 from src.config.logging_config import setup_logging, get_logger
 
 # 새로운 모니터링 시스템 import
-from src.services.scheduler_service import SchedulerService
+from src.services.scheduler_service import SchedulerService, ALL_SITES_KEY
+from src.services.crawl_job_queue import create_crawl_job_queue
+from src.utils.event_loop import set_main_loop
 from src.services.notification_service import NotificationService
+from src.services.email_delivery import shutdown_email_delivery
+from src.services.notification_dispatcher import NotificationDispatcher
+from src.services.websocket_broadcaster import WebSocketBroadcaster
+from src.services.crawl_progress_stream import CrawlProgressStream
+from src.services.change_feed_service import ChangeFeedService
+from src.services.health_service import SiteHealthService
+from src.services.recent_documents import RecentDocuments
+from src.repositories.parquet_snapshot_repository import ParquetSnapshotRepository
 
 # 로깅 시스템 초기화
 setup_logging(log_level="INFO", log_to_file=True)
 logger = get_logger(__name__)
 
-# 웹 환경용 레거시 크롤러들 import (tkinter 의존성 없음)
-try:
-    from src.crawlers.web_legacy_crawlers import (
-        crawl_moef_site, crawl_mois_site, crawl_bai_site
-    )
-    LEGACY_CRAWLERS_AVAILABLE = True
-    logger.info("웹 환경용 레거시 크롤러 로드 성공")
-except ImportError as e:
-    logger.error(f"웹 레거시 크롤러 import 실패: {e}")
-    LEGACY_CRAWLERS_AVAILABLE = False
-    
-    # 더미 함수들로 대체
-    def crawl_moef_site(**kwargs):
-        raise NotImplementedError("웹 레거시 크롤러 사용 불가")
-        
-    def crawl_mois_site(**kwargs):
-        raise NotImplementedError("웹 레거시 크롤러 사용 불가")
-        
-    def crawl_bai_site(**kwargs):
-        raise NotImplementedError("웹 레거시 크롤러 사용 불가")
-
-class LegacyCrawlerWrapper:
-    """레거시 크롤러 함수를 클래스 인터페이스로 래핑"""
-    def __init__(self, site_name, site_key, crawler_func, key_column):
-        self.site_name = site_name
-        self.site_key = site_key
-        self.crawler_func = crawler_func
-        self.key_column = key_column
-    
-    def get_site_name(self):
-        return self.site_name
-    
-    def get_site_key(self):
-        return self.site_key
-    
-    def get_key_column(self):
-        return self.key_column
-    
-    def crawl(self, progress_callback=None, status_callback=None, **kwargs):
-        return self.crawler_func(progress=progress_callback, status_message=status_callback, **kwargs)
-    
-    def validate_data(self, data):
-        return not data.empty if data is not None else False
-
-
 # FastAPI 앱 초기화
 app = FastAPI(
     title="Tax Law Crawler Web Interface",
@@ -94,6 +61,14 @@ app = FastAPI(
     version="1.0.0"
 )
 
+
+@app.exception_handler(QueryCancelledError)
+async def query_cancelled_handler(request: Request, exc: QueryCancelledError):
+    """클라이언트 연결 해제로 취소된 DB 작업 (서버 오류가 아니므로 디버그 로그만 남김)"""
+    logger.debug(f"DB 작업 취소: {request.url.path} ({exc})")
+    return JSONResponse(status_code=499, content={"detail": str(exc)})
+
+
 # 정적 파일 및 템플릿 설정
 static_path = project_root / "src" / "web" / "static"
 templates_path = project_root / "src" / "web" / "templates"
@@ -101,63 +76,40 @@ templates_path = project_root / "src" / "web" / "templates"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 templates = Jinja2Templates(directory=str(templates_path))
 
-# 크롤링 서비스 초기화
-repository = SQLiteRepository()
+# 크롤링 서비스 초기화 (DATABASE_URL이 PostgreSQL이면 공유 저장소 사용, 아니면 SQLite)
+database_url = os.environ.get("DATABASE_URL", "")
+if database_url.startswith(("postgresql://", "postgres://")):
+    from src.repositories.postgres_repository import PostgresRepository
+    repository = PostgresRepository(database_url)
+else:
+    repository = SQLiteRepository()
 
 # 기존 데이터베이스 스키마 업데이트 (웹 서버 시작 시)
 logger.info("기존 데이터베이스 스키마 업데이트 중...")
 repository.force_schema_update()
 
-# 기본 크롤러 (항상 사용 가능)
-crawlers = {
-    "tax_tribunal": TaxTribunalCrawler(),
-    "nts_authority": NTSAuthorityCrawler(),
-    "nts_precedent": NTSPrecedentCrawler(),
-}
+# 비동기 저장소 파사드 (엔드포인트의 DB 작업은 DB 전용 스레드 풀에서 실행)
+async_repository = AsyncRepository(repository)
 
-# 레거시 크롤러들 (tkinter 사용 가능한 경우에만 추가)
-if LEGACY_CRAWLERS_AVAILABLE:
-    crawlers.update({
-        "moef": LegacyCrawlerWrapper(
-            "기획재정부", "moef", crawl_moef_site, "문서번호"
-        ),
-        "mois": LegacyCrawlerWrapper(
-            "행정안전부", "mois", crawl_mois_site, "문서번호"
-        ),
-        "bai": LegacyCrawlerWrapper(
-            "감사원", "bai", crawl_bai_site, "문서번호"
-        )
-    })
-    logger.info(f"모든 크롤러 사용 가능: {len(crawlers)}개")
-else:
-    logger.warning(f"기본 크롤러만 사용 가능: {len(crawlers)}개 (레거시 크롤러 제외)")
+# 사이트별 크롤러 (크롤링 워커와 같은 레지스트리 사용)
+crawlers = build_crawlers()
 
 crawling_service = CrawlingService(crawlers, repository)
 
-# WebSocket 연결 관리
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+# 크롤링 실행기 (프로세스 격리 모드면 크롤링마다 자식 프로세스에서 실행하여 웹 프로세스 메모리 증가 방지)
+crawl_executor = ProcessCrawlingService(repository) if CRAWL_PROCESS_CONFIG.get("enabled") else crawling_service
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+# WebSocket 연결 관리 (클라이언트별 전송 큐로 동시 전송, 느리거나 끊어진 연결은 제거)
+manager = WebSocketBroadcaster()
 
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+# CDC 변경 피드 서비스 (사이트 테이블 INSERT 시퀀스 기반)
+change_feed_service = ChangeFeedService(db_path=repository.db_path)
 
-    async def send_personal_message(self, message: dict, websocket: WebSocket):
-        await websocket.send_text(json.dumps(message))
+# 사이트 건강도 요약 (리더의 상태 체크 작업이 갱신, 모든 워커가 조회)
+health_service = SiteHealthService(db_path=repository.db_path)
 
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except:
-                # 연결이 끊어진 경우 무시
-                pass
-
-manager = ConnectionManager()
+# 분석용 Parquet 스냅샷 저장소 (pyarrow 미설치 시 비활성)
+snapshot_repository = ParquetSnapshotRepository()
 
 # 새로운 모니터링 시스템 서비스 초기화 (안전한 초기화)
 try:
@@ -169,10 +121,18 @@ try:
     if migration_status['migration_needed']:
         logger.warning("모니터링 시스템 테이블 누락 감지 - 자동 마이그레이션 실행")
         migration.migrate_to_monitoring_system()
+    else:
+        migration.apply_schema_updates()
     
-    # 서비스 초기화 (WebSocket 매니저 전달)
-    scheduler_service = SchedulerService(db_path=repository.db_path, crawling_service=crawling_service)
+    # 서비스 초기화 (WebSocket 매니저를 가진 알림 서비스를 스케줄러/크롤링 서비스와 공유)
     notification_service = NotificationService(db_path=repository.db_path, websocket_manager=manager)
+    crawling_service.notification_service = notification_service
+    # 아웃박스에 등록된 알림을 서버 이벤트 루프에서 발송 (시작 이벤트에서 실행)
+    notification_dispatcher = NotificationDispatcher(notification_service)
+    # PostgreSQL 저장소를 쓰면 리더 리스도 공유 DB에 두어 여러 호스트 간 조정
+    scheduler_service = SchedulerService(db_path=repository.db_path, crawling_service=crawl_executor,
+                                         notification_service=notification_service,
+                                         lease_dsn=getattr(repository, "dsn", None))
     logger.info("모니터링 시스템 서비스 초기화 완료")
     
 except Exception as e:
@@ -180,6 +140,24 @@ except Exception as e:
     # 안전한 더미 서비스로 대체
     scheduler_service = None
     notification_service = None
+    notification_dispatcher = None
+
+# 최근 새로운 문서 프로젝션 (/api/new-data 목록, 알림 서비스와 같은 인스턴스 공유)
+recent_documents = (notification_service.recent_documents if notification_service
+                    else RecentDocuments(db_path=repository.db_path))
+
+# 크롤링 작업 큐 (작업 큐 모드면 스케줄러가 없어도 웹 프로세스에서 크롤링하지 않고 크롤링 워커에 맡김)
+crawl_job_queue = None
+if CRAWL_QUEUE_CONFIG.get("mode") == "queue":
+    crawl_job_queue = (scheduler_service.job_queue if scheduler_service
+                       else create_crawl_job_queue(repository.db_path, getattr(repository, "dsn", None)))
+
+
+def enqueue_manual_crawl(site_key: str) -> bool:
+    """수동 크롤링을 작업 큐에 등록 (같은 사이트가 대기/실행 중이면 False)"""
+    priority = CRAWL_RESOURCE_CONFIG.get("manual_priority_boost", 10)
+    timeout = CRAWL_WATCHDOG_CONFIG.get("default_timeout_seconds", 3600)
+    return crawl_job_queue.enqueue(site_key, True, 1, priority, timeout) is not None
 
 # 사이트 정보 매핑 (동적으로 생성)
 BASE_SITE_INFO = {
@@ -247,13 +225,14 @@ async def site_detail(request: Request, site_key: str):
     })
 
 @app.get("/api/dashboard")
-async def get_dashboard_data():
+async def get_dashboard_data(request: Request):
     """대시보드 데이터 조회"""
     try:
         dashboard_data = []
+        all_stats = await async_repository.get_all_statistics(list(SITE_INFO.keys()), request=request)
         
         for site_key, site_info in SITE_INFO.items():
-            stats = repository.get_statistics(site_key)
+            stats = all_stats.get(site_key, {})
             
             # last_updated 시간을 ISO 형식으로 변환 (시간대 정보 포함)
             last_updated = stats.get("last_updated")
@@ -281,11 +260,14 @@ async def get_dashboard_data():
             "last_refresh": datetime.now().isoformat()
         }
     
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Dashboard data error: {str(e)}")
 
 @app.get("/api/sites/{site_key}/data")
 async def get_site_data(
+    request: Request,
     site_key: str, 
     page: int = 1, 
     limit: int = 50, 
@@ -300,34 +282,35 @@ async def get_site_data(
         if site_key not in SITE_INFO:
             raise HTTPException(status_code=404, detail="Site not found")
         
-        # 필터 조건에 따라 데이터 로드
-        if filter == "recent" and days:
-            # 최근 N일 데이터만 로드
-            data = repository.load_filtered_data(site_key, recent_days=days)
-        elif filter == "range" and start and end:
-            # 날짜 범위 데이터 로드
-            data = repository.load_filtered_data(site_key, start_date=start, end_date=end)
-        else:
-            # 전체 데이터 로드 (메타데이터 포함)
-            data = repository.load_existing_data(site_key, include_metadata=True)
-        
-        # 검색 필터링
-        if search:
-            # 모든 텍스트 컬럼에서 검색
-            text_columns = data.select_dtypes(include=['object']).columns
-            mask = data[text_columns].astype(str).apply(
-                lambda x: x.str.contains(search, case=False, na=False)
-            ).any(axis=1)
-            data = data[mask]
-        
-        # 페이지네이션
-        total_count = len(data)
         start_idx = (page - 1) * limit
         end_idx = start_idx + limit
-        page_data = data.iloc[start_idx:end_idx]
         
-        # JSON 직렬화 가능한 형태로 변환
-        records = page_data.to_dict('records')
+        def load_page():
+            # 필터 조건에 따라 데이터 로드
+            if filter == "recent" and days:
+                # 최근 N일 데이터만 로드
+                data = repository.load_filtered_data(site_key, recent_days=days)
+            elif filter == "range" and start and end:
+                # 날짜 범위 데이터 로드
+                data = repository.load_filtered_data(site_key, start_date=start, end_date=end)
+            else:
+                # 전체 데이터 로드 (메타데이터 포함)
+                data = repository.load_existing_data(site_key, include_metadata=True)
+            
+            # 검색 필터링
+            if search:
+                # 모든 텍스트 컬럼에서 검색
+                text_columns = data.select_dtypes(include=['object']).columns
+                mask = data[text_columns].astype(str).apply(
+                    lambda x: x.str.contains(search, case=False, na=False)
+                ).any(axis=1)
+                data = data[mask]
+            
+            # 페이지네이션 후 JSON 직렬화 가능한 형태로 변환
+            return len(data), data.iloc[start_idx:end_idx].to_dict('records')
+        
+        # 데이터 로드/검색/페이지네이션은 DB 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        total_count, records = await async_repository.run(load_page, request=request)
         
         # 필터 정보 포함
         filter_info = None
@@ -355,6 +338,8 @@ async def get_site_data(
             "filter": filter_info
         }
     
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Site data error: {str(e)}")
 
@@ -366,6 +351,15 @@ async def start_all_crawling():
         logger.info(f"사용 가능한 크롤러: {list(crawlers.keys())}")
         logger.info(f"SITE_INFO 키: {list(SITE_INFO.keys())}")
         
+        # 리더가 아닌 워커는 크롤링을 직접 실행하지 않고 리더에게 전달
+        if scheduler_service and not scheduler_service.is_leader():
+            if not scheduler_service.trigger_manual_crawl(ALL_SITES_KEY):
+                raise HTTPException(status_code=500, detail="리더에게 크롤링 요청 전달 실패")
+            return {
+                "status": "queued",
+                "message": "전체 사이트 크롤링을 스케줄러 리더에게 요청했습니다."
+            }
+        
         # 전체 크롤링 백그라운드 실행
         async def run_all_crawling():
             try:
@@ -453,6 +447,10 @@ async def start_crawling(site_key: str):
             success = scheduler_service.trigger_manual_crawl(site_key)
             if not success:
                 raise HTTPException(status_code=500, detail="크롤링 실행 실패")
+        elif crawl_job_queue:
+            # 작업 큐 모드: 크롤링 워커가 실행 (결과는 스케줄러 리더가 수집)
+            if not await async_repository.run(enqueue_manual_crawl, site_key):
+                raise HTTPException(status_code=500, detail="크롤링 작업 등록 실패 (이미 대기/실행 중일 수 있음)")
         else:
             # 스케줄러 서비스가 없으면 기존 방식 사용
             asyncio.create_task(run_crawling_task(choice))
@@ -468,14 +466,15 @@ async def start_crawling(site_key: str):
         raise HTTPException(status_code=500, detail=f"Crawling start error: {str(e)}")
 
 @app.get("/api/stats")
-async def get_statistics():
+async def get_statistics(request: Request):
     """전체 통계 정보"""
     try:
         total_records = 0
         site_stats = {}
+        all_stats = await async_repository.get_all_statistics(list(SITE_INFO.keys()), request=request)
         
         for site_key, site_info in SITE_INFO.items():
-            stats = repository.get_statistics(site_key)
+            stats = all_stats.get(site_key, {})
             site_count = stats.get("total_count", 0)
             total_records += site_count
             
@@ -488,9 +487,11 @@ async def get_statistics():
         return {
             "total_records": total_records,
             "site_stats": site_stats,
-            "database_info": repository.get_database_info()
+            "database_info": await async_repository.get_database_info(request=request)
         }
     
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Statistics error: {str(e)}")
 
@@ -503,11 +504,37 @@ async def get_schedules():
         if not scheduler_service:
             raise HTTPException(status_code=503, detail="스케줄러 서비스를 사용할 수 없습니다")
         
-        status = scheduler_service.get_schedule_status()
+        status = await async_repository.run(scheduler_service.get_schedule_status)
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"스케줄 조회 실패: {str(e)}")
 
+@app.get("/api/schedules/plan")
+async def get_schedule_plan():
+    """반복 작업 겹침/분산 계획 및 다음 실행 시각 조회"""
+    try:
+        if not scheduler_service:
+            raise HTTPException(status_code=503, detail="스케줄러 서비스를 사용할 수 없습니다")
+        
+        return scheduler_service.get_schedule_plan()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스케줄 계획 조회 실패: {str(e)}")
+
+@app.get("/api/schedules/adaptive")
+async def get_adaptive_schedule_report():
+    """적응형 스케줄 보고서 (사이트별 도착 패턴, 다음 크롤링 시각, 예상 탐지 지연)"""
+    try:
+        if not scheduler_service:
+            raise HTTPException(status_code=503, detail="스케줄러 서비스를 사용할 수 없습니다")
+        
+        return await async_repository.run(scheduler_service.get_adaptive_schedule_report)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"적응형 스케줄 보고서 조회 실패: {str(e)}")
+
 @app.get("/api/schedules/{site_key}")
 async def get_site_schedule(site_key: str):
     """특정 사이트 스케줄 상세 조회"""
@@ -515,7 +542,7 @@ async def get_site_schedule(site_key: str):
         if site_key not in SITE_INFO:
             raise HTTPException(status_code=404, detail="Site not found")
         
-        status = scheduler_service.get_schedule_status(site_key)
+        status = await async_repository.run(scheduler_service.get_schedule_status, site_key)
         return status
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"사이트 스케줄 조회 실패: {str(e)}")
@@ -540,7 +567,8 @@ async def create_or_update_schedule(request: Request):
         if site_key not in SITE_INFO:
             raise HTTPException(status_code=404, detail="Site not found")
         
-        success = scheduler_service.add_crawl_schedule(
+        success = await async_repository.run(
+            scheduler_service.add_crawl_schedule,
             site_key, cron_expression, enabled, priority, notification_threshold
         )
         
@@ -563,7 +591,7 @@ async def delete_schedule(site_key: str):
         if site_key not in SITE_INFO:
             raise HTTPException(status_code=404, detail="Site not found")
         
-        success = scheduler_service.remove_crawl_schedule(site_key)
+        success = await async_repository.run(scheduler_service.remove_crawl_schedule, site_key)
         
         if success:
             return {
@@ -646,11 +674,11 @@ async def get_notification_stats(site_key: str = None):
         raise HTTPException(status_code=500, detail=f"알림 통계 조회 실패: {str(e)}")
 
 @app.get("/api/sites/recent-counts")
-async def get_recent_data_counts(hours: int = 24):
+async def get_recent_data_counts(request: Request, hours: int = 24):
     """각 사이트별 최근 데이터 개수 조회 (각 사이트 테이블 기반)"""
     try:
         # Repository에서 최근 데이터 개수 조회
-        counts = repository.get_recent_data_counts(hours)
+        counts = await async_repository.get_recent_data_counts(hours, request=request)
         
         # 사이트 정보와 함께 반환
         result = {}
@@ -666,136 +694,301 @@ async def get_recent_data_counts(hours: int = 24):
             "total_new_items": sum(counts.values())
         }
         
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"최근 데이터 개수 조회 실패: {str(e)}")
 
 @app.get("/api/new-data")
 async def get_new_data(
+    request: Request,
     site_key: str = None, 
     hours: int = 24, 
-    limit: int = 100
+    limit: int = 100,
+    cursor: int = None,
+    session_id: str = None
 ):
-    """새로운 데이터 조회"""
+    """
+    새로운 데이터 조회 (최근 문서 프로젝션, doc_id 커서 페이지네이션)
+
+    - cursor: 이전 응답의 next_cursor (생략 시 가장 최근 문서부터)
+    - session_id: 지정 시 해당 크롤링 세션에서 발견된 문서만
+    """
     try:
-        import sqlite3
         from datetime import timedelta
         
         # 조회 시간 범위 계산
         cutoff_time = datetime.now() - timedelta(hours=hours)
         
-        with sqlite3.connect(repository.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 쿼리 구성
-            where_conditions = ["discovered_at >= ?"]
-            params = [cutoff_time.isoformat()]
-            
-            if site_key:
-                where_conditions.append("site_key = ?")
-                params.append(site_key)
-            
-            where_clause = " AND ".join(where_conditions)
-            
-            query = f"""
-                SELECT log_id, site_key, data_id, data_title, data_summary,
-                       data_category, data_date, discovered_at, is_important,
-                       notification_sent, tags, metadata
-                FROM new_data_log 
-                WHERE {where_clause}
-                ORDER BY discovered_at DESC
-                LIMIT ?
-            """
-            
-            params.append(limit)
-            cursor.execute(query, params)
-            
-            columns = [desc[0] for desc in cursor.description]
-            new_data = []
-            
-            for row in cursor.fetchall():
-                data_row = dict(zip(columns, row))
-                
-                # JSON 필드 파싱
-                if data_row['tags']:
-                    data_row['tags'] = json.loads(data_row['tags'])
-                if data_row['metadata']:
-                    data_row['metadata'] = json.loads(data_row['metadata'])
-                
-                # 사이트 이름 추가
-                data_row['site_name'] = SITE_INFO.get(data_row['site_key'], {}).get('name', data_row['site_key'])
-                
-                new_data.append(data_row)
+        page, total_count = await asyncio.gather(
+            async_repository.run(recent_documents.list_documents, site_key, session_id, cutoff_time,
+                                 cursor, limit, request=request),
+            async_repository.run(recent_documents.count_documents, site_key, session_id, cutoff_time,
+                                 request=request)
+        )
+        
+        new_data = page["documents"]
+        for data_row in new_data:
+            data_row['notification_sent'] = data_row['notification_id'] is not None
+            # 사이트 이름 추가
+            data_row['site_name'] = SITE_INFO.get(data_row['site_key'], {}).get('name', data_row['site_key'])
         
         return {
             "new_data": new_data,
-            "total_count": len(new_data),
+            "total_count": total_count,
+            "next_cursor": page["next_cursor"],
             "hours": hours,
             "cutoff_time": cutoff_time.isoformat()
         }
         
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"새로운 데이터 조회 실패: {str(e)}")
 
+@app.get("/api/changes")
+async def get_changes(
+    request: Request,
+    since: int = None,
+    limit: int = 500,
+    site_key: str = None,
+    wait: float = 0,
+    include_data: bool = False,
+    consumer: str = None
+):
+    """
+    변경 피드 조회 (시퀀스 기반 커서)
+
+    - since: 이 시퀀스 이후의 변경만 반환 (생략 시 consumer 커서 위치, 둘 다 없으면 0)
+    - wait: 변경이 없을 때 최대 대기 시간(초, 롱폴링)
+    - consumer: 지정 시 반환한 마지막 시퀀스까지 소비자 커서 저장
+    """
+    try:
+        limit = max(1, min(limit, 5000))
+        wait = max(0.0, min(wait, 60.0))
+
+        if since is None:
+            since = await async_repository.run(change_feed_service.get_cursor, consumer) if consumer else 0
+
+        if wait > 0:
+            result = await change_feed_service.wait_for_changes(
+                since, wait, limit, site_key, include_data
+            )
+        else:
+            def read_changes():
+                changes = change_feed_service.get_changes(since, limit, site_key, include_data)
+                changes["latest_seq"] = change_feed_service.get_latest_seq(site_key)
+                return changes
+            result = await async_repository.run(read_changes, request=request)
+
+        if consumer and result["changes"]:
+            await async_repository.run(change_feed_service.commit_cursor, consumer, result["next_seq"])
+
+        result["since"] = since
+        return result
+
+    except QueryCancelledError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"변경 피드 조회 실패: {str(e)}")
+
+@app.get("/api/changes/cursors")
+async def get_change_cursors():
+    """전체 소비자 커서 및 지연 조회"""
+    try:
+        return {
+            "cursors": await async_repository.run(change_feed_service.list_cursors),
+            "latest_seq": await async_repository.run(change_feed_service.get_latest_seq)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"소비자 커서 조회 실패: {str(e)}")
+
+@app.get("/api/changes/cursors/{consumer_id}")
+async def get_change_cursor(consumer_id: str):
+    """소비자 커서 조회"""
+    try:
+        last_seq = await async_repository.run(change_feed_service.get_cursor, consumer_id)
+        latest_seq = await async_repository.run(change_feed_service.get_latest_seq)
+        return {
+            "consumer_id": consumer_id,
+            "last_seq": last_seq,
+            "latest_seq": latest_seq,
+            "lag": max(0, latest_seq - last_seq)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"소비자 커서 조회 실패: {str(e)}")
+
+@app.post("/api/changes/cursors/{consumer_id}")
+async def commit_change_cursor(consumer_id: str, request: Request):
+    """소비자 커서 저장 (처리 완료한 마지막 시퀀스)"""
+    try:
+        body = await request.json()
+        seq = int(body.get("seq", 0))
+
+        if not await async_repository.run(change_feed_service.commit_cursor, consumer_id, seq):
+            raise HTTPException(status_code=500, detail="소비자 커서 저장 실패")
+
+        return {
+            "status": "success",
+            "consumer_id": consumer_id,
+            "last_seq": await async_repository.run(change_feed_service.get_cursor, consumer_id)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"소비자 커서 저장 실패: {str(e)}")
+
+@app.get("/api/archive/status")
+async def get_archive_status():
+    """hot/cold 아카이브 현황 조회"""
+    try:
+        if not scheduler_service:
+            raise HTTPException(status_code=503, detail="모니터링 시스템이 초기화되지 않았습니다")
+        return await async_repository.run(scheduler_service.archive_service.get_archive_status)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"아카이브 현황 조회 실패: {str(e)}")
+
+@app.post("/api/archive/run")
+async def run_archive():
+    """보관 기간이 지난 데이터 즉시 아카이브"""
+    try:
+        if not scheduler_service:
+            raise HTTPException(status_code=503, detail="모니터링 시스템이 초기화되지 않았습니다")
+        return await async_repository.run(scheduler_service.archive_service.run_archive)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"아카이브 실행 실패: {str(e)}")
+
+@app.get("/api/analytics/{site_key}/counts")
+async def get_analytics_counts(
+    request: Request,
+    site_key: str,
+    group_by: str = "month",
+    start_month: str = None,
+    end_month: str = None
+):
+    """
+    스냅샷 기반 그룹별 문서 수 집계 (라이브 DB 미사용)
+
+    - group_by: 쉼표로 구분한 컬럼 (예: 세목,month)
+    - start_month, end_month: YYYY-MM
+    """
+    try:
+        if site_key not in SITE_INFO:
+            raise HTTPException(status_code=404, detail="Site not found")
+        if not snapshot_repository.is_available(site_key):
+            raise HTTPException(status_code=404, detail="분석용 스냅샷이 없습니다 (pyarrow 설치 및 크롤링 필요)")
+
+        columns = [col.strip() for col in group_by.split(",") if col.strip()]
+        counts = await async_repository.run(
+            snapshot_repository.aggregate_counts, site_key, columns, start_month, end_month,
+            request=request
+        )
+
+        return {
+            "site_key": site_key,
+            "site_name": SITE_INFO[site_key]["name"],
+            "group_by": columns,
+            "counts": counts,
+            "total_count": sum(row["count"] for row in counts)
+        }
+    except (HTTPException, QueryCancelledError):
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"분석 집계 실패: {str(e)}")
+
+@app.get("/api/analytics/snapshots")
+async def get_snapshot_status():
+    """사이트별 분석용 스냅샷 현황"""
+    try:
+        sites = await async_repository.run(
+            lambda: {site_key: snapshot_repository.get_snapshot_info(site_key) for site_key in SITE_INFO}
+        )
+        return {
+            "available": snapshot_repository.is_available(),
+            "sites": sites
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스냅샷 현황 조회 실패: {str(e)}")
+
+@app.post("/api/analytics/snapshots/{site_key}")
+async def refresh_snapshot(site_key: str, rebuild: bool = False):
+    """사이트 스냅샷 증분 갱신 (rebuild=true면 전체 재생성)"""
+    try:
+        if site_key not in SITE_INFO:
+            raise HTTPException(status_code=404, detail="Site not found")
+
+        snapshot_service = crawling_service.snapshot_service
+        if not snapshot_service or not snapshot_service.is_enabled():
+            raise HTTPException(status_code=503, detail="스냅샷 기능을 사용할 수 없습니다 (pyarrow 미설치)")
+
+        if rebuild:
+            return await async_repository.run(snapshot_service.rebuild, site_key)
+        return await async_repository.run(snapshot_service.export_incremental, site_key)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스냅샷 갱신 실패: {str(e)}")
+
 @app.get("/api/system-status")
-async def get_system_status():
+async def get_system_status(request: Request):
     """시스템 상태 조회"""
     try:
-        import sqlite3
-        
         # 스케줄러 상태 확인
         scheduler_status = {
             "scheduler_running": scheduler_service.is_running() if scheduler_service else False,
             "active_jobs": len(scheduler_service.scheduler.get_jobs()) if scheduler_service and scheduler_service.is_running() else 0,
-            "service_available": scheduler_service is not None
+            "service_available": scheduler_service is not None,
+            # 크롤링 대기열 깊이, 자원 풀 사용량, 대기 시간
+            "job_queue": scheduler_service.get_queue_status() if scheduler_service else None,
+            # 리더 선출 상태 (이 워커가 예약 작업을 실행하는 리더인지, 현재 리더와 전달 대기 요청 수)
+            "leader": await async_repository.run(scheduler_service.get_leader_status) if scheduler_service else None
         }
         
-        # 시스템 상태 테이블 확인
+        # WebSocket 연결 수, 클라이언트별 대기 메시지/지연 시간
+        websocket_status = manager.get_stats()
+        
+        # 시스템 상태 + 건강도 요약 (원본 실행 로그는 상태 체크 작업에서만 집계)
+        def load_system_status():
+            system_status = health_service.get_system_status()
+            if system_status is None:
+                # system_status 테이블이 없으면 기본 상태 반환
+                return [{
+                    'site_key': site_key,
+                    'site_name': site_info['name'],
+                    'component_type': 'crawler',
+                    'status': 'unknown',
+                    'health_score': 50,
+                    'last_check': None,
+                    'error_message': 'system_status 테이블 없음'
+                } for site_key, site_info in SITE_INFO.items()]
+            
+            for status_row in system_status:
+                # 사이트 이름 추가
+                status_row['site_name'] = SITE_INFO.get(status_row['site_key'], {}).get('name', status_row['site_key'])
+            return system_status
+        
         system_status = []
         try:
-            with sqlite3.connect(repository.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 테이블 존재 확인
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='system_status'")
-                if cursor.fetchone():
-                    # 시스템 상태 조회
-                    cursor.execute("""
-                        SELECT site_key, component_type, status, last_check, last_success,
-                               last_error, error_message, consecutive_errors, health_score,
-                               uptime_seconds, response_time_ms
-                        FROM system_status
-                        ORDER BY site_key, component_type
-                    """)
-                    
-                    columns = [desc[0] for desc in cursor.description]
-                    
-                    for row in cursor.fetchall():
-                        status_row = dict(zip(columns, row))
-                        # 사이트 이름 추가
-                        status_row['site_name'] = SITE_INFO.get(status_row['site_key'], {}).get('name', status_row['site_key'])
-                        system_status.append(status_row)
-                else:
-                    # system_status 테이블이 없으면 기본 상태 반환
-                    for site_key, site_info in SITE_INFO.items():
-                        system_status.append({
-                            'site_key': site_key,
-                            'site_name': site_info['name'],
-                            'component_type': 'crawler',
-                            'status': 'unknown',
-                            'health_score': 50,
-                            'last_check': None,
-                            'error_message': 'system_status 테이블 없음'
-                        })
+            system_status = await async_repository.run(load_system_status, request=request)
         except sqlite3.Error as db_error:
             logger.warning(f"시스템 상태 DB 조회 실패: {db_error}")
         
         return {
             "system_status": system_status,
             "scheduler_status": scheduler_status,
+            "websocket_status": websocket_status,
             "timestamp": datetime.now().isoformat(),
             "monitoring_available": scheduler_service is not None
         }
         
+    except QueryCancelledError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"시스템 상태 조회 실패: {str(e)}")
 
@@ -803,7 +996,7 @@ async def get_system_status():
 async def get_job_history(site_key: str = None, limit: int = 50):
     """작업 이력 조회"""
     try:
-        history = scheduler_service.get_job_history(site_key, limit)
+        history = await async_repository.run(scheduler_service.get_job_history, site_key, limit)
         
         # 사이트 이름 추가
         for item in history:
@@ -821,7 +1014,7 @@ async def get_job_history(site_key: str = None, limit: int = 50):
 async def clear_job_history():
     """크롤링 진행현황 모두 삭제"""
     try:
-        success = scheduler_service.clear_job_history()
+        success = await async_repository.run(scheduler_service.clear_job_history)
         
         if success:
             return {
@@ -846,6 +1039,12 @@ async def start_scheduler():
         
         scheduler_service.start()
         
+        if not scheduler_service.is_leader():
+            return {
+                "status": "standby",
+                "message": "다른 워커가 스케줄러 리더입니다 - 리더가 중단되면 이 워커가 인계받습니다"
+            }
+        
         # 시스템 알림 발송
         await notification_service.send_system_notification(
             "스케줄러가 시작되었습니다", "normal", "system"
@@ -888,29 +1087,20 @@ async def stop_scheduler():
 async def get_email_settings():
     """이메일 설정 조회"""
     try:
-        with sqlite3.connect(repository.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM email_settings 
-                ORDER BY is_primary DESC, created_at
-            """)
+        settings = await async_repository.fetch_all("""
+            SELECT * FROM email_settings 
+            ORDER BY is_primary DESC, created_at
+        """)
+        
+        for setting in settings:
+            # 비밀번호 관련 필드는 클라이언트에 전송하지 않음
+            setting.pop('encrypted_password', None)
             
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            
-            settings = []
-            for row in rows:
-                setting = dict(zip(columns, row))
-                # 비밀번호 관련 필드는 클라이언트에 전송하지 않음
-                setting.pop('encrypted_password', None)
-                
-                # JSON 필드 파싱
-                if setting.get('notification_types'):
-                    setting['notification_types'] = json.loads(setting['notification_types'])
-                
-                settings.append(setting)
-            
-            return settings
+            # JSON 필드 파싱
+            if setting.get('notification_types'):
+                setting['notification_types'] = json.loads(setting['notification_types'])
+        
+        return settings
             
     except Exception as e:
         logger.error(f"이메일 설정 조회 실패: {e}")
@@ -942,53 +1132,57 @@ async def save_email_settings(request: Request):
         except (ValueError, TypeError):
             raise HTTPException(status_code=400, detail="올바른 포트 번호를 입력해주세요 (1-65535)")
         
-        with sqlite3.connect(repository.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 기존 설정 확인
-            cursor.execute("SELECT setting_id FROM email_settings WHERE email_address = ?", 
-                         (data['email_address'],))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # 기존 설정 업데이트
-                cursor.execute("""
-                    UPDATE email_settings 
-                    SET smtp_server = ?, smtp_port = ?, smtp_username = ?, use_tls = ?,
-                        is_active = ?, notification_types = ?, min_data_threshold = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE email_address = ?
-                """, (
-                    data['smtp_server'],
-                    port,
-                    data.get('smtp_username', ''),
-                    data.get('use_tls', True),
-                    data.get('is_active', True),
-                    data.get('notification_types', '["new_data"]'),
-                    data.get('min_data_threshold', 1),
-                    data['email_address']
-                ))
-                setting_id = existing[0]
-            else:
-                # 새 설정 생성
-                cursor.execute("""
-                    INSERT INTO email_settings 
-                    (email_address, smtp_server, smtp_port, smtp_username, use_tls,
-                     is_active, notification_types, min_data_threshold)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data['email_address'],
-                    data['smtp_server'],
-                    port,
-                    data.get('smtp_username', ''),
-                    data.get('use_tls', True),
-                    data.get('is_active', True),
-                    data.get('notification_types', '["new_data"]'),
-                    data.get('min_data_threshold', 1)
-                ))
-                setting_id = cursor.lastrowid
-            
-            conn.commit()
+        def save_setting():
+            with sqlite3.connect(repository.db_path) as conn:
+                cursor = conn.cursor()
+                
+                # 기존 설정 확인
+                cursor.execute("SELECT setting_id FROM email_settings WHERE email_address = ?", 
+                             (data['email_address'],))
+                existing = cursor.fetchone()
+                
+                if existing:
+                    # 기존 설정 업데이트
+                    cursor.execute("""
+                        UPDATE email_settings 
+                        SET smtp_server = ?, smtp_port = ?, smtp_username = ?, use_tls = ?,
+                            is_active = ?, notification_types = ?, min_data_threshold = ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE email_address = ?
+                    """, (
+                        data['smtp_server'],
+                        port,
+                        data.get('smtp_username', ''),
+                        data.get('use_tls', True),
+                        data.get('is_active', True),
+                        data.get('notification_types', '["new_data"]'),
+                        data.get('min_data_threshold', 1),
+                        data['email_address']
+                    ))
+                    setting_id = existing[0]
+                else:
+                    # 새 설정 생성
+                    cursor.execute("""
+                        INSERT INTO email_settings 
+                        (email_address, smtp_server, smtp_port, smtp_username, use_tls,
+                         is_active, notification_types, min_data_threshold)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        data['email_address'],
+                        data['smtp_server'],
+                        port,
+                        data.get('smtp_username', ''),
+                        data.get('use_tls', True),
+                        data.get('is_active', True),
+                        data.get('notification_types', '["new_data"]'),
+                        data.get('min_data_threshold', 1)
+                    ))
+                    setting_id = cursor.lastrowid
+                
+                conn.commit()
+            return setting_id
+        
+        setting_id = await async_repository.run(save_setting)
         
         return {
             "status": "success",
@@ -1002,6 +1196,53 @@ async def save_email_settings(request: Request):
         logger.error(f"이메일 설정 저장 실패: {e}")
         raise HTTPException(status_code=500, detail=f"이메일 설정 저장 실패: {str(e)}")
 
+@app.get("/api/email-settings/{setting_id}/subscriptions")
+async def get_email_subscriptions(setting_id: int):
+    """이메일 수신자의 세목/키워드 구독 규칙 조회"""
+    try:
+        return await async_repository.run(notification_service.subscriptions.list_rules, setting_id)
+    except Exception as e:
+        logger.error(f"구독 규칙 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"구독 규칙 조회 실패: {str(e)}")
+
+@app.post("/api/email-settings/{setting_id}/subscriptions")
+async def add_email_subscription(setting_id: int, request: Request):
+    """
+    이메일 수신자의 구독 규칙 추가
+
+    규칙이 하나라도 있는 수신자는 규칙에 일치한 새로운 데이터만 이메일로 받음
+    (rule_type: 'tax_type' = 세목 일치, 'keyword' = 제목/요약에 키워드 포함, site_key 생략 시 전체 사이트)
+    """
+    try:
+        data = await request.json()
+        rule_id = await async_repository.run(
+            notification_service.subscriptions.add_rule,
+            setting_id, data.get('rule_type'), data.get('pattern'), data.get('site_key')
+        )
+        return {
+            "status": "success",
+            "message": "구독 규칙이 추가되었습니다",
+            "rule_id": rule_id
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"구독 규칙 추가 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"구독 규칙 추가 실패: {str(e)}")
+
+@app.delete("/api/email-settings/{setting_id}/subscriptions/{rule_id}")
+async def delete_email_subscription(setting_id: int, rule_id: int):
+    """이메일 수신자의 구독 규칙 삭제"""
+    try:
+        deleted = await async_repository.run(notification_service.subscriptions.delete_rule, rule_id, setting_id)
+    except Exception as e:
+        logger.error(f"구독 규칙 삭제 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"구독 규칙 삭제 실패: {str(e)}")
+
+    if not deleted:
+        raise HTTPException(status_code=404, detail="구독 규칙을 찾을 수 없습니다")
+    return {"status": "success", "message": "구독 규칙이 삭제되었습니다"}
+
 @app.post("/api/email-settings/test")
 async def send_test_email(request: Request):
     """테스트 이메일 발송"""
@@ -1030,7 +1271,17 @@ async def send_test_email(request: Request):
         raise HTTPException(status_code=500, detail=f"테스트 이메일 발송 실패: {str(e)}")
 
 async def run_crawling_task(choice: str):
-    """크롤링 작업 실행 (비동기)"""
+    """크롤링 작업 실행 (비동기, 작업 큐 모드면 크롤링 워커에 등록)"""
+    if crawl_job_queue:
+        site_key = next((key for key, value in SITE_CHOICES.items() if value == choice), None)
+        if site_key is None or not await async_repository.run(enqueue_manual_crawl, site_key):
+            await manager.broadcast({
+                "type": "crawl_error",
+                "error": f"크롤링 작업 등록 실패: {choice}",
+                "timestamp": datetime.now().isoformat()
+            })
+        return
+    
     try:
         await manager.broadcast({
             "type": "crawl_start",
@@ -1042,72 +1293,17 @@ async def run_crawling_task(choice: str):
         import asyncio
         import concurrent.futures
         
-        # WebSocket 연동 진행상황 콜백 (Thread-safe 실시간 웹 피드백)
-        class WebSocketProgress:
-            def __init__(self, loop, manager, choice):
-                self.value = 0
-                self.loop = loop
-                self.manager = manager
-                self.choice = choice
-            
-            def update(self):
-                # Thread-safe WebSocket 전송
-                try:
-                    message = {
-                        "type": "crawl_progress",
-                        "choice": self.choice,
-                        "progress": self.value,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    # asyncio.run_coroutine_threadsafe로 비동기 작업 스케줄링
-                    asyncio.run_coroutine_threadsafe(
-                        self.manager.broadcast(message), 
-                        self.loop
-                    )
-                except Exception as e:
-                    logger.error(f"진행률 WebSocket 전송 오류: {e}")
-        
-        class WebSocketStatus:
-            def __init__(self, loop, manager, choice):
-                self.text = ""
-                self.loop = loop
-                self.manager = manager
-                self.choice = choice
-            
-            def config(self, text):
-                self.text = text
-                # Thread-safe WebSocket 전송
-                try:
-                    message = {
-                        "type": "crawl_status",
-                        "choice": self.choice,
-                        "status": text,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    # asyncio.run_coroutine_threadsafe로 비동기 작업 스케줄링
-                    asyncio.run_coroutine_threadsafe(
-                        self.manager.broadcast(message), 
-                        self.loop
-                    )
-                except Exception as e:
-                    logger.error(f"상태 WebSocket 전송 오류: {e}")
-            
-            def update(self):
-                # 상태 업데이트 시에도 전송
-                if self.text:
-                    self.config(self.text)
+        # 진행 상황 스트림 (크롤링 스레드의 진행률/상태를 모아 변경된 필드만 제한된 빈도로 WebSocket 전송)
+        loop = asyncio.get_running_loop()
+        stream = CrawlProgressStream(choice, manager.broadcast, loop)
         
         def run_sync_crawling():
             """동기 크롤링 실행 (Thread-safe WebSocket 연동)"""
             try:
-                # 현재 이벤트 루프를 가져와서 WebSocket 연동 진행상황 객체 생성
-                progress = WebSocketProgress(loop, manager, choice)
-                status = WebSocketStatus(loop, manager, choice)
-                
                 logger.info(f"크롤링 실행 시작: choice={choice}")
                 
                 # 크롤링 실행
-                crawling_service.execute_crawling(choice, progress, status, is_periodic=False)
+                crawl_executor.execute_crawling(choice, stream.progress, stream.status, is_periodic=False)
                 logger.info(f"크롤링 실행 완료: choice={choice}")
                 return {"status": "success", "message": "크롤링 완료"}
                 
@@ -1119,9 +1315,12 @@ async def run_crawling_task(choice: str):
                 return {"status": "error", "error": str(e)}
         
         # ThreadPoolExecutor로 동기 함수를 비동기 실행
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(executor, run_sync_crawling)
+        try:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                result = await loop.run_in_executor(executor, run_sync_crawling)
+        finally:
+            # 완료/오류 알림 전에 남은 진행 상황 전송
+            await stream.close()
         
         # 결과에 따른 알림
         if result["status"] == "success":
@@ -1257,6 +1456,9 @@ async def websocket_endpoint(websocket: WebSocket):
             await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+    except RuntimeError:
+        # 느린 연결로 제거되어 서버가 먼저 소켓을 닫은 경우
+        manager.disconnect(websocket)
 
 @app.on_event("startup")
 async def startup_event():
@@ -1264,15 +1466,25 @@ async def startup_event():
     logger.info("FastAPI 서버 시작")
     logger.info("웹 인터페이스: http://localhost:8001")
     
-    # 스케줄러 시작
+    # 알림 디스패처 시작 (이전 실행에서 발송하지 못한 알림도 이어서 발송)
     try:
+        notification_dispatcher.start()
+    except Exception as e:
+        logger.error(f"알림 디스패처 시작 실패: {e}")
+    
+    # 스케줄러 시작 (서버 이벤트 루프에서 트리거 처리 및 알림 발송)
+    try:
+        scheduler_service.attach_event_loop(asyncio.get_running_loop())
         scheduler_service.start()
-        logger.info("자동 스케줄러 시작됨")
         
-        # 시스템 시작 알림
-        await notification_service.send_system_notification(
-            "모니터링 시스템이 시작되었습니다", "normal", "system"
-        )
+        # 여러 워커 중 리더만 예약 작업 실행 및 시작 알림 발송 (나머지는 HTTP 처리 + 리더 대기)
+        if scheduler_service.is_leader():
+            logger.info("자동 스케줄러 시작됨 (리더)")
+            await notification_service.send_system_notification(
+                "모니터링 시스템이 시작되었습니다", "normal", "system"
+            )
+        else:
+            logger.info("자동 스케줄러 대기 모드 (다른 워커가 리더)")
     except Exception as e:
         logger.error(f"스케줄러 시작 실패: {e}")
 
@@ -1281,13 +1493,37 @@ async def shutdown_event():
     """서버 종료 시 이벤트"""
     logger.info("FastAPI 서버 종료")
     
-    # 스케줄러 중지
+    # 스케줄러 중지 (리더 리스 반납 포함)
     try:
-        if scheduler_service.is_running():
-            scheduler_service.stop()
-            logger.info("스케줄러 정상 종료됨")
+        scheduler_service.stop()
+        logger.info("스케줄러 정상 종료됨")
     except Exception as e:
         logger.error(f"스케줄러 종료 실패: {e}")
+    
+    # 알림 디스패처 종료 (진행 중 발송 결과 기록 후 종료)
+    try:
+        await notification_dispatcher.stop()
+    except Exception as e:
+        logger.error(f"알림 디스패처 종료 실패: {e}")
+    
+    # WebSocket 연결 종료 (클라이언트별 전송 태스크 정리)
+    try:
+        await manager.close_all()
+    except Exception as e:
+        logger.error(f"WebSocket 연결 종료 실패: {e}")
+    
+    # 작업 스레드의 코루틴 전달 대상 해제
+    set_main_loop(None)
+    
+    # DB 전용 스레드 풀 종료
+    shutdown_db_executor()
+    
+    # 유지 중인 SMTP 연결 종료
+    shutdown_email_delivery()
+    
+    # PostgreSQL 연결 풀 종료
+    if hasattr(repository, 'close'):
+        repository.close()
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
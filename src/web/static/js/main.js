@@ -5,6 +5,7 @@ class TaxCrawlerApp {
     constructor() {
         this.ws = null;
         this.isConnected = false;
+        this.crawlProgressState = {};
         this.init();
     }
 
@@ -80,12 +81,16 @@ class TaxCrawlerApp {
         switch (data.type) {
             case 'crawl_start':
                 this.showNotification(`크롤링 시작: ${this.getCrawlChoiceName(data.choice)}`, 'info');
+                this.crawlProgressState = {};
                 this.updateCrawlStatus('진행 중...', 0);
                 this.showCrawlStatusContainer(true);
                 break;
                 
             case 'crawl_progress':
-                this.updateCrawlProgress(data.progress);
+                // 변경된 필드만 전송되므로 이전 상태에 병합 (null은 해당 필드 초기화)
+                this.crawlProgressState = { ...this.crawlProgressState, ...data };
+                this.updateCrawlStatus(this.formatCrawlProgress(this.crawlProgressState),
+                                       this.crawlProgressState.progress ?? null);
                 break;
                 
             case 'crawl_status':
@@ -109,6 +114,20 @@ class TaxCrawlerApp {
         }
     }
 
+    formatCrawlProgress(state) {
+        // 구조화된 진행 상황을 표시 문구로 변환
+        const parts = [];
+        if (state.message) parts.push(state.message);
+        else if (state.site) parts.push(state.site);
+        if (state.page != null && state.pages != null) parts.push(`페이지 ${state.page}/${state.pages}`);
+        if (state.eta_seconds != null) {
+            const minutes = Math.floor(state.eta_seconds / 60);
+            const seconds = state.eta_seconds % 60;
+            parts.push(`남은 시간 약 ${minutes > 0 ? `${minutes}분 ` : ''}${seconds}초`);
+        }
+        return parts.join(' · ') || '진행 중...';
+    }
+
     getCrawlChoiceName(choice) {
         const choices = {
             '1': '조세심판원',
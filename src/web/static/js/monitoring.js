@@ -451,8 +451,8 @@ class MonitoringApp {
     }
     
     handleCrawlProgress(message) {
-        // 진행률 표시 (필요한 경우)
-        console.log(`크롤링 진행률: ${message.progress}%`);
+        // 진행률 표시 (변경된 필드만 전송됨: site, stage, page, items, progress, eta_seconds 등)
+        console.log('크롤링 진행 상황:', message);
     }
     
     handleCrawlStatus(message) {
@@ -597,7 +597,7 @@ class MonitoringApp {
     
     async loadNewDataCount() {
         try {
-            const response = await fetch('/api/new-data?hours=24&limit=1000');
+            const response = await fetch('/api/new-data?hours=24&limit=1');
             const data = await response.json();
             
             const newDataElement = document.getElementById('newDataCount');
@@ -0,0 +1,23 @@
+"""
+테스트 공용 fixture
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+@pytest.fixture
+def monitoring_db(tmp_path) -> str:
+    """사이트 테이블과 모니터링 시스템 테이블을 만든 임시 데이터베이스 경로 (마이그레이션 백업도 tmp_path 아래에 생성)"""
+    from src.repositories.sqlite_repository import SQLiteRepository
+    from src.database.migrations import DatabaseMigration
+
+    db_path = str(tmp_path / "test.db")
+    SQLiteRepository(db_path)
+    DatabaseMigration(db_path).migrate_to_monitoring_system()
+    return db_path
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+적응형 크롤링 스케줄 테스트 스크립트
+
+도착률 모델의 구간 적분, 다음 크롤링 시각 계산(최소/최대 간격), new_data_log 기반 도착률 학습을 확인
+"""
+
+import os
+import sys
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.adaptive_schedule_service import AdaptiveScheduleService, ArrivalModel, HOURS_PER_WEEK
+
+MONDAY = datetime(2026, 10, 12)  # 월요일 0시 (버킷 0)
+CONFIG = {"enabled": True, "min_observations": 3, "target_arrivals_per_crawl": 1.0,
+          "min_interval_minutes": 60, "max_interval_hours": 24, "prior_weight_weeks": 0.0}
+
+
+def _model(rates_by_bucket: dict) -> ArrivalModel:
+    model = ArrivalModel("moef")
+    for bucket, rate in rates_by_bucket.items():
+        model.rates[bucket] = rate
+    return model
+
+
+def test_arrival_model_integrates_rates_per_hour_bucket():
+    """예상 도착 건수와 지연 합은 시간 버킷 경계를 넘어 구간별로 적분"""
+    model = _model({0: 2.0, 1: 2.0, 2: 2.0, 3: 4.0})
+
+    assert model.expected_arrivals(MONDAY, MONDAY + timedelta(hours=3)) == pytest.approx(6.0)
+    assert model.expected_arrivals(MONDAY + timedelta(minutes=150), MONDAY + timedelta(minutes=210)) \
+        == pytest.approx(2.0 * 0.5 + 4.0 * 0.5)
+    # 일정한 도착률 r로 T시간 동안 도착한 문서의 지연 합 = r T² / 2
+    assert model.delay_mass(MONDAY, MONDAY + timedelta(hours=3)) == pytest.approx(9.0)
+    assert model.weekly_arrivals == pytest.approx(10.0)
+    print("✅ 도착률 구간 적분")
+
+
+def test_next_crawl_waits_for_target_arrivals_within_interval_bounds():
+    """누적 예상 도착이 목표에 닿는 시각에 크롤링하되 최소/최대 간격 범위를 지킴"""
+    service = AdaptiveScheduleService(db_path="", config=CONFIG)
+
+    # 월요일 10시에만 시간당 4건 → 8시 크롤링 후 다음 크롤링은 10:15
+    model = _model({10: 4.0})
+    assert service._plan_next(model, MONDAY + timedelta(hours=8)) == MONDAY + timedelta(hours=10, minutes=15)
+
+    # 도착이 잦아도 최소 간격 이전에는 크롤링하지 않음
+    busy = _model({bucket: 10.0 for bucket in range(HOURS_PER_WEEK)})
+    assert service._plan_next(busy, MONDAY) == MONDAY + timedelta(hours=1)
+
+    # 도착이 없으면 최대 간격으로 확인
+    assert service._plan_next(ArrivalModel("moef"), MONDAY) == MONDAY + timedelta(hours=24)
+    print("✅ 다음 크롤링 시각 계산")
+
+
+def test_learns_rates_from_discoveries_between_crawls(monitoring_db):
+    """발견 문서는 직전 성공 크롤링~발견 시각 구간의 시간 버킷에 균등 분배되어 학습"""
+    with sqlite3.connect(monitoring_db) as conn:
+        for week in range(2):
+            day = MONDAY + timedelta(weeks=week)
+            for hour in (10, 12):
+                conn.execute("""
+                    INSERT INTO crawl_execution_log (site_key, execution_type, start_time, end_time, status)
+                    VALUES ('moef', 'scheduled', ?, ?, 'success')
+                """, ((day + timedelta(hours=hour)).isoformat(), (day + timedelta(hours=hour)).isoformat()))
+            for index in range(2):
+                conn.execute("""
+                    INSERT INTO new_data_log (site_key, data_id, data_title, discovered_at)
+                    VALUES ('moef', ?, '제목', ?)
+                """, (f"W{week}-{index}", (day + timedelta(hours=12)).isoformat()))
+
+    service = AdaptiveScheduleService(db_path=monitoring_db, config=CONFIG)
+    now = MONDAY + timedelta(weeks=2, hours=10)  # 첫 크롤링(월요일 10시)부터 정확히 2주
+    model = service.learn_arrival_rates("moef", now=now)
+
+    assert model.observations == 4
+    assert model.weeks_observed == pytest.approx(2.0)
+    # 주마다 10~12시 구간에 2건 → 10시/11시 버킷에 주당 1건씩
+    assert model.rates[10] == pytest.approx(1.0) and model.rates[11] == pytest.approx(1.0)
+    assert model.weekly_arrivals == pytest.approx(2.0)
+
+    service._models["moef"] = model
+    assert service.is_enabled_for("moef")
+    assert not AdaptiveScheduleService(db_path=monitoring_db, config={**CONFIG, "min_observations": 5}) \
+        .is_enabled_for("moef")
+    print(f"✅ 도착률 학습: 관측 {model.observations}건, {model.weeks_observed}주")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
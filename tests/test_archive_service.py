@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+아카이브(hot/cold 계층) 테스트 스크립트
+
+보관 기간이 지난 행을 연도별 아카이브로 이동한 뒤에도 신규 데이터 판별과 기존 데이터 조회가 아카이브를 함께 보는지 확인
+"""
+
+import os
+import sys
+import sqlite3
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.repositories.sqlite_repository import SQLiteRepository
+from src.services.archive_service import ArchiveService
+
+
+def _moef_rows(numbers: list, created_at: str = None) -> pd.DataFrame:
+    df = pd.DataFrame({
+        "문서번호": numbers,
+        "회신일자": ["2020-01-01"] * len(numbers),
+        "제목": [f"제목 {number}" for number in numbers],
+        "링크": [f"http://example.com/{number}" for number in numbers],
+    })
+    if created_at:
+        df["created_at"] = created_at
+    return df
+
+
+def test_archived_keys_are_not_new_and_still_loaded(tmp_path):
+    """아카이브된 키는 신규로 판별되지 않고, 기존 데이터 조회에는 hot/아카이브 행이 모두 포함"""
+    db_path = str(tmp_path / "test.db")
+    repository = SQLiteRepository(db_path)
+    assert repository.save_data("moef", _moef_rows(["M1", "M2"], "2020-03-01 09:00:00"))
+    assert repository.save_data("moef", _moef_rows(["M3"]))
+
+    archive = ArchiveService(db_path, {"archive_folder": str(tmp_path / "archive")})
+    cutoff = "2024-01-01"
+    assert archive._archive_table_year("moef_data", "created_at", cutoff, "2020") == 2
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM moef_data").fetchone()[0] == 1
+        manifest = conn.execute("SELECT archive_year, row_count FROM archive_manifest").fetchall()
+    assert manifest == [("2020", 2)]
+    assert os.path.exists(archive.get_archive_path("2020"))
+
+    new_entries = repository.compare_and_get_new_entries("moef", _moef_rows(["M1", "M3", "M4"]), "문서번호")
+    assert new_entries["문서번호"].tolist() == ["M4"]
+
+    existing = repository.load_existing_data("moef")
+    assert sorted(existing["문서번호"]) == ["M1", "M2", "M3"]
+    assert len(repository.load_existing_data("moef", include_archive=False)) == 1
+
+    # 재크롤링된 아카이브 문서는 다시 저장되지 않음
+    assert repository.save_data("moef", _moef_rows(["M2", "M4"]))
+    assert sorted(repository.load_existing_data("moef")["문서번호"]) == ["M1", "M2", "M3", "M4"]
+    print(f"✅ 아카이브 후 신규 판별/조회: {len(existing)}개")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
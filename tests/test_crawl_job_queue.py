@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+크롤링 작업 큐 결과 대기 테스트 스크립트
+
+작업 큐 모드에서 리더의 결과 수집 없이도 crawl_jobs 상태로 결과 확인, 대기 기한 초과, 리더 자격 상실 시 대기 중단을 확인
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.config.settings import CRAWL_QUEUE_CONFIG
+from src.services.crawl_job_queue import SQLCrawlJobQueue, JOB_SUCCEEDED, JOB_FAILED
+
+
+@pytest.fixture
+def scheduler(monitoring_db, monkeypatch):
+    from src.services.scheduler_service import SchedulerService
+
+    db_path = monitoring_db
+    monkeypatch.setitem(CRAWL_QUEUE_CONFIG, "result_poll_seconds", 0.05)
+
+    service = SchedulerService(db_path=db_path)
+    service.job_queue = SQLCrawlJobQueue(db_path)
+    yield service
+    service.dispatcher.shutdown(wait=True)
+
+
+def _finish_job(queue: SQLCrawlJobQueue, status: str, result=None, error_message=None):
+    """크롤링 워커처럼 작업을 할당받아 결과 기록"""
+    job = queue.claim("worker-1")
+    assert job is not None
+    assert queue.complete(job["id"], "worker-1", status, result=result, error_message=error_message)
+    return job
+
+
+def test_wait_reads_finished_job_without_leader_collection(scheduler):
+    """결과를 수집하는 리더가 없어도 crawl_jobs의 완료 상태와 결과로 대기 종료"""
+    result = {"results": [{"site_key": "moef", "status": "success", "new_count": 2}]}
+    future = scheduler._enqueue_crawl_job("moef")
+    _finish_job(scheduler.job_queue, JOB_SUCCEEDED, result=result)
+
+    assert scheduler._wait_for_crawl_result(future) == result
+    assert future.job_id not in scheduler._queue_futures
+
+    failed = scheduler._enqueue_crawl_job("mois")
+    _finish_job(scheduler.job_queue, JOB_FAILED, error_message="접속 실패")
+    with pytest.raises(RuntimeError, match="접속 실패"):
+        scheduler._wait_for_crawl_result(failed)
+    print("✅ crawl_jobs 상태로 결과 확인")
+
+
+def test_wait_gives_up_after_deadline(scheduler):
+    """워커가 작업을 끝내지 않으면 대기 기한 이후 TimeoutError"""
+    future = scheduler._enqueue_crawl_job("moef")
+    assert future.deadline > time.time()
+    future.deadline = time.time() + 0.1
+
+    with pytest.raises(TimeoutError):
+        scheduler._wait_for_crawl_result(future)
+    assert scheduler._queue_futures == {}
+    print("✅ 대기 기한 초과 처리")
+
+
+def test_leader_demotion_fails_pending_futures(scheduler):
+    """리더 자격을 잃으면 결과를 기다리던 Future를 실패 처리하고 비움 (작업은 큐에 남아 워커가 실행)"""
+    future = scheduler._enqueue_crawl_job("moef")
+    assert scheduler._queue_futures
+
+    scheduler._on_leader_demoted()
+
+    assert scheduler._queue_futures == {}
+    with pytest.raises(RuntimeError, match="리더 자격 상실"):
+        scheduler._wait_for_crawl_result(future)
+    assert scheduler.job_queue.get_job(future.job_id)["status"] == "queued"
+    print("✅ 리더 자격 상실 시 대기 중단")
+
+
+
+def test_enqueue_allows_one_active_job_per_site(tmp_path):
+    """여러 스케줄러가 동시에 등록해도 사이트별 대기/실행 중 작업은 한 건 (완료 후에는 다시 등록 가능)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    db_path = str(tmp_path / "queue.db")
+    queues = [SQLCrawlJobQueue(db_path) for _ in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        job_ids = list(executor.map(lambda queue: queue.enqueue("moef"), queues * 5))
+
+    assert len([job_id for job_id in job_ids if job_id is not None]) == 1
+    assert queues[0].enqueue("mois") is not None
+
+    _finish_job(queues[0], JOB_SUCCEEDED, result={"results": []})
+    _finish_job(queues[0], JOB_SUCCEEDED, result={"results": []})
+    assert queues[1].enqueue("moef") is not None
+    print("✅ 사이트별 단일 활성 작업")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
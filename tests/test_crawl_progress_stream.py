@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+크롤링 진행 상황 스트림 테스트 스크립트
+
+연속 업데이트가 제한된 빈도로 묶여 전송되는지, 메시지에 마지막 전송 이후 바뀐 필드만 담기는지 확인
+"""
+
+import os
+import sys
+import asyncio
+import threading
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.crawl_progress_stream import CrawlProgressStream
+
+CONFIG = {"max_updates_per_second": 10, "eta_min_progress": 3}
+
+
+def test_updates_are_rate_limited_and_carry_only_changed_fields():
+    """한 번에 몰린 업데이트는 한 메시지로, 전송 간격 안의 변경은 다음 전송으로 미뤄지고 바뀐 필드만 포함"""
+    async def scenario():
+        messages = []
+
+        async def publish(message):
+            messages.append(message)
+
+        stream = CrawlProgressStream("moef", publish, config=CONFIG)
+        stream.status.report("목록 수집 중", site="moef", stage="list", page=1)
+        for value in range(1, 21):
+            stream.progress(value)
+        await asyncio.sleep(0.02)
+        first_count = len(messages)
+
+        # 같은 값 재전송은 메시지를 만들지 않음
+        stream.progress(20)
+        stream.status.report("목록 수집 중", site="moef", page=1)
+        await asyncio.sleep(0.15)
+        unchanged_count = len(messages)
+
+        # 전송 간격 안의 변경은 간격이 지난 뒤 전송 (다른 스레드에서 호출해도 됨)
+        worker = threading.Thread(target=stream.progress, args=(40,))
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0.02)
+        throttled_count = len(messages)
+        await asyncio.sleep(0.15)
+
+        # 사이트가 바뀌면 이전 사이트의 페이지 값은 지워진 것으로 전송, 종료 시 대기 중인 변경 즉시 전송
+        stream.status.report("mois 시작", site="mois", stage="list")
+        await stream.close()
+        stream.progress(90)
+        await asyncio.sleep(0.15)
+        return stream, messages, first_count, unchanged_count, throttled_count
+
+    stream, messages, first_count, unchanged_count, throttled_count = asyncio.run(scenario())
+
+    assert first_count == 1 and unchanged_count == 1 and throttled_count == 1
+    assert len(messages) == 3 and [message["seq"] for message in messages] == [1, 2, 3]
+    assert stream.updates == 25
+
+    first = messages[0]
+    assert first["type"] == "crawl_progress" and first["choice"] == "moef"
+    assert (first["site"], first["stage"], first["page"], first["progress"]) == ("moef", "list", 1, 20)
+    assert first["message"] == "목록 수집 중" and "eta_seconds" in first
+
+    second = messages[1]
+    assert second["progress"] == 40
+    assert not {"site", "stage", "page", "message"} & second.keys()
+
+    third = messages[2]
+    assert (third["site"], third["message"], third["page"]) == ("mois", "mois 시작", None)
+    assert "stage" not in third and "progress" not in third
+    print(f"✅ 업데이트 {stream.updates}회 → 전송 {len(messages)}회")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
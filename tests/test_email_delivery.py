@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+이메일 발송(SMTP 연결 풀) 테스트 스크립트
+
+로컬 SMTP 스텁 서버를 띄워 연결 재사용, 수신자 일괄 발송, 수신자 거부, 연결 끊김 후 재연결을 확인
+"""
+
+import os
+import sys
+import socketserver
+import threading
+from email.mime.text import MIMEText
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.email_delivery import EmailDeliveryService
+from src.services.notification_service import NotificationService, NotificationData
+
+
+class _SMTPStubHandler(socketserver.StreamRequestHandler):
+    """EHLO/AUTH PLAIN/MAIL/RCPT/DATA/NOOP/RSET/QUIT만 처리하는 SMTP 스텁 ('reject'가 포함된 수신자는 거부)"""
+
+    def reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        self.server.sessions += 1
+        self.server.connections.append(self.connection)
+        self.reply("220 stub ready")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-stub")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "HELO":
+                self.reply("250 stub")
+            elif verb == "AUTH":
+                self.server.logins += 1
+                self.reply("235 ok")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 ok")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                if "reject" in address:
+                    self.reply("550 no such user")
+                else:
+                    recipients.append(address)
+                    self.reply("250 ok")
+            elif verb == "DATA":
+                self.reply("354 end with .")
+                while self.rfile.readline().rstrip(b"\r\n") != b".":
+                    pass
+                self.server.messages.append(list(recipients))
+                self.reply("250 queued")
+            elif verb in ("NOOP", "RSET"):
+                self.reply("250 ok")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+class _SMTPStub(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPStubHandler)
+        self.sessions = 0
+        self.logins = 0
+        self.messages = []
+        self.connections = []
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def drop_connections(self):
+        """서버 측에서 모든 연결을 끊음 (유휴 연결 종료 상황 재현)"""
+        for connection in self.connections:
+            try:
+                connection.shutdown(2)
+            except OSError:
+                pass
+        self.connections = []
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def _message() -> MIMEText:
+    message = MIMEText("본문", "plain", "utf-8")
+    message["Subject"] = "테스트"
+    message["From"] = "sender@example.com"
+    return message
+
+
+def test_pool_reuses_session_and_batches_recipients():
+    """여러 수신자를 한 세션/한 메시지로 발송하고 다음 발송에서 연결 재사용"""
+    stub = _SMTPStub()
+    delivery = EmailDeliveryService({"retry_backoff_seconds": 0})
+    try:
+        pool = delivery.get_pool("127.0.0.1", stub.port, "sender@example.com", "secret", use_tls=False)
+        recipients = ["a@example.com", "b@example.com", "c@example.com"]
+
+        results = delivery.send_message(pool, _message(), recipients, from_addr="sender@example.com")
+        assert results == {recipient: None for recipient in recipients}
+        delivery.send_message(pool, _message(), recipients, from_addr="sender@example.com")
+
+        assert stub.sessions == 1
+        assert stub.logins == 1
+        assert stub.messages == [recipients, recipients]
+        assert pool.stats["reuses"] == 1
+        print(f"✅ 세션 {stub.sessions}개로 메시지 {len(stub.messages)}건 발송")
+    finally:
+        delivery.close()
+        stub.stop()
+
+
+def test_recipient_batches_and_refusals():
+    """수신자 수 제한에 따른 분할 발송과 일부/전체 수신자 거부 결과"""
+    stub = _SMTPStub()
+    delivery = EmailDeliveryService({"max_recipients_per_message": 2, "retry_backoff_seconds": 0})
+    try:
+        pool = delivery.get_pool("127.0.0.1", stub.port, use_tls=False)
+        results = delivery.send_message(pool, _message(),
+                                        ["a@example.com", "reject@example.com", "b@example.com"],
+                                        from_addr="sender@example.com")
+        assert results["a@example.com"] is None
+        assert results["b@example.com"] is None
+        assert results["reject@example.com"].startswith("550")
+        assert stub.messages == [["a@example.com"], ["b@example.com"]]
+
+        # 모든 수신자가 거부되어도 연결은 유지되어 재사용
+        results = delivery.send_message(pool, _message(), ["reject@example.com"], from_addr="sender@example.com")
+        assert results["reject@example.com"].startswith("550")
+        assert stub.sessions == 1
+    finally:
+        delivery.close()
+        stub.stop()
+
+
+def test_reconnects_after_server_disconnect():
+    """서버가 유휴 연결을 끊으면 연결을 버리고 재연결하여 발송"""
+    stub = _SMTPStub()
+    delivery = EmailDeliveryService({"retry_backoff_seconds": 0})
+    try:
+        pool = delivery.get_pool("127.0.0.1", stub.port, "sender@example.com", "secret", use_tls=False)
+        delivery.send_message(pool, _message(), ["a@example.com"], from_addr="sender@example.com")
+        stub.drop_connections()
+
+        results = delivery.send_message(pool, _message(), ["b@example.com"], from_addr="sender@example.com")
+        assert results == {"b@example.com": None}
+        assert stub.sessions == 2
+        assert pool.stats["discards"] == 1
+        print(f"✅ 연결 끊김 후 재연결 발송 (재연결 {pool.stats['connects']}회)")
+    finally:
+        delivery.close()
+        stub.stop()
+
+
+def test_notification_service_sends_one_session_per_server(tmp_path, monkeypatch):
+    """같은 SMTP 서버를 쓰는 이메일 설정 여러 개는 한 세션에서 일괄 발송"""
+    stub = _SMTPStub()
+    monkeypatch.setenv("EMAIL_PASSWORD", "secret")
+    try:
+        service = NotificationService(db_path=str(tmp_path / "test.db"))
+        settings = [
+            {"setting_id": index, "email_address": f"user{index}@example.com", "smtp_server": "127.0.0.1",
+             "smtp_port": stub.port, "smtp_username": "sender@example.com", "use_tls": 0}
+            for index in range(1, 4)
+        ]
+        notification = NotificationData(site_key="system", notification_type="test",
+                                        title="테스트", message="일괄 발송")
+
+        results = service._sync_send_email_batch(settings, notification)
+        assert results == {1: True, 2: True, 3: True}
+        assert stub.sessions == 1
+        assert stub.messages == [[setting["email_address"] for setting in settings]]
+    finally:
+        from src.services.email_delivery import shutdown_email_delivery
+        shutdown_email_delivery()
+        stub.stop()
+
+
+def test_notification_email_renders_once_for_all_servers(monitoring_db, monkeypatch):
+    """SMTP 서버가 다른 수신자들에게 발송해도 본문 문서 조회/렌더링은 알림당 한 번"""
+    import asyncio
+    import sqlite3
+
+    stubs = [_SMTPStub(), _SMTPStub()]
+    monkeypatch.setenv("EMAIL_PASSWORD", "secret")
+    try:
+        db_path = monitoring_db
+        with sqlite3.connect(db_path) as conn:
+            for index in range(4):
+                conn.execute("""
+                    INSERT INTO email_settings (email_address, smtp_server, smtp_port, smtp_username, use_tls,
+                                                is_active)
+                    VALUES (?, '127.0.0.1', ?, 'sender@example.com', 0, 1)
+                """, (f"user{index}@example.com", stubs[index % 2].port))
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, crawl_session_id)
+                VALUES ('moef', 'D1', '<법인세> 해석', 'session-1')
+            """)
+
+        service = NotificationService(db_path=db_path)
+        notification = NotificationData(site_key="moef", notification_type="new_data", title="새로운 데이터",
+                                        message="1개", new_data_count=1, metadata={"session_id": "session-1"})
+        deliveries = [{"target": setting_id, "delivery_id": setting_id * 10} for setting_id in range(1, 5)]
+
+        outcomes = asyncio.run(service._send_email_notification(notification, deliveries))
+        assert outcomes == {10: None, 20: None, 30: None, 40: None}
+        assert [stub.sessions for stub in stubs] == [1, 1]
+        assert service.email_renderer.stats["renders"] == 1
+        assert service.email_renderer.stats["data_loads"] == 1
+        assert "&lt;법인세&gt; 해석" in service.email_renderer.render(notification)
+        print(f"✅ 렌더링 통계: {service.email_renderer.stats}")
+    finally:
+        from src.services.email_delivery import shutdown_email_delivery
+        shutdown_email_delivery()
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
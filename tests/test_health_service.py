@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+사이트 건강도 요약 테스트 스크립트
+
+REFRESH_SQL 한 번으로 계산되는 사이트별 상태 판정(연속 실패/오래된 성공/낮은 성공률/성공 이력 없음),
+최근 실행 창의 성공률과 p95 소요시간, 이상 사이트의 system_status 반영을 확인
+"""
+
+import os
+import sys
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.health_service import SiteHealthService
+
+CONFIG = {"window_runs": 6, "lookback_days": 14, "stale_success_hours": 24,
+          "error_consecutive_errors": 3, "warning_success_rate": 0.5, "min_runs_for_rate": 5}
+
+
+def _add_runs(conn: sqlite3.Connection, site_key: str, runs: list, days_ago: float = 0):
+    """최근 실행 기록 (runs: 최신순 (상태, 소요 초) 목록, 한 시간 간격)"""
+    now = datetime.now() - timedelta(days=days_ago)
+    for index, (status, duration) in enumerate(runs):
+        start = now - timedelta(hours=index + 1)
+        conn.execute("""
+            INSERT INTO crawl_execution_log (site_key, execution_type, start_time, end_time, status)
+            VALUES (?, 'scheduled', ?, ?, ?)
+        """, (site_key, start.isoformat(), (start + timedelta(seconds=duration)).isoformat(), status))
+
+
+def test_refresh_classifies_sites_in_one_pass(monitoring_db):
+    """사이트별 상태/사유/성공률/p95가 한 번의 갱신으로 계산되고 이상 사이트의 system_status에 반영"""
+    with sqlite3.connect(monitoring_db) as conn:
+        conn.execute("UPDATE crawl_schedules SET last_success = datetime('now', '-1 hour')")
+        conn.execute("UPDATE crawl_schedules SET last_success = NULL WHERE site_key = 'tax_tribunal'")
+        conn.execute("""
+            UPDATE crawl_schedules SET last_success = datetime('now', '-30 hours') WHERE site_key = 'nts_authority'
+        """)
+        conn.execute("UPDATE crawl_schedules SET consecutive_errors = 3 WHERE site_key = 'bai'")
+        conn.execute("UPDATE crawl_schedules SET consecutive_errors = 5 WHERE site_key = 'nts_precedent'")
+        conn.execute("""
+            UPDATE system_status SET status = 'running' WHERE site_key = 'nts_precedent'
+        """)
+
+        # 최근 6회만 집계 (7번째 실행과 조회 기간 밖의 실패는 제외)
+        _add_runs(conn, "moef", [("success", seconds) for seconds in (10, 20, 30, 40, 50, 60)] + [("failed", 999)])
+        _add_runs(conn, "moef", [("failed", 5)] * 3, days_ago=20)
+        _add_runs(conn, "mois", [("success", 10)] + [("failed", 10)] * 4)
+
+    service = SiteHealthService(db_path=monitoring_db, config=CONFIG)
+    counts = service.refresh()
+    assert counts == {"healthy": 1, "warning": 2, "error": 2, "unknown": 1}
+
+    summary = {row["site_key"]: row for row in service.get_summary()}
+    moef = summary["moef"]
+    assert moef["status"] == "healthy" and moef["status_reason"] is None
+    assert moef["window_runs"] == 6 and moef["success_rate"] == 1.0
+    assert moef["p95_duration_seconds"] == pytest.approx(60.0)
+    assert moef["last_success_age_hours"] == pytest.approx(1.0, abs=0.05)
+
+    assert (summary["mois"]["status"], summary["mois"]["status_reason"]) == ("warning", "최근 5회 성공률 20%")
+    assert (summary["nts_authority"]["status"], summary["nts_authority"]["status_reason"]) == \
+        ("warning", "24시간 이상 성공한 크롤링 없음")
+    assert (summary["bai"]["status"], summary["bai"]["status_reason"]) == ("error", "연속 3회 실패")
+    assert (summary["tax_tribunal"]["status"], summary["tax_tribunal"]["status_reason"]) == \
+        ("unknown", "성공 이력 없음")
+    assert summary["tax_tribunal"]["window_runs"] == 0 and summary["tax_tribunal"]["success_rate"] is None
+
+    statuses = {row["site_key"]: row for row in service.get_system_status()}
+    assert statuses["bai"]["status"] == "error" and statuses["bai"]["error_message"] == "연속 3회 실패"
+    assert statuses["mois"]["status"] == "warning"
+    assert statuses["moef"]["status"] == "healthy"
+    # 실행 중인 사이트의 system_status는 덮어쓰지 않음 (요약에만 error)
+    assert statuses["nts_precedent"]["status"] == "running"
+    assert statuses["nts_precedent"]["health_status"] == "error"
+
+    # 다시 갱신해도 사이트당 한 행 유지 (UPSERT)
+    with sqlite3.connect(monitoring_db) as conn:
+        conn.execute("UPDATE crawl_schedules SET consecutive_errors = 0 WHERE site_key = 'bai'")
+    assert service.refresh()["healthy"] == 2
+    assert len(service.get_summary()) == 6
+    print(f"✅ 건강도 요약: {counts}")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+크롤링 작업 디스패처 테스트 스크립트
+
+watchdog이 포기한 작업의 풀 슬롯 반환, 스레드가 끝날 때까지 사이트 잠금 유지, 남은 스레드의 저장 단계 차단을 확인
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.job_dispatcher import CrawlJobDispatcher
+from src.utils.crawl_context import CrawlCancelledError, ensure_not_cancelled
+
+
+def test_abandon_keeps_site_lock_until_thread_exits():
+    """포기한 작업은 슬롯만 반환하고, 같은 사이트 새 작업은 남은 스레드가 끝난 뒤에만 허용"""
+    dispatcher = CrawlJobDispatcher(pools={"http": 1}, site_pools={}, default_pool="http")
+    started, resume = threading.Event(), threading.Event()
+    persisted = []
+
+    def stuck_crawl():
+        started.set()
+        resume.wait(5)
+        ensure_not_cancelled()
+        persisted.append("moef")
+
+    try:
+        future = dispatcher.submit("moef", stuck_crawl)
+        assert started.wait(5)
+
+        abandoned = dispatcher.abandon("moef", TimeoutError("제한 시간 초과"))
+        assert abandoned is not None
+        assert dispatcher.abandon("moef", TimeoutError("중복")) is None
+        with pytest.raises(TimeoutError):
+            future.result(timeout=1)
+
+        # 풀 슬롯은 반환되어 다른 사이트는 실행되지만, 같은 사이트는 잠금 유지
+        assert dispatcher.submit("mois", lambda: "done").result(timeout=5) == "done"
+        assert dispatcher.submit("moef", lambda: "again") is None
+        assert "moef" not in [job.site_key for job in dispatcher.running_jobs()]
+        assert {job["site_key"]: job["abandoned"] for job in dispatcher.get_status()["running"]}["moef"] is True
+
+        # 남은 스레드는 저장 직전 취소를 확인하고 종료한 뒤 사이트 잠금 해제
+        resume.set()
+        abandoned.thread.join(5)
+        assert persisted == []
+        assert not dispatcher.is_busy("moef")
+        assert dispatcher.submit("moef", lambda: "again").result(timeout=5) == "again"
+        print(f"✅ 디스패처 상태: {dispatcher.get_status()['completed_count']}건 완료")
+    finally:
+        resume.set()
+        dispatcher.shutdown(wait=True)
+
+
+def test_ensure_not_cancelled_outside_crawl_job():
+    """작업 스레드 밖(CLI 등)에서는 취소 확인이 아무 동작도 하지 않음"""
+    ensure_not_cancelled()
+    assert issubclass(CrawlCancelledError, Exception)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
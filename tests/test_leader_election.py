@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+스케줄러 리더 선출 테스트 스크립트
+
+리스 획득/갱신과 term 증가, 만료 후 인계, release() 후 즉시 인계, 지연 요청의 실행 시각 대기와 리더 교체 후 재처리를 확인
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.services.leader_election as leader_module
+from src.services.leader_election import LeaderElection, REQUEST_CRAWL, REQUEST_RELOAD_SCHEDULES
+
+
+class _Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(leader_module, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+def _pair(tmp_path):
+    """같은 DB를 쓰는 두 워커 (리더 자격 변경 이벤트 기록)"""
+    events = []
+    db_path = str(tmp_path / "leader.db")
+    workers = [LeaderElection(db_path, config={"lease_seconds": 30},
+                              on_elected=lambda name=name: events.append((name, "elected")),
+                              on_demoted=lambda name=name: events.append((name, "demoted")))
+               for name in ("a", "b")]
+    return workers, events
+
+
+def test_takeover_after_expiry_and_release(tmp_path, clock):
+    """리더가 갱신하지 못하면 만료 후 다른 워커가 인계(term 증가), release()하면 만료를 기다리지 않고 인계"""
+    (a, b), events = _pair(tmp_path)
+
+    assert a.try_acquire() and a.term == 1
+    assert not b.try_acquire()
+    clock.now += 20
+    assert a.try_acquire() and a.term == 1
+    assert b.get_leader()["holder_id"] == a.holder_id
+
+    # a가 갱신하지 못한 채 리스 만료
+    clock.now += 31
+    assert b.get_leader() is None
+    assert b.try_acquire() and b.term == 2
+    assert not a.try_acquire() and not a.is_leader
+    assert events == [("a", "elected"), ("b", "elected"), ("a", "demoted")]
+
+    # 반납하면 a가 바로 인계
+    b.release()
+    assert not b.is_leader
+    assert a.try_acquire() and a.term == 3
+    assert not b.try_acquire()
+    print(f"✅ 리더 인계: {events}")
+
+
+def test_delayed_request_waits_and_survives_leader_change(tmp_path, clock):
+    """지연 요청은 실행 시각 전에는 가져가지 않고, 완료 전에 리더가 바뀌면 새 리더가 다시 가져감"""
+    (a, b), _ = _pair(tmp_path)
+    assert a.try_acquire()
+
+    assert b.submit_request(REQUEST_CRAWL, "moef", delay_seconds=60)
+    assert b.submit_request(REQUEST_RELOAD_SCHEDULES, "mois")
+    assert b.claim_requests() == []
+
+    due = a.claim_requests()
+    assert [request["action"] for request in due] == [REQUEST_RELOAD_SCHEDULES]
+    assert a.complete_request(due[0]["id"])
+    assert a.get_status()["pending_requests"] == 1
+
+    # 실행 시각이 된 요청을 가져간 뒤 완료하기 전에 리더 중단
+    clock.now += 61
+    claimed = a.claim_requests()
+    assert [(request["action"], request["site_key"]) for request in claimed] == [(REQUEST_CRAWL, "moef")]
+    assert a.claim_requests() == []
+
+    clock.now += 31
+    assert b.try_acquire()
+    reclaimed = b.claim_requests()
+    assert [request["id"] for request in reclaimed] == [claimed[0]["id"]]
+    assert not a.complete_request(claimed[0]["id"])
+    assert b.complete_request(claimed[0]["id"])
+    assert b.claim_requests() == []
+
+    clock.now += 8 * 86400
+    assert b.cleanup_requests() == 2
+    print("✅ 지연 요청 처리")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
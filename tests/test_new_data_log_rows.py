@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+새로운 데이터 로그 행 구성 테스트 스크립트
+
+컬럼 단위로 만드는 new_data_log 행의 요약/태그/메타데이터가 결측값과 누락 컬럼을 어떻게 다루는지 고정
+"""
+
+import os
+import sys
+import json
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.crawler_service import CrawlingService
+
+
+def test_rows_skip_nan_categories_and_missing_columns():
+    """결측 세목/유형은 태그에서 빠지고(이전 행 단위 구현의 '세목:nan' 태그 대신), 없는 컬럼은 기본값 사용"""
+    service = CrawlingService({}, None)
+    df = pd.DataFrame({
+        "세목": ["법인세", np.nan, ""],
+        "유형": ["경정", "취소", np.nan],
+        "결정일": ["2026-10-01", "2026-10-02", "2026-10-03"],
+        "청구번호": ["A1", "A2", None],
+        "제목": ["중요 개정 사항", "일반 \"따옴표\" 제목", "기타"],
+    })
+
+    rows = service._build_new_data_log_rows("tax_tribunal", df, "청구번호", "session-1")
+    assert len(rows) == 3
+
+    tags = [json.loads(row[9]) for row in rows]
+    assert tags[0][:3] == ["tax_tribunal", "세목:법인세", "유형:경정"] and tags[0][-1] == "중요"
+    assert tags[1][:2] == ["tax_tribunal", "유형:취소"]
+    assert not any(tag.startswith("세목:") for tag in tags[1] + tags[2])
+    assert not any(tag.startswith("유형:") for tag in tags[2])
+    assert all(tag.startswith("발견:") for tag in (tags[1][-1], tags[2][-1]))
+
+    # 요약/분류/키는 행 단위 str()과 같은 문자열 (결측값도 NULL이 되지 않음)
+    assert rows[0][4] == "법인세 - 경정 (2026-10-01)"
+    assert rows[1][4] == "nan - 취소 (2026-10-02)"
+    assert rows[1][5] == "nan"
+    assert rows[2][1] == "nan"
+    assert rows[1][3] == "일반 \"따옴표\" 제목"
+
+    metadata = [json.loads(row[10]) for row in rows]
+    assert metadata[0]["crawl_session_id"] == "session-1" and metadata[0]["site_key"] == "tax_tribunal"
+    assert metadata[1]["original_data"]["세목"] is None
+    assert metadata[1]["original_data"]["제목"] == "일반 \"따옴표\" 제목"
+    assert metadata[2]["original_data"]["청구번호"] is None
+
+    # 키/날짜 컬럼이 없는 사이트 데이터는 기본값으로 기록
+    rows = service._build_new_data_log_rows("moef", df[["제목"]], "문서번호", None)
+    assert [row[1] for row in rows] == ["unknown"] * 3
+    assert [row[6] for row in rows] == [""] * 3
+    assert [json.loads(row[9])[0] for row in rows] == ["moef"] * 3
+    print("✅ 결측값/누락 컬럼 처리 확인")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+알림 소비자 커서 테스트 스크립트
+
+사이트별 notifications 커서 기준으로 알림 구간이 이어지는지 (임계값 미달 구간 합산, 같은 구간 중복 알림 방지) 확인
+"""
+
+import os
+import sys
+import asyncio
+import sqlite3
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.notification_service import NotificationService
+
+
+def _save_documents(db_path: str, session_id: str, data_ids: list) -> tuple:
+    """크롤링 저장 흉내 (CDC 로그와 새로운 데이터 로그 기록), 이번 저장의 시퀀스 구간 반환"""
+    with sqlite3.connect(db_path) as conn:
+        start = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM data_change_log").fetchone()[0]
+        for data_id in data_ids:
+            conn.execute("INSERT INTO data_change_log (site_key, data_id) VALUES ('moef', ?)", (data_id,))
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, crawl_session_id)
+                VALUES ('moef', ?, '제목', ?)
+            """, (data_id, session_id))
+        end = conn.execute("SELECT MAX(seq) FROM data_change_log").fetchone()[0]
+    return (start, end)
+
+
+def test_notification_resumes_from_durable_cursor(monitoring_db):
+    """임계값 미달 구간은 다음 알림에 합산되고, 이미 알림을 만든 구간은 다시 알리지 않음"""
+    db_path = monitoring_db
+    service = NotificationService(db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO crawl_schedules (site_key, site_name, notification_threshold)
+            VALUES ('moef', '기획재정부', 3)
+        """)
+
+    first_range = _save_documents(db_path, "session-1", ["A", "B"])
+    assert asyncio.run(service.send_new_data_notification("moef", 2, "session-1", first_range))
+
+    second_range = _save_documents(db_path, "session-2", ["C", "D"])
+    assert asyncio.run(service.send_new_data_notification("moef", 2, "session-2", second_range))
+
+    with sqlite3.connect(db_path) as conn:
+        notifications = conn.execute("""
+            SELECT notification_id, new_data_count FROM notification_history WHERE notification_type = 'new_data'
+        """).fetchall()
+        assert len(notifications) == 1 and notifications[0][1] == 4
+        notified = conn.execute("""
+            SELECT COUNT(*) FROM new_data_log WHERE notification_sent = 1 AND notification_id = ?
+        """, (notifications[0][0],)).fetchone()[0]
+        assert notified == 4
+
+    consumer_id = service.notification_cursor_id("moef")
+    assert service.change_feed.get_cursor(consumer_id) == second_range[1]
+
+    # 같은 구간이 다시 전달되면 (크롤러/스케줄러 양쪽 호출 등) 알림을 만들지 않음
+    assert asyncio.run(service.send_new_data_notification("moef", 2, "session-2", second_range))
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("""
+            SELECT COUNT(*) FROM notification_history WHERE notification_type = 'new_data'
+        """).fetchone()[0] == 1
+    print(f"✅ 알림 커서: seq {service.change_feed.get_cursor(consumer_id)}")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+알림 다이제스트 테스트 스크립트
+
+수신자별 대기 항목 누적, 기간 경과 전 미발송, 기간 경과 후 수신자별 요약 이메일 1건, 강제 발송과 정리를 확인
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.services.notification_digest as digest_module
+
+
+def _create_service(db_path: str):
+    from src.services.notification_service import NotificationService
+
+    with sqlite3.connect(db_path) as conn:
+        for address in ("all@example.com", "corp@example.com"):
+            conn.execute("""
+                INSERT INTO email_settings (email_address, smtp_server, smtp_port, is_active,
+                                            min_data_threshold, notification_types)
+                VALUES (?, 'localhost', 25, 1, 1, '["new_data"]')
+            """, (address,))
+        for site_key, data_id, category in [("moef", "A", "법인세"), ("moef", "B", "소득세"),
+                                            ("mois", "C", "법인세"), ("bai", "D", "부가가치세")]:
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, data_category, crawl_session_id)
+                VALUES (?, ?, '제목', ?, ?)
+            """, (site_key, data_id, category, f"session-{site_key}"))
+
+    service = NotificationService(db_path=db_path)
+    service.subscriptions.add_rule(2, "tax_type", "법인세")
+    return service, db_path
+
+
+def _email_deliveries(db_path: str) -> list:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("""
+            SELECT d.target, h.metadata FROM notification_deliveries d
+            JOIN notification_history h ON h.notification_id = d.notification_id
+            WHERE d.channel = 'email' ORDER BY d.target
+        """).fetchall()
+
+
+def test_digest_sends_one_email_per_recipient_after_window(monitoring_db, monkeypatch):
+    """기간이 지나기 전에는 발송하지 않고, 지나면 수신자별로 대기 항목을 모은 요약 이메일 1건"""
+    service, db_path = _create_service(monitoring_db)
+    for site_key, count in (("moef", 2), ("mois", 1), ("bai", 1)):
+        assert asyncio.run(service.send_new_data_notification(site_key, count, f"session-{site_key}"))
+
+    with sqlite3.connect(db_path) as conn:
+        pending = dict(conn.execute("""
+            SELECT setting_id, COUNT(*) FROM notification_digest_items
+            WHERE digest_notification_id IS NULL GROUP BY setting_id
+        """).fetchall())
+    assert pending == {1: 3, 2: 2}
+
+    assert service.flush_digests() == 0
+    assert _email_deliveries(db_path) == []
+
+    window = service.digest.config["window_seconds"]
+    monkeypatch.setattr(digest_module, "time", SimpleNamespace(time=lambda: time.time() + window + 1))
+    assert service.flush_digests() == 2
+
+    deliveries = _email_deliveries(db_path)
+    assert [target for target, _ in deliveries] == ["1", "2"]
+    metadata = {target: json.loads(raw) for target, raw in deliveries}
+    assert metadata["1"]["site_counts"] == {"moef": 2, "mois": 1, "bai": 1}
+    assert metadata["2"]["data_ids"] == {"moef": ["A"], "mois": ["C"]}
+
+    # 발송 완료된 항목은 다시 요약하지 않음
+    assert service.flush_digests() == 0
+    assert service.flush_digests(force=True) == 0
+    print(f"✅ 수신자별 요약 이메일: {[target for target, _ in deliveries]}")
+
+
+def test_force_flush_and_cleanup(monitoring_db, monkeypatch):
+    """강제 발송은 기간과 관계없이 요약하고, 정리는 보관 기간이 지난 발송 완료 이벤트만 삭제"""
+    service, db_path = _create_service(monitoring_db)
+    assert asyncio.run(service.send_new_data_notification("moef", 2, "session-moef"))
+    assert service.flush_digests() == 0
+    assert service.flush_digests(force=True) == 2
+    assert [target for target, _ in _email_deliveries(db_path)] == ["1", "2"]
+
+    assert asyncio.run(service.send_new_data_notification("mois", 1, "session-mois"))
+
+    retention = service.digest.config["retention_days"] * 86400
+    monkeypatch.setattr(digest_module, "time", SimpleNamespace(time=lambda: time.time() + retention + 1))
+    assert service.digest.cleanup() == 1
+
+    with sqlite3.connect(db_path) as conn:
+        events = [row[0] for row in conn.execute("SELECT site_key FROM notification_digest_events")]
+        items = conn.execute("SELECT COUNT(*) FROM notification_digest_items").fetchone()[0]
+    assert events == ["mois"]
+    assert items == 2
+    print("✅ 강제 발송/정리 확인")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+알림 아웃박스 테스트 스크립트
+
+발송 건 등록, 디스패처 간 배타 할당, 리스 만료 재할당, 발송 결과(성공/재시도/실패) 기록과 최종 상태,
+웹 워커별 WebSocket 팬아웃을 확인
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.services.notification_outbox as outbox_module
+from src.services.notification_outbox import NotificationOutbox
+
+
+def _enqueue(db_path: str, deliveries: list) -> int:
+    """알림과 발송 건을 한 트랜잭션으로 등록"""
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO notification_history (site_key, notification_type, title, message, status)
+            VALUES ('moef', 'new_data', '새로운 데이터', '2건', 'pending')
+        """)
+        notification_id = cursor.lastrowid
+        NotificationOutbox.add_deliveries(cursor, notification_id, deliveries)
+        NotificationOutbox.finalize(cursor, [notification_id])
+        return notification_id
+
+
+def _rows(db_path: str) -> dict:
+    with sqlite3.connect(db_path) as conn:
+        return {(channel, target): (status, attempts) for channel, target, status, attempts in conn.execute(
+            "SELECT channel, target, status, attempts FROM notification_deliveries")}
+
+
+def _notification(db_path: str, notification_id: int) -> tuple:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("""
+            SELECT status, delivery_channels, error_message FROM notification_history WHERE notification_id = ?
+        """, (notification_id,)).fetchone()
+
+
+def _advance(monkeypatch, seconds: float):
+    now = time.time() + seconds
+    monkeypatch.setattr(outbox_module, "time", SimpleNamespace(time=lambda: now))
+
+
+def test_enqueue_records_deliveries_in_notification_transaction(monitoring_db):
+    """발송 건은 알림과 함께 커밋되고, 중복 대상은 한 건, WebSocket은 할당 없이 sent로 기록"""
+    db_path = monitoring_db
+    outbox = NotificationOutbox(db_path)
+
+    notification_id = _enqueue(db_path, [("websocket", ""), ("email", 1), ("email", 2), ("email", "1")])
+    assert _rows(db_path) == {
+        ("websocket", ""): ("sent", 0),
+        ("email", "1"): ("pending", 0),
+        ("email", "2"): ("pending", 0)
+    }
+    assert _notification(db_path, notification_id)[0] == "pending"
+
+    # 알림 저장이 롤백되면 발송 건도 남지 않음
+    with pytest.raises(sqlite3.IntegrityError):
+        with sqlite3.connect(db_path) as conn:
+            NotificationOutbox.add_deliveries(conn.cursor(), 999, [("email", 3)])
+            conn.execute("INSERT INTO notification_history (site_key) VALUES (NULL)")
+    assert ("email", "3") not in _rows(db_path)
+
+    # WebSocket만 있는 알림은 등록과 함께 sent로 확정
+    websocket_only = _enqueue(db_path, [("websocket", "")])
+    assert _notification(db_path, websocket_only)[:2] == ("sent", '["websocket"]')
+    assert outbox.get_stats() == {"sent": 2, "pending": 2}
+    print("✅ 발송 건 등록")
+
+
+def test_claim_is_exclusive_and_reclaims_expired_lease(monitoring_db, monkeypatch):
+    """할당된 건은 다른 디스패처가 가져가지 않고, 리스가 만료되면 재할당 (이전 디스패처의 결과는 무시)"""
+    db_path = monitoring_db
+    outbox = NotificationOutbox(db_path, config={"lease_seconds": 60})
+    _enqueue(db_path, [("websocket", ""), ("email", 1), ("email", 2)])
+
+    claimed = outbox.claim("worker-1")
+    assert [delivery["target"] for delivery in claimed] == ["1", "2"]
+    assert all(delivery["attempts"] == 1 for delivery in claimed)
+    assert outbox.claim("worker-2") == []
+
+    _advance(monkeypatch, 61)
+    reclaimed = outbox.claim("worker-2")
+    assert [delivery["delivery_id"] for delivery in reclaimed] == [delivery["delivery_id"] for delivery in claimed]
+    assert all(delivery["attempts"] == 2 for delivery in reclaimed)
+
+    assert outbox.complete("worker-1", claimed, {delivery["delivery_id"]: None for delivery in claimed}) == \
+        {"sent": 0, "retry": 0, "failed": 0}
+    assert outbox.complete("worker-2", reclaimed, {delivery["delivery_id"]: None for delivery in reclaimed}) == \
+        {"sent": 2, "retry": 0, "failed": 0}
+    print("✅ 배타 할당 및 리스 만료 재할당")
+
+
+def test_complete_retries_with_backoff_then_fails(monitoring_db, monkeypatch):
+    """실패 건은 백오프 후 재시도하고 max_attempts회 이후 failed, 남은 건이 없으면 알림 최종 상태 반영"""
+    db_path = monitoring_db
+    outbox = NotificationOutbox(db_path, config={"max_attempts": 2, "retry_backoff_seconds": 10})
+    notification_id = _enqueue(db_path, [("websocket", ""), ("email", 1), ("email", 2)])
+
+    first = outbox.claim("worker-1")
+    outcomes = {first[0]["delivery_id"]: None, first[1]["delivery_id"]: "SMTP 오류"}
+    assert outbox.complete("worker-1", first, outcomes) == {"sent": 1, "retry": 1, "failed": 0}
+    assert _rows(db_path)[("email", "2")] == ("pending", 1)
+    assert _notification(db_path, notification_id)[0] == "pending"
+
+    # 백오프 전에는 할당되지 않음
+    assert outbox.claim("worker-1") == []
+    _advance(monkeypatch, 11)
+    second = outbox.claim("worker-1")
+    assert [(delivery["target"], delivery["attempts"]) for delivery in second] == [("2", 2)]
+    assert outbox.complete("worker-1", second, {}) == {"sent": 0, "retry": 0, "failed": 1}
+
+    status, channels, error_message = _notification(db_path, notification_id)
+    assert status == "sent"
+    assert sorted(json.loads(channels)) == ["email", "websocket"]
+    assert error_message == "발송 결과 없음"
+    assert outbox.get_stats() == {"sent": 2, "failed": 1}
+    print("✅ 재시도 및 실패 처리")
+
+
+class _Sockets:
+    """웹 워커 하나에 연결된 WebSocket 목록 대용"""
+
+    def __init__(self):
+        self.messages = []
+
+    async def broadcast(self, message):
+        self.messages.append(message)
+
+
+def test_websocket_notification_reaches_every_worker(monitoring_db):
+    """웹 워커마다 디스패처가 WebSocket 발송 건을 읽어 자신의 연결에 한 번씩 전송"""
+    from src.services.notification_service import NotificationService
+    from src.services.notification_dispatcher import NotificationDispatcher
+
+    db_path = monitoring_db
+    workers = []
+    for _ in range(2):
+        sockets = _Sockets()
+        service = NotificationService(db_path=db_path, websocket_manager=sockets)
+        workers.append((sockets, NotificationDispatcher(service)))
+
+    async def scenario():
+        for _, dispatcher in workers:
+            await dispatcher.dispatch_once()
+        assert await workers[0][1].notification_service.send_system_notification("점검 예정")
+        for _, dispatcher in workers:
+            assert await dispatcher.dispatch_once() == 1
+            assert await dispatcher.dispatch_once() == 0
+
+    asyncio.run(scenario())
+
+    for sockets, dispatcher in workers:
+        assert [message["message"] for message in sockets.messages] == ["점검 예정"]
+        assert dispatcher.stats["relayed"] == 1 and dispatcher.stats["dispatched"] == 0
+    print("✅ 워커별 WebSocket 팬아웃")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+알림 빈도 제한 테스트 스크립트
+
+토큰 버킷 소진/충전, 여러 인스턴스(프로세스) 간 상태 공유, 일일 한도, 오래된 상태 정리를 확인
+"""
+
+import os
+import sys
+import sqlite3
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.services.notification_throttle as throttle_module
+from src.services.notification_throttle import NotificationThrottle
+
+
+class _Clock:
+    """time.time() 대체용 시계 (테스트에서 시간을 직접 진행)"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_token_bucket_exhausts_and_refills(tmp_path, monkeypatch):
+    """버킷을 모두 쓰면 거부되고, 충전 시간이 지나면 다시 허용 (상태는 다른 인스턴스와 공유)"""
+    clock = _Clock()
+    monkeypatch.setattr(throttle_module.time, "time", clock.time)
+    config = {"type_limits": {"error": {"capacity": 2, "refill_seconds": 60}}, "daily_limit": 100}
+    db_path = str(tmp_path / "test.db")
+    throttle = NotificationThrottle(db_path, config)
+    scopes = throttle.type_scopes("moef", "error")
+
+    assert throttle.acquire(scopes)
+    assert throttle.acquire(scopes)
+    assert not throttle.acquire(scopes)
+
+    # 다른 프로세스도 같은 DB 상태를 보고 거부
+    other = NotificationThrottle(db_path, config)
+    assert not other.acquire(scopes)
+    assert other.stats["denied_from_memory"] == 0
+
+    # 충전 전에는 메모리에 기억한 시각까지 DB 조회 없이 거부
+    clock.now += 30
+    assert not throttle.acquire(scopes)
+    assert throttle.stats["denied_from_memory"] == 1
+
+    clock.now += 30
+    assert throttle.acquire(scopes)
+    assert not throttle.acquire(scopes)
+
+    # 다른 사이트/타입은 별도 버킷, 제외 타입은 제한 없음
+    assert throttle.acquire(throttle.type_scopes("mois", "error"))
+    assert throttle.type_scopes("moef", "system") == []
+    print(f"✅ 토큰 버킷 통계: {throttle.stats}")
+
+
+def test_daily_limit_and_cleanup(tmp_path, monkeypatch):
+    """일일 한도를 넘으면 거부되고, 보관 기간 동안 쓰이지 않은 상태는 정리"""
+    clock = _Clock()
+    monkeypatch.setattr(throttle_module.time, "time", clock.time)
+    db_path = str(tmp_path / "test.db")
+    throttle = NotificationThrottle(db_path, {"recipient_daily_limit": 2, "retention_days": 7})
+    scopes = throttle.recipient_scopes(1)
+
+    assert throttle.acquire(scopes)
+    assert throttle.acquire(scopes)
+    assert not throttle.acquire(scopes)
+    assert throttle.acquire(throttle.recipient_scopes(2))
+
+    clock.now += 8 * 86400
+    assert throttle.cleanup() == 2
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM notification_throttle").fetchone()[0] == 0
+    print("✅ 일일 한도와 정리 확인")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+최근 새로운 문서 프로젝션 테스트 스크립트
+
+새로운 데이터 로그 기록 시 프로젝션 반영(링크/태그/중요 여부), 커서 페이지네이션, 알림 ID 갱신을 확인
+"""
+
+import os
+import sys
+import json
+import asyncio
+import sqlite3
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.recent_documents import RecentDocuments
+
+
+def test_refresh_projects_new_log_rows_and_pages_by_cursor(monitoring_db):
+    """로그 기록 트랜잭션에서 반영된 문서를 사이트별로 커서 페이지네이션 (중복/누락 없음)"""
+    db_path = monitoring_db
+    projection = RecentDocuments(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        for index in range(25):
+            site_key = "moef" if index % 2 else "mois"
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, data_category, crawl_session_id,
+                                          tags, metadata)
+                VALUES (?, ?, ?, 'nan', 'session-1', ?, ?)
+            """, (site_key, f"D{index}", f"문서 {index}",
+                  json.dumps(["중요"] if index == 3 else [site_key], ensure_ascii=False),
+                  json.dumps({"original_data": {"링크": f"http://example.com/{index}"}}, ensure_ascii=False)))
+        assert RecentDocuments.refresh(conn) == 25
+        assert RecentDocuments.refresh(conn) == 0
+
+    data_ids, cursor = [], None
+    while True:
+        page = projection.list_documents(site_key="moef", cursor=cursor, limit=5)
+        data_ids += [document["data_id"] for document in page["documents"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert data_ids == [f"D{index}" for index in range(23, 0, -2)]
+    # 마지막 행에서 끝나는 페이지는 빈 다음 페이지 커서를 반환하지 않음
+    assert projection.list_documents(site_key="moef", limit=12)["next_cursor"] is None
+    assert projection.list_documents(site_key="moef", limit=11)["next_cursor"] is not None
+    assert projection.count_documents(site_key="moef", session_id="session-1") == 12
+
+    document = projection.get_documents("moef", ["D3"])[0]
+    assert document["link"] == "http://example.com/3"
+    assert document["tags"] == ["중요"] and document["is_important"] is True
+    assert document["data_category"] is None
+    print(f"✅ 커서 페이지네이션: {len(data_ids)}개 문서")
+
+
+def test_notification_marks_projected_documents(monitoring_db):
+    """새로운 데이터 알림 저장 시 프로젝션 문서의 알림 ID도 함께 기록"""
+    from src.services.notification_service import NotificationService
+
+    db_path = monitoring_db
+    service = NotificationService(db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        for data_id in ("A", "B"):
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, crawl_session_id)
+                VALUES ('moef', ?, '제목', 'session-1')
+            """, (data_id,))
+        RecentDocuments.refresh(conn)
+
+    assert asyncio.run(service.send_new_data_notification("moef", 2, "session-1"))
+
+    documents = service.recent_documents.list_documents(session_id="session-1")["documents"]
+    assert len(documents) == 2
+    assert all(document["notification_id"] is not None for document in documents)
+    print("✅ 알림 ID 기록 완료")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
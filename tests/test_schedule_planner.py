@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+스케줄 실행 시각 분산 테스트 스크립트
+
+같은 시각에 실행되는 cron 작업이 오프셋 계획 후 min_gap_seconds 이상 떨어지는지, OffsetTrigger가 시각을 그대로 늦추는지 확인
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytz
+from apscheduler.triggers.cron import CronTrigger
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.schedule_planner import OffsetTrigger, fire_times, plan_offsets, unwrap_trigger
+
+TIMEZONE = pytz.timezone("Asia/Seoul")
+CONFIG = {"min_gap_seconds": 300, "jitter_seconds": 60, "max_slots": 6, "horizon_hours": 24}
+
+
+def test_offset_trigger_delays_every_fire_time():
+    """OffsetTrigger는 원래 트리거의 모든 실행 시각을 같은 초만큼 늦춤"""
+    trigger = CronTrigger.from_crontab("0 */6 * * *", timezone=TIMEZONE)
+    now = TIMEZONE.localize(datetime(2026, 10, 19, 0, 30))
+    end = now + timedelta(days=1)
+
+    shifted = OffsetTrigger(trigger, 90)
+    assert fire_times(shifted, now, end) == [fire_time + timedelta(seconds=90)
+                                             for fire_time in fire_times(trigger, now, end)]
+    assert unwrap_trigger(OffsetTrigger(shifted, 30)) is trigger
+    print(f"✅ 오프셋 트리거: {shifted}")
+
+
+def test_plan_offsets_separates_simultaneous_cron_jobs():
+    """같은 시각 cron 작업 두 개는 계획 후 모든 실행 시각이 min_gap_seconds 이상 떨어짐 (우선 작업은 원래 시각 유지)"""
+    triggers = {
+        "crawl_moef": CronTrigger.from_crontab("0 */6 * * *", timezone=TIMEZONE),
+        "crawl_mois": CronTrigger.from_crontab("0 */6 * * *", timezone=TIMEZONE),
+    }
+    now = TIMEZONE.localize(datetime(2026, 10, 19, 0, 30))
+
+    plan = plan_offsets(triggers, ["crawl_moef", "crawl_mois"], now, CONFIG)
+
+    assert plan["offsets"]["crawl_moef"] == 0
+    assert plan["offsets"]["crawl_mois"] >= CONFIG["min_gap_seconds"]
+    assert plan["overlaps"] == [{"jobs": ["crawl_moef", "crawl_mois"], "count": 4}]
+    assert plan["remaining_overlaps"] == []
+
+    end = now + timedelta(hours=CONFIG["horizon_hours"])
+    moef_times = fire_times(triggers["crawl_moef"], now, end)
+    mois_times = fire_times(OffsetTrigger(triggers["crawl_mois"], plan["offsets"]["crawl_mois"]), now, end)
+    assert len(moef_times) == len(mois_times) == 4
+    for moef_time in moef_times:
+        assert all(abs((mois_time - moef_time).total_seconds()) >= CONFIG["min_gap_seconds"]
+                   for mois_time in mois_times)
+
+    # 같은 입력이면 재시작 후에도 같은 오프셋 (결정적 지터)
+    assert plan_offsets(triggers, ["crawl_moef", "crawl_mois"], now, CONFIG)["offsets"] == plan["offsets"]
+    print(f"✅ 실행 시각 분산: {plan['offsets']}")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+구독 규칙 매칭 엔진 테스트 스크립트
+
+다중 패턴 오토마톤 정확성, 세목/키워드/사이트 범위 규칙 매칭, 알림 저장 시 수신자별 일치 문서 기록을 확인
+"""
+
+import os
+import sys
+import json
+import random
+import asyncio
+import sqlite3
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.services.subscription_matcher import KeywordAutomaton, SubscriptionMatcher, normalize_text
+
+
+def test_automaton_matches_naive_search():
+    """겹치거나 포함 관계인 패턴도 단순 검색과 같은 결과"""
+    patterns = ["부가가치세", "가치세", "세", "법인세", "법인", "인세", "가산세"]
+    automaton = KeywordAutomaton()
+    for pattern in patterns:
+        automaton.add(pattern, pattern)
+    automaton.build()
+
+    random.seed(42)
+    alphabet = "부가치세법인산소득"
+    for _ in range(300):
+        text = "".join(random.choice(alphabet) for _ in range(random.randint(0, 30)))
+        assert automaton.find(text) == {pattern for pattern in patterns if pattern in text}, text
+
+    assert automaton.find("법인세 부가가치세 신고") == {"부가가치세", "가치세", "세", "법인세", "법인", "인세"}
+    print("✅ 오토마톤 결과가 단순 검색과 일치")
+
+
+def test_matcher_evaluates_rules_in_one_pass():
+    """세목 역색인, 키워드 오토마톤, 사이트 범위가 함께 적용되어 수신자별 일치 문서 계산"""
+    rules = [
+        {"rule_id": 1, "setting_id": 10, "rule_type": "tax_type", "pattern": "법인세", "site_key": ""},
+        {"rule_id": 2, "setting_id": 10, "rule_type": "keyword", "pattern": "가산 세", "site_key": ""},
+        {"rule_id": 3, "setting_id": 20, "rule_type": "tax_type", "pattern": "부가가치세", "site_key": "nts_authority"},
+        {"rule_id": 4, "setting_id": 30, "rule_type": "keyword", "pattern": "Transfer Pricing", "site_key": ""},
+    ]
+    matcher = SubscriptionMatcher(rules)
+    documents = [
+        {"site_key": "nts_authority", "data_id": "A", "data_category": "법인세, 부가가치세", "data_title": "합병 관련"},
+        {"site_key": "moef", "data_id": "B", "data_category": "부가가치세", "data_title": "신고불성실가산세 적용"},
+        {"site_key": "moef", "data_id": "C", "data_category": "nan", "data_title": "transfer pricing 조정"},
+        {"site_key": "moef", "data_id": "D", "data_category": "소득세", "data_title": "기타"},
+    ]
+
+    matches, label_counts = matcher.match(documents)
+    assert matches == {10: ["A", "B"], 20: ["A"], 30: ["C"]}
+    assert label_counts == {"법인세": 1, "가산 세": 1, "부가가치세": 1, "Transfer Pricing": 1}
+    assert matcher.subscribed_settings == {10, 20, 30}
+    assert normalize_text(" 부가 가치세 ") == "부가가치세"
+    print(f"✅ 수신자별 일치 문서: {matches}")
+
+
+def test_notification_records_matched_documents_per_recipient(monitoring_db):
+    """구독 규칙이 있는 수신자는 일치 문서만, 규칙이 없는 수신자는 전체 문서로 다이제스트 항목 기록"""
+    from src.services.notification_service import NotificationService
+
+    db_path = monitoring_db
+
+    with sqlite3.connect(db_path) as conn:
+        for address in ("all@example.com", "corp@example.com", "none@example.com"):
+            conn.execute("""
+                INSERT INTO email_settings (email_address, smtp_server, smtp_port, is_active,
+                                            min_data_threshold, notification_types)
+                VALUES (?, 'localhost', 25, 1, 1, '["new_data"]')
+            """, (address,))
+        for data_id, category, title in [("A", "법인세", "합병 과세"), ("B", "소득세", "연말정산"),
+                                         ("C", "부가가치세", "법인 전환 시 부가가치세")]:
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, data_category, crawl_session_id)
+                VALUES ('moef', ?, ?, ?, 'session-1')
+            """, (data_id, title, category))
+
+    service = NotificationService(db_path=db_path)
+    service.subscriptions.add_rule(2, "tax_type", "법인세")
+    service.subscriptions.add_rule(2, "keyword", "법인 전환")
+    service.subscriptions.add_rule(3, "tax_type", "증여세")
+
+    assert asyncio.run(service.send_new_data_notification("moef", 3, "session-1"))
+
+    with sqlite3.connect(db_path) as conn:
+        items = dict(conn.execute("SELECT setting_id, data_ids FROM notification_digest_items").fetchall())
+        metadata = json.loads(conn.execute("""
+            SELECT metadata FROM notification_history WHERE notification_type = 'new_data'
+        """).fetchone()[0])
+
+    assert items == {1: None, 2: json.dumps(["A", "C"])}
+    assert metadata["matched_subscriptions"] == {"법인세": 1, "법인 전환": 1}
+    print(f"✅ 수신자별 다이제스트 항목: {items}")
+
+
+
+def test_immediate_email_shows_only_matched_documents(monitoring_db, monkeypatch):
+    """다이제스트를 끄면 즉시 이메일도 구독 규칙이 있는 수신자에게는 일치 문서만 담은 본문으로 발송"""
+    from src.config.settings import NOTIFICATION_DIGEST_CONFIG
+    from src.services.notification_service import NotificationService
+
+    monkeypatch.setitem(NOTIFICATION_DIGEST_CONFIG, "enabled", False)
+    db_path = monitoring_db
+    with sqlite3.connect(db_path) as conn:
+        for address in ("all@example.com", "corp@example.com"):
+            conn.execute("""
+                INSERT INTO email_settings (email_address, smtp_server, smtp_port, is_active,
+                                            min_data_threshold, notification_types)
+                VALUES (?, 'localhost', 25, 1, 1, '["new_data"]')
+            """, (address,))
+        for data_id, category, title in [("A", "법인세", "합병 과세"), ("B", "소득세", "연말정산")]:
+            conn.execute("""
+                INSERT INTO new_data_log (site_key, data_id, data_title, data_category, crawl_session_id)
+                VALUES ('moef', ?, ?, ?, 'session-1')
+            """, (data_id, title, category))
+
+    service = NotificationService(db_path=db_path)
+    service.subscriptions.add_rule(2, "tax_type", "법인세")
+    batches = []
+
+    def send_batch(settings, notification, html_content=None):
+        batches.append(([setting['email_address'] for setting in settings], html_content))
+        return {setting['setting_id']: True for setting in settings}
+
+    monkeypatch.setattr(service, "_sync_send_email_batch", send_batch)
+
+    async def scenario():
+        assert await service.send_new_data_notification("moef", 2, "session-1")
+        deliveries = [delivery for delivery in service.outbox.claim("worker-1") if delivery['channel'] == 'email']
+        assert {delivery['target']: delivery['data_ids'] for delivery in deliveries} == {"1": None, "2": ["A"]}
+        rows = service.outbox.load_notifications([deliveries[0]['notification_id']])
+        notification = service.notification_from_row(rows[deliveries[0]['notification_id']])
+        return await service.deliver(deliveries[0]['notification_id'], notification, deliveries)
+
+    outcomes = asyncio.run(scenario())
+    assert all(error is None for error in outcomes.values())
+
+    # 같은 SMTP 서버여도 구독 보기가 다르면 다른 본문으로 나누어 발송
+    bodies = {recipients[0]: html for recipients, html in batches}
+    assert len(batches) == 2
+    assert "합병 과세" in bodies["all@example.com"] and "연말정산" in bodies["all@example.com"]
+    assert "합병 과세" in bodies["corp@example.com"] and "연말정산" not in bodies["corp@example.com"]
+    print("✅ 수신자별 일치 문서 본문")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
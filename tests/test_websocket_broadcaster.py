@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+WebSocket 브로드캐스터 테스트 스크립트
+
+진행 상황 메시지 병합, 큐 초과 시 가장 오래된 메시지 버림, 대기 시간 초과 연결 제거를 확인
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+from types import SimpleNamespace
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import src.services.websocket_broadcaster as broadcaster_module
+from src.services.websocket_broadcaster import WebSocketBroadcaster
+
+
+class _GatedWebSocket:
+    """gate가 열릴 때까지 전송이 끝나지 않는 WebSocket (느린 브라우저 흉내)"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def _connect_blocked(broadcaster: WebSocketBroadcaster) -> _GatedWebSocket:
+    """연결 후 첫 메시지를 전송 중 상태로 만들어 이후 메시지가 큐에 대기하게 함"""
+    websocket = _GatedWebSocket()
+    await broadcaster.connect(websocket)
+    await broadcaster.broadcast({"type": "system", "seq": 0})
+    await asyncio.sleep(0)
+    return websocket
+
+
+async def _drain(websocket: _GatedWebSocket):
+    websocket.gate.set()
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_progress_messages_coalesce_while_queued():
+    """대기 중인 같은 크롤링의 진행 상황 메시지는 큐 위치를 유지한 채 최신 필드로 병합"""
+    async def scenario():
+        broadcaster = WebSocketBroadcaster({"queue_size": 10})
+        websocket = await _connect_blocked(broadcaster)
+
+        await broadcaster.broadcast({"type": "crawl_progress", "choice": "moef", "progress": 10, "status": "running"})
+        await broadcaster.broadcast({"type": "crawl_progress", "choice": "mois", "progress": 5})
+        await broadcaster.broadcast({"type": "crawl_progress", "choice": "moef", "progress": 20})
+        await broadcaster.broadcast({"type": "system", "seq": 1})
+        await _drain(websocket)
+
+        stats = broadcaster.get_stats()["clients"][0]
+        await broadcaster.close_all()
+        return websocket.sent, stats
+
+    sent, stats = asyncio.run(scenario())
+    assert sent == [
+        {"type": "system", "seq": 0},
+        {"type": "crawl_progress", "choice": "moef", "progress": 20, "status": "running"},
+        {"type": "crawl_progress", "choice": "mois", "progress": 5},
+        {"type": "system", "seq": 1},
+    ]
+    assert stats["coalesced"] == 1 and stats["sent"] == 4 and stats["dropped"] == 0
+    print(f"✅ 진행 상황 병합: {stats['coalesced']}건")
+
+
+def test_full_queue_drops_oldest_message():
+    """큐가 가득 차면 가장 오래된 대기 메시지를 버리고, 버린 병합 대상은 이후 새 메시지로 다시 대기"""
+    async def scenario():
+        broadcaster = WebSocketBroadcaster({"queue_size": 3})
+        websocket = await _connect_blocked(broadcaster)
+
+        await broadcaster.broadcast({"type": "crawl_progress", "choice": "moef", "progress": 10})
+        for seq in range(1, 4):
+            await broadcaster.broadcast({"type": "system", "seq": seq})
+        await broadcaster.broadcast({"type": "crawl_progress", "choice": "moef", "progress": 30})
+        await _drain(websocket)
+
+        stats = broadcaster.get_stats()["clients"][0]
+        await broadcaster.close_all()
+        return websocket.sent, stats
+
+    sent, stats = asyncio.run(scenario())
+    assert sent == [
+        {"type": "system", "seq": 0},
+        {"type": "system", "seq": 2},
+        {"type": "system", "seq": 3},
+        {"type": "crawl_progress", "choice": "moef", "progress": 30},
+    ]
+    assert stats["dropped"] == 2 and stats["coalesced"] == 0
+    print(f"✅ 가장 오래된 메시지 버림: {stats['dropped']}건")
+
+
+def test_lagging_client_is_evicted(monkeypatch):
+    """가장 오래된 대기 메시지가 max_lag_seconds를 넘긴 연결은 제거되고 다른 연결은 계속 수신"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(broadcaster_module, "time", SimpleNamespace(
+        monotonic=lambda: clock.now, time=time.time, perf_counter=time.perf_counter
+    ))
+
+    async def scenario():
+        broadcaster = WebSocketBroadcaster({"max_lag_seconds": 30})
+        slow = await _connect_blocked(broadcaster)
+        fast = _GatedWebSocket()
+        fast.gate.set()
+        await broadcaster.connect(fast)
+
+        assert await broadcaster.broadcast({"type": "system", "seq": 1}) == 2
+        await _drain(fast)
+        clock.now += 31
+        delivered = await broadcaster.broadcast({"type": "system", "seq": 2})
+        await _drain(fast)
+
+        stats = broadcaster.get_stats()
+        await broadcaster.close_all()
+        return delivered, stats, slow, fast
+
+    delivered, stats, slow, fast = asyncio.run(scenario())
+    assert delivered == 1
+    assert stats["evicted"] == 1 and stats["active_connections"] == 1
+    assert slow.closed_with == 1013
+    assert [message["seq"] for message in fast.sent] == [1, 2]
+    print(f"✅ 지연 연결 제거: {stats['evicted']}개")
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))